@@ -2,11 +2,17 @@
 """Script to load educational theory data into databases.
 
 Usage:
-    python -m scripts.load_data [--data-dir PATH] [--clear]
+    python -m scripts.load_data [--data-dir PATH]
+                                [--clear | --incremental | --rebuild-vectors]
 
 Options:
     --data-dir PATH    Directory containing JSON data files
     --clear            Clear existing data before loading
+    --incremental      Only upsert, re-embed, or delete entities whose
+                       content hash changed since the last load
+    --rebuild-vectors  Build a new versioned vector collection (e.g. after
+                       changing the embedding model), verify it against the
+                       live one, and atomically switch the collection alias
 """
 
 import argparse
@@ -73,11 +79,38 @@ async def main() -> int:
         help="Directory containing JSON data files",
         default=Path(__file__).parent.parent / "data" / "theories",
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--clear",
         action="store_true",
         help="Clear existing data before loading",
     )
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Sync only changed entities using stored content hashes",
+    )
+    mode.add_argument(
+        "--rebuild-vectors",
+        action="store_true",
+        help="Rebuild the vector collection side by side and swap the alias",
+    )
+    parser.add_argument(
+        "--min-recall",
+        type=float,
+        default=0.5,
+        help="Minimum top-k neighbour overlap with the old collection (rebuild only)",
+    )
+    parser.add_argument(
+        "--no-swap",
+        action="store_true",
+        help="Build and verify the new collection without switching to it",
+    )
+    parser.add_argument(
+        "--drop-old",
+        action="store_true",
+        help="Delete the previous collection after a successful swap",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -134,6 +167,50 @@ async def main() -> int:
             data_dir=args.data_dir,
         )
 
+        if args.rebuild_vectors:
+            logger.info("Rebuilding vector collection...")
+            report = await loader.rebuild_vectors(
+                min_recall=args.min_recall,
+                swap=not args.no_swap,
+            )
+
+            logger.info("=" * 50)
+            logger.info("Vector Rebuild Complete!")
+            logger.info("=" * 50)
+            for key, value in report.to_dict().items():
+                logger.info(f"  {key}: {value}")
+            logger.info("=" * 50)
+
+            if report.reason:
+                return 1
+            if report.swapped and args.drop_old and report.old_collection != report.alias:
+                chromadb_adapter.drop_collection(report.old_collection)
+            return 0
+
+        if args.incremental:
+            logger.info("Synchronizing changed data...")
+            summary = await loader.sync_all()
+
+            logger.info("=" * 50)
+            logger.info("Incremental Sync Complete!")
+            logger.info("=" * 50)
+            for item_type, changes in summary.items():
+                logger.info(
+                    f"  {item_type.capitalize()}: "
+                    f"added={len(changes['added'])}, "
+                    f"changed={len(changes['changed'])}, "
+                    f"removed={len(changes['removed'])}, "
+                    f"unchanged={changes['unchanged']}"
+                )
+                for kind in ("added", "changed", "removed"):
+                    if changes[kind]:
+                        logger.info(f"    {kind}: {', '.join(changes[kind])}")
+            reembedded = summary["theories"]["reembedded"]
+            logger.info(f"  Re-embedded theories: {len(reembedded)}")
+            logger.info("=" * 50)
+
+            return 0
+
         # Load all data
         logger.info("Loading data...")
         counts = await loader.load_all()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Script to precompute inferred theory relationships across the catalog.
+
+Usage:
+    python -m scripts.precompute_relationships [--restart] [--max-pairs N]
+
+Options:
+    --restart        Discard the checkpoint and previously inferred
+                     relationships and start over
+    --max-pairs N    Maximum candidate pairs judged by the LLM
+
+The run checkpoints after every LLM batch; running the script again
+after an interruption continues with the pairs not yet judged.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tenjin.infrastructure.config.settings import get_settings
+from tenjin.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tenjin.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+from tenjin.infrastructure.adapters.esperanto_adapter import EmbeddingAdapter, EsperantoAdapter
+from tenjin.infrastructure.repositories.neo4j_theory_repository import Neo4jTheoryRepository
+from tenjin.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+from tenjin.infrastructure.repositories.chromadb_vector_repository import (
+    ChromaDBVectorRepository,
+)
+from tenjin.application.services.relationship_precompute_service import (
+    RelationshipPrecomputeService,
+)
+
+
+def setup_logging(verbose: bool = False) -> None:
+    """Configure logging."""
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
+
+async def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (0 for success, 1 for failure).
+    """
+    parser = argparse.ArgumentParser(
+        description="Precompute inferred relationships between TENJIN theories"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard the checkpoint and inferred relationships and start over",
+    )
+    parser.add_argument(
+        "--max-pairs",
+        type=int,
+        default=None,
+        help="Maximum candidate pairs judged by the LLM",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+    setup_logging(args.verbose)
+    logger = logging.getLogger(__name__)
+
+    settings = get_settings()
+
+    neo4j_adapter = Neo4jAdapter(
+        uri=settings.neo4j.uri,
+        user=settings.neo4j.user,
+        password=settings.neo4j.password,
+    )
+    chromadb_adapter = ChromaDBAdapter(
+        host=settings.chromadb.host,
+        port=settings.chromadb.port,
+        persist_dir=settings.chromadb.persist_dir,
+        collection_name=settings.chromadb.collection_name,
+    )
+
+    try:
+        await neo4j_adapter.connect()
+        chromadb_adapter.connect()
+
+        service = RelationshipPrecomputeService(
+            Neo4jTheoryRepository(neo4j_adapter),
+            ChromaDBVectorRepository(
+                chromadb_adapter,
+                EmbeddingAdapter(
+                    provider=settings.embedding.provider,
+                    model=settings.embedding.model,
+                ),
+            ),
+            Neo4jGraphRepository(neo4j_adapter),
+            EsperantoAdapter(provider=settings.llm.provider, model=settings.llm.model),
+        )
+        report = await service.precompute(restart=args.restart, max_pairs=args.max_pairs)
+
+        logger.info("=" * 50)
+        logger.info("Relationship Precomputation Complete!")
+        logger.info("=" * 50)
+        for key, value in report.to_dict().items():
+            logger.info(f"  {key}: {value}")
+        logger.info("=" * 50)
+
+        return 1 if report.failed_batches else 0
+
+    except Exception as e:
+        logger.error(f"Error precomputing relationships: {e}", exc_info=True)
+        return 1
+
+    finally:
+        await neo4j_adapter.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -9,6 +9,11 @@ from .citation_service import CitationService
 from .methodology_service import MethodologyService
 from .inference_service import InferenceService
 from .cache_service import CacheService
+from .job_service import JobService
+from .relationship_precompute_service import RelationshipPrecomputeService
+from .link_prediction import LinkPredictor, LinkScore
+from .learning_path import LearningPath, LearningPathPlanner, LearningStep
+from .coverage import CoverageReport, OutcomeCoverage, compute_coverage
 
 __all__ = [
     "TheoryService",
@@ -20,4 +25,14 @@ __all__ = [
     "MethodologyService",
     "InferenceService",
     "CacheService",
+    "JobService",
+    "RelationshipPrecomputeService",
+    "LinkPredictor",
+    "LinkScore",
+    "LearningPath",
+    "LearningPathPlanner",
+    "LearningStep",
+    "CoverageReport",
+    "OutcomeCoverage",
+    "compute_coverage",
 ]
@@ -7,11 +7,13 @@ from ...domain.repositories.theory_repository import TheoryRepository
 from ...domain.repositories.graph_repository import GraphRepository
 from ...domain.value_objects.theory_id import TheoryId
 from ...infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class AnalysisService:
     """Service for theory analysis operations.
 
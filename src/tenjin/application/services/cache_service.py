@@ -3,11 +3,13 @@
 from typing import Any
 
 from ...infrastructure.adapters.redis_adapter import RedisAdapter
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class CacheService:
     """Service for managing application cache."""
 
@@ -7,11 +7,13 @@ from ...domain.entities.theory import Theory
 from ...domain.entities.theorist import Theorist
 from ...domain.repositories.theory_repository import TheoryRepository
 from ...domain.value_objects.theory_id import TheoryId
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class CitationService:
     """Service for citation generation operations.
 
@@ -0,0 +1,179 @@
+"""Outcome coverage - Vectorized matching of learning outcomes to theories."""
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+
+@dataclass
+class OutcomeCoverage:
+    """Coverage of one target learning outcome.
+
+    Attributes:
+        outcome: Learning outcome text.
+        score: Highest cosine similarity to an applied theory (0.0 if none).
+        covered: Whether the score reaches the coverage threshold.
+        covered_by: Applied theory with the highest similarity.
+        candidates: Best not-yet-applied theories as (theory ID, similarity),
+            only for uncovered outcomes.
+    """
+
+    outcome: str
+    score: float
+    covered: bool
+    covered_by: str | None = None
+    candidates: list[tuple[str, float]] = field(default_factory=list)
+
+    def to_dict(self, names: Mapping[str, str] | None = None) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Args:
+            names: Theory names by ID, added where known.
+
+        Returns:
+            Dictionary with score, coverage flag and candidate theories.
+        """
+        names = names or {}
+        result: dict[str, Any] = {
+            "outcome": self.outcome,
+            "score": round(self.score, 4),
+            "covered": self.covered,
+            "covered_by": self.covered_by,
+        }
+        if self.covered_by in names:
+            result["covered_by_name"] = names[self.covered_by]
+        if not self.covered:
+            result["candidates"] = [
+                {
+                    "theory_id": theory_id,
+                    "name": names.get(theory_id),
+                    "similarity": round(similarity, 4),
+                }
+                for theory_id, similarity in self.candidates
+            ]
+        return result
+
+
+@dataclass
+class CoverageReport:
+    """Coverage of all target outcomes by the applied theories.
+
+    Attributes:
+        outcomes: Coverage per outcome, in input order.
+        threshold: Cosine similarity at which an outcome counts as covered.
+    """
+
+    outcomes: list[OutcomeCoverage]
+    threshold: float
+
+    @property
+    def coverage_score(self) -> float:
+        """Share of outcomes covered (0.0-1.0)."""
+        if not self.outcomes:
+            return 0.0
+        return sum(o.covered for o in self.outcomes) / len(self.outcomes)
+
+    @property
+    def gaps(self) -> list[OutcomeCoverage]:
+        """Outcomes not covered by any applied theory."""
+        return [o for o in self.outcomes if not o.covered]
+
+    def candidate_ids(self) -> list[str]:
+        """Candidate theories over all gaps, best first and deduplicated."""
+        ranked = sorted(
+            (c for gap in self.gaps for c in gap.candidates), key=lambda c: c[1], reverse=True
+        )
+        return list(dict.fromkeys(theory_id for theory_id, _ in ranked))
+
+    def to_dict(self, names: Mapping[str, str] | None = None) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Args:
+            names: Theory names by ID, added where known.
+
+        Returns:
+            Dictionary with the overall score, per-outcome coverage and gaps.
+        """
+        return {
+            "coverage_score": round(self.coverage_score, 4),
+            "threshold": self.threshold,
+            "outcomes": [o.to_dict(names) for o in self.outcomes],
+            "uncovered_outcomes": [o.outcome for o in self.gaps],
+        }
+
+
+def compute_coverage(
+    outcomes: Sequence[str],
+    outcome_vectors: np.ndarray,
+    theory_ids: Sequence[str],
+    theory_vectors: np.ndarray,
+    applied_ids: Sequence[str],
+    threshold: float = 0.5,
+    candidates_per_gap: int = 3,
+) -> CoverageReport:
+    """Compute outcome coverage from an outcome x theory cosine matrix.
+
+    Args:
+        outcomes: Target learning outcomes.
+        outcome_vectors: Outcome embeddings (one row per outcome).
+        theory_ids: Theory IDs, one per row of ``theory_vectors``.
+        theory_vectors: Theory embeddings.
+        applied_ids: Theories currently applied in the design.
+        threshold: Cosine similarity at which an outcome counts as covered.
+        candidates_per_gap: Not-yet-applied theories suggested per gap.
+
+    Returns:
+        Coverage report.
+    """
+    if not outcomes:
+        return CoverageReport(outcomes=[], threshold=threshold)
+
+    def normalize(matrix: np.ndarray) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float32).reshape(len(matrix), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    ids = list(theory_ids)
+    if ids:
+        similarity = normalize(outcome_vectors) @ normalize(theory_vectors).T
+    else:
+        similarity = np.zeros((len(outcomes), 0), dtype=np.float32)
+
+    applied = set(applied_ids)
+    applied_mask = np.array([theory_id in applied for theory_id in ids], dtype=bool)
+
+    if applied_mask.any():
+        applied_scores = np.where(applied_mask, similarity, -np.inf)
+        best_applied = applied_scores.argmax(axis=1)
+        scores = applied_scores[np.arange(len(outcomes)), best_applied]
+    else:
+        best_applied = np.zeros(len(outcomes), dtype=np.int64)
+        scores = np.zeros(len(outcomes), dtype=np.float32)
+
+    open_scores = np.where(applied_mask, -np.inf, similarity)
+    k = min(candidates_per_gap, int((~applied_mask).sum()))
+    if k > 0:
+        top = np.argpartition(-open_scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(open_scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+    else:
+        top = np.zeros((len(outcomes), 0), dtype=np.int64)
+
+    report = []
+    for row, outcome in enumerate(outcomes):
+        score = max(float(scores[row]), 0.0)
+        covered = bool(applied_mask.any()) and score >= threshold
+        report.append(
+            OutcomeCoverage(
+                outcome=outcome,
+                score=score,
+                covered=covered,
+                covered_by=ids[best_applied[row]] if applied_mask.any() else None,
+                candidates=[]
+                if covered
+                else [(ids[j], float(similarity[row, j])) for j in top[row]],
+            )
+        )
+    return CoverageReport(outcomes=report, threshold=threshold)
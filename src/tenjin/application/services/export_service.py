@@ -6,11 +6,13 @@ from typing import Any
 
 from ...domain.entities.theory import Theory
 from ...domain.repositories.theory_repository import TheoryRepository
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class ExportService:
     """Service for exporting theory data in various formats."""
 
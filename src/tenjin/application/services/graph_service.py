@@ -5,11 +5,13 @@ from typing import Any, Sequence
 from ...domain.entities.relationship import TheoryRelationship
 from ...domain.repositories.graph_repository import GraphRepository
 from ...domain.value_objects.relationship_type import RelationshipType
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class GraphService:
     """Service for graph exploration operations.
 
@@ -298,16 +300,18 @@ class GraphService:
         """
         node_stats = await self._repository.execute_cypher(node_query)
 
-        # Get relationship counts by type
+        # Get relationship counts by type; inferred edges are reported apart
         rel_query = """
         MATCH ()-[r]->()
-        RETURN type(r) as type, count(*) as count
+        RETURN type(r) as type, coalesce(r.inferred, false) as inferred, count(*) as count
         """
         rel_stats = await self._repository.execute_cypher(rel_query)
+        curated = [r for r in rel_stats if not r["inferred"]]
 
         return {
             "nodes": {r["label"]: r["count"] for r in node_stats},
-            "relationships": {r["type"]: r["count"] for r in rel_stats},
+            "relationships": {r["type"]: r["count"] for r in curated},
             "total_nodes": sum(r["count"] for r in node_stats),
-            "total_relationships": sum(r["count"] for r in rel_stats),
+            "total_relationships": sum(r["count"] for r in curated),
+            "inferred_relationships": sum(r["count"] for r in rel_stats if r["inferred"]),
         }
@@ -17,11 +17,18 @@ from ...domain.repositories.graph_repository import GraphRepository
 from ...domain.value_objects.theory_id import TheoryId
 from ...domain.value_objects.search_query import SearchQuery
 from ...infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from ...infrastructure.adapters.streaming import ProgressCallback, stream_json_fields
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
+from .coverage import CoverageReport, compute_coverage
+from .link_prediction import LinkPredictor, LinkScore
+from .relationship_precompute_service import load_catalog
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class InferenceService:
     """Service for advanced LLM-powered inference operations.
 
@@ -244,13 +251,22 @@ Always respond with valid JSON."""
         current_design: dict[str, Any],
         target_outcomes: list[str],
         applied_theories: list[str] | None = None,
+        on_progress: ProgressCallback | None = None,
+        use_llm: bool = True,
     ) -> dict[str, Any]:
         """Analyze gaps in a learning design and suggest improvements.
 
+        Outcome coverage is computed numerically first: the outcomes are
+        embedded and compared with every theory embedding. The LLM only
+        receives the resulting summary; with ``use_llm=False`` the coverage
+        is returned on its own.
+
         Args:
             current_design: Current learning design description
             target_outcomes: Desired learning outcomes
             applied_theories: Theories currently being used (optional)
+            on_progress: Receives analysis fields as they are generated (optional)
+            use_llm: Run the LLM analysis on top of the coverage computation
 
         Returns:
             Gap analysis with improvement suggestions
@@ -269,36 +285,112 @@ Always respond with valid JSON."""
                 except ValueError:
                     continue
 
-        # Search for potentially useful theories
-        outcome_query = " ".join(target_outcomes)
-        query = SearchQuery(
-            query=outcome_query,
-            search_type="semantic",
-            limit=15,
-        )
-        relevant_theories = await self._vector_repo.semantic_search(query)
+        coverage = await self._compute_outcome_coverage(target_outcomes, applied_theory_details)
 
-        # Get details for relevant theories
         candidate_theories = []
-        for result in relevant_theories.results:
-            theory = await self._theory_repo.get_by_id(result.id)
-            if theory and theory not in applied_theory_details:
-                candidate_theories.append(theory)
+        if coverage is not None:
+            # Theories closest to the uncovered outcomes
+            for theory_id in coverage.candidate_ids()[:10]:
+                theory = await self._theory_repo.get_by_id(theory_id)
+                if theory:
+                    candidate_theories.append(theory)
+        elif use_llm:
+            # Search for potentially useful theories
+            outcome_query = " ".join(target_outcomes)
+            query = SearchQuery(
+                query=outcome_query,
+                search_type="semantic",
+                limit=15,
+            )
+            relevant_theories = await self._vector_repo.semantic_search(query)
+
+            # Get details for relevant theories
+            for result in relevant_theories.results:
+                theory = await self._theory_repo.get_by_id(result.id)
+                if theory and theory not in applied_theory_details:
+                    candidate_theories.append(theory)
+
+        names = {t.id.value: t.name for t in [*applied_theory_details, *candidate_theories]}
+        result = {
+            "current_design": current_design,
+            "target_outcomes": target_outcomes,
+            "applied_theories": [t.to_dict() for t in applied_theory_details],
+            "coverage": coverage.to_dict(names) if coverage is not None else None,
+        }
+        if not use_llm:
+            return result
 
         # Perform gap analysis with LLM
-        analysis = await self._perform_gap_analysis(
+        result["analysis"] = await self._perform_gap_analysis(
             current_design,
             target_outcomes,
             applied_theory_details,
             candidate_theories[:10],
+            on_progress,
+            coverage_summary=(
+                self._format_coverage(coverage, names) if coverage is not None else None
+            ),
         )
+        return result
 
-        return {
-            "current_design": current_design,
-            "target_outcomes": target_outcomes,
-            "applied_theories": [t.to_dict() for t in applied_theory_details],
-            "analysis": analysis,
-        }
+    async def _compute_outcome_coverage(
+        self,
+        target_outcomes: list[str],
+        applied_theories: list[Theory],
+    ) -> CoverageReport | None:
+        """Match target outcomes against all theory embeddings.
+
+        Args:
+            target_outcomes: Target outcomes
+            applied_theories: Currently applied theories
+
+        Returns:
+            Coverage report, or None if embeddings are unavailable
+        """
+        if not target_outcomes:
+            return None
+        settings = get_settings().inference
+        try:
+            outcome_vectors = await self._vector_repo.embed_texts(target_outcomes)
+            theory_ids, theory_vectors = await self._vector_repo.get_embedding_matrix()
+            if not theory_ids or len(outcome_vectors) != len(target_outcomes):
+                return None
+            return compute_coverage(
+                target_outcomes,
+                outcome_vectors,
+                theory_ids,
+                theory_vectors,
+                [t.id.value for t in applied_theories],
+                threshold=settings.gap_coverage_threshold,
+                candidates_per_gap=settings.gap_candidates_per_outcome,
+            )
+        except Exception as e:
+            logger.warning(f"Outcome coverage unavailable, using semantic search: {e}")
+            return None
+
+    @staticmethod
+    def _format_coverage(coverage: CoverageReport, names: dict[str, str]) -> str:
+        """Summarize outcome coverage for the gap analysis prompt.
+
+        Args:
+            coverage: Coverage report
+            names: Theory names by ID
+
+        Returns:
+            One line per outcome
+        """
+        lines = []
+        for item in coverage.outcomes:
+            if item.covered:
+                by = names.get(item.covered_by or "", item.covered_by)
+                lines.append(f"- [covered {item.score:.2f} by {by}] {item.outcome}")
+            else:
+                candidates = ", ".join(
+                    f"{names.get(theory_id, theory_id)} ({similarity:.2f})"
+                    for theory_id, similarity in item.candidates
+                )
+                lines.append(f"- [GAP {item.score:.2f}] {item.outcome} -> {candidates}")
+        return "\n".join(lines)
 
     async def _perform_gap_analysis(
         self,
@@ -306,6 +398,8 @@ Always respond with valid JSON."""
         target_outcomes: list[str],
         applied_theories: list[Theory],
         candidate_theories: list[Theory],
+        on_progress: ProgressCallback | None = None,
+        coverage_summary: str | None = None,
     ) -> dict[str, Any]:
         """Perform LLM-powered gap analysis.
 
@@ -314,6 +408,8 @@ Always respond with valid JSON."""
             target_outcomes: Target outcomes
             applied_theories: Currently applied theories
             candidate_theories: Potentially useful theories
+            on_progress: Progress callback; streams the completion when set
+            coverage_summary: Precomputed outcome coverage (replaces the outcome list)
 
         Returns:
             Gap analysis results
@@ -328,6 +424,16 @@ Always respond with valid JSON."""
             for t in candidate_theories[:8]
         )
 
+        if coverage_summary:
+            outcome_section = (
+                "TARGET LEARNING OUTCOMES (embedding similarity to the applied theories; "
+                "GAP lines list the closest unapplied theories):\n" + coverage_summary
+            )
+        else:
+            outcome_section = "TARGET LEARNING OUTCOMES:\n" + "\n".join(
+                f"- {o}" for o in target_outcomes
+            )
+
         prompt = f"""Analyze the gaps in this learning design and suggest improvements.
 
 CURRENT DESIGN:
@@ -337,8 +443,7 @@ CURRENT DESIGN:
 - Duration: {current_design.get('duration', 'not specified')}
 - Setting: {current_design.get('setting', 'not specified')}
 
-TARGET LEARNING OUTCOMES:
-{chr(10).join(f'- {o}' for o in target_outcomes)}
+{outcome_section}
 
 CURRENTLY APPLIED THEORIES:
 {applied_desc}
@@ -388,7 +493,12 @@ Provide thorough, evidence-based gap analysis with actionable recommendations.
 Always respond with valid JSON."""
 
         try:
-            response = await self._llm.generate(prompt, system_prompt)
+            if on_progress:
+                response = await stream_json_fields(
+                    self._llm, prompt, system_prompt, on_progress, "gap_analysis"
+                )
+            else:
+                response = await self._llm.generate(prompt, system_prompt)
             return json.loads(response)
         except Exception as e:
             logger.error(f"Gap analysis failed: {e}")
@@ -440,32 +550,131 @@ Always respond with valid JSON."""
             limit=20,
         )
 
-        # Get all theories for potential relationship discovery
-        all_theories = await self._theory_repo.get_all()
-        
-        # Filter to theories not already related
-        existing_ids = {r["theory"]["id"] for r in existing_relations}
-        existing_ids.add(theory_id)
-        unrelated_theories = [
-            t for t in all_theories
-            if t.id.value not in existing_ids
-        ][:15]
-
-        # Use LLM to infer potential relationships
-        inferred = await self._infer_relationships(
-            base_theory,
-            unrelated_theories,
-        )
+        # Relationships precomputed offline turn this into a lookup
+        inferred = await self._get_precomputed_relationships(theory_id)
+        inference_source = "precomputed"
+
+        if not inferred:
+            inference_source = "llm"
+
+            # Consider the whole catalog, not just the first page
+            all_theories = await load_catalog(self._theory_repo)
+
+            # Filter to theories not already related
+            existing_ids = {r["theory"]["id"] for r in existing_relations}
+            existing_ids.add(theory_id)
+            unrelated_theories = [
+                t for t in all_theories
+                if t.id.value not in existing_ids
+            ]
+
+            # Only the most promising candidates reach the LLM
+            candidates, link_scores = await self._prefilter_candidates(
+                base_theory, all_theories, unrelated_theories
+            )
+
+            # Use LLM to infer potential relationships
+            inferred = await self._infer_relationships(
+                base_theory,
+                candidates,
+            )
+            for rel in inferred:
+                score = link_scores.get(rel["related_theory"]["id"])
+                if score is not None:
+                    rel["link_score"] = score.to_dict()
 
         return {
             "base_theory": base_theory.to_dict(),
             "existing_relationships": existing_relations,
             "inferred_relationships": inferred,
+            "inference_source": inference_source,
             "relationship_graph": await self._build_relationship_graph(
                 base_theory, existing_relations, inferred
             ),
         }
 
+    async def _get_precomputed_relationships(self, theory_id: str) -> list[dict[str, Any]]:
+        """Get relationships stored by the offline precomputation.
+
+        Args:
+            theory_id: Base theory ID
+
+        Returns:
+            Inferred relationships in the same shape as ``_infer_relationships``
+        """
+        directions = {
+            "source_to_target": "base_to_candidate",
+            "target_to_source": "candidate_to_base",
+        }
+        stored = await self._graph_repo.get_inferred_relationships(
+            theory_id=theory_id,
+            min_confidence=get_settings().inference.min_confidence,
+            limit=15,
+        )
+        return [
+            {
+                "related_theory": rel["theory"],
+                "relationship_type": rel["relationship_type"],
+                "strength": rel["confidence"],
+                "direction": directions.get(rel["direction"], "bidirectional"),
+                "evidence": rel["evidence"],
+                "practical_implications": rel["practical_implications"],
+                "inferred": True,
+            }
+            for rel in stored
+        ]
+
+    async def _prefilter_candidates(
+        self,
+        base_theory: Theory,
+        all_theories: list[Theory],
+        candidates: list[Theory],
+    ) -> tuple[list[Theory], dict[str, LinkScore]]:
+        """Rank relationship candidates with local link prediction.
+
+        Args:
+            base_theory: Base theory
+            all_theories: Theories forming the graph
+            candidates: Theories not yet related to the base theory
+
+        Returns:
+            Tuple of (top candidates, link scores by theory ID)
+        """
+        settings = get_settings().inference
+        if not settings.prefilter_enabled or len(candidates) <= settings.prefilter_top_k:
+            return candidates[: settings.prefilter_top_k], {}
+
+        theories = list(all_theories)
+        if all(t.id != base_theory.id for t in theories):
+            theories.append(base_theory)
+        try:
+            predictor = LinkPredictor(
+                theories,
+                await self._graph_repo.get_relationship_pairs(),
+                await self._vector_repo.get_embeddings([t.id.value for t in theories]),
+                weights={
+                    "common_neighbors": settings.prefilter_weight_common_neighbors,
+                    "adamic_adar": settings.prefilter_weight_adamic_adar,
+                    "jaccard": settings.prefilter_weight_jaccard,
+                    "embedding": settings.prefilter_weight_embedding,
+                },
+            )
+            top = predictor.top_k(
+                base_theory.id.value,
+                [t.id.value for t in candidates],
+                k=settings.prefilter_top_k,
+            )
+        except Exception as e:
+            logger.warning(f"Link prediction prefilter failed, using unranked candidates: {e}")
+            return candidates[: settings.prefilter_top_k], {}
+
+        by_id = {t.id.value: t for t in candidates}
+        logger.debug(
+            f"Link prediction kept {len(top)} of {len(candidates)} candidates "
+            f"for {base_theory.id.value}"
+        )
+        return [by_id[s.theory_id] for s in top], {s.theory_id: s for s in top}
+
     async def _infer_relationships(
         self,
         base_theory: Theory,
@@ -792,6 +1001,7 @@ Always respond with valid JSON."""
         theory_ids: list[str],
         synthesis_goal: str,
         context: dict[str, Any] | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Synthesize multiple theories into an integrated framework.
 
@@ -799,6 +1009,7 @@ Always respond with valid JSON."""
             theory_ids: List of theory IDs to synthesize
             synthesis_goal: Purpose of the synthesis (e.g., "course design")
             context: Optional context (target audience, constraints, etc.)
+            on_progress: Receives synthesis fields as they are generated (optional)
 
         Returns:
             Integrated framework with analysis
@@ -829,7 +1040,7 @@ Always respond with valid JSON."""
 
         # Perform synthesis analysis
         synthesis = await self._perform_synthesis(
-            theories, relationships, synthesis_goal, context or {}
+            theories, relationships, synthesis_goal, context or {}, on_progress
         )
 
         return {
@@ -849,6 +1060,7 @@ Always respond with valid JSON."""
         relationships: list,
         synthesis_goal: str,
         context: dict[str, Any],
+        on_progress: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Perform LLM-based theory synthesis.
 
@@ -857,6 +1069,7 @@ Always respond with valid JSON."""
             relationships: Relationships between theories
             synthesis_goal: Purpose of synthesis
             context: Additional context
+            on_progress: Progress callback; streams the completion when set
 
         Returns:
             Synthesis results
@@ -959,7 +1172,12 @@ Create coherent, practical frameworks that combine theoretical insights.
 Always respond with valid JSON."""
 
         try:
-            response = await self._llm.generate(prompt, system_prompt)
+            if on_progress:
+                response = await stream_json_fields(
+                    self._llm, prompt, system_prompt, on_progress, "synthesis"
+                )
+            else:
+                response = await self._llm.generate(prompt, system_prompt)
             return json.loads(response)
         except Exception as e:
             logger.error(f"Synthesis failed: {e}")
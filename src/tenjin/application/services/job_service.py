@@ -0,0 +1,382 @@
+"""Job service - Background execution of long-running operations."""
+
+import asyncio
+import json
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable
+
+from ...infrastructure.adapters.job_store import JobRecord, JobStatus, JobStore
+from ...infrastructure.adapters.streaming import ProgressCallback
+from ...infrastructure.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Runs an operation: (arguments, progress callback) -> JSON-serializable result
+JobHandler = Callable[[dict[str, Any], ProgressCallback], Awaitable[Any]]
+
+
+class JobService:
+    """Service running registered operations as background jobs.
+
+    Submitting a job returns immediately with a job ID; a bounded pool of
+    worker tasks executes queued jobs and persists every state change in
+    the job store. Submitting an operation with the same arguments as a
+    pending, running, or completed job returns that job instead of
+    starting a new one. Jobs left unfinished by a previous server process
+    are resumed on start.
+
+    Several processes may share one store: each pending job is claimed in
+    the store before it runs, so a job queued by more than one process
+    runs once. Interrupted jobs must then be recovered by one process
+    only (``recover``) before the others start with ``recover=False``.
+    A job running in another process is cancelled through a request in
+    the store, which its owner picks up on the next progress report or
+    poll and confirms by finishing the job as cancelled.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_workers: int = 2,
+        timeout_seconds: float = 1800.0,
+        result_ttl_seconds: int = 86400,
+        cancel_poll_seconds: float = 2.0,
+    ) -> None:
+        """Initialize job service.
+
+        Args:
+            store: Job state store.
+            max_workers: Jobs executed concurrently.
+            timeout_seconds: Maximum run time of one job.
+            result_ttl_seconds: How long finished jobs are kept.
+            cancel_poll_seconds: Interval of checking running jobs for
+                cancel requests made by other processes.
+        """
+        self._store = store
+        self._max_workers = max_workers
+        self._timeout = timeout_seconds
+        self._result_ttl = result_ttl_seconds
+        self._cancel_poll = cancel_poll_seconds
+        self._handlers: dict[str, JobHandler] = {}
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._watcher: asyncio.Task | None = None
+        self._running: dict[str, asyncio.Task] = {}
+        self._cancelling: set[str] = set()
+        self._submit_lock = asyncio.Lock()
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def register(self, operation: str, handler: JobHandler) -> None:
+        """Register an operation that can be run as a job.
+
+        Args:
+            operation: Operation name.
+            handler: Coroutine function running the operation.
+        """
+        self._handlers[operation] = handler
+
+    @property
+    def operations(self) -> list[str]:
+        """Names of registered operations."""
+        return sorted(self._handlers)
+
+    async def recover(self) -> int:
+        """Purge expired jobs and requeue jobs interrupted by a restart.
+
+        Jobs still marked as running were left by a stopped process; they
+        are reset to pending so that they run again from the start.
+
+        Returns:
+            Number of interrupted jobs reset.
+        """
+        purged = await self._store.purge_finished(time.time() - self._result_ttl)
+        if purged:
+            logger.info(f"Purged {purged} expired jobs")
+
+        reset = 0
+        for job in await self._store.list_unfinished():
+            if job.status == JobStatus.RUNNING:
+                job.status = JobStatus.PENDING
+                await self._store.save(job)
+                reset += 1
+        if reset:
+            logger.info(f"Recovered {reset} interrupted jobs")
+        return reset
+
+    async def start(self, recover: bool = True) -> None:
+        """Resume unfinished jobs and start the worker pool.
+
+        Args:
+            recover: Recover interrupted jobs first. Disable when another
+                process sharing the store has already recovered them.
+        """
+        if self._workers:
+            return
+
+        if recover:
+            await self.recover()
+
+        resumed = 0
+        for job in await self._store.list_unfinished():
+            if job.status == JobStatus.PENDING:
+                self._queue.put_nowait(job.job_id)
+                resumed += 1
+        if resumed:
+            logger.info(f"Resuming {resumed} unfinished jobs")
+
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self._max_workers)
+        ]
+        self._watcher = asyncio.create_task(self._watch_cancels(), name="job-cancel-watcher")
+        logger.info(f"Job service started with {self._max_workers} workers")
+
+    async def stop(self) -> None:
+        """Stop the worker pool.
+
+        Running jobs stay marked as running in the store and are resumed by
+        the next ``start``.
+        """
+        tasks = [*self._workers, *([self._watcher] if self._watcher else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._watcher = None
+        logger.info("Job service stopped")
+
+    async def submit(
+        self,
+        operation: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> tuple[JobRecord, bool]:
+        """Submit an operation for background execution.
+
+        Args:
+            operation: Registered operation name.
+            arguments: Operation arguments.
+
+        Returns:
+            Tuple of (job, deduplicated) where deduplicated is True if an
+            identical existing job was returned.
+
+        Raises:
+            ValueError: If the operation is not registered.
+        """
+        if operation not in self._handlers:
+            raise ValueError(
+                f"Unknown operation: {operation}. Available: {', '.join(self.operations)}"
+            )
+        arguments = arguments or {}
+
+        async with self._submit_lock:
+            existing = await self._store.find_reusable(
+                JobRecord.make_dedup_key(operation, arguments)
+            )
+            if existing is not None and not self._expired(existing):
+                logger.info(f"Job {existing.job_id} reused for {operation}")
+                return existing, True
+
+            job = JobRecord.create(operation, arguments)
+            await self._store.save(job)
+            self._queue.put_nowait(job.job_id)
+
+        logger.info(f"Job {job.job_id} submitted: {operation}")
+        return job, False
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        """Get a job.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            Job record or None if unknown or expired.
+        """
+        job = await self._store.get(job_id)
+        if job is None or self._expired(job):
+            return None
+        return job
+
+    async def cancel(self, job_id: str) -> JobRecord | None:
+        """Cancel a pending or running job.
+
+        Finished jobs are returned unchanged. A job running in another
+        process stays running, with ``cancel_requested`` set, until that
+        process has cancelled it.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            Job record after cancellation, or None if unknown.
+        """
+        job = await self.get(job_id)
+        if job is None or job.status.finished:
+            return job
+
+        await self._store.request_cancel(job_id)
+        task = self._running.get(job_id)
+        if task is not None:
+            self._cancel_local(job_id)
+            await asyncio.gather(task, return_exceptions=True)
+            return await self._store.get(job_id) or job
+
+        if job.status == JobStatus.PENDING:
+            # Not started: the worker skips cancelled jobs when it dequeues them
+            await self._finish(job, JobStatus.CANCELLED)
+            return await self._store.get(job_id) or job
+
+        logger.info(f"Job {job_id} runs in another process, cancellation requested")
+        job.cancel_requested = True
+        return job
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get worker pool statistics.
+
+        Returns:
+            Dictionary with worker, queue, and running job counts.
+        """
+        return {
+            "workers": len(self._workers),
+            "max_workers": self._max_workers,
+            "queued": self._queue.qsize(),
+            "running": len(self._running),
+            "operations": self.operations,
+        }
+
+    def _cancel_local(self, job_id: str) -> None:
+        """Cancel a job running in this process."""
+        task = self._running.get(job_id)
+        if task is not None and job_id not in self._cancelling:
+            self._cancelling.add(job_id)
+            task.cancel()
+
+    async def _watch_cancels(self) -> None:
+        """Cancel running jobs whose cancellation another process requested."""
+        while True:
+            await asyncio.sleep(self._cancel_poll)
+            if not self._running:
+                continue
+            try:
+                for job_id in await self._store.cancel_requested(list(self._running)):
+                    logger.info(f"Job {job_id} cancelled by request from another process")
+                    self._cancel_local(job_id)
+            except Exception as e:
+                logger.warning(f"Checking job cancel requests failed: {e}")
+
+    def _expired(self, job: JobRecord) -> bool:
+        """Check whether a finished job is past its retention time."""
+        return (
+            job.finished_at is not None
+            and time.time() - job.finished_at > self._result_ttl
+        )
+
+    async def _worker(self) -> None:
+        """Execute queued jobs until cancelled."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = await self._store.get(job_id)
+                if (
+                    job is not None
+                    and job.status == JobStatus.PENDING
+                    and await self._store.claim(job, self._owner)
+                ):
+                    await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} could not be executed: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: JobRecord) -> None:
+        """Run one job and persist its outcome.
+
+        Args:
+            job: Pending job.
+        """
+        handler = self._handlers.get(job.operation)
+        if handler is None:
+            await self._finish(job, JobStatus.FAILED, error=f"Unknown operation: {job.operation}")
+            return
+        if await self._store.cancel_requested([job.job_id]):
+            await self._finish(job, JobStatus.CANCELLED)
+            return
+
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        job.attempts += 1
+        # Register the task before anything awaits so cancel() always finds it
+        task = asyncio.create_task(self._execute(job, handler))
+        self._running[job.job_id] = task
+        try:
+            await task
+        except asyncio.CancelledError:
+            worker = asyncio.current_task()
+            if worker is not None and worker.cancelling():
+                raise
+            # Only the job was cancelled (before its handler started)
+        finally:
+            self._running.pop(job.job_id, None)
+            self._cancelling.discard(job.job_id)
+
+    async def _execute(self, job: JobRecord, handler: JobHandler) -> None:
+        """Call the operation handler and record the outcome.
+
+        Args:
+            job: Running job.
+            handler: Operation handler.
+        """
+
+        async def on_progress(message: str) -> None:
+            if await self._store.cancel_requested([job.job_id]):
+                self._cancel_local(job.job_id)
+                return
+            job.progress += 1
+            job.progress_message = message
+            await self._store.save(job)
+
+        try:
+            await self._store.save(job)
+            logger.info(f"Job {job.job_id} started: {job.operation} (attempt {job.attempts})")
+            result = await asyncio.wait_for(handler(job.arguments, on_progress), self._timeout)
+        except asyncio.CancelledError:
+            if job.job_id not in self._cancelling:
+                # Worker shutdown: leave the job running so it is resumed
+                raise
+            await self._finish(job, JobStatus.CANCELLED)
+        except asyncio.TimeoutError:
+            await self._finish(
+                job, JobStatus.FAILED, error=f"Timed out after {self._timeout:.0f}s"
+            )
+        except Exception as e:
+            await self._finish(job, JobStatus.FAILED, error=f"{type(e).__name__}: {e}")
+        else:
+            # Round-trip through JSON so stored and in-memory results agree
+            job.result = json.loads(json.dumps(result, ensure_ascii=False, default=str))
+            await self._finish(job, JobStatus.COMPLETED)
+
+    async def _finish(
+        self,
+        job: JobRecord,
+        status: JobStatus,
+        error: str | None = None,
+    ) -> None:
+        """Persist the final state of a job.
+
+        The store keeps a state already final, e.g. a job cancelled by
+        another process before this one noticed.
+        """
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        await self._store.save(job)
+        elapsed = job.finished_at - (job.started_at or job.finished_at)
+        if status == JobStatus.FAILED:
+            logger.warning(f"Job {job.job_id} failed after {elapsed:.1f}s: {error}")
+        else:
+            logger.info(f"Job {job.job_id} {status.value} after {elapsed:.1f}s")
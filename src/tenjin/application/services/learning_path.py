@@ -0,0 +1,229 @@
+"""Learning path planner - Deterministic ordering of theories by prerequisites."""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Sequence
+
+from ...domain.entities.theory import Theory
+from ...domain.value_objects.relationship_type import RelationshipType
+
+# Relationship types that imply a learning order, mapped to whether the
+# source theory is the prerequisite (True) or the target is (False)
+PREREQUISITE_TYPES: dict[RelationshipType, bool] = {
+    RelationshipType.INFLUENCES: True,
+    RelationshipType.INFLUENCED_BY: False,
+    RelationshipType.BUILDS_UPON: False,
+    RelationshipType.EXTENDS: False,
+    RelationshipType.DERIVED_FROM: False,
+}
+
+
+@dataclass
+class LearningStep:
+    """One theory in a learning path.
+
+    Attributes:
+        theory: Theory to learn.
+        order: Position in the path (1-based).
+        relevance: Semantic relevance to the goal (0.0-1.0).
+        prerequisites: Theories earlier in the path this one depends on.
+        known_prerequisites: Prerequisites the learner already knows.
+        unlocks: Theories later in the path that depend on this one.
+    """
+
+    theory: Theory
+    order: int
+    relevance: float
+    prerequisites: list[Theory] = field(default_factory=list)
+    known_prerequisites: list[str] = field(default_factory=list)
+    unlocks: list[Theory] = field(default_factory=list)
+
+    @property
+    def reason(self) -> str:
+        """Explain the position of the step."""
+        parts = []
+        if self.prerequisites:
+            parts.append(f"Builds on {', '.join(t.name for t in self.prerequisites)}")
+        if self.unlocks:
+            parts.append(f"Foundation for {', '.join(t.name for t in self.unlocks)}")
+        if not parts:
+            parts.append(f"Relevant to the goal (relevance {self.relevance:.2f})")
+        return "; ".join(parts)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with the step's position, reason and prerequisites.
+        """
+        return {
+            "theory_id": str(self.theory.id),
+            "name": self.theory.name,
+            "name_ja": self.theory.name_ja,
+            "order": self.order,
+            "reason": self.reason,
+            "prerequisites": [t.name for t in self.prerequisites],
+            "known_prerequisites": self.known_prerequisites,
+            "relevance": round(self.relevance, 4),
+        }
+
+
+@dataclass
+class LearningPath:
+    """Ordered learning path.
+
+    Attributes:
+        steps: Steps in learning order.
+        broken_edges: Prerequisite edges dropped to break cycles,
+            as (prerequisite ID, dependent ID) pairs.
+    """
+
+    steps: list[LearningStep] = field(default_factory=list)
+    broken_edges: list[tuple[str, str]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with the ordered steps and dropped cycle edges.
+        """
+        return {
+            "steps": [step.to_dict() for step in self.steps],
+            "broken_edges": [list(edge) for edge in self.broken_edges],
+        }
+
+
+class LearningPathPlanner:
+    """Orders theories into a learning path without an LLM.
+
+    Prerequisite edges among the candidates form a DAG. Cycles are broken
+    by adding edges strongest first and skipping any edge that would close
+    a cycle, so the weakest link of every cycle is dropped. The DAG is then
+    ordered topologically; among theories whose prerequisites are met, the
+    one with the highest combination of semantic relevance, outgoing
+    prerequisite strength and priority comes first. Ties keep the
+    candidate order, so the same inputs always give the same path.
+    """
+
+    def __init__(
+        self,
+        relevance_weight: float = 0.6,
+        strength_weight: float = 0.3,
+        priority_weight: float = 0.1,
+    ) -> None:
+        """Initialize learning path planner.
+
+        Args:
+            relevance_weight: Weight of semantic relevance to the goal.
+            strength_weight: Weight of the strength of edges to later theories.
+            priority_weight: Weight of the theory priority level.
+        """
+        self._relevance_weight = relevance_weight
+        self._strength_weight = strength_weight
+        self._priority_weight = priority_weight
+
+    def plan(
+        self,
+        theories: Sequence[Theory],
+        relevance: Mapping[str, float],
+        relationships: Iterable[Mapping[str, Any]],
+        known: Iterable[str] = (),
+    ) -> LearningPath:
+        """Order theories into a learning path.
+
+        Args:
+            theories: Candidate theories, most relevant first.
+            relevance: Semantic relevance by theory ID.
+            relationships: Relationships with source_id, target_id,
+                relationship_type and strength.
+            known: IDs of theories the learner already knows.
+
+        Returns:
+            Learning path.
+        """
+        ids = [str(t.id) for t in theories]
+        index = {theory_id: i for i, theory_id in enumerate(ids)}
+        known_ids = set(known)
+
+        # Strongest prerequisite edge per (prerequisite, dependent) pair
+        weights: dict[tuple[int, int], float] = {}
+        known_prerequisites: dict[int, set[str]] = {}
+        for rel in relationships:
+            try:
+                source_first = PREREQUISITE_TYPES.get(
+                    RelationshipType(str(rel["relationship_type"]).lower())
+                )
+            except ValueError:
+                continue
+            if source_first is None:
+                continue
+            source, target = str(rel["source_id"]), str(rel["target_id"])
+            before, after = (source, target) if source_first else (target, source)
+            if before in known_ids and after in index:
+                known_prerequisites.setdefault(index[after], set()).add(before)
+            if before not in index or after not in index or before == after:
+                continue
+            edge = (index[before], index[after])
+            weights[edge] = max(weights.get(edge, 0.0), float(rel.get("strength") or 0.0))
+
+        successors: list[set[int]] = [set() for _ in ids]
+        broken: list[tuple[str, str]] = []
+        for (before, after), _ in sorted(weights.items(), key=lambda item: (-item[1], item[0])):
+            if self._reachable(successors, after, before):
+                broken.append((ids[before], ids[after]))
+            else:
+                successors[before].add(after)
+
+        predecessors: list[set[int]] = [set() for _ in ids]
+        for before, following in enumerate(successors):
+            for after in following:
+                predecessors[after].add(before)
+
+        outgoing = [sum(weights[(i, j)] for j in successors[i]) for i in range(len(ids))]
+        peak = max(outgoing, default=0.0) or 1.0
+        keys = [
+            self._relevance_weight * relevance.get(ids[i], 0.0)
+            + self._strength_weight * outgoing[i] / peak
+            + self._priority_weight * (5 - int(t.priority)) / 4
+            for i, t in enumerate(theories)
+        ]
+
+        remaining = [len(p) for p in predecessors]
+        ready = [(-keys[i], i) for i in range(len(ids)) if remaining[i] == 0]
+        heapq.heapify(ready)
+        order: list[int] = []
+        while ready:
+            _, i = heapq.heappop(ready)
+            order.append(i)
+            for j in successors[i]:
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    heapq.heappush(ready, (-keys[j], j))
+
+        return LearningPath(
+            steps=[
+                LearningStep(
+                    theory=theories[i],
+                    order=position,
+                    relevance=relevance.get(ids[i], 0.0),
+                    prerequisites=[theories[p] for p in sorted(predecessors[i])],
+                    known_prerequisites=sorted(known_prerequisites.get(i, set())),
+                    unlocks=[theories[s] for s in sorted(successors[i])],
+                )
+                for position, i in enumerate(order, start=1)
+            ],
+            broken_edges=broken,
+        )
+
+    @staticmethod
+    def _reachable(successors: list[set[int]], start: int, goal: int) -> bool:
+        """Check whether ``goal`` can be reached from ``start``."""
+        stack, seen = [start], {start}
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                return True
+            for following in successors[node] - seen:
+                seen.add(following)
+                stack.append(following)
+        return False
@@ -0,0 +1,228 @@
+"""Link prediction - Local scoring of candidate theory relationships."""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from ...domain.entities.theory import Theory
+
+# Principle words shorter than this carry little meaning ("of", "and", "the")
+_MIN_TOKEN_LENGTH = 4
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+DEFAULT_WEIGHTS = {
+    "common_neighbors": 0.2,
+    "adamic_adar": 0.2,
+    "jaccard": 0.2,
+    "embedding": 0.4,
+}
+
+
+@dataclass
+class LinkScore:
+    """Link prediction score of one candidate theory.
+
+    Attributes:
+        theory_id: Candidate theory ID.
+        score: Weighted combination of the features (0.0-1.0).
+        common_neighbors: Theories related to both the base and the candidate.
+        adamic_adar: Common neighbours weighted by 1 / log(degree).
+        jaccard: Overlap of principle and keyword sets.
+        embedding_similarity: Cosine similarity of stored embeddings.
+    """
+
+    theory_id: str
+    score: float
+    common_neighbors: int
+    adamic_adar: float
+    jaccard: float
+    embedding_similarity: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with the combined score and its features.
+        """
+        return {
+            "theory_id": self.theory_id,
+            "score": round(self.score, 4),
+            "common_neighbors": self.common_neighbors,
+            "adamic_adar": round(self.adamic_adar, 4),
+            "jaccard": round(self.jaccard, 4),
+            "embedding_similarity": round(self.embedding_similarity, 4),
+        }
+
+
+def feature_set(theory: Theory) -> set[str]:
+    """Get the principle/keyword set of a theory.
+
+    Args:
+        theory: Theory entity.
+
+    Returns:
+        Lowercased keywords and principle words.
+    """
+    features = {keyword.strip().lower() for keyword in theory.keywords if keyword.strip()}
+    for principle in theory.key_principles:
+        features.update(
+            token
+            for token in _TOKEN_PATTERN.findall(principle.lower())
+            if len(token) >= _MIN_TOKEN_LENGTH
+        )
+    return features
+
+
+class LinkPredictor:
+    """Scores how likely unconnected theories are related.
+
+    The curated relationship graph, the theories' principle/keyword sets
+    and their embeddings are held as matrices, so scoring a base theory
+    against every other theory is a handful of vector products:
+
+    - common neighbours: ``A[b] @ A``
+    - Adamic-Adar: ``(A[b] / log(degree)) @ A``
+    - Jaccard: ``F @ F[b]`` over the binary feature incidence matrix
+    - embedding cosine: ``U @ U[b]`` over unit-normalized embeddings
+
+    Graph features are scaled by their maximum over the candidates and
+    combined with the configured weights.
+    """
+
+    def __init__(
+        self,
+        theories: Sequence[Theory],
+        relationship_pairs: Iterable[tuple[str, str]],
+        embeddings: Mapping[str, Sequence[float]] | None = None,
+        weights: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize link predictor.
+
+        Args:
+            theories: Theories to score (base and candidates).
+            relationship_pairs: Curated relationships as (source, target) pairs.
+            embeddings: Stored embeddings by theory ID; missing ones score 0.
+            weights: Feature weights (defaults to ``DEFAULT_WEIGHTS``).
+        """
+        self._ids = [str(t.id) for t in theories]
+        self._index = {theory_id: i for i, theory_id in enumerate(self._ids)}
+        self._weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        count = len(self._ids)
+
+        adjacency = np.zeros((count, count), dtype=np.float32)
+        for source, target in relationship_pairs:
+            i, j = self._index.get(source), self._index.get(target)
+            if i is not None and j is not None and i != j:
+                adjacency[i, j] = adjacency[j, i] = 1.0
+        degree = adjacency.sum(axis=1)
+        self._adjacency = adjacency
+        # Only theories with degree >= 2 can be a common neighbour of two others
+        self._inverse_log_degree = np.where(
+            degree > 1, 1.0 / np.log(np.maximum(degree, 2.0)), 0.0
+        ).astype(np.float32)
+
+        vocabulary: dict[str, int] = {}
+        incidence = [
+            [vocabulary.setdefault(f, len(vocabulary)) for f in feature_set(t)] for t in theories
+        ]
+        features = np.zeros((count, len(vocabulary)), dtype=np.float32)
+        for i, columns in enumerate(incidence):
+            features[i, columns] = 1.0
+        self._features = features
+        self._feature_counts = features.sum(axis=1)
+
+        dimensions = len(next(iter((embeddings or {}).values()), []))
+        unit = np.zeros((count, dimensions), dtype=np.float32)
+        for theory_id, vector in (embeddings or {}).items():
+            i = self._index.get(theory_id)
+            if i is not None and len(vector) == dimensions:
+                unit[i] = vector
+        norms = np.linalg.norm(unit, axis=1, keepdims=True)
+        self._unit = unit / np.where(norms == 0, 1.0, norms)
+
+    def score(
+        self,
+        theory_id: str,
+        candidate_ids: Sequence[str] | None = None,
+    ) -> list[LinkScore]:
+        """Score candidates against a base theory.
+
+        Args:
+            theory_id: Base theory ID.
+            candidate_ids: Candidates to score (defaults to all other theories).
+
+        Returns:
+            Scores in candidate order.
+
+        Raises:
+            KeyError: If the base theory is unknown.
+        """
+        base = self._index[theory_id]
+        if candidate_ids is None:
+            candidate_ids = [c for c in self._ids if c != theory_id]
+        known = [c for c in candidate_ids if c in self._index and c != theory_id]
+        if not known:
+            return []
+        idx = np.array([self._index[c] for c in known], dtype=np.int64)
+
+        row = self._adjacency[base]
+        common = (row @ self._adjacency)[idx]
+        adamic = ((row * self._inverse_log_degree) @ self._adjacency)[idx]
+
+        intersection = (self._features @ self._features[base])[idx]
+        union = self._feature_counts[idx] + self._feature_counts[base] - intersection
+        jaccard = np.divide(
+            intersection, union, out=np.zeros_like(intersection), where=union > 0
+        )
+
+        cosine = np.clip((self._unit @ self._unit[base])[idx], 0.0, 1.0)
+
+        combined = (
+            self._weights["common_neighbors"] * self._scaled(common)
+            + self._weights["adamic_adar"] * self._scaled(adamic)
+            + self._weights["jaccard"] * jaccard
+            + self._weights["embedding"] * cosine
+        )
+        total = sum(self._weights.values())
+        if total > 0:
+            combined = combined / total
+
+        return [
+            LinkScore(
+                theory_id=candidate,
+                score=float(combined[k]),
+                common_neighbors=int(common[k]),
+                adamic_adar=float(adamic[k]),
+                jaccard=float(jaccard[k]),
+                embedding_similarity=float(cosine[k]),
+            )
+            for k, candidate in enumerate(known)
+        ]
+
+    def top_k(
+        self,
+        theory_id: str,
+        candidate_ids: Sequence[str] | None = None,
+        k: int = 8,
+    ) -> list[LinkScore]:
+        """Get the highest-scoring candidates.
+
+        Args:
+            theory_id: Base theory ID.
+            candidate_ids: Candidates to score (defaults to all other theories).
+            k: Number of candidates returned.
+
+        Returns:
+            Up to ``k`` scores, best first (ties keep candidate order).
+        """
+        scores = self.score(theory_id, candidate_ids)
+        order = np.argsort([-s.score for s in scores], kind="stable")[:k]
+        return [scores[i] for i in order]
+
+    @staticmethod
+    def _scaled(values: np.ndarray) -> np.ndarray:
+        """Scale non-negative values to 0-1 by their maximum."""
+        peak = float(values.max()) if values.size else 0.0
+        return values / peak if peak > 0 else values
@@ -1,19 +1,27 @@
 """MethodologyService - Methodology operations."""
 
+import json
 from typing import Any
 
 from ...domain.entities.methodology import Methodology
+from ...domain.repositories.methodology_repository import MethodologyRepository
 from ...domain.repositories.theory_repository import TheoryRepository
 from ...domain.repositories.vector_repository import VectorRepository
 from ...domain.value_objects.theory_id import TheoryId
 from ...domain.value_objects.methodology_id import MethodologyId
 from ...domain.value_objects.search_query import SearchQuery
 from ...infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from ...infrastructure.adapters.streaming import ProgressCallback, stream_json_fields
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
+from ...infrastructure.repositories.memory_methodology_repository import (
+    InMemoryMethodologyRepository,
+)
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class MethodologyService:
     """Service for methodology operations.
 
@@ -26,6 +34,7 @@ class MethodologyService:
         theory_repository: TheoryRepository,
         vector_repository: VectorRepository,
         llm_adapter: EsperantoAdapter,
+        methodology_repository: MethodologyRepository | None = None,
     ) -> None:
         """Initialize methodology service.
 
@@ -33,11 +42,13 @@ class MethodologyService:
             theory_repository: Repository for theory data.
             vector_repository: Repository for vector search.
             llm_adapter: LLM adapter for AI guidance.
+            methodology_repository: Repository for methodologies
+                (in process memory if omitted).
         """
         self._theory_repo = theory_repository
         self._vector_repo = vector_repository
         self._llm = llm_adapter
-        self._methodologies: dict[str, Methodology] = {}
+        self._methodologies = methodology_repository or InMemoryMethodologyRepository()
 
     async def get_methodology(
         self,
@@ -56,7 +67,7 @@ class MethodologyService:
         except ValueError:
             return {"error": "Invalid methodology ID"}
 
-        methodology = self._methodologies.get(str(mid))
+        methodology = await self._methodologies.get(str(mid))
         if not methodology:
             return {"error": "Methodology not found"}
 
@@ -82,7 +93,7 @@ class MethodologyService:
         Returns:
             List of methodologies.
         """
-        methodologies = list(self._methodologies.values())
+        methodologies = list(await self._methodologies.list_all())
 
         # Apply filters
         if theory_id:
@@ -133,7 +144,7 @@ class MethodologyService:
 
         methodologies = []
         for result in results.results:
-            methodology = self._methodologies.get(str(result.entity_id))
+            methodology = await self._methodologies.get(str(result.entity_id))
             if methodology:
                 methodologies.append({
                     "methodology": methodology.to_dict(),
@@ -169,7 +180,7 @@ class MethodologyService:
 
         # Get associated methodologies
         associated = [
-            m for m in self._methodologies.values()
+            m for m in await self._methodologies.list_all()
             if theory_id in [str(tid) for tid in m.theory_ids]
         ]
 
@@ -280,12 +291,14 @@ Provide a brief 2-3 sentence explanation."""
         self,
         methodology_id: str,
         context: str = "",
+        on_progress: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Get implementation guide for a methodology.
 
         Args:
             methodology_id: Methodology identifier.
             context: Optional implementation context.
+            on_progress: Receives guide sections as they are generated.
 
         Returns:
             Implementation guide.
@@ -295,7 +308,7 @@ Provide a brief 2-3 sentence explanation."""
         except ValueError:
             return {"error": "Invalid methodology ID"}
 
-        methodology = self._methodologies.get(str(mid))
+        methodology = await self._methodologies.get(str(mid))
         if not methodology:
             return {"error": "Methodology not found"}
 
@@ -319,8 +332,12 @@ Provide a comprehensive guide in JSON format with:
 Return valid JSON only."""
 
         try:
-            response = await self._llm.generate(prompt)
-            import json
+            if on_progress:
+                response = await stream_json_fields(
+                    self._llm, prompt, None, on_progress, "implementation_guide"
+                )
+            else:
+                response = await self._llm.generate(prompt)
             guide = json.loads(response)
         except Exception as e:
             logger.warning(f"Guide generation failed: {e}")
@@ -370,7 +387,7 @@ Return valid JSON only."""
                 evidence_level=data.get("evidence_level", "moderate"),
             )
 
-            self._methodologies[str(methodology.id)] = methodology
+            await self._methodologies.save(methodology)
 
             # Index in vector store
             await self._vector_repo.upsert(
@@ -408,7 +425,7 @@ Return valid JSON only."""
         except ValueError:
             return {"error": "Invalid methodology ID"}
 
-        methodology = self._methodologies.get(str(mid))
+        methodology = await self._methodologies.get(str(mid))
         if not methodology:
             return {"error": "Methodology not found"}
 
@@ -424,7 +441,7 @@ Return valid JSON only."""
         if "benefits" in data:
             methodology.benefits = data["benefits"]
 
-        self._methodologies[str(mid)] = methodology
+        await self._methodologies.save(methodology)
 
         # Update vector index
         await self._vector_repo.upsert(
@@ -456,11 +473,9 @@ Return valid JSON only."""
         except ValueError:
             return {"error": "Invalid methodology ID"}
 
-        if str(mid) not in self._methodologies:
+        if not await self._methodologies.delete(str(mid)):
             return {"error": "Methodology not found"}
 
-        del self._methodologies[str(mid)]
-
         return {
             "methodology_id": methodology_id,
             "status": "deleted",
@@ -472,7 +487,7 @@ Return valid JSON only."""
         Returns:
             Methodology statistics.
         """
-        methodologies = list(self._methodologies.values())
+        methodologies = list(await self._methodologies.list_all())
 
         # Count by category
         category_counts: dict[str, int] = {}
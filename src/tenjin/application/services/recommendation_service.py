@@ -1,6 +1,9 @@
 """RecommendationService - Theory recommendation operations."""
 
-from typing import Any
+import asyncio
+import json
+import re
+from typing import Any, Literal
 
 from ...domain.entities.theory import Theory
 from ...domain.repositories.theory_repository import TheoryRepository
@@ -8,12 +11,19 @@ from ...domain.repositories.vector_repository import VectorRepository
 from ...domain.repositories.graph_repository import GraphRepository
 from ...domain.value_objects.category_type import CategoryType
 from ...domain.value_objects.search_query import SearchQuery
+from ...infrastructure.adapters.deadline import gather_or_cancel
 from ...infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
+from .learning_path import PREREQUISITE_TYPES, LearningPathPlanner
 
 logger = get_logger(__name__)
 
+ExplanationMode = Literal["batch", "gather", "sequential"]
 
+
+@trace_methods("service")
 class RecommendationService:
     """Service for theory recommendation operations.
 
@@ -27,6 +37,8 @@ class RecommendationService:
         vector_repository: VectorRepository,
         graph_repository: GraphRepository,
         llm_adapter: EsperantoAdapter,
+        explanation_mode: ExplanationMode | None = None,
+        explanation_concurrency: int | None = None,
     ) -> None:
         """Initialize recommendation service.
 
@@ -35,11 +47,20 @@ class RecommendationService:
             vector_repository: Repository for vector search.
             graph_repository: Repository for relationship data.
             llm_adapter: LLM adapter for AI recommendations.
+            explanation_mode: How recommendation explanations are generated:
+                "batch" (one structured call for all theories), "gather"
+                (one call per theory, run concurrently), or "sequential".
+            explanation_concurrency: Maximum concurrent calls in "gather" mode.
         """
+        settings = get_settings()
         self._theory_repo = theory_repository
         self._vector_repo = vector_repository
         self._graph_repo = graph_repository
         self._llm = llm_adapter
+        self._explanation_mode = explanation_mode or settings.llm.explanation_mode
+        self._explanation_concurrency = (
+            explanation_concurrency or settings.llm.explanation_concurrency
+        )
 
     async def recommend_for_context(
         self,
@@ -141,12 +162,12 @@ class RecommendationService:
         Returns:
             Recommendations with explanations.
         """
-        recommendations = []
-
-        for theory, score in theories:
-            # Generate personalized explanation
-            explanation = await self._generate_explanation(context, theory)
+        explanations = await self._generate_explanations(
+            context, [theory for theory, _ in theories]
+        )
 
+        recommendations = []
+        for (theory, score), explanation in zip(theories, explanations, strict=True):
             recommendations.append({
                 "theory": theory.to_dict(),
                 "relevance_score": score,
@@ -157,6 +178,148 @@ class RecommendationService:
 
         return recommendations
 
+    async def _generate_explanations(
+        self,
+        context: str,
+        theories: list[Theory],
+    ) -> list[str]:
+        """Generate explanations for several theories using the configured mode.
+
+        Args:
+            context: Educational context.
+            theories: Recommended theories.
+
+        Returns:
+            Explanations in the same order as theories.
+        """
+        if not theories:
+            return []
+        if self._explanation_mode == "batch" and len(theories) > 1:
+            return await self._generate_explanations_batch(context, theories)
+        if self._explanation_mode == "gather":
+            return await self._generate_explanations_gather(context, theories)
+        return [await self._generate_explanation(context, t) for t in theories]
+
+    async def _generate_explanations_gather(
+        self,
+        context: str,
+        theories: list[Theory],
+    ) -> list[str]:
+        """Generate one explanation per theory with bounded concurrency.
+
+        Args:
+            context: Educational context.
+            theories: Recommended theories.
+
+        Returns:
+            Explanations in the same order as theories.
+        """
+        semaphore = asyncio.Semaphore(self._explanation_concurrency)
+
+        async def explain(theory: Theory) -> str:
+            async with semaphore:
+                return await self._generate_explanation(context, theory)
+
+        return await gather_or_cancel(*(explain(t) for t in theories))
+
+    async def _generate_explanations_batch(
+        self,
+        context: str,
+        theories: list[Theory],
+    ) -> list[str]:
+        """Generate explanations for all theories in one structured LLM call.
+
+        The response must be a JSON array of {"theory_id", "explanation"}
+        objects. Entries for unknown theory IDs are ignored; theories missing
+        from a valid response are explained individually (gather mode), as
+        are all theories if the call itself fails; templates are used only
+        for theories whose individual call fails as well.
+
+        Args:
+            context: Educational context.
+            theories: Recommended theories.
+
+        Returns:
+            Explanations in the same order as theories.
+        """
+        theory_list = "\n\n".join(
+            f"""- theory_id: {theory.id}
+  Theory: {theory.name}
+  Description: {theory.description}
+  Key principles: {', '.join(theory.key_principles[:3])}
+  Applications: {', '.join(theory.applications[:3])}"""
+            for theory in theories
+        )
+        prompt = f"""For each theory below, explain in 2-3 sentences why it is \
+suitable for this context.
+Context: {context}
+
+Theories:
+{theory_list}
+
+Return a JSON array with one object per theory, using the theory_id exactly as given:
+[{{"theory_id": "...", "explanation": "..."}}]
+
+Return valid JSON only."""
+
+        try:
+            response = await self._llm.generate(prompt)
+        except Exception as e:
+            logger.warning(f"Batch explanation generation failed, explaining individually: {e}")
+            return await self._generate_explanations_gather(context, theories)
+
+        explained = self._parse_explanations(response, {str(t.id) for t in theories})
+        missing = [t for t in theories if str(t.id) not in explained]
+        if missing:
+            logger.info(
+                f"Batch explanation response covered {len(theories) - len(missing)}/"
+                f"{len(theories)} theories, explaining the rest individually"
+            )
+            for theory, text in zip(
+                missing,
+                await self._generate_explanations_gather(context, missing),
+                strict=True,
+            ):
+                explained[str(theory.id)] = text
+
+        return [explained[str(t.id)] for t in theories]
+
+    @staticmethod
+    def _parse_explanations(response: str, theory_ids: set[str]) -> dict[str, str]:
+        """Parse a batched explanation response.
+
+        Args:
+            response: LLM response text (optionally wrapped in a code fence).
+            theory_ids: IDs of the candidate theories.
+
+        Returns:
+            Mapping of theory ID to explanation for valid entries only.
+        """
+        text = re.sub(r"^```(?:json)?\s*|\s*```$", "", response.strip())
+        try:
+            # Tolerate prose before or after the array
+            items, _ = json.JSONDecoder().raw_decode(text, max(text.find("["), 0))
+        except json.JSONDecodeError:
+            logger.warning("Batch explanation response is not valid JSON")
+            return {}
+        if not isinstance(items, list):
+            return {}
+
+        explained: dict[str, str] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            theory_id = str(item.get("theory_id", ""))
+            explanation = item.get("explanation")
+            if (
+                theory_id in theory_ids
+                and theory_id not in explained
+                and isinstance(explanation, str)
+                and explanation.strip()
+            ):
+                explained[theory_id] = explanation.strip()
+        return explained
+
     async def _generate_explanation(
         self,
         context: str,
@@ -186,7 +349,19 @@ Provide a brief, practical explanation of the fit."""
             return response.strip()
         except Exception as e:
             logger.warning(f"Explanation generation failed: {e}")
-            return f"{theory.name} aligns with your context through its focus on {theory.key_principles[0] if theory.key_principles else 'learning'}."
+            return self._fallback_explanation(theory)
+
+    @staticmethod
+    def _fallback_explanation(theory: Theory) -> str:
+        """Build a template explanation used when the LLM is unavailable.
+
+        Args:
+            theory: Recommended theory.
+
+        Returns:
+            Explanation text.
+        """
+        return f"{theory.name} aligns with your context through its focus on {theory.key_principles[0] if theory.key_principles else 'learning'}."
 
     async def recommend_similar(
         self,
@@ -402,12 +577,17 @@ Provide a brief explanation of how they work together."""
         self,
         goal: str,
         current_knowledge: list[str] | None = None,
+        narrate: bool = False,
     ) -> dict[str, Any]:
         """Generate a learning path of theories for a goal.
 
+        The order is computed locally from prerequisite relationships and
+        semantic relevance, so the same inputs always give the same path.
+
         Args:
             goal: Learning or teaching goal.
             current_knowledge: Already known theories.
+            narrate: Also have the LLM describe the computed path.
 
         Returns:
             Ordered learning path.
@@ -423,44 +603,62 @@ Provide a brief explanation of how they work together."""
         results = await self._vector_repo.semantic_search(query)
 
         candidates = []
+        relevance: dict[str, float] = {}
         for result in results.results:
             if str(result.id) not in current_knowledge:
                 theory = await self._theory_repo.get_by_id(result.id)
                 if theory:
                     candidates.append(theory)
+                    relevance[str(theory.id)] = result.score
 
-        # Use LLM to order into learning path
+        relationships: list[dict[str, Any]] = []
         if candidates:
-            path_prompt = f"""Create a learning path for this goal: {goal}
-
-Available theories (order these from foundational to advanced):
-{chr(10).join(f'- {t.name}: {t.description[:100]}' for t in candidates)}
-
-Already known: {', '.join(current_knowledge) if current_knowledge else 'None'}
-
-Return as JSON array with objects containing:
-- name: theory name
-- order: sequence number (1-based)
-- reason: why at this position
-- prerequisites: what should be learned first
-
-Return valid JSON only."""
-
             try:
-                response = await self._llm.generate(path_prompt)
-                import json
-
-                path = json.loads(response)
-            except Exception:
-                path = [{"name": t.name, "order": i + 1, "reason": "Relevance"} 
-                       for i, t in enumerate(candidates)]
-
-        else:
-            path = []
+                relationships = list(
+                    await self._graph_repo.get_relationships_among(
+                        [str(t.id) for t in candidates] + current_knowledge,
+                        list(PREREQUISITE_TYPES),
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Prerequisite relationships unavailable: {e}")
+
+        plan = LearningPathPlanner().plan(
+            candidates, relevance, relationships, known=current_knowledge
+        )
+        path = [step.to_dict() for step in plan.steps]
 
-        return {
+        result = {
             "goal": goal,
             "current_knowledge": current_knowledge,
             "learning_path": path,
             "estimated_theories": len(path),
+            "broken_cycles": [list(edge) for edge in plan.broken_edges],
         }
+        if narrate and path:
+            result["narrative"] = await self._narrate_learning_path(goal, path)
+        return result
+
+    async def _narrate_learning_path(self, goal: str, path: list[dict[str, Any]]) -> str:
+        """Describe an already ordered learning path.
+
+        Args:
+            goal: Learning or teaching goal.
+            path: Ordered learning path steps.
+
+        Returns:
+            Narrative text, or an empty string if generation fails.
+        """
+        steps = "\n".join(f"{step['order']}. {step['name']}: {step['reason']}" for step in path)
+        prompt = f"""Describe this learning path for the goal: {goal}
+
+{steps}
+
+Keep the order exactly as given. In 1-2 sentences per step, explain what the
+learner gains at that step and how it prepares the next one."""
+
+        try:
+            return await self._llm.generate(prompt, operation="learning_path_narration")
+        except Exception as e:
+            logger.warning(f"Learning path narration failed: {e}")
+            return ""
@@ -0,0 +1,426 @@
+"""Relationship precomputation service - Offline inference of theory relationships."""
+
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from ...domain.entities.theory import Theory
+from ...domain.repositories.graph_repository import GraphRepository
+from ...domain.repositories.theory_repository import TheoryRepository
+from ...domain.repositories.vector_repository import VectorRepository
+from ...infrastructure.adapters.deadline import gather_or_cancel
+from ...infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from ...infrastructure.adapters.streaming import ProgressCallback
+from ...infrastructure.adapters.tracing import trace_methods
+from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
+
+logger = get_logger(__name__)
+
+# Theories fetched per page and similarity rows computed per block
+_PAGE_SIZE = 500
+_BLOCK_SIZE = 1024
+
+
+async def load_catalog(theory_repo: TheoryRepository) -> list[Theory]:
+    """Load every theory, page by page (``get_all`` alone is capped).
+
+    Args:
+        theory_repo: Theory repository.
+
+    Returns:
+        All theories.
+    """
+    theories: list[Theory] = []
+    offset = 0
+    while True:
+        page = list(await theory_repo.get_all(limit=_PAGE_SIZE, offset=offset))
+        theories.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return theories
+        offset += _PAGE_SIZE
+
+
+_PAIR_DIRECTIONS = {
+    "a_to_b": "source_to_target",
+    "b_to_a": "target_to_source",
+    "bidirectional": "bidirectional",
+}
+
+
+@dataclass
+class CandidatePair:
+    """Unconnected theory pair selected for LLM judgement.
+
+    Attributes:
+        source_id: ID of the first theory (lower catalog index).
+        target_id: ID of the second theory.
+        similarity: Embedding cosine similarity.
+    """
+
+    source_id: str
+    target_id: str
+    similarity: float
+
+    @property
+    def key(self) -> str:
+        """Checkpoint key of the pair."""
+        return f"{self.source_id}|{self.target_id}"
+
+
+@dataclass
+class PrecomputeReport:
+    """Outcome of a relationship precomputation run.
+
+    Attributes:
+        theories: Theories in the catalog.
+        theories_without_embedding: Theories skipped for lack of a vector.
+        candidate_pairs: Pairs selected by embedding similarity.
+        resumed_pairs: Pairs already judged by an earlier run.
+        judged_pairs: Pairs judged by the LLM in this run.
+        llm_calls: LLM batch calls made.
+        failed_batches: Batches that failed and will be retried next run.
+        relationships_stored: Inferred edges written to the graph.
+        elapsed_seconds: Wall-clock duration.
+    """
+
+    theories: int = 0
+    theories_without_embedding: int = 0
+    candidate_pairs: int = 0
+    resumed_pairs: int = 0
+    judged_pairs: int = 0
+    llm_calls: int = 0
+    failed_batches: int = 0
+    relationships_stored: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with all report fields.
+        """
+        return {
+            "theories": self.theories,
+            "theories_without_embedding": self.theories_without_embedding,
+            "candidate_pairs": self.candidate_pairs,
+            "resumed_pairs": self.resumed_pairs,
+            "judged_pairs": self.judged_pairs,
+            "llm_calls": self.llm_calls,
+            "failed_batches": self.failed_batches,
+            "relationships_stored": self.relationships_stored,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+
+@trace_methods("service")
+class RelationshipPrecomputeService:
+    """Service inferring relationships across the whole catalog in batch.
+
+    Candidate pairs are the most similar (by stored embedding) theories
+    that have no curated relationship yet. Pairs are judged by the LLM in
+    batches; accepted relationships are stored as inferred edges with a
+    confidence, and every finished batch is checkpointed so an interrupted
+    run resumes where it stopped. Online relationship inference then only
+    looks up the stored edges.
+    """
+
+    def __init__(
+        self,
+        theory_repository: TheoryRepository,
+        vector_repository: VectorRepository,
+        graph_repository: GraphRepository,
+        llm_adapter: EsperantoAdapter,
+        checkpoint_path: str | Path | None = None,
+    ) -> None:
+        """Initialize relationship precomputation service.
+
+        Args:
+            theory_repository: Repository for theory data.
+            vector_repository: Repository for stored embeddings.
+            graph_repository: Repository for graph relationships.
+            llm_adapter: LLM adapter for pair judgement.
+            checkpoint_path: Checkpoint file (defaults to settings).
+        """
+        self._theory_repo = theory_repository
+        self._vector_repo = vector_repository
+        self._graph_repo = graph_repository
+        self._llm = llm_adapter
+        self._settings = get_settings().inference
+        self._checkpoint_path = Path(checkpoint_path or self._settings.precompute_checkpoint)
+
+    async def precompute(
+        self,
+        restart: bool = False,
+        max_pairs: int | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> PrecomputeReport:
+        """Infer and store relationships for the most promising pairs.
+
+        Args:
+            restart: Discard the checkpoint and stored inferred edges first.
+            max_pairs: Maximum candidate pairs (defaults to settings).
+            on_progress: Receives a JSON progress message per finished batch.
+
+        Returns:
+            Precomputation report.
+        """
+        started = time.monotonic()
+        report = PrecomputeReport()
+        settings = self._settings
+
+        if restart:
+            self._checkpoint_path.unlink(missing_ok=True)
+            deleted = await self._graph_repo.delete_inferred_relationships()
+            logger.info(f"Restarting precomputation, removed {deleted} inferred relationships")
+
+        theories = await self._load_theories()
+        report.theories = len(theories)
+        vectors = await self._vector_repo.get_embeddings([str(t.id) for t in theories])
+        embedded = [t for t in theories if str(t.id) in vectors]
+        report.theories_without_embedding = len(theories) - len(embedded)
+        if report.theories_without_embedding:
+            logger.warning(
+                f"{report.theories_without_embedding} theories have no stored embedding "
+                "and are skipped"
+            )
+
+        connected = set(await self._graph_repo.get_relationship_pairs())
+        pairs = self.select_candidate_pairs(
+            [str(t.id) for t in embedded],
+            np.asarray([vectors[str(t.id)] for t in embedded], dtype=np.float32),
+            connected,
+            neighbors=settings.precompute_neighbors,
+            min_similarity=settings.precompute_min_similarity,
+            max_pairs=max_pairs or settings.precompute_max_pairs,
+        )
+        report.candidate_pairs = len(pairs)
+
+        checkpoint = self._load_checkpoint()
+        done: set[str] = set(checkpoint.get("judged", []))
+        pending = [p for p in pairs if p.key not in done]
+        report.resumed_pairs = len(pairs) - len(pending)
+        logger.info(
+            f"Precomputing relationships: {len(pairs)} candidate pairs, "
+            f"{report.resumed_pairs} already judged"
+        )
+
+        by_id = {str(t.id): t for t in embedded}
+        batch_size = settings.precompute_batch_size
+        batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+        semaphore = asyncio.Semaphore(settings.precompute_concurrency)
+        checkpoint_lock = asyncio.Lock()
+
+        async def run_batch(batch: list[CandidatePair]) -> None:
+            async with semaphore:
+                report.llm_calls += 1
+                try:
+                    inferred = await self._judge_pairs(batch, by_id)
+                except Exception as e:
+                    report.failed_batches += 1
+                    logger.warning(f"Relationship batch failed, will retry next run: {e}")
+                    return
+                stored = await self._graph_repo.save_inferred_relationships(inferred)
+
+            async with checkpoint_lock:
+                report.judged_pairs += len(batch)
+                report.relationships_stored += stored
+                done.update(p.key for p in batch)
+                checkpoint["stored"] = checkpoint.get("stored", 0) + stored
+                self._save_checkpoint(done, checkpoint["stored"])
+                if on_progress:
+                    await on_progress(
+                        json.dumps(
+                            {
+                                "judged_pairs": report.resumed_pairs + report.judged_pairs,
+                                "candidate_pairs": report.candidate_pairs,
+                                "relationships_stored": report.relationships_stored,
+                            }
+                        )
+                    )
+
+        await gather_or_cancel(*(run_batch(batch) for batch in batches))
+
+        report.elapsed_seconds = time.monotonic() - started
+        logger.info(f"Relationship precomputation finished: {report.to_dict()}")
+        return report
+
+    async def _load_theories(self) -> list[Theory]:
+        """Load the whole catalog page by page."""
+        return await load_catalog(self._theory_repo)
+
+    @staticmethod
+    def select_candidate_pairs(
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        connected: set[tuple[str, str]],
+        neighbors: int = 5,
+        min_similarity: float = 0.3,
+        max_pairs: int = 2000,
+    ) -> list[CandidatePair]:
+        """Pick the most similar unconnected theory pairs.
+
+        For every theory the ``neighbors`` most similar theories without a
+        curated relationship are taken; the union of these pairs is ranked
+        by cosine similarity.
+
+        Args:
+            ids: Theory IDs, one per vector row.
+            vectors: Embedding matrix (rows in ``ids`` order).
+            connected: Pairs that already have a relationship (any direction).
+            neighbors: Candidates per theory.
+            min_similarity: Minimum cosine similarity.
+            max_pairs: Maximum pairs returned.
+
+        Returns:
+            Candidate pairs, most similar first.
+        """
+        count = len(ids)
+        if count < 2:
+            return []
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        unit = vectors / np.where(norms == 0, 1.0, norms)
+        index = {theory_id: i for i, theory_id in enumerate(ids)}
+        k = min(neighbors, count - 1)
+
+        # Connected pairs in both directions as index arrays
+        linked = [(index[a], index[b]) for a, b in connected if a in index and b in index]
+        link_rows = np.array([i for i, j in linked] + [j for i, j in linked], dtype=np.int64)
+        link_cols = np.array([j for i, j in linked] + [i for i, j in linked], dtype=np.int64)
+
+        best: dict[tuple[int, int], float] = {}
+        for start in range(0, count, _BLOCK_SIZE):
+            block = unit[start : start + _BLOCK_SIZE] @ unit.T
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = -np.inf
+            in_block = (link_rows >= start) & (link_rows < start + len(rows))
+            block[link_rows[in_block] - start, link_cols[in_block]] = -np.inf
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            for row, columns in enumerate(top):
+                i = row + start
+                for j in columns:
+                    similarity = float(block[row, j])
+                    if similarity >= min_similarity:
+                        best[(min(i, j), max(i, j))] = similarity
+
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)[:max_pairs]
+        return [CandidatePair(ids[i], ids[j], round(sim, 4)) for (i, j), sim in ranked]
+
+    async def _judge_pairs(
+        self,
+        pairs: list[CandidatePair],
+        theories: dict[str, Theory],
+    ) -> list[dict[str, Any]]:
+        """Ask the LLM which pairs are related.
+
+        Args:
+            pairs: Candidate pairs.
+            theories: Theories by ID.
+
+        Returns:
+            Inferred relationships at or above the minimum confidence.
+        """
+
+        def describe(theory: Theory) -> str:
+            return (
+                f"{theory.name} ({theory.category.display_name}): "
+                f"{theory.description[:200]} "
+                f"Principles: {', '.join(theory.key_principles[:3])}"
+            )
+
+        pair_desc = "\n".join(
+            f"{i + 1}. A: {describe(theories[p.source_id])}\n"
+            f"   B: {describe(theories[p.target_id])}"
+            for i, p in enumerate(pairs)
+        )
+
+        prompt = f"""Judge whether each pair of educational theories has a meaningful
+theoretical relationship.
+
+PAIRS:
+{pair_desc}
+
+Relationship types: "foundation", "extension", "complement", "contrast", "application", "synthesis".
+
+Return JSON:
+{{
+  "relationships": [
+    {{
+      "pair_index": <1-based>,
+      "relationship_type": "<type>",
+      "confidence": <0.0-1.0>,
+      "direction": "a_to_b" | "b_to_a" | "bidirectional",
+      "evidence": "<reasoning for this relationship>",
+      "practical_implications": "<how this relationship is useful>"
+    }}
+  ]
+}}
+
+Omit pairs without a meaningful relationship.
+Return valid JSON only."""
+
+        system_prompt = """You are an expert in educational theory and epistemology.
+Identify genuine theoretical relationships based on scholarly analysis.
+Always respond with valid JSON."""
+
+        response = await self._llm.generate(
+            prompt, system_prompt, operation="relationship_precompute"
+        )
+        text = re.sub(r"^```(?:json)?\s*|\s*```$", "", response.strip())
+        result, _ = json.JSONDecoder().raw_decode(text, max(text.find("{"), 0))
+        items = result.get("relationships", []) if isinstance(result, dict) else []
+
+        inferred: dict[int, dict[str, Any]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                idx = int(item.get("pair_index", 0)) - 1
+                confidence = float(item.get("confidence", 0.0))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= idx < len(pairs) or idx in inferred:
+                continue
+            if confidence < self._settings.min_confidence:
+                continue
+            pair = pairs[idx]
+            inferred[idx] = {
+                "source_id": pair.source_id,
+                "target_id": pair.target_id,
+                "relationship_type": str(item.get("relationship_type", "unknown")),
+                "confidence": min(confidence, 1.0),
+                "direction": _PAIR_DIRECTIONS.get(
+                    str(item.get("direction")), "bidirectional"
+                ),
+                "evidence": str(item.get("evidence", "")),
+                "practical_implications": str(item.get("practical_implications", "")),
+                "similarity": pair.similarity,
+            }
+        return list(inferred.values())
+
+    def _load_checkpoint(self) -> dict[str, Any]:
+        """Load the checkpoint, or an empty one if missing or unreadable."""
+        try:
+            return json.loads(self._checkpoint_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self._checkpoint_path}: {e}")
+            return {}
+
+    def _save_checkpoint(self, judged: set[str], stored: int) -> None:
+        """Atomically write the checkpoint."""
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._checkpoint_path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"judged": sorted(judged), "stored": stored, "updated_at": time.time()}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._checkpoint_path)
@@ -8,11 +8,14 @@ from ...domain.value_objects.search_query import SearchQuery
 from ...domain.value_objects.search_result import SearchResult, SearchResults
 from ...domain.value_objects.category_type import CategoryType
 from ...domain.value_objects.priority_level import PriorityLevel
+from ...infrastructure.adapters.deadline import gather_or_cancel
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class SearchService:
     """Service for search operations.
 
@@ -414,8 +417,6 @@ class SearchService:
         Returns:
             Batch results with individual results and aggregations
         """
-        import asyncio
-
         logger.info(f"Batch search: {len(queries)} queries")
 
         # Execute searches concurrently
@@ -461,7 +462,7 @@ class SearchService:
 
         # Run all searches concurrently
         tasks = [execute_single(q, i) for i, q in enumerate(queries)]
-        individual_results = await asyncio.gather(*tasks)
+        individual_results = await gather_or_cancel(*tasks)
 
         # Calculate aggregations
         successful = [r for r in individual_results if r["success"]]
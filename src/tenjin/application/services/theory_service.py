@@ -9,11 +9,13 @@ from ...domain.repositories.theory_repository import TheoryRepository
 from ...domain.value_objects.theory_id import TheoryId
 from ...domain.value_objects.category_type import CategoryType
 from ...domain.value_objects.priority_level import PriorityLevel
+from ...infrastructure.adapters.tracing import trace_methods
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("service")
 class TheoryService:
     """Service for theory-related business operations.
 
@@ -84,3 +84,25 @@ class Methodology:
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Methodology":
+        """Create a methodology from its dictionary representation.
+
+        Args:
+            data: Dictionary as returned by ``to_dict``.
+
+        Returns:
+            Methodology instance.
+        """
+        return cls(
+            id=MethodologyId.from_string(data["id"]),
+            name=data["name"],
+            name_ja=data.get("name_ja"),
+            description=data.get("description", ""),
+            description_ja=data.get("description_ja", ""),
+            steps=list(data.get("steps", [])),
+            related_theory_ids=list(data.get("related_theory_ids", [])),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
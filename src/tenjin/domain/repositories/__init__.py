@@ -3,9 +3,11 @@
 from .theory_repository import TheoryRepository
 from .graph_repository import GraphRepository
 from .vector_repository import VectorRepository
+from .methodology_repository import MethodologyRepository
 
 __all__ = [
     "TheoryRepository",
     "GraphRepository",
     "VectorRepository",
+    "MethodologyRepository",
 ]
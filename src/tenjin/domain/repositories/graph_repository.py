@@ -188,6 +188,82 @@ class GraphRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_relationships_among(
+        self,
+        theory_ids: Sequence[str],
+        relationship_types: Sequence[RelationshipType] | None = None,
+    ) -> Sequence[dict[str, Any]]:
+        """Get curated relationships whose both ends are in a set of theories.
+
+        Args:
+            theory_ids: Theory IDs.
+            relationship_types: Relationship types to include (all if None).
+
+        Returns:
+            Relationships with source_id, target_id, relationship_type and strength.
+        """
+        ...
+
+    @abstractmethod
+    async def get_relationship_pairs(self) -> Sequence[tuple[str, str]]:
+        """Get the theory pairs connected by curated relationships.
+
+        Inferred relationships are not included.
+
+        Returns:
+            Sequence of (source ID, target ID) pairs.
+        """
+        ...
+
+    @abstractmethod
+    async def save_inferred_relationships(
+        self,
+        relationships: Sequence[dict[str, Any]],
+    ) -> int:
+        """Store LLM-inferred relationships, replacing earlier ones per pair.
+
+        Args:
+            relationships: Relationships with ``source_id``, ``target_id``,
+                ``relationship_type``, ``confidence``, ``direction``
+                (``source_to_target``, ``target_to_source`` or
+                ``bidirectional``), ``evidence`` and
+                ``practical_implications``.
+
+        Returns:
+            Number of relationships stored.
+        """
+        ...
+
+    @abstractmethod
+    async def get_inferred_relationships(
+        self,
+        theory_id: str,
+        min_confidence: float = 0.0,
+        limit: int = 20,
+    ) -> Sequence[dict[str, Any]]:
+        """Get stored inferred relationships of a theory.
+
+        Args:
+            theory_id: Theory ID.
+            min_confidence: Minimum confidence.
+            limit: Maximum number of results.
+
+        Returns:
+            Related theory data with relationship type, confidence, and
+            direction relative to the given theory, highest confidence first.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_inferred_relationships(self) -> int:
+        """Delete all stored inferred relationships.
+
+        Returns:
+            Number of relationships deleted.
+        """
+        ...
+
     @abstractmethod
     async def execute_cypher(
         self,
@@ -0,0 +1,52 @@
+"""MethodologyRepository interface - Abstract repository for methodologies."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from ..entities.methodology import Methodology
+
+
+class MethodologyRepository(ABC):
+    """Abstract repository interface for user-defined methodologies."""
+
+    @abstractmethod
+    async def get(self, methodology_id: str) -> Methodology | None:
+        """Get a methodology by ID.
+
+        Args:
+            methodology_id: Methodology identifier.
+
+        Returns:
+            Methodology if found, None otherwise.
+        """
+        ...
+
+    @abstractmethod
+    async def list_all(self) -> Sequence[Methodology]:
+        """List all methodologies, oldest first.
+
+        Returns:
+            Sequence of methodologies.
+        """
+        ...
+
+    @abstractmethod
+    async def save(self, methodology: Methodology) -> None:
+        """Insert or update a methodology.
+
+        Args:
+            methodology: Methodology to save.
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, methodology_id: str) -> bool:
+        """Delete a methodology.
+
+        Args:
+            methodology_id: Methodology identifier.
+
+        Returns:
+            True if the methodology existed.
+        """
+        ...
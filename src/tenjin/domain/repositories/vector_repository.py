@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Sequence
 
+import numpy as np
+
 from ..value_objects.search_query import SearchQuery
 from ..value_objects.search_result import SearchResult, SearchResults
 
@@ -93,6 +95,39 @@ class VectorRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_embeddings(self, entity_ids: Sequence[str]) -> dict[str, list[float]]:
+        """Get raw embedding vectors for multiple entities.
+
+        Args:
+            entity_ids: Entity IDs.
+
+        Returns:
+            Mapping of entity ID to vector (entities without one are omitted).
+        """
+        ...
+
+    @abstractmethod
+    async def get_embedding_matrix(self) -> tuple[list[str], np.ndarray]:
+        """Get the embedding vectors of every entity in the collection.
+
+        Returns:
+            Entity IDs and a matrix with one row per ID, in order.
+        """
+        ...
+
+    @abstractmethod
+    async def embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts with the collection's embedding model.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One vector per text, in order.
+        """
+        ...
+
     @abstractmethod
     async def batch_add_embeddings(
         self,
@@ -3,13 +3,47 @@
 from .neo4j_adapter import Neo4jAdapter
 from .chromadb_adapter import ChromaDBAdapter
 from .esperanto_adapter import EsperantoAdapter, EmbeddingAdapter
-from .redis_adapter import RedisAdapter, CacheDecorator
+from .embedding_store import EmbeddingStore
+from .local_providers import LocalEmbeddingModel, LocalLanguageModel
+from .rate_limiter import ProviderLimiter, TokenBucket
+from .streaming import JsonFieldStream
+from .job_store import JobRecord, JobStatus, RedisJobStore, SQLiteJobStore
+from .redis_adapter import STATE_KEY_PREFIX, RedisAdapter, CacheDecorator
+from .metrics import MetricsRegistry, EventLoopLagMonitor, get_metrics
+from .tracing import OTLPJsonExporter, start_trace, trace_methods
+from .slow_log import IndexAdvisor, SlowOperationLog, get_slow_log
+from .profiler import SamplingProfiler, get_profiler
+from .admission import AdmissionPool, Overloaded
 
 __all__ = [
     "Neo4jAdapter",
     "ChromaDBAdapter",
     "EsperantoAdapter",
     "EmbeddingAdapter",
+    "EmbeddingStore",
+    "LocalEmbeddingModel",
+    "LocalLanguageModel",
+    "ProviderLimiter",
+    "TokenBucket",
+    "JsonFieldStream",
+    "JobRecord",
+    "JobStatus",
+    "SQLiteJobStore",
+    "RedisJobStore",
     "RedisAdapter",
+    "STATE_KEY_PREFIX",
     "CacheDecorator",
+    "MetricsRegistry",
+    "EventLoopLagMonitor",
+    "get_metrics",
+    "OTLPJsonExporter",
+    "start_trace",
+    "trace_methods",
+    "IndexAdvisor",
+    "SlowOperationLog",
+    "get_slow_log",
+    "SamplingProfiler",
+    "get_profiler",
+    "AdmissionPool",
+    "Overloaded",
 ]
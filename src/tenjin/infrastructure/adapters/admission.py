@@ -0,0 +1,219 @@
+"""Admission control for server work.
+
+An ``AdmissionPool`` bounds the work in flight. Callers over the limit
+wait in FIFO order, but only while the queue is shorter than its bound
+and only for a bounded time; otherwise they are rejected right away with
+``Overloaded``, which carries a retry-after hint derived from how long
+recent work held its slot. Rejecting early keeps one busy client from
+building a backlog that every other client then waits behind.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from ..config.logging import get_logger
+from .metrics import get_metrics
+
+logger = get_logger(__name__)
+
+# Weight of the newest hold time in the moving average
+_HOLD_ALPHA = 0.2
+
+
+class Overloaded(Exception):
+    """Work was rejected because its pool is saturated."""
+
+    def __init__(self, pool: str, reason: str, retry_after: float) -> None:
+        """Initialize overloaded error.
+
+        Args:
+            pool: Pool that rejected the work.
+            reason: "queue_full" or "wait_timeout".
+            retry_after: Suggested seconds before retrying.
+        """
+        super().__init__(f"Server busy ({pool}: {reason}), retry after {retry_after:g}s")
+        self.pool = pool
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionStats:
+    """Admission counts of one pool.
+
+    Attributes:
+        admitted: Work admitted.
+        rejected: Work rejected (queue full or wait timed out).
+        total_wait_seconds: Sum of queueing times of admitted work.
+        max_wait_seconds: Longest queueing time of admitted work.
+    """
+
+    admitted: int = 0
+    rejected: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary of counts and wait times.
+        """
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avg_wait_ms": (
+                round(self.total_wait_seconds / self.admitted * 1000, 2) if self.admitted else 0.0
+            ),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+
+class AdmissionPool:
+    """Bounded in-flight limit with a bounded, time-limited queue."""
+
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        max_queue: int = 0,
+        max_wait_seconds: float = 0.0,
+    ) -> None:
+        """Initialize admission pool.
+
+        Args:
+            name: Pool name (for errors and metrics).
+            max_in_flight: Work admitted at once.
+            max_queue: Callers allowed to wait for a slot (0 = reject when full).
+            max_wait_seconds: Longest time a caller waits for a slot.
+        """
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._hold_seconds = 1.0
+        self.stats = AdmissionStats()
+        metrics = get_metrics()
+        self._rejected = metrics.counter(
+            "tenjin_admission_rejected_total",
+            "Work rejected by admission control",
+            ("pool", "reason"),
+        )
+        self._waiting = metrics.gauge(
+            "tenjin_admission_waiting", "Work queued for admission", ("pool",)
+        )
+
+    @property
+    def waiting(self) -> int:
+        """Callers queued for a slot."""
+        return len(self._waiters)
+
+    def retry_after(self) -> float:
+        """Estimate when a slot will be free for a new caller.
+
+        Returns:
+            Seconds (at least 1), from the average hold time and the queue.
+        """
+        rounds = (self.waiting + 1) / max(1, self.max_in_flight)
+        return float(max(1, math.ceil(self._hold_seconds * rounds)))
+
+    def _reject(self, reason: str) -> Overloaded:
+        """Count a rejection and build its error."""
+        self.stats.rejected += 1
+        self._rejected.inc(pool=self.name, reason=reason)
+        error = Overloaded(self.name, reason, self.retry_after())
+        logger.warning(f"Admission rejected: {error}")
+        return error
+
+    async def _admit(self) -> None:
+        """Take a slot, waiting in the queue if allowed.
+
+        Raises:
+            Overloaded: If the queue is full or the wait timed out.
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return
+        if self.waiting >= self.max_queue:
+            raise self._reject("queue_full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._waiting.set(self.waiting, pool=self.name)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait_seconds)
+        except TimeoutError:
+            self._abandon(waiter)
+            raise self._reject("wait_timeout") from None
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        finally:
+            self._waiting.set(self.waiting, pool=self.name)
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> None:
+        """Leave the queue, passing on a slot handed over while giving up."""
+        if waiter.done() and not waiter.cancelled():
+            self._release()
+        else:
+            waiter.cancel()
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Hold a slot of the pool.
+
+        Raises:
+            Overloaded: If the pool is saturated.
+        """
+        started = time.monotonic()
+        await self._admit()
+        admitted = time.monotonic()
+        waited = admitted - started
+        self.stats.admitted += 1
+        self.stats.total_wait_seconds += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        try:
+            yield
+        finally:
+            held = time.monotonic() - admitted
+            self._hold_seconds += _HOLD_ALPHA * (held - self._hold_seconds)
+            self._release()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get limits, occupancy and admission counts.
+
+        Returns:
+            Dictionary of pool statistics.
+        """
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            **self.stats.to_dict(),
+        }
+
+
+__all__ = [
+    "AdmissionPool",
+    "AdmissionStats",
+    "Overloaded",
+]
@@ -1,21 +1,35 @@
 """ChromaDB adapter for vector database operations."""
 
-from typing import Any, Sequence
-
-import chromadb
-from chromadb.config import Settings as ChromaSettings
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Sequence
 
 from ..config.logging import get_logger
 from ..config.settings import get_settings
+from .deadline import check_deadline
+from .metrics import track_adapter
+from .slow_log import get_slow_log
+from .startup import lazy_import
+
+if TYPE_CHECKING:
+    import chromadb
 
 logger = get_logger(__name__)
 
+# Registry collection whose metadata maps logical collection names (aliases)
+# to the physical, versioned collections that currently back them.
+ALIAS_REGISTRY_COLLECTION = "tenjin_collection_aliases"
+
 
 class ChromaDBAdapter:
     """Adapter for ChromaDB vector database operations.
 
     Provides interface for embedding storage and semantic search.
     Supports both HTTP client (server mode) and PersistentClient (local mode).
+
+    ``collection_name`` is a logical name. If an alias record exists for it,
+    the adapter uses the physical collection the alias points to, so vector
+    rebuilds can be built side by side and switched over atomically.
     """
 
     def __init__(
@@ -24,6 +38,7 @@ class ChromaDBAdapter:
         port: int | None = None,
         persist_dir: str | None = None,
         collection_name: str | None = None,
+        resolve_alias: bool = True,
     ) -> None:
         """Initialize ChromaDB adapter.
 
@@ -31,19 +46,28 @@ class ChromaDBAdapter:
             host: ChromaDB server host (for HTTP mode). If set, uses HttpClient.
             port: ChromaDB server port.
             persist_dir: Directory for persistent storage (for local mode).
-            collection_name: Name of the collection to use.
+            collection_name: Name of the collection (or alias) to use.
+            resolve_alias: Whether to follow alias records for collection_name.
+                Disable to address a physical collection directly.
         """
         settings = get_settings()
         self._host = host or settings.chromadb.host
         self._port = port or settings.chromadb.port
         self._persist_dir = persist_dir or settings.chromadb.persist_dir
         self._collection_name = collection_name or settings.chromadb.collection_name
-        self._client: chromadb.ClientAPI | None = None
-        self._collection: chromadb.Collection | None = None
+        self._resolve_alias = resolve_alias
+        self._alias_refresh_interval = settings.chromadb.alias_refresh_interval
+        self._alias_checked_at = 0.0
+        self._physical_name = self._collection_name
+        self._client: "chromadb.ClientAPI | None" = None
+        self._collection: "chromadb.Collection | None" = None
 
     def connect(self) -> None:
         """Initialize ChromaDB client and collection."""
         if self._client is None:
+            # Imported here: chromadb is the slowest import of the server
+            chromadb = lazy_import("chromadb")
+            ChromaSettings = lazy_import("chromadb.config").Settings
             if self._host:
                 # HTTP client mode (Docker/server)
                 logger.info(f"Connecting to ChromaDB server at {self._host}:{self._port}")
@@ -64,15 +88,50 @@ class ChromaDBAdapter:
                         allow_reset=True,
                     ),
                 )
-            
-            self._collection = self._client.get_or_create_collection(
-                name=self._collection_name,
-                metadata={"hnsw:space": "cosine"},
+
+            self._open_collection()
+            logger.info(
+                f"ChromaDB collection '{self._collection_name}' "
+                f"(-> '{self._physical_name}') initialized "
+                f"with {self._collection.count()} documents"  # type: ignore[union-attr]
+            )
+
+    def _open_collection(self) -> None:
+        """Resolve the alias and open the physical collection."""
+        if self._resolve_alias:
+            self._physical_name = (
+                self.resolve_alias(self._collection_name) or self._collection_name
             )
+        self._alias_checked_at = time.monotonic()
+        self._collection = self._client.get_or_create_collection(  # type: ignore[union-attr]
+            name=self._physical_name,
+            metadata={"hnsw:space": "cosine"},
+        )
+
+    def _refresh_alias(self) -> None:
+        """Follow an alias swap made by another process.
+
+        Queries keep using the currently open collection until the alias
+        points elsewhere; the check runs at most once per refresh interval.
+        """
+        if (
+            not self._resolve_alias
+            or self._alias_refresh_interval <= 0
+            or time.monotonic() - self._alias_checked_at < self._alias_refresh_interval
+        ):
+            return
+        self._alias_checked_at = time.monotonic()
+        try:
+            target = self.resolve_alias(self._collection_name) or self._collection_name
+        except Exception as e:
+            logger.warning(f"Alias lookup for '{self._collection_name}' failed: {e}")
+            return
+        if target != self._physical_name:
             logger.info(
-                f"ChromaDB collection '{self._collection_name}' initialized "
-                f"with {self._collection.count()} documents"
+                f"Collection alias '{self._collection_name}' moved "
+                f"'{self._physical_name}' -> '{target}'"
             )
+            self._open_collection()
 
     def close(self) -> None:
         """Close ChromaDB connection (persists automatically)."""
@@ -81,7 +140,7 @@ class ChromaDBAdapter:
         self._collection = None
 
     @property
-    def collection(self) -> chromadb.Collection:
+    def collection(self) -> "chromadb.Collection":
         """Get the active collection.
 
         Returns:
@@ -92,8 +151,142 @@ class ChromaDBAdapter:
         """
         if self._collection is None:
             self.connect()
+        else:
+            self._refresh_alias()
         return self._collection  # type: ignore
 
+    @property
+    def collection_name(self) -> str:
+        """Logical collection name (alias) this adapter serves."""
+        return self._collection_name
+
+    @property
+    def physical_name(self) -> str:
+        """Name of the physical collection currently in use."""
+        return self._physical_name
+
+    # ===========================================
+    # Collection Aliases
+    # ===========================================
+
+    def for_collection(self, name: str) -> "ChromaDBAdapter":
+        """Create an adapter for a physical collection sharing this client.
+
+        Args:
+            name: Physical collection name (aliases are not followed).
+
+        Returns:
+            ChromaDB adapter bound to the collection.
+        """
+        if self._client is None:
+            self.connect()
+        adapter = ChromaDBAdapter(
+            host=self._host,
+            port=self._port,
+            persist_dir=self._persist_dir,
+            collection_name=name,
+            resolve_alias=False,
+        )
+        adapter._client = self._client
+        adapter._open_collection()
+        return adapter
+
+    def _alias_registry(self) -> "chromadb.Collection":
+        """Get the alias registry collection."""
+        if self._client is None:
+            self.connect()
+        return self._client.get_or_create_collection(  # type: ignore[union-attr]
+            name=ALIAS_REGISTRY_COLLECTION,
+        )
+
+    def get_aliases(self) -> dict[str, str]:
+        """Get all alias records.
+
+        Returns:
+            Mapping of alias to physical collection name.
+        """
+        metadata = self._alias_registry().metadata or {}
+        # "<alias>:previous" / "<alias>:swapped_at" are bookkeeping entries
+        return {
+            k: v for k, v in metadata.items() if isinstance(v, str) and ":" not in k
+        }
+
+    def resolve_alias(self, alias: str) -> str | None:
+        """Resolve an alias to its physical collection.
+
+        Args:
+            alias: Logical collection name.
+
+        Returns:
+            Physical collection name, or None if no alias record exists.
+        """
+        return self.get_aliases().get(alias)
+
+    def swap_alias(self, alias: str, target: str) -> str | None:
+        """Point an alias at another physical collection.
+
+        The swap is a single metadata write on the registry collection, so
+        readers see either the old or the new target, never a mix.
+
+        Args:
+            alias: Logical collection name.
+            target: Existing physical collection to switch to.
+
+        Returns:
+            Previous physical collection name (the alias itself if the
+            collection was never aliased).
+
+        Raises:
+            ValueError: If the target collection does not exist.
+        """
+        if self._client is None:
+            self.connect()
+        if target not in self.list_collections():
+            raise ValueError(f"Collection '{target}' does not exist")
+
+        registry = self._alias_registry()
+        records = dict(registry.metadata or {})
+        previous = records.get(alias, alias)
+        records[alias] = target
+        records[f"{alias}:previous"] = previous
+        records[f"{alias}:swapped_at"] = datetime.now(timezone.utc).isoformat()
+        registry.modify(metadata=records)
+        logger.info(f"Swapped collection alias '{alias}': '{previous}' -> '{target}'")
+
+        if alias == self._collection_name and self._resolve_alias:
+            self._open_collection()
+        return previous
+
+    def list_collections(self) -> list[str]:
+        """List physical collection names.
+
+        Returns:
+            Collection names, excluding the alias registry.
+        """
+        if self._client is None:
+            self.connect()
+        names = [
+            c if isinstance(c, str) else c.name
+            for c in self._client.list_collections()  # type: ignore[union-attr]
+        ]
+        return [n for n in names if n != ALIAS_REGISTRY_COLLECTION]
+
+    def drop_collection(self, name: str) -> None:
+        """Delete a physical collection that no alias points to.
+
+        Args:
+            name: Physical collection name.
+
+        Raises:
+            ValueError: If the collection is the target of an alias.
+        """
+        if self._client is None:
+            self.connect()
+        if name in self.get_aliases().values() or name == self._physical_name:
+            raise ValueError(f"Collection '{name}' is in use and cannot be dropped")
+        self._client.delete_collection(name)  # type: ignore[union-attr]
+        logger.info(f"Dropped ChromaDB collection '{name}'")
+
     def add(
         self,
         ids: Sequence[str],
@@ -118,7 +311,8 @@ class ChromaDBAdapter:
         if metadatas is not None:
             kwargs["metadatas"] = list(metadatas)
 
-        self.collection.add(**kwargs)
+        with track_adapter("chromadb", "add"):
+            self.collection.add(**kwargs)
         logger.debug(f"Added {len(ids)} documents to ChromaDB")
 
     def upsert(
@@ -145,9 +339,41 @@ class ChromaDBAdapter:
         if metadatas is not None:
             kwargs["metadatas"] = list(metadatas)
 
-        self.collection.upsert(**kwargs)
+        with track_adapter("chromadb", "upsert"):
+            self.collection.upsert(**kwargs)
         logger.debug(f"Upserted {len(ids)} documents to ChromaDB")
 
+    def update(
+        self,
+        ids: Sequence[str],
+        embeddings: Sequence[list[float]] | None = None,
+        documents: Sequence[str] | None = None,
+        metadatas: Sequence[dict[str, Any]] | None = None,
+    ) -> None:
+        """Update existing documents in the collection.
+
+        Unlike upsert, fields that are not given keep their stored values,
+        so metadata can be changed without re-embedding.
+
+        Args:
+            ids: Document IDs.
+            embeddings: New embeddings (optional).
+            documents: New document texts (optional).
+            metadatas: New document metadata (optional).
+        """
+        kwargs: dict[str, Any] = {"ids": list(ids)}
+
+        if embeddings is not None:
+            kwargs["embeddings"] = list(embeddings)
+        if documents is not None:
+            kwargs["documents"] = list(documents)
+        if metadatas is not None:
+            kwargs["metadatas"] = list(metadatas)
+
+        with track_adapter("chromadb", "update"):
+            self.collection.update(**kwargs)
+        logger.debug(f"Updated {len(ids)} documents in ChromaDB")
+
     def query(
         self,
         query_embeddings: Sequence[list[float]] | None = None,
@@ -182,7 +408,19 @@ class ChromaDBAdapter:
         else:
             kwargs["include"] = ["metadatas", "documents", "distances"]
 
-        return self.collection.query(**kwargs)
+        # Queries block the event loop and cannot be interrupted once started
+        check_deadline("ChromaDB query")
+        started = time.perf_counter()
+        with track_adapter("chromadb", "query"):
+            result = self.collection.query(**kwargs)
+        get_slow_log().record(
+            "vector",
+            f"query {self.collection_name}",
+            time.perf_counter() - started,
+            {"n_results": n_results, "where": where},
+            rows=sum(len(ids) for ids in result.get("ids") or []),
+        )
+        return result
 
     def get(
         self,
@@ -215,7 +453,8 @@ class ChromaDBAdapter:
         else:
             kwargs["include"] = ["metadatas", "documents", "embeddings"]
 
-        return self.collection.get(**kwargs)
+        with track_adapter("chromadb", "get"):
+            return self.collection.get(**kwargs)
 
     def delete(
         self,
@@ -235,7 +474,8 @@ class ChromaDBAdapter:
         if where is not None:
             kwargs["where"] = where
 
-        self.collection.delete(**kwargs)
+        with track_adapter("chromadb", "delete"):
+            self.collection.delete(**kwargs)
         logger.debug(f"Deleted documents from ChromaDB")
 
     def count(self) -> int:
@@ -248,11 +488,11 @@ class ChromaDBAdapter:
 
     def reset(self) -> None:
         """Reset the collection (delete all documents)."""
-        logger.warning(f"Resetting ChromaDB collection '{self._collection_name}'")
+        logger.warning(f"Resetting ChromaDB collection '{self._physical_name}'")
         if self._client:
-            self._client.delete_collection(self._collection_name)
+            self._client.delete_collection(self._physical_name)
             self._collection = self._client.get_or_create_collection(
-                name=self._collection_name,
+                name=self._physical_name,
                 metadata={"hnsw:space": "cosine"},
             )
 
@@ -277,6 +517,7 @@ class ChromaDBAdapter:
         """
         return {
             "collection_name": self._collection_name,
+            "physical_collection": self._physical_name,
             "document_count": self.count(),
             "persist_directory": self._persist_dir,
         }
@@ -0,0 +1,293 @@
+"""Per-provider circuit breakers for LLM requests.
+
+A breaker keeps a rolling window of recent call outcomes and latencies.
+When the error rate or slow-call rate in the window crosses the
+threshold, the circuit opens and requests to the provider are skipped
+immediately instead of each paying a full timeout. After a cool-down a
+single probe is let through (half-open); its outcome closes or reopens
+the circuit. Breakers are shared per provider across adapter instances.
+
+Latency windows per provider and operation track how long each kind of
+request usually takes, so that the hedge delay of a short operation is
+not driven by long completions on the same provider.
+"""
+
+import math
+import time
+from collections import deque
+from enum import StrEnum
+from typing import Any
+
+from ..config.logging import get_logger
+from ..config.settings import get_settings
+
+logger = get_logger(__name__)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        slow_call_seconds: float = 30.0,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            name: Provider name.
+            failure_threshold: Error or slow-call rate that opens the circuit.
+            window_size: Number of recent calls considered.
+            min_calls: Calls needed in the window before the circuit can open.
+            open_seconds: Cool-down before a half-open probe is allowed.
+            slow_call_seconds: Latency above which a successful call counts as slow.
+        """
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._min_calls = min_calls
+        self._open_seconds = open_seconds
+        self._slow_call_seconds = slow_call_seconds
+        # (succeeded, latency seconds) per call
+        self._window: deque[tuple[bool, float]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_error: str | None = None
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open after the cool-down."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+            logger.info(f"Circuit for {self.name} half-open, allowing a probe request")
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, reserving the half-open probe.
+
+        Returns:
+            True if the request may proceed.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call.
+
+        Args:
+            latency: Call latency in seconds.
+        """
+        if self._state == CircuitState.HALF_OPEN:
+            self._close()
+        self._window.append((True, latency))
+        self._evaluate()
+
+    def record_failure(self, latency: float, error: Exception | None = None) -> None:
+        """Record a failed call.
+
+        Args:
+            latency: Call latency in seconds.
+            error: Error raised by the call.
+        """
+        if error is not None:
+            self._last_error = f"{type(error).__name__}: {error}"
+        if self._state == CircuitState.HALF_OPEN:
+            self._open("half-open probe failed")
+            return
+        self._window.append((False, latency))
+        self._evaluate()
+
+    def record_abandoned(self) -> None:
+        """Record a call that was cancelled before it completed.
+
+        The call says nothing about provider health, but a reserved
+        half-open probe must be released so another request can probe.
+        """
+        self._probe_in_flight = False
+
+    def latency_percentile(self, percentile: float, min_samples: int = 1) -> float | None:
+        """Get a percentile of recent successful call latencies.
+
+        Args:
+            percentile: Percentile between 0 and 1 (e.g. 0.95).
+            min_samples: Successful calls needed for a meaningful value.
+
+        Returns:
+            Latency in seconds, or None if there are too few samples.
+        """
+        return _percentile([latency for ok, latency in self._window if ok], percentile, min_samples)
+
+    def _evaluate(self) -> None:
+        """Open the circuit if the window's error or slow-call rate is too high."""
+        if self._state != CircuitState.CLOSED or len(self._window) < self._min_calls:
+            return
+        calls = len(self._window)
+        failures = sum(1 for ok, _ in self._window if not ok)
+        slow = sum(1 for ok, latency in self._window if ok and latency > self._slow_call_seconds)
+        if failures / calls >= self._failure_threshold:
+            self._open(f"error rate {failures}/{calls}")
+        elif slow / calls >= self._failure_threshold:
+            self._open(f"slow-call rate {slow}/{calls}")
+
+    def _open(self, reason: str) -> None:
+        """Open the circuit."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._times_opened += 1
+        logger.warning(
+            f"Circuit for {self.name} opened ({reason}); "
+            f"skipping it for {self._open_seconds:.0f}s"
+        )
+
+    def _close(self) -> None:
+        """Close the circuit and start a fresh window."""
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+        self._window.clear()
+        logger.info(f"Circuit for {self.name} closed")
+
+    def get_status(self) -> dict[str, Any]:
+        """Get the breaker state and window statistics.
+
+        Returns:
+            Dictionary with state, error rate, and latency figures.
+        """
+        state = self.state
+        calls = len(self._window)
+        latencies = [latency for _, latency in self._window]
+        status: dict[str, Any] = {
+            "state": state.value,
+            "window_calls": calls,
+            "error_rate": round(
+                sum(1 for ok, _ in self._window if not ok) / calls if calls else 0.0, 3
+            ),
+            "avg_latency_seconds": round(sum(latencies) / calls if calls else 0.0, 3),
+            "p95_latency_seconds": round(self.latency_percentile(0.95) or 0.0, 3),
+            "times_opened": self._times_opened,
+            "last_error": self._last_error,
+        }
+        if state == CircuitState.OPEN:
+            status["retry_in_seconds"] = round(
+                max(0.0, self._open_seconds - (time.monotonic() - self._opened_at)), 1
+            )
+        return status
+
+
+class LatencyWindow:
+    """Rolling window of successful call latencies of one operation."""
+
+    def __init__(self, window_size: int = 20) -> None:
+        """Initialize latency window.
+
+        Args:
+            window_size: Number of recent calls considered.
+        """
+        self._latencies: deque[float] = deque(maxlen=window_size)
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a successful call."""
+        self._latencies.append(latency)
+
+    def percentile(self, percentile: float, min_samples: int = 1) -> float | None:
+        """Get a percentile of the recorded latencies.
+
+        Args:
+            percentile: Percentile between 0 and 1 (e.g. 0.95).
+            min_samples: Calls needed for a meaningful value.
+
+        Returns:
+            Latency in seconds, or None if there are too few samples.
+        """
+        return _percentile(list(self._latencies), percentile, min_samples)
+
+
+def _percentile(latencies: list[float], percentile: float, min_samples: int) -> float | None:
+    """Get the nearest-rank percentile of latencies, None if too few."""
+    if not latencies or len(latencies) < min_samples:
+        return None
+    latencies = sorted(latencies)
+    rank = max(1, math.ceil(len(latencies) * percentile))
+    return latencies[rank - 1]
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_latency_windows: dict[tuple[str, str], LatencyWindow] = {}
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for a provider, creating it from settings.
+
+    Args:
+        provider: Provider name.
+
+    Returns:
+        Circuit breaker.
+    """
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        settings = get_settings().llm
+        breaker = CircuitBreaker(
+            provider,
+            failure_threshold=settings.circuit_failure_threshold,
+            window_size=settings.circuit_window_size,
+            min_calls=settings.circuit_min_calls,
+            open_seconds=settings.circuit_open_seconds,
+            slow_call_seconds=settings.circuit_slow_call_seconds,
+        )
+        _breakers[provider] = breaker
+    return breaker
+
+
+def get_latency_window(provider: str, operation: str) -> LatencyWindow:
+    """Get the shared latency window of an operation on a provider.
+
+    Args:
+        provider: Provider name.
+        operation: Operation name.
+
+    Returns:
+        Latency window.
+    """
+    window = _latency_windows.get((provider, operation))
+    if window is None:
+        window = LatencyWindow(get_settings().llm.circuit_window_size)
+        _latency_windows[(provider, operation)] = window
+    return window
+
+
+def get_circuit_states() -> dict[str, dict[str, Any]]:
+    """Get the status of all provider circuit breakers.
+
+    Returns:
+        Mapping of provider to breaker status.
+    """
+    return {name: breaker.get_status() for name, breaker in _breakers.items()}
+
+
+def reset_circuit_breakers() -> None:
+    """Drop all breakers and latency windows so they are recreated from current settings."""
+    _breakers.clear()
+    _latency_windows.clear()
@@ -0,0 +1,156 @@
+"""Request deadlines carried through contextvars.
+
+A tool call sets a deadline for everything it awaits. The deadline lives
+in a context variable, so services, repositories and adapters (and the
+tasks they spawn) can read the time left without it being passed down
+explicitly:
+
+- ``deadline()`` scopes a block: it cancels the block when the time is
+  up and raises ``DeadlineExceededError``. Nested scopes can only shorten the
+  deadline.
+- ``remaining()`` / ``check_deadline()`` let adapters derive their own
+  timeouts (e.g. Neo4j transaction timeouts) and fail fast before
+  starting work that cannot finish in time.
+- ``bounded()`` limits one operation to its own timeout and the deadline.
+- ``gather_or_cancel()`` runs awaitables concurrently and cancels the rest
+  as soon as one fails, so no orphaned work keeps holding connections.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from ..config.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Absolute deadline (time.monotonic) of the current request
+_deadline: ContextVar[float | None] = ContextVar("tenjin_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """The request's deadline passed before the operation finished."""
+
+
+def remaining() -> float | None:
+    """Get the time left until the current deadline.
+
+    Returns:
+        Seconds left (may be negative), or None without a deadline.
+    """
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def check_deadline(operation: str = "operation") -> None:
+    """Fail fast if the current deadline has passed.
+
+    Args:
+        operation: Operation about to start (for the error message).
+
+    Raises:
+        DeadlineExceededError: If no time is left.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(f"Deadline exceeded before {operation}")
+
+
+@asynccontextmanager
+async def deadline(seconds: float | None) -> AsyncIterator[None]:
+    """Run a block under a deadline.
+
+    The block's task is cancelled when the deadline passes. An enclosing
+    deadline that expires earlier stays in effect.
+
+    Args:
+        seconds: Time allowed for the block (None = no deadline of its own).
+
+    Raises:
+        DeadlineExceededError: If the block did not finish in time.
+    """
+    if seconds is None:
+        yield
+        return
+
+    expires = time.monotonic() + seconds
+    enclosing = _deadline.get()
+    if enclosing is not None:
+        expires = min(expires, enclosing)
+    token = _deadline.set(expires)
+    loop = asyncio.get_running_loop()
+    try:
+        async with asyncio.timeout_at(loop.time() + expires - time.monotonic()) as scope:
+            yield
+    except TimeoutError as e:
+        if scope.expired() and not isinstance(e, DeadlineExceededError):
+            raise DeadlineExceededError(f"Deadline of {seconds:g}s exceeded") from e
+        raise
+    finally:
+        _deadline.reset(token)
+
+
+@asynccontextmanager
+async def bounded(seconds: float | None, operation: str = "operation") -> AsyncIterator[None]:
+    """Limit one operation to its own timeout and the current deadline.
+
+    Args:
+        seconds: Timeout of the operation (None = only the deadline).
+        operation: Operation name (for error messages).
+
+    Raises:
+        DeadlineExceededError: If the deadline ran out first.
+        TimeoutError: If the operation's own timeout ran out.
+    """
+    check_deadline(operation)
+    left = remaining()
+    limited_by_deadline = left is not None and (seconds is None or left < seconds)
+    timeout = left if limited_by_deadline else seconds
+    try:
+        async with asyncio.timeout(timeout) as scope:
+            yield
+    except TimeoutError as e:
+        if scope.expired() and limited_by_deadline:
+            raise DeadlineExceededError(f"Deadline exceeded during {operation}") from e
+        raise
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Run awaitables concurrently, cancelling the rest if one fails.
+
+    Unlike ``asyncio.gather``, the remaining awaitables do not keep running
+    after the first error (or after the caller is cancelled); they are
+    cancelled and awaited so their connections are released before the
+    error propagates.
+
+    Args:
+        *aws: Awaitables to run.
+
+    Returns:
+        Results in the order of the awaitables.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        if pending:
+            logger.debug(f"Cancelling {len(pending)} pending operations")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+__all__ = [
+    "DeadlineExceededError",
+    "remaining",
+    "check_deadline",
+    "deadline",
+    "bounded",
+    "gather_or_cancel",
+]
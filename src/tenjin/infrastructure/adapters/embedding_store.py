@@ -0,0 +1,307 @@
+"""Persistent on-disk embedding store.
+
+Embeddings are keyed by (provider, model, sha256(text)) so that rebuilding
+the vector store with an unchanged model needs no embedding calls at all.
+
+Layout of the store directory:
+    index.sqlite3   key -> (offset, dimension) index
+    vectors.f32     append-only file of little-endian float32 values
+"""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from ..config.logging import get_logger
+
+try:  # POSIX advisory locks guard appends from concurrent processes
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+_FLOAT_SIZE = 4
+
+
+class EmbeddingStore:
+    """Append-only float32 embedding store with a SQLite index.
+
+    Vectors are read through a memory map of the vector file, so lookups
+    do not copy the whole file into memory. Failures to read or write the
+    store are logged and treated as cache misses; they never fail an
+    embedding request.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize embedding store.
+
+        Args:
+            directory: Directory holding the index and vector files.
+        """
+        self._dir = Path(directory)
+        self._index_path = self._dir / "index.sqlite3"
+        self._vectors_path = self._dir / "vectors.f32"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._mmap: mmap.mmap | None = None
+        self._mapped_size = 0
+        self._disabled = False
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(provider: str, model: str, text: str) -> str:
+        """Build the store key for a text.
+
+        Args:
+            provider: Embedding provider name.
+            model: Embedding model name.
+            text: Embedded text.
+
+        Returns:
+            Store key.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{provider}:{model}:{digest}"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, creating the store if needed."""
+        if self._conn is None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._vectors_path.touch(exist_ok=True)
+            self._conn = sqlite3.connect(self._index_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    dimension INTEGER NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            logger.info(f"Embedding store opened at {self._dir}")
+        return self._conn
+
+    def _lookup(self, keys: Sequence[str]) -> dict[str, tuple[int, int]]:
+        """Look up index entries for keys.
+
+        Args:
+            keys: Store keys.
+
+        Returns:
+            Mapping of found key to (offset, dimension).
+        """
+        conn = self._connect()
+        found: dict[str, tuple[int, int]] = {}
+        unique = list(dict.fromkeys(keys))
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(unique), 500):
+            chunk = unique[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, offset, dimension FROM embeddings WHERE key IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            found.update({k: (o, d) for k, o, d in rows})
+        return found
+
+    def _read_vector(self, offset: int, dimension: int) -> list[float] | None:
+        """Read a vector from the memory-mapped vector file.
+
+        Args:
+            offset: Float offset of the vector.
+            dimension: Number of floats.
+
+        Returns:
+            Vector, or None if the file is shorter than expected.
+        """
+        end = (offset + dimension) * _FLOAT_SIZE
+        if end > self._mapped_size:
+            # The file grew since it was mapped (appends by us or another process)
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            size = self._vectors_path.stat().st_size
+            if size == 0 or end > size:
+                return None
+            with open(self._vectors_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+
+        values = array("f")
+        values.frombytes(self._mmap[offset * _FLOAT_SIZE : end])  # type: ignore[index]
+        return values.tolist()
+
+    def get_many(
+        self,
+        provider: str,
+        model: str,
+        texts: Sequence[str],
+    ) -> list[list[float] | None]:
+        """Look up stored embeddings for texts.
+
+        Args:
+            provider: Embedding provider name.
+            model: Embedding model name.
+            texts: Texts to look up.
+
+        Returns:
+            Embeddings in input order, None for misses.
+        """
+        if self._disabled or not texts:
+            return [None] * len(texts)
+
+        keys = [self.make_key(provider, model, t) for t in texts]
+        try:
+            with self._lock:
+                found = self._lookup(keys)
+                results = [
+                    self._read_vector(*found[k]) if k in found else None for k in keys
+                ]
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Embedding store read failed, treating as miss: {e}")
+            return [None] * len(texts)
+
+        hits = sum(1 for r in results if r is not None)
+        self._hits += hits
+        self._misses += len(results) - hits
+        return results
+
+    def get(self, provider: str, model: str, text: str) -> list[float] | None:
+        """Look up a stored embedding.
+
+        Args:
+            provider: Embedding provider name.
+            model: Embedding model name.
+            text: Text to look up.
+
+        Returns:
+            Embedding, or None on miss.
+        """
+        return self.get_many(provider, model, [text])[0]
+
+    def put_many(
+        self,
+        provider: str,
+        model: str,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+    ) -> int:
+        """Store embeddings for texts.
+
+        Args:
+            provider: Embedding provider name.
+            model: Embedding model name.
+            texts: Embedded texts.
+            embeddings: Embeddings in the same order as texts.
+
+        Returns:
+            Number of newly stored embeddings.
+        """
+        if self._disabled or not texts:
+            return 0
+
+        entries = {
+            self.make_key(provider, model, t): e for t, e in zip(texts, embeddings, strict=True)
+        }
+        try:
+            with self._lock:
+                conn = self._connect()
+                existing = self._lookup(list(entries))
+                new = {k: v for k, v in entries.items() if k not in existing}
+                if not new:
+                    return 0
+
+                rows = []
+                with open(self._vectors_path, "ab") as f:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        f.seek(0, os.SEEK_END)
+                        offset = f.tell() // _FLOAT_SIZE
+                        for key, vector in new.items():
+                            values = array("f", vector)
+                            f.write(values.tobytes())
+                            rows.append((key, provider, model, offset, len(values)))
+                            offset += len(values)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    finally:
+                        if fcntl is not None:
+                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+                conn.executemany(
+                    "INSERT OR IGNORE INTO embeddings "
+                    "(key, provider, model, offset, dimension) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+                return len(rows)
+        except (OSError, sqlite3.Error) as e:
+            # e.g. read-only data volume: keep serving, just without persistence
+            logger.warning(f"Embedding store write failed, disabling store: {e}")
+            self._disabled = True
+            return 0
+
+    def put(self, provider: str, model: str, text: str, embedding: Sequence[float]) -> None:
+        """Store an embedding.
+
+        Args:
+            provider: Embedding provider name.
+            model: Embedding model name.
+            text: Embedded text.
+            embedding: Embedding vector.
+        """
+        self.put_many(provider, model, [text], [embedding])
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get store statistics.
+
+        Returns:
+            Dictionary with entry counts, size, and hit ratio.
+        """
+        stats: dict[str, Any] = {
+            "directory": str(self._dir),
+            "enabled": not self._disabled,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": (
+                self._hits / (self._hits + self._misses)
+                if self._hits + self._misses
+                else 0.0
+            ),
+        }
+        if self._disabled:
+            return stats
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT provider, model, count(*) FROM embeddings GROUP BY provider, model"
+                ).fetchall()
+            stats["entries"] = {f"{p}/{m}": c for p, m, c in rows}
+            stats["vector_bytes"] = self._vectors_path.stat().st_size
+        except (OSError, sqlite3.Error) as e:
+            stats["error"] = str(e)
+        return stats
+
+    def close(self) -> None:
+        """Close the index database and vector memory map."""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+                self._mapped_size = 0
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
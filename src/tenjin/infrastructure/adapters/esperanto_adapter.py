@@ -1,18 +1,34 @@
 """Esperanto adapter for LLM and embedding operations."""
 
-from typing import Any
-
-from esperanto import LanguageModel, provider_classes
-from esperanto.providers.llm.ollama import OllamaLanguageModel
-from esperanto.providers.llm.openai import OpenAILanguageModel
-from esperanto.providers.embedding.ollama import OllamaEmbeddingModel
-from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from ..config.logging import get_logger
 from ..config.settings import get_settings
+from .circuit_breaker import get_circuit_breaker, get_circuit_states, get_latency_window
+from .deadline import DeadlineExceededError, bounded, check_deadline
+from .embedding_store import EmbeddingStore
+from .local_providers import LocalEmbeddingModel, LocalLanguageModel
+from .metrics import observe_adapter_call, record_cache_lookup, record_llm_tokens, track_adapter
+from .rate_limiter import estimate_tokens, get_limiter_statistics, get_provider_limiter
+from .slow_log import get_slow_log
+from .startup import lazy_import
+
+if TYPE_CHECKING:
+    from esperanto import LanguageModel
+    from esperanto.providers.embedding.ollama import OllamaEmbeddingModel
+    from esperanto.providers.embedding.openai import OpenAIEmbeddingModel
+    from esperanto.providers.llm.ollama import OllamaLanguageModel
+    from esperanto.providers.llm.openai import OpenAILanguageModel
 
 logger = get_logger(__name__)
 
+# (texts, attempt, embeddings, error, latency seconds) of one embedding sub-batch
+_ChunkOutcome = tuple[list[str], int, list[list[float]] | None, Exception | None, float]
+
 
 class EsperantoAdapter:
     """Adapter for esperanto LLM operations.
@@ -47,8 +63,15 @@ class EsperantoAdapter:
             fallback_providers or settings.llm.fallback_provider_list
         )
         self._llm: LanguageModel | None = None
-
-    def _create_llm(self, provider: str | None = None) -> OllamaLanguageModel | OpenAILanguageModel:
+        # One client per provider, reused across requests and fallbacks
+        self._clients: dict[str, LanguageModel] = {}
+        self._hedge_operations = set(settings.llm.hedge_operation_list)
+        self._hedge_stats = {"hedged": 0, "hedge_wins": 0}
+        self._request_timeout = settings.llm.request_timeout or None
+
+    def _create_llm(
+        self, provider: str | None = None
+    ) -> "OllamaLanguageModel | OpenAILanguageModel | LocalLanguageModel":
         """Create a language model instance.
 
         Args:
@@ -62,22 +85,28 @@ class EsperantoAdapter:
         logger.debug(f"Creating LLM with provider: {use_provider}, model: {self._model}")
 
         if use_provider == "ollama":
-            return OllamaLanguageModel(
+            return lazy_import("esperanto.providers.llm.ollama").OllamaLanguageModel(
                 model_name=self._model,
                 base_url=settings.embedding.base_url,  # Same base URL as embedding
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
             )
         elif use_provider == "openai":
-            return OpenAILanguageModel(
+            return lazy_import("esperanto.providers.llm.openai").OpenAILanguageModel(
                 model_name=self._model,
                 api_key=settings.openai_api_key,
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
             )
+        elif use_provider == "local":
+            # Deterministic, network-free stub for offline tests and benchmarks
+            return LocalLanguageModel(
+                model_name=self._model,
+                latency=settings.llm.stub_latency,
+            )
         else:
             # Default to Ollama
-            return OllamaLanguageModel(
+            return lazy_import("esperanto.providers.llm.ollama").OllamaLanguageModel(
                 model_name=self._model,
                 base_url=settings.embedding.base_url,
                 temperature=self._temperature,
@@ -85,27 +114,56 @@ class EsperantoAdapter:
             )
 
     @property
-    def llm(self) -> OllamaLanguageModel | OpenAILanguageModel:
+    def llm(self) -> "OllamaLanguageModel | OpenAILanguageModel | LocalLanguageModel":
         """Get or create the language model.
 
         Returns:
             LanguageModel instance.
         """
         if self._llm is None:
-            self._llm = self._create_llm()
+            self._llm = self._get_llm(self._provider)
         return self._llm
 
+    def _get_llm(
+        self, provider: str
+    ) -> "OllamaLanguageModel | OpenAILanguageModel | LocalLanguageModel":
+        """Get the cached client for a provider, creating it on first use.
+
+        Args:
+            provider: Provider name.
+
+        Returns:
+            LanguageModel instance.
+        """
+        client = self._clients.get(provider)
+        if client is None:
+            client = self._create_llm(provider)
+            self._clients[provider] = client
+        return client  # type: ignore[return-value]
+
     async def generate(
         self,
         prompt: str,
         system_prompt: str | None = None,
+        operation: str | None = None,
+        hedge: bool | None = None,
         **kwargs: Any,
     ) -> str:
         """Generate text from a prompt.
 
+        Providers are tried in order (primary first), skipping any whose
+        circuit is open. With hedging, if the first provider has not
+        answered within its recent latency percentile, the same request is
+        also sent to the next provider; the first answer wins and the other
+        request is cancelled.
+
         Args:
             prompt: User prompt.
             system_prompt: Optional system prompt.
+            operation: Operation name used to look up hedging configuration
+                (e.g. "rerank").
+            hedge: Force hedging on or off (defaults to whether the operation
+                is listed in LLM_HEDGE_OPERATIONS).
             **kwargs: Additional generation parameters.
 
         Returns:
@@ -116,20 +174,299 @@ class EsperantoAdapter:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        # Try primary provider
-        providers_to_try = [self._provider] + self._fallback_providers
+        if hedge is None:
+            hedge = operation is not None and operation in self._hedge_operations
+
+        # Primary first, then fallbacks; providers with an open circuit are
+        # skipped immediately instead of each paying a full timeout
+        providers_to_try = list(dict.fromkeys([self._provider] + self._fallback_providers))
+        candidates = iter(providers_to_try)
+        last_error: Exception | None = None
+
+        for provider in candidates:
+            # Falling back is pointless once the request deadline has passed
+            check_deadline("LLM request")
+            if not get_circuit_breaker(provider).allow_request():
+                logger.debug(f"Skipping provider {provider}: circuit open")
+                continue
+
+            tasks = {
+                asyncio.create_task(self._attempt(provider, messages, kwargs, operation)): provider
+            }
+            try:
+                if hedge:
+                    hedge = False  # hedge at most once per request
+                    delay = self._hedge_delay(provider, operation)
+                    done, _ = await asyncio.wait(tasks, timeout=delay)
+                    if not done:
+                        backup = next(
+                            (p for p in candidates if get_circuit_breaker(p).allow_request()),
+                            None,
+                        )
+                        if backup is not None:
+                            logger.debug(
+                                f"Hedging {operation or 'request'}: {provider} slower "
+                                f"than {delay:.2f}s, also sending to {backup}"
+                            )
+                            self._hedge_stats["hedged"] += 1
+                            tasks[
+                                asyncio.create_task(
+                                    self._attempt(backup, messages, kwargs, operation)
+                                )
+                            ] = backup
+
+                while tasks:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        finished = tasks.pop(task)
+                        error = task.exception()
+                        if error is None:
+                            if finished != provider:
+                                self._hedge_stats["hedge_wins"] += 1
+                            return task.result()
+                        if isinstance(error, DeadlineExceededError):
+                            raise error
+                        logger.warning(f"Provider {finished} failed: {error}")
+                        last_error = error  # type: ignore[assignment]
+            finally:
+                # Cancel the slower hedged request (or all, if we were cancelled)
+                for task in tasks:
+                    task.cancel()
+
+        if last_error is None:
+            raise RuntimeError(
+                "All LLM providers unavailable: circuits open for "
+                + ", ".join(providers_to_try)
+            )
+        raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
+
+    async def _attempt(
+        self,
+        provider: str,
+        messages: list[dict[str, str]],
+        kwargs: dict[str, Any],
+        operation: str | None = None,
+    ) -> str:
+        """Send a request to one provider, recording the outcome on its circuit.
+
+        The caller must have been admitted by the provider's circuit breaker.
+        The request is limited to LLM_REQUEST_TIMEOUT and the request
+        deadline; running out of deadline does not count against the
+        provider's circuit.
+
+        Args:
+            provider: Provider name.
+            messages: Chat messages.
+            kwargs: Additional generation parameters.
+            operation: Operation name (for the slow-operation log).
+
+        Returns:
+            Generated text.
+        """
+        breaker = get_circuit_breaker(provider)
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        started = time.monotonic()
+        try:
+            llm = self._get_llm(provider)
+            limiter = get_provider_limiter(provider)
+            async with limiter.acquire(prompt_tokens):
+                # Latency excludes time spent queued in the limiter
+                started = time.monotonic()
+                async with bounded(self._request_timeout, f"LLM request to {provider}"):
+                    response = await llm.achat_complete(messages, **kwargs)
+        except DeadlineExceededError:
+            breaker.record_abandoned()
+            raise
+        except Exception as e:
+            breaker.record_failure(time.monotonic() - started, e)
+            observe_adapter_call("llm", provider, time.monotonic() - started, error=True)
+            raise
+        except BaseException:
+            breaker.record_abandoned()
+            raise
+
+        elapsed = time.monotonic() - started
+        completion_tokens = estimate_tokens(response.content or "")
+        breaker.record_success(elapsed)
+        get_latency_window(provider, operation or "generate").record(elapsed)
+        observe_adapter_call("llm", provider, elapsed)
+        limiter.record_tokens(completion_tokens)
+        record_llm_tokens(provider, prompt_tokens, completion_tokens)
+        get_slow_log().record(
+            "llm",
+            f"{operation or 'generate'} via {provider}/{self._model}",
+            elapsed,
+            messages,
+            rows=completion_tokens,
+        )
+        return response.content
+
+    def _hedge_delay(self, provider: str, operation: str | None = None) -> float:
+        """Get how long to wait for a provider before hedging.
+
+        Args:
+            provider: Provider name.
+            operation: Operation name.
+
+        Returns:
+            Delay in seconds: the configured percentile of the recent
+            successful latencies of the operation on the provider, or the
+            default delay while there are too few samples.
+        """
+        settings = get_settings().llm
+        observed = get_latency_window(provider, operation or "generate").percentile(
+            settings.hedge_percentile, min_samples=settings.hedge_min_samples
+        )
+        delay = observed if observed is not None else settings.hedge_default_delay
+        return max(settings.hedge_min_delay, delay)
+
+    def get_hedge_statistics(self) -> dict[str, int]:
+        """Get hedged request counts.
+
+        Returns:
+            Dictionary with hedged requests and how often the backup won.
+        """
+        return dict(self._hedge_stats)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        on_chunk: Callable[[str], Awaitable[None]] | None = None,
+        operation: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Generate text using the provider's streaming API.
+
+        Each text delta is passed to ``on_chunk`` as it arrives. Providers
+        are tried in order like ``generate``, but only until output has
+        started: a stream failing midway is not restarted elsewhere.
+        Providers without streaming support deliver one final chunk.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: Optional system prompt.
+            on_chunk: Callback receiving text deltas. Errors raised by the
+                callback stop further callbacks but not the generation.
+            operation: Operation name (for logging).
+            **kwargs: Additional generation parameters.
+
+        Returns:
+            Full generated text.
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        callback = on_chunk
+
+        async def emit(delta: str) -> None:
+            nonlocal callback
+            if callback is None or not delta:
+                return
+            try:
+                await callback(delta)
+            except Exception as e:
+                # Progress is best effort, e.g. the client went away
+                logger.warning(f"Stream consumer failed, continuing without it: {e}")
+                callback = None
+
+        providers_to_try = list(dict.fromkeys([self._provider] + self._fallback_providers))
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        last_error: Exception | None = None
 
         for provider in providers_to_try:
+            check_deadline("LLM stream")
+            breaker = get_circuit_breaker(provider)
+            if not breaker.allow_request():
+                continue
+
+            parts: list[str] = []
+            started = time.monotonic()
             try:
-                llm = self._create_llm(provider) if provider != self._provider else self.llm
-                response = await llm.achat_complete(messages, **kwargs)
-                return response.content
+                llm = self._get_llm(provider)
+                limiter = get_provider_limiter(provider)
+                async with limiter.acquire(prompt_tokens):
+                    started = time.monotonic()
+                    async with bounded(self._request_timeout, f"LLM stream from {provider}"):
+                        result = await llm.achat_complete(messages, stream=True, **kwargs)
+                    if hasattr(result, "__aiter__"):
+                        # Each chunk gets the request timeout, so a stalled stream fails
+                        stream = aiter(result)
+                        while True:
+                            async with bounded(
+                                self._request_timeout, f"LLM stream from {provider}"
+                            ):
+                                chunk = await anext(stream, None)
+                            if chunk is None:
+                                break
+                            delta = self._chunk_text(chunk)
+                            if delta:
+                                parts.append(delta)
+                                await emit(delta)
+                    else:
+                        parts.append(result.content or "")
+                        await emit(parts[-1])
+            except DeadlineExceededError:
+                breaker.record_abandoned()
+                raise
             except Exception as e:
+                breaker.record_failure(time.monotonic() - started, e)
+                observe_adapter_call("llm", provider, time.monotonic() - started, error=True)
+                if parts:
+                    raise RuntimeError(
+                        f"Stream from {provider} failed after partial output: {e}"
+                    ) from e
                 logger.warning(f"Provider {provider} failed: {e}")
-                if provider == providers_to_try[-1]:
-                    raise RuntimeError(f"All LLM providers failed. Last error: {e}")
+                last_error = e
+                continue
+            except BaseException:
+                breaker.record_abandoned()
+                raise
+
+            text = "".join(parts)
+            elapsed = time.monotonic() - started
+            completion_tokens = estimate_tokens(text)
+            breaker.record_success(elapsed)
+            observe_adapter_call("llm", provider, elapsed)
+            limiter.record_tokens(completion_tokens)
+            record_llm_tokens(provider, prompt_tokens, completion_tokens)
+            get_slow_log().record(
+                "llm",
+                f"{operation or 'stream'} via {provider}/{self._model}",
+                elapsed,
+                messages,
+                rows=completion_tokens,
+            )
+            logger.debug(
+                f"Streamed {operation or 'completion'} from {provider}: "
+                f"{len(parts)} chunks in {time.monotonic() - started:.2f}s"
+            )
+            return text
+
+        if last_error is None:
+            raise RuntimeError(
+                "All LLM providers unavailable: circuits open for "
+                + ", ".join(providers_to_try)
+            )
+        raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
 
-        return ""
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Extract the text delta of a streamed chunk.
+
+        Args:
+            chunk: Chat completion chunk.
+
+        Returns:
+            Delta text (empty if the chunk carries none).
+        """
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return ""
+        delta = getattr(choices[0], "delta", None)
+        return getattr(delta, "content", None) or ""
 
     async def generate_with_context(
         self,
@@ -186,7 +523,7 @@ Documents:
 Ranking (numbers only, comma-separated):"""
 
         try:
-            response = await self.generate(prompt)
+            response = await self.generate(prompt, operation="rerank")
             # Parse response to get rankings
             rankings = [
                 int(x.strip()) - 1
@@ -207,6 +544,26 @@ Ranking (numbers only, comma-separated):"""
             logger.warning(f"Reranking failed, returning original order: {e}")
             return documents[:top_k]
 
+    def get_limiter_statistics(self) -> dict[str, dict[str, Any]]:
+        """Get queue depth and wait-time statistics of the provider limiters.
+
+        Returns:
+            Mapping of provider to limiter statistics.
+        """
+        return get_limiter_statistics()
+
+    def get_provider_health(self) -> dict[str, dict[str, Any]]:
+        """Get circuit breaker state of the configured providers.
+
+        Returns:
+            Mapping of provider to breaker status, in routing order.
+        """
+        states = get_circuit_states()
+        return {
+            provider: states.get(provider) or get_circuit_breaker(provider).get_status()
+            for provider in dict.fromkeys([self._provider] + self._fallback_providers)
+        }
+
     def get_available_providers(self) -> list[str]:
         """Get list of available LLM providers.
 
@@ -216,49 +573,115 @@ Ranking (numbers only, comma-separated):"""
         # Extract provider names from class names (e.g., "OpenAILanguageModel" -> "openai")
         return [
             cls.replace("LanguageModel", "").lower()
-            for cls in provider_classes
+            for cls in lazy_import("esperanto").provider_classes
             if "LanguageModel" in cls
-        ]
+        ] + ["local"]
 
     def health_check(self) -> bool:
         """Check if LLM provider is accessible.
 
         Returns:
-            True if healthy.
+            True if the model can be created and at least one configured
+            provider's circuit is not open.
         """
         try:
-            # Just verify we can create the model
+            # Verify we can create the model
             _ = self.llm
-            return True
+            return any(
+                status["state"] != "open" for status in self.get_provider_health().values()
+            )
         except Exception as e:
             logger.error(f"LLM health check failed: {e}")
             return False
 
 
+@dataclass
+class EmbeddingBatchStats:
+    """Throughput statistics of one embed_batch call.
+
+    Attributes:
+        texts: Texts sent to the provider (store hits excluded).
+        cached: Texts served from the embedding store.
+        requests: Provider requests made, including retries.
+        retries: Sub-batches retried after a provider error.
+        elapsed_seconds: Wall-clock time spent embedding.
+        final_batch_size: Adaptive batch size at the end of the call.
+    """
+
+    texts: int = 0
+    cached: int = 0
+    requests: int = 0
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+    final_batch_size: int = 0
+
+    @property
+    def texts_per_second(self) -> float:
+        """Embedding throughput in texts per second."""
+        return self.texts / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with all statistics.
+        """
+        return {
+            "texts": self.texts,
+            "cached": self.cached,
+            "requests": self.requests,
+            "retries": self.retries,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "texts_per_second": round(self.texts_per_second, 2),
+            "final_batch_size": self.final_batch_size,
+        }
+
+
 class EmbeddingAdapter:
     """Adapter for esperanto embedding operations.
 
     Provides text embedding functionality through esperanto.
+    Embeddings are looked up in a persistent on-disk store before
+    calling the provider, so unchanged texts are never re-embedded.
+    Only document texts (``embed_batch`` and ``embed(persist=True)``) are
+    stored; search queries are looked up but never written.
     """
 
     def __init__(
         self,
         provider: str | None = None,
         model: str | None = None,
+        store: EmbeddingStore | None = None,
     ) -> None:
         """Initialize embedding adapter.
 
         Args:
             provider: Embedding provider name.
             model: Embedding model name.
+            store: Persistent embedding store (defaults to settings).
         """
         settings = get_settings()
         self._provider = provider or settings.embedding.provider
         self._model = model or settings.embedding.model
         self._embedding_model: EmbeddingModel | None = None
+        # Local embeddings are cheaper to compute than to read back from disk
+        if store is None and settings.embedding.cache_enabled and self._provider != "local":
+            store = EmbeddingStore(settings.embedding.cache_dir)
+        self._store = store
+
+        # Adaptive batching state persists across calls
+        self._batch_size = settings.embedding.batch_size
+        self._max_batch_size = max(settings.embedding.max_batch_size, self._batch_size)
+        self._batch_concurrency = settings.embedding.batch_concurrency
+        self._target_batch_latency = settings.embedding.target_batch_latency
+        self._batch_max_retries = settings.embedding.batch_max_retries
+        self._retry_backoff = 0.5
+        self._last_batch_stats = EmbeddingBatchStats()
 
     @property
-    def embedding_model(self) -> OllamaEmbeddingModel | OpenAIEmbeddingModel:
+    def embedding_model(
+        self,
+    ) -> "OllamaEmbeddingModel | OpenAIEmbeddingModel | LocalEmbeddingModel":
         """Get or create the embedding model.
 
         Returns:
@@ -269,34 +692,53 @@ class EmbeddingAdapter:
             logger.debug(
                 f"Creating embedding model: {self._provider}/{self._model}"
             )
+            ollama = "esperanto.providers.embedding.ollama"
             if self._provider == "ollama":
-                self._embedding_model = OllamaEmbeddingModel(
+                self._embedding_model = lazy_import(ollama).OllamaEmbeddingModel(
                     model_name=self._model,
                     base_url=settings.embedding.base_url,
                 )
             elif self._provider == "openai":
-                self._embedding_model = OpenAIEmbeddingModel(
+                openai = lazy_import("esperanto.providers.embedding.openai")
+                self._embedding_model = openai.OpenAIEmbeddingModel(
                     model_name=self._model,
                     api_key=settings.embedding.api_key,
                 )
+            elif self._provider == "local":
+                self._embedding_model = LocalEmbeddingModel(
+                    model_name=self._model,
+                    dimensions=settings.embedding.dimensions,
+                )
             else:
                 # Default to Ollama
-                self._embedding_model = OllamaEmbeddingModel(
+                self._embedding_model = lazy_import(ollama).OllamaEmbeddingModel(
                     model_name=self._model,
                     base_url=settings.embedding.base_url,
                 )
         return self._embedding_model
 
-    async def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str, persist: bool = False) -> list[float]:
         """Generate embedding for a single text.
 
         Args:
             text: Text to embed.
+            persist: Store the embedding (document texts; search queries
+                are not stored so the store does not grow with every query).
 
         Returns:
             Embedding vector.
         """
-        result = await self.embedding_model.aembed([text])
+        if self._store:
+            cached = await asyncio.to_thread(self._store.get, self._provider, self._model, text)
+            record_cache_lookup("embedding", cached is not None)
+            if cached is not None:
+                return cached
+
+        check_deadline("embedding")
+        with track_adapter("embedding", "embed"):
+            result = await self.embedding_model.aembed([text])
+        if self._store and persist:
+            await asyncio.to_thread(self._store.put, self._provider, self._model, text, result[0])
         return result[0]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -311,29 +753,196 @@ class EmbeddingAdapter:
         if not texts:
             return []
 
-        # Process in batches to avoid rate limits
-        batch_size = 100
-        all_embeddings = []
+        cached: list[list[float] | None] = (
+            await asyncio.to_thread(self._store.get_many, self._provider, self._model, texts)
+            if self._store
+            else [None] * len(texts)
+        )
+        if self._store:
+            hits = sum(e is not None for e in cached)
+            record_cache_lookup("embedding", True, hits)
+            record_cache_lookup("embedding", False, len(texts) - hits)
+
+        # Embed each distinct missing text once
+        missing = list(dict.fromkeys(t for t, e in zip(texts, cached, strict=True) if e is None))
+        if missing:
+            computed = await self._embed_adaptive(missing)
+        else:
+            computed = {}
+            self._last_batch_stats = EmbeddingBatchStats(final_batch_size=self._batch_size)
+        self._last_batch_stats.cached = len(texts) - len(missing)
+
+        return [e if e is not None else computed[t] for t, e in zip(texts, cached, strict=True)]
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            result = await self.embedding_model.aembed(batch)
-            all_embeddings.extend(result)
+    async def _embed_adaptive(self, texts: list[str]) -> dict[str, list[float]]:
+        """Embed texts with bounded concurrency and adaptive batch sizing.
 
-        return all_embeddings
+        Up to ``batch_concurrency`` sub-batches are in flight at once. The
+        batch size grows while requests finish well under the target latency
+        and shrinks on slow responses or provider errors. A failed sub-batch
+        is split in half and retried with backoff instead of failing the
+        whole call; each successful sub-batch is persisted immediately.
 
-    def embed_sync(self, text: str) -> list[float]:
+        Args:
+            texts: Distinct texts to embed.
+
+        Returns:
+            Mapping of text to embedding.
+
+        Raises:
+            RuntimeError: If a sub-batch still fails after all retries.
+        """
+        stats = EmbeddingBatchStats(texts=len(texts))
+        results: dict[str, list[float]] = {}
+        retry_queue: list[tuple[list[str], int]] = []
+        pending: set[asyncio.Task[_ChunkOutcome]] = set()
+        position = 0
+        start = time.perf_counter()
+
+        try:
+            while position < len(texts) or retry_queue or pending:
+                check_deadline("embedding")
+                while len(pending) < self._batch_concurrency and (
+                    retry_queue or position < len(texts)
+                ):
+                    if retry_queue:
+                        chunk, attempt = retry_queue.pop(0)
+                    else:
+                        chunk = texts[position : position + self._batch_size]
+                        position += len(chunk)
+                        attempt = 0
+                    pending.add(asyncio.create_task(self._embed_chunk(chunk, attempt)))
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    chunk, attempt, embeddings, error, latency = task.result()
+                    stats.requests += 1
+
+                    if error is not None or embeddings is None:
+                        self._batch_size = max(1, self._batch_size // 2)
+                        if attempt >= self._batch_max_retries:
+                            raise RuntimeError(
+                                f"Embedding failed for {len(chunk)} texts after "
+                                f"{attempt + 1} attempts: {error}"
+                            ) from error
+                        logger.warning(
+                            f"Embedding sub-batch of {len(chunk)} failed "
+                            f"(attempt {attempt + 1}), retrying: {error}"
+                        )
+                        stats.retries += 1
+                        mid = (len(chunk) + 1) // 2
+                        for part in (chunk[:mid], chunk[mid:]):
+                            if part:
+                                retry_queue.append((part, attempt + 1))
+                        continue
+
+                    self._adapt_batch_size(len(chunk), latency)
+                    results.update(zip(chunk, embeddings, strict=True))
+                    if self._store:
+                        await asyncio.to_thread(
+                            self._store.put_many, self._provider, self._model, chunk, embeddings
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Let cancelled requests release their connections before returning
+                await asyncio.gather(*pending, return_exceptions=True)
+            stats.elapsed_seconds = time.perf_counter() - start
+            stats.final_batch_size = self._batch_size
+            self._last_batch_stats = stats
+
+        logger.info(
+            f"Embedded {stats.texts} texts in {stats.elapsed_seconds:.2f}s "
+            f"({stats.texts_per_second:.1f} texts/s, {stats.requests} requests, "
+            f"{stats.retries} retries, batch size {stats.final_batch_size})"
+        )
+        return results
+
+    async def _embed_chunk(
+        self,
+        chunk: list[str],
+        attempt: int,
+    ) -> _ChunkOutcome:
+        """Embed one sub-batch, capturing errors instead of raising.
+
+        Args:
+            chunk: Texts to embed.
+            attempt: Retry attempt (0 for the first try).
+
+        Returns:
+            Tuple of (chunk, attempt, embeddings, error, latency seconds).
+        """
+        if attempt:
+            await asyncio.sleep(self._retry_backoff * 2 ** (attempt - 1))
+
+        start = time.perf_counter()
+        try:
+            embeddings = await self.embedding_model.aembed(chunk)
+            if len(embeddings) != len(chunk):
+                raise ValueError(
+                    f"Provider returned {len(embeddings)} embeddings for {len(chunk)} texts"
+                )
+            latency = time.perf_counter() - start
+            observe_adapter_call("embedding", "embed_batch", latency)
+            return chunk, attempt, embeddings, None, latency
+        except Exception as e:
+            latency = time.perf_counter() - start
+            observe_adapter_call("embedding", "embed_batch", latency, error=True)
+            return chunk, attempt, None, e, latency
+
+    def _adapt_batch_size(self, size: int, latency: float) -> None:
+        """Adjust the batch size from an observed sub-batch latency.
+
+        Args:
+            size: Size of the completed sub-batch.
+            latency: Its latency in seconds.
+        """
+        if latency > self._target_batch_latency:
+            self._batch_size = max(1, self._batch_size // 2)
+        elif latency < self._target_batch_latency / 2 and size >= self._batch_size:
+            self._batch_size = min(self._max_batch_size, self._batch_size * 2)
+
+    def get_batch_statistics(self) -> dict[str, Any]:
+        """Get throughput statistics of the last embed_batch call.
+
+        Returns:
+            Batch statistics dictionary.
+        """
+        return self._last_batch_stats.to_dict()
+
+    def embed_sync(self, text: str, persist: bool = False) -> list[float]:
         """Generate embedding synchronously.
 
         Args:
             text: Text to embed.
+            persist: Store the embedding (see ``embed``).
 
         Returns:
             Embedding vector.
         """
+        if self._store:
+            cached = self._store.get(self._provider, self._model, text)
+            if cached is not None:
+                return cached
+
         result = self.embedding_model.embed([text])
+        if self._store and persist:
+            self._store.put(self._provider, self._model, text, result[0])
         return result[0]
 
+    def get_store_statistics(self) -> dict[str, Any]:
+        """Get persistent embedding store statistics.
+
+        Returns:
+            Store statistics, or ``{"enabled": False}`` without a store.
+        """
+        if not self._store:
+            return {"enabled": False}
+        return self._store.get_statistics()
+
     @property
     def dimension(self) -> int:
         """Get embedding dimension.
@@ -360,7 +969,8 @@ class EmbeddingAdapter:
             True if healthy.
         """
         try:
-            _ = self.embed_sync("test")
+            # Bypass the store so the provider itself is exercised
+            _ = self.embedding_model.embed(["test"])
             return True
         except Exception as e:
             logger.error(f"Embedding health check failed: {e}")
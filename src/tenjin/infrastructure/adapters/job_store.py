@@ -0,0 +1,544 @@
+"""Persistent stores for background job state.
+
+Jobs are persisted as they change state so that results survive a server
+restart and unfinished jobs can be resumed. Two backends are provided:
+SQLite (default, no extra service needed) and Redis (shared between
+server processes, finished jobs expire through key TTLs).
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from ..config.logging import get_logger
+from .redis_adapter import RedisAdapter
+
+logger = get_logger(__name__)
+
+
+class JobStatus(StrEnum):
+    """Background job states."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class JobRecord:
+    """State of one background job.
+
+    Attributes:
+        job_id: Unique job identifier.
+        operation: Name of the operation to run.
+        arguments: Operation arguments.
+        dedup_key: Hash of operation and arguments; identical jobs share it.
+        status: Current state.
+        created_at: Submission time (epoch seconds).
+        started_at: Time the last run started.
+        finished_at: Time the job reached a final state.
+        progress: Number of progress messages reported.
+        progress_message: Last progress message.
+        result: Operation result once completed.
+        error: Error message if failed.
+        attempts: Number of runs started (greater than 1 after a resume).
+        cancel_requested: Cancellation was requested while the job ran in
+            another process; that process cancels it.
+    """
+
+    job_id: str
+    operation: str
+    arguments: dict[str, Any]
+    dedup_key: str
+    status: JobStatus = JobStatus.PENDING
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    progress: int = 0
+    progress_message: str | None = None
+    result: Any = None
+    error: str | None = None
+    attempts: int = 0
+    cancel_requested: bool = False
+
+    @staticmethod
+    def make_dedup_key(operation: str, arguments: dict[str, Any]) -> str:
+        """Build the deduplication key of a job.
+
+        Args:
+            operation: Operation name.
+            arguments: Operation arguments.
+
+        Returns:
+            Hex digest identifying the operation and its arguments.
+        """
+        payload = json.dumps(
+            {"operation": operation, "arguments": arguments},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def create(cls, operation: str, arguments: dict[str, Any]) -> "JobRecord":
+        """Create a new pending job.
+
+        Args:
+            operation: Operation name.
+            arguments: Operation arguments.
+
+        Returns:
+            Job record with a fresh ID.
+        """
+        return cls(
+            job_id=uuid.uuid4().hex,
+            operation=operation,
+            arguments=arguments,
+            dedup_key=cls.make_dedup_key(operation, arguments),
+        )
+
+    def to_dict(self, include_result: bool = True) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Args:
+            include_result: Include the (possibly large) result.
+
+        Returns:
+            Dictionary with job state.
+        """
+        data: dict[str, Any] = {
+            "job_id": self.job_id,
+            "operation": self.operation,
+            "arguments": self.arguments,
+            "dedup_key": self.dedup_key,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+            "progress_message": self.progress_message,
+            "error": self.error,
+            "attempts": self.attempts,
+            "cancel_requested": self.cancel_requested,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "JobRecord":
+        """Create a job record from its dictionary representation.
+
+        Args:
+            data: Dictionary produced by ``to_dict``.
+
+        Returns:
+            Job record.
+        """
+        return cls(
+            job_id=data["job_id"],
+            operation=data["operation"],
+            arguments=data.get("arguments") or {},
+            dedup_key=data["dedup_key"],
+            status=JobStatus(data["status"]),
+            created_at=data.get("created_at") or time.time(),
+            started_at=data.get("started_at"),
+            finished_at=data.get("finished_at"),
+            progress=data.get("progress", 0),
+            progress_message=data.get("progress_message"),
+            result=data.get("result"),
+            error=data.get("error"),
+            attempts=data.get("attempts", 0),
+            cancel_requested=data.get("cancel_requested", False),
+        )
+
+
+class JobStore(ABC):
+    """Interface of job state stores."""
+
+    @abstractmethod
+    async def save(self, job: JobRecord) -> None:
+        """Insert or update a job.
+
+        A job that has reached a final state is not overwritten, so a
+        process still running a job cancelled elsewhere cannot revive it.
+
+        Args:
+            job: Job record.
+        """
+        ...
+
+    @abstractmethod
+    async def get(self, job_id: str) -> JobRecord | None:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            Job record or None if unknown (or expired).
+        """
+        ...
+
+    @abstractmethod
+    async def find_reusable(self, dedup_key: str) -> JobRecord | None:
+        """Find the newest pending, running, or completed job with a key.
+
+        Args:
+            dedup_key: Deduplication key.
+
+        Returns:
+            Job record or None.
+        """
+        ...
+
+    @abstractmethod
+    async def list_unfinished(self) -> list[JobRecord]:
+        """List pending and running jobs, oldest first.
+
+        Returns:
+            Unfinished job records.
+        """
+        ...
+
+    @abstractmethod
+    async def purge_finished(self, older_than: float) -> int:
+        """Delete finished jobs that finished before a time.
+
+        Args:
+            older_than: Epoch seconds.
+
+        Returns:
+            Number of jobs deleted.
+        """
+        ...
+
+    @abstractmethod
+    async def claim(self, job: JobRecord, owner: str) -> bool:
+        """Claim the next attempt of a pending job for one process.
+
+        Several server processes may queue the same pending job (e.g. when
+        they all resume unfinished jobs on start); only the process whose
+        claim succeeds runs it.
+
+        Args:
+            job: Pending job.
+            owner: Identifier of the claiming process.
+
+        Returns:
+            True if this process may run the job.
+        """
+        ...
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> None:
+        """Record a request to cancel a job.
+
+        The request is kept apart from the job record, so the process
+        running the job sees it even though it keeps saving the job.
+
+        Args:
+            job_id: Job identifier.
+        """
+        ...
+
+    @abstractmethod
+    async def cancel_requested(self, job_ids: list[str]) -> set[str]:
+        """Find the jobs whose cancellation was requested.
+
+        Args:
+            job_ids: Job identifiers.
+
+        Returns:
+            Identifiers of the jobs with a cancel request.
+        """
+        ...
+
+
+class SQLiteJobStore(JobStore):
+    """Job store in a local SQLite database.
+
+    Queries run in a worker thread so they do not block the event loop.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize SQLite job store.
+
+        Args:
+            path: Database file path.
+        """
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema if needed."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    dedup_key TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    finished_at REAL,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_dedup ON jobs (dedup_key, created_at)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_claims (
+                    job_id TEXT NOT NULL,
+                    attempt INTEGER NOT NULL,
+                    owner TEXT NOT NULL,
+                    PRIMARY KEY (job_id, attempt)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_cancels (
+                    job_id TEXT PRIMARY KEY,
+                    requested_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            logger.info(f"Job store opened at {self._path}")
+        return self._conn
+
+    def _fetch(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a query and return its rows (blocking)."""
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def _write(self, *statements: tuple[str, tuple[Any, ...]]) -> int:
+        """Run statements in one transaction (blocking).
+
+        Returns:
+            Number of rows changed by the first statement.
+        """
+        with self._lock:
+            conn = self._connect()
+            rowcounts = [conn.execute(sql, params).rowcount for sql, params in statements]
+            conn.commit()
+        return rowcounts[0]
+
+    async def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[JobRecord]:
+        """Run a query returning job data rows."""
+        rows = await asyncio.to_thread(self._fetch, sql, params)
+        return [JobRecord.from_dict(json.loads(row[0])) for row in rows]
+
+    async def save(self, job: JobRecord) -> None:
+        """Insert or update a job."""
+        data = json.dumps(job.to_dict(), ensure_ascii=False, default=str)
+        await asyncio.to_thread(
+            self._write,
+            (
+                """
+                INSERT INTO jobs
+                    (job_id, dedup_key, status, created_at, finished_at, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (job_id) DO UPDATE SET
+                    status = excluded.status,
+                    finished_at = excluded.finished_at,
+                    data = excluded.data
+                WHERE jobs.status NOT IN ('completed', 'failed', 'cancelled')
+                """,
+                (
+                    job.job_id,
+                    job.dedup_key,
+                    job.status.value,
+                    job.created_at,
+                    job.finished_at,
+                    data,
+                ),
+            ),
+        )
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        """Get a job by ID."""
+        jobs = await self._query("SELECT data FROM jobs WHERE job_id = ?", (job_id,))
+        if not jobs:
+            return None
+        jobs[0].cancel_requested = bool(await self.cancel_requested([job_id]))
+        return jobs[0]
+
+    async def find_reusable(self, dedup_key: str) -> JobRecord | None:
+        """Find the newest pending, running, or completed job with a key."""
+        jobs = await self._query(
+            """
+            SELECT data FROM jobs
+            WHERE dedup_key = ? AND status IN ('pending', 'running', 'completed')
+            ORDER BY created_at DESC LIMIT 1
+            """,
+            (dedup_key,),
+        )
+        return jobs[0] if jobs else None
+
+    async def list_unfinished(self) -> list[JobRecord]:
+        """List pending and running jobs, oldest first."""
+        return await self._query(
+            """
+            SELECT data FROM jobs WHERE status IN ('pending', 'running')
+            ORDER BY created_at
+            """
+        )
+
+    async def purge_finished(self, older_than: float) -> int:
+        """Delete finished jobs that finished before a time."""
+        return await asyncio.to_thread(
+            self._write,
+            (
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+                (older_than,),
+            ),
+            ("DELETE FROM job_claims WHERE job_id NOT IN (SELECT job_id FROM jobs)", ()),
+            ("DELETE FROM job_cancels WHERE job_id NOT IN (SELECT job_id FROM jobs)", ()),
+        )
+
+    async def claim(self, job: JobRecord, owner: str) -> bool:
+        """Claim the next attempt of a pending job for one process."""
+        claimed = await asyncio.to_thread(
+            self._write,
+            (
+                "INSERT OR IGNORE INTO job_claims (job_id, attempt, owner) VALUES (?, ?, ?)",
+                (job.job_id, job.attempts, owner),
+            ),
+        )
+        return claimed == 1
+
+    async def request_cancel(self, job_id: str) -> None:
+        """Record a request to cancel a job."""
+        await asyncio.to_thread(
+            self._write,
+            (
+                "INSERT OR IGNORE INTO job_cancels (job_id, requested_at) VALUES (?, ?)",
+                (job_id, time.time()),
+            ),
+        )
+
+    async def cancel_requested(self, job_ids: list[str]) -> set[str]:
+        """Find the jobs whose cancellation was requested."""
+        if not job_ids:
+            return set()
+        placeholders = ", ".join("?" for _ in job_ids)
+        rows = await asyncio.to_thread(
+            self._fetch,
+            f"SELECT job_id FROM job_cancels WHERE job_id IN ({placeholders})",
+            tuple(job_ids),
+        )
+        return {row[0] for row in rows}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisJobStore(JobStore):
+    """Job store in Redis.
+
+    Each job is a JSON value under ``jobs:<id>``; ``jobs:key:<dedup key>``
+    points to the newest job with that key, ``jobs:claim:<id>:<attempt>``
+    records which process runs an attempt and ``jobs:cancel:<id>`` marks a
+    cancel request. The keys live in the durable
+    keyspace (``RedisAdapter.scoped``), out of reach of cache invalidation.
+    Every key expires after the configured TTL, which is refreshed on each
+    state change.
+    """
+
+    def __init__(self, redis: RedisAdapter, ttl_seconds: int = 86400) -> None:
+        """Initialize Redis job store.
+
+        Args:
+            redis: Connected Redis adapter of the durable keyspace.
+            ttl_seconds: Lifetime of job keys after their last update.
+        """
+        self._redis = redis
+        self._ttl = ttl_seconds
+
+    async def save(self, job: JobRecord) -> None:
+        """Insert or update a job."""
+        current = await self._redis.get_json(f"jobs:{job.job_id}")
+        if current and JobStatus(current["status"]).finished:
+            return
+        await self._redis.set_json(f"jobs:{job.job_id}", job.to_dict(), ttl=self._ttl)
+        await self._redis.set(f"jobs:key:{job.dedup_key}", job.job_id, ttl=self._ttl)
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        """Get a job by ID."""
+        data = await self._redis.get_json(f"jobs:{job_id}")
+        if not data:
+            return None
+        job = JobRecord.from_dict(data)
+        job.cancel_requested = await self._redis.exists(f"jobs:cancel:{job_id}")
+        return job
+
+    async def find_reusable(self, dedup_key: str) -> JobRecord | None:
+        """Find the newest pending, running, or completed job with a key."""
+        job_id = await self._redis.get(f"jobs:key:{dedup_key}")
+        if not job_id:
+            return None
+        job = await self.get(job_id)
+        if job is None or job.status in (JobStatus.FAILED, JobStatus.CANCELLED):
+            return None
+        return job
+
+    async def list_unfinished(self) -> list[JobRecord]:
+        """List pending and running jobs, oldest first."""
+        jobs = []
+        for key in await self._redis.keys("jobs:*"):
+            if key.startswith(("jobs:key:", "jobs:claim:", "jobs:cancel:")):
+                continue
+            job = await self.get(key.removeprefix("jobs:"))
+            if job is not None and not job.status.finished:
+                jobs.append(job)
+        return sorted(jobs, key=lambda j: j.created_at)
+
+    async def purge_finished(self, older_than: float) -> int:
+        """Finished jobs expire through key TTLs; nothing to delete."""
+        return 0
+
+    async def claim(self, job: JobRecord, owner: str) -> bool:
+        """Claim the next attempt of a pending job for one process."""
+        return await self._redis.set_if_absent(
+            f"jobs:claim:{job.job_id}:{job.attempts}", owner, ttl=self._ttl
+        )
+
+    async def request_cancel(self, job_id: str) -> None:
+        """Record a request to cancel a job."""
+        await self._redis.set(f"jobs:cancel:{job_id}", "1", ttl=self._ttl)
+
+    async def cancel_requested(self, job_ids: list[str]) -> set[str]:
+        """Find the jobs whose cancellation was requested."""
+        return {
+            job_id for job_id in job_ids if await self._redis.exists(f"jobs:cancel:{job_id}")
+        }
@@ -0,0 +1,229 @@
+"""Local, deterministic LLM and embedding providers.
+
+These providers need no network access and always return the same output
+for the same input, which makes them suitable for air-gapped CI, offline
+benchmarks, and end-to-end load tests of the services. They implement the
+subset of the esperanto model interfaces used by the adapters.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+import numpy as np
+
+# Word and character n-gram sizes hashed into the embedding space
+_CHAR_NGRAMS = (3, 4, 5)
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class LocalEmbeddingModel:
+    """Feature-hashed character n-gram embedding model.
+
+    Each text is tokenized into words and character n-grams of the padded
+    words. Every feature is hashed (blake2b, stable across processes) to a
+    dimension and a sign, weighted by sublinear term frequency, and the
+    vector is L2-normalized. Texts sharing vocabulary therefore get a high
+    cosine similarity, which is enough for realistic search behaviour.
+    """
+
+    def __init__(self, model_name: str = "hash-ngram", dimensions: int = 384) -> None:
+        """Initialize local embedding model.
+
+        Args:
+            model_name: Model name (only used for identification).
+            dimensions: Embedding dimension.
+        """
+        self.model_name = model_name
+        self.dimensions = dimensions
+        self._feature_cache: dict[str, tuple[int, float]] = {}
+
+    def _features(self, text: str) -> dict[str, int]:
+        """Count word and character n-gram features of a text.
+
+        Args:
+            text: Input text.
+
+        Returns:
+            Mapping of feature to occurrence count.
+        """
+        counts: dict[str, int] = {}
+        for word in _TOKEN_PATTERN.findall(text.lower()):
+            counts[f"w:{word}"] = counts.get(f"w:{word}", 0) + 1
+            padded = f"<{word}>"
+            for n in _CHAR_NGRAMS:
+                for i in range(len(padded) - n + 1):
+                    gram = f"c:{padded[i : i + n]}"
+                    counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    def _slot(self, feature: str) -> tuple[int, float]:
+        """Map a feature to its hashed dimension and sign.
+
+        Args:
+            feature: Feature string.
+
+        Returns:
+            Tuple of (dimension index, +1.0 or -1.0).
+        """
+        slot = self._feature_cache.get(feature)
+        if slot is None:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            slot = (value % self.dimensions, 1.0 if value >> 63 else -1.0)
+            self._feature_cache[feature] = slot
+        return slot
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Embedding vectors in input order.
+        """
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                index, sign = self._slot(feature)
+                matrix[row, index] += sign * (1.0 + np.log(count))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1.0, norms)
+        return matrix.tolist()
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts asynchronously.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Embedding vectors in input order.
+        """
+        return self.embed(texts)
+
+
+@dataclass
+class LocalChatResponse:
+    """Minimal chat completion response with a ``content`` attribute."""
+
+    content: str
+    model: str
+
+
+class LocalLanguageModel:
+    """Deterministic language model stub.
+
+    Responses depend only on the prompt, so repeated runs are comparable:
+
+    - prompts asking for a comma-separated ranking get ``"1, 2, ..."``;
+    - prompts asking for JSON get the first JSON example found in the
+      prompt, or ``{}`` when there is none;
+    - any other prompt gets a short text echoing the start of the prompt.
+
+    An optional fixed latency simulates provider response time in load tests.
+    """
+
+    def __init__(self, model_name: str = "stub", latency: float = 0.0) -> None:
+        """Initialize local language model.
+
+        Args:
+            model_name: Model name (only used for identification).
+            latency: Seconds to sleep before each response.
+        """
+        self.model_name = model_name
+        self.latency = latency
+
+    def chat_complete(self, messages: list[dict[str, Any]], **kwargs: Any) -> LocalChatResponse:
+        """Produce a deterministic completion.
+
+        Args:
+            messages: Chat messages with ``role`` and ``content``.
+            **kwargs: Ignored generation parameters.
+
+        Returns:
+            Chat response.
+        """
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        return LocalChatResponse(content=self._respond(prompt), model=self.model_name)
+
+    async def achat_complete(
+        self, messages: list[dict[str, Any]], stream: bool = False, **kwargs: Any
+    ) -> LocalChatResponse | AsyncIterator[Any]:
+        """Produce a deterministic completion asynchronously.
+
+        Args:
+            messages: Chat messages with ``role`` and ``content``.
+            stream: Return an async iterator of chunks (with
+                ``choices[0].delta.content``) instead of a response.
+            **kwargs: Ignored generation parameters.
+
+        Returns:
+            Chat response, or chunk iterator when streaming.
+        """
+        if stream:
+            return self._stream(self.chat_complete(messages).content)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self.chat_complete(messages, **kwargs)
+
+    async def _stream(self, content: str, chunk_size: int = 16) -> AsyncIterator[Any]:
+        """Yield a response in fixed-size chunks, spreading the latency over them.
+
+        Args:
+            content: Full response text.
+            chunk_size: Characters per chunk.
+
+        Yields:
+            Chunks shaped like esperanto chat completion chunks.
+        """
+        pieces = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+        for piece in pieces:
+            if self.latency > 0:
+                await asyncio.sleep(self.latency / len(pieces))
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    def _respond(self, prompt: str) -> str:
+        """Build the response text for a prompt.
+
+        Args:
+            prompt: Concatenated message contents.
+
+        Returns:
+            Response text.
+        """
+        lowered = prompt.lower()
+        if "comma-separated" in lowered or "comma separated" in lowered:
+            count = len(re.findall(r"^\s*\d+\.", prompt, re.MULTILINE))
+            return ", ".join(str(i) for i in range(1, count + 1))
+        if "json" in lowered:
+            return self._json_example(prompt)
+
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        words = prompt.split()[:40]
+        return f"[{self.model_name}:{digest}] " + " ".join(words)
+
+    @staticmethod
+    def _json_example(prompt: str) -> str:
+        """Extract the first JSON value embedded in a prompt.
+
+        Args:
+            prompt: Prompt text.
+
+        Returns:
+            Compact JSON text.
+        """
+        decoder = json.JSONDecoder()
+        for match in re.finditer(r"[\[{]", prompt):
+            try:
+                value, _ = decoder.raw_decode(prompt, match.start())
+            except json.JSONDecodeError:
+                continue
+            if value:
+                return json.dumps(value, ensure_ascii=False)
+        return "{}"
@@ -0,0 +1,488 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms are kept in a process-wide registry and
+rendered by the SSE server's ``/metrics`` endpoint, so any
+Prometheus-compatible scraper can collect them without a client library
+or an external collector. Adapters record their calls through the helpers
+at the bottom of this module, which also add the calls as spans to the
+active trace.
+"""
+
+import asyncio
+import bisect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, suppress
+from typing import Any
+
+from ..config.logging import get_logger
+from .tracing import record_span, span
+
+logger = get_logger(__name__)
+
+# Upper bounds (seconds) of latency histogram buckets
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+LabelKey = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    """Base class of labelled metrics."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize metric.
+
+        Args:
+            name: Metric name.
+            help_text: Description shown in the exposition.
+            labelnames: Names of the labels every sample carries.
+        """
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelKey:
+        """Get the label values in label name order.
+
+        Raises:
+            ValueError: If the labels do not match the label names.
+        """
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} is missing label {e}") from None
+
+    def _labels(self, key: LabelKey, extra: str = "") -> str:
+        """Render a label set."""
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> list[str]:
+        """Render the metric's sample lines."""
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        """Render the metric with its HELP and TYPE lines."""
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize counter."""
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the count.
+
+        Args:
+            amount: Non-negative increment.
+            **labels: Label values.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Get the current count of a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def label_values(self, label: str) -> list[str]:
+        """Get the distinct values recorded for a label."""
+        index = self.labelnames.index(label)
+        with self._lock:
+            return sorted({key[index] for key in self._values})
+
+    def samples(self) -> list[str]:
+        """Render the metric's sample lines."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize gauge."""
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the value."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        """Get the current value of a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        """Render the metric's sample lines."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize histogram.
+
+        Args:
+            name: Metric name.
+            help_text: Description shown in the exposition.
+            labelnames: Names of the labels every sample carries.
+            buckets: Increasing bucket upper bounds (+Inf is added).
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        # Per label set: non-cumulative bucket counts (+Inf last), sum
+        self._series: dict[LabelKey, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value.
+            **labels: Label values.
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations of a label set."""
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> list[str]:
+        """Render the metric's sample lines."""
+        with self._lock:
+            items = sorted((k, (list(c), s[0])) for k, (c, s) in self._series.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{self._labels(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics of the process."""
+
+    def __init__(self) -> None:
+        """Initialize metrics registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> _Metric:
+        """Get a metric by name, creating it on first use."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, help_text, labelnames)  # type: ignore
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, help_text, labelnames)  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(  # type: ignore
+            Histogram, name, help_text, labelnames, buckets=buckets
+        )
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges before rendering.
+
+        Args:
+            collector: Callable run on every render.
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text.
+        """
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Drop all metrics (collectors stay registered)."""
+        with self._lock:
+            self._metrics.clear()
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+def reset_metrics() -> None:
+    """Drop all recorded metrics."""
+    _registry.clear()
+
+
+def _adapter_duration() -> Histogram:
+    return _registry.histogram(
+        "tenjin_adapter_duration_seconds",
+        "Latency of calls to backing services",
+        ("adapter", "operation", "status"),
+    )
+
+
+def _cache_requests() -> Counter:
+    return _registry.counter(
+        "tenjin_cache_requests_total", "Cache lookups by result", ("cache", "result")
+    )
+
+
+def observe_adapter_call(adapter: str, operation: str, seconds: float, error: bool = False) -> None:
+    """Record the latency of a call to a backing service.
+
+    Args:
+        adapter: Service (neo4j, chromadb, embedding, llm, redis).
+        operation: Operation name (the provider for LLM calls).
+        seconds: Call duration.
+        error: Whether the call failed.
+    """
+    _adapter_duration().observe(
+        seconds, adapter=adapter, operation=operation, status="error" if error else "ok"
+    )
+    record_span(f"{adapter}.{operation}", seconds, error, **{"tenjin.layer": "adapter"})
+
+
+@contextmanager
+def track_adapter(adapter: str, operation: str) -> Iterator[None]:
+    """Record the latency of the block as a call to a backing service.
+
+    The block also runs in a span of the active trace.
+
+    Exceptions raised in the block are recorded as errors and re-raised.
+
+    Args:
+        adapter: Service (neo4j, chromadb, embedding, llm, redis).
+        operation: Operation name.
+    """
+    started = time.perf_counter()
+    error = True
+    try:
+        with span(f"{adapter}.{operation}", **{"tenjin.layer": "adapter"}):
+            yield
+        error = False
+    finally:
+        _adapter_duration().observe(
+            time.perf_counter() - started,
+            adapter=adapter,
+            operation=operation,
+            status="error" if error else "ok",
+        )
+
+
+def record_cache_lookup(cache: str, hit: bool, count: int = 1) -> None:
+    """Record cache lookups.
+
+    Args:
+        cache: Cache name (tool, redis, embedding).
+        hit: Whether the lookups were answered from the cache.
+        count: Number of lookups.
+    """
+    if count > 0:
+        _cache_requests().inc(count, cache=cache, result="hit" if hit else "miss")
+
+
+def record_llm_tokens(provider: str, prompt_tokens: int, completion_tokens: int) -> None:
+    """Record (estimated) LLM token usage.
+
+    Args:
+        provider: LLM provider.
+        prompt_tokens: Tokens sent.
+        completion_tokens: Tokens generated.
+    """
+    tokens = _registry.counter(
+        "tenjin_llm_tokens_total", "Estimated LLM tokens", ("provider", "kind")
+    )
+    tokens.inc(prompt_tokens, provider=provider, kind="prompt")
+    tokens.inc(completion_tokens, provider=provider, kind="completion")
+
+
+def update_cache_hit_ratios() -> None:
+    """Derive per-cache hit ratio gauges from the lookup counters."""
+    requests = _cache_requests()
+    ratio = _registry.gauge(
+        "tenjin_cache_hit_ratio", "Share of cache lookups answered from the cache", ("cache",)
+    )
+    for cache in requests.label_values("cache"):
+        hits = requests.get(cache=cache, result="hit")
+        total = hits + requests.get(cache=cache, result="miss")
+        ratio.set(hits / total if total else 0.0, cache=cache)
+
+
+class EventLoopLagMonitor:
+    """Samples how late the event loop wakes up a sleeping task.
+
+    A sleep of ``interval`` seconds that returns noticeably later means
+    callbacks are blocking the loop (e.g. synchronous I/O or CPU work).
+    """
+
+    def __init__(self, interval: float = 0.5) -> None:
+        """Initialize event loop lag monitor.
+
+        Args:
+            interval: Seconds between samples.
+        """
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Sample loop lag until cancelled."""
+        histogram = _registry.histogram(
+            "tenjin_event_loop_lag_seconds",
+            "Delay of event loop wake-ups beyond the scheduled time",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+        )
+        gauge = _registry.gauge(
+            "tenjin_event_loop_lag_last_seconds", "Most recent event loop lag sample"
+        )
+        while True:
+            expected = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, time.monotonic() - expected)
+            histogram.observe(lag)
+            gauge.set(lag)
+
+
+_registry.add_collector(update_cache_hit_ratios)
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "EventLoopLagMonitor",
+    "CONTENT_TYPE",
+    "get_metrics",
+    "reset_metrics",
+    "observe_adapter_call",
+    "track_adapter",
+    "record_cache_lookup",
+    "record_llm_tokens",
+]
@@ -1,23 +1,36 @@
 """Neo4j database adapter for graph operations."""
 
 import asyncio
+import contextvars
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Sequence
-
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
-from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
 
 from ..config.logging import get_logger
 from ..config.settings import get_settings
+from .deadline import check_deadline, remaining
+from .metrics import track_adapter
+from .slow_log import IndexAdvisor, get_slow_log, total_db_hits
+from .startup import lazy_import
+
+if TYPE_CHECKING:
+    from neo4j import AsyncDriver, AsyncSession, Query
 
 logger = get_logger(__name__)
 
 
+def _retryable() -> tuple[type[Exception], ...]:
+    """Neo4j errors worth retrying (evaluated only when an error is raised)."""
+    errors = lazy_import("neo4j.exceptions")
+    return (errors.ServiceUnavailable, errors.SessionExpired)
+
+
 class Neo4jAdapter:
     """Adapter for Neo4j graph database operations.
 
     Provides async interface for Neo4j operations with connection pooling
-    and automatic retry logic.
+    and automatic retry logic. Under a request deadline, queries run with a
+    transaction timeout of the time left, so the server aborts them too.
     """
 
     def __init__(
@@ -37,31 +50,41 @@ class Neo4jAdapter:
         self._uri = uri or settings.neo4j.uri
         self._user = user or settings.neo4j.user
         self._password = password or settings.neo4j.password
-        self._driver: AsyncDriver | None = None
+        self._driver: "AsyncDriver | None" = None
+        # Background PROFILE runs of slow reads
+        self._profiles: set[asyncio.Task[None]] = set()
+
+    async def connect(self, verify: bool = True) -> None:
+        """Establish connection to Neo4j.
 
-    async def connect(self) -> None:
-        """Establish connection to Neo4j."""
+        Args:
+            verify: Check connectivity now instead of on the first query
+                (skipped by workers whose supervisor already checked it).
+        """
         if self._driver is None:
             logger.info(f"Connecting to Neo4j at {self._uri}")
-            self._driver = AsyncGraphDatabase.driver(
+            self._driver = lazy_import("neo4j").AsyncGraphDatabase.driver(
                 self._uri,
                 auth=(self._user, self._password),
                 max_connection_lifetime=3600,
                 max_connection_pool_size=50,
             )
-            # Verify connectivity
-            await self._driver.verify_connectivity()
+            if verify:
+                await self._driver.verify_connectivity()
             logger.info("Neo4j connection established")
 
     async def close(self) -> None:
         """Close Neo4j connection."""
+        for task in self._profiles:
+            task.cancel()
+        await asyncio.gather(*self._profiles, return_exceptions=True)
         if self._driver:
             logger.info("Closing Neo4j connection")
             await self._driver.close()
             self._driver = None
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(self) -> AsyncIterator["AsyncSession"]:
         """Get a database session.
 
         Yields:
@@ -73,6 +96,24 @@ class Neo4jAdapter:
         async with self._driver.session() as session:  # type: ignore
             yield session
 
+    @staticmethod
+    def _query(query: str, operation: str) -> "str | Query":
+        """Attach the time left until the request deadline as transaction timeout.
+
+        Args:
+            query: Cypher query string.
+            operation: Operation name (for the error message).
+
+        Returns:
+            The query, wrapped with a timeout under a deadline.
+
+        Raises:
+            DeadlineExceededError: If the deadline has already passed.
+        """
+        check_deadline(f"Neo4j {operation}")
+        left = remaining()
+        return query if left is None else lazy_import("neo4j").Query(query, timeout=left)
+
     async def execute_read(
         self,
         query: str,
@@ -90,26 +131,46 @@ class Neo4jAdapter:
             List of result records as dictionaries.
         """
         parameters = parameters or {}
+        slow_log = get_slow_log()
+        advice = slow_log.advisor.review(query) if slow_log.enabled else []
 
         for attempt in range(max_retries):
             try:
-                async with self.session() as session:
-                    result = await session.run(query, parameters)
-                    records = await result.data()
-                    return records
-            except (ServiceUnavailable, SessionExpired) as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2**attempt
+                started = time.perf_counter()
+                with track_adapter("neo4j", "read"):
+                    async with self.session() as session:
+                        result = await session.run(self._query(query, "read"), parameters)
+                        records = await result.data()
+                break
+            except _retryable() as e:
+                wait_time = 2**attempt
+                left = remaining()
+                # A retry that cannot finish before the deadline is not attempted
+                if attempt < max_retries - 1 and (left is None or left > wait_time):
                     logger.warning(
                         f"Neo4j query failed (attempt {attempt + 1}), "
                         f"retrying in {wait_time}s: {e}"
                     )
                     await asyncio.sleep(wait_time)
                 else:
-                    logger.error(f"Neo4j query failed after {max_retries} attempts")
+                    logger.error(f"Neo4j query failed after {attempt + 1} attempts")
                     raise
-
-        return []
+        else:
+            return []
+
+        elapsed = time.perf_counter() - started
+        if slow_log.is_slow("cypher", elapsed):
+            if get_settings().slow_log.profile_cypher and slow_log.should_profile(query):
+                # Profiled off the request path, outside its deadline and tracing context
+                task = asyncio.create_task(
+                    self._profile(query, parameters, elapsed, len(records), advice),
+                    context=contextvars.Context(),
+                )
+                self._profiles.add(task)
+                task.add_done_callback(self._profiles.discard)
+            else:
+                slow_log.record("cypher", query, elapsed, parameters, len(records), advice=advice)
+        return records
 
     async def execute_write(
         self,
@@ -126,17 +187,65 @@ class Neo4jAdapter:
             Result summary as dictionary.
         """
         parameters = parameters or {}
+        slow_log = get_slow_log()
+
+        started = time.perf_counter()
+        with track_adapter("neo4j", "write"):
+            async with self.session() as session:
+                result = await session.run(self._query(query, "write"), parameters)
+                summary = await result.consume()
+        elapsed = time.perf_counter() - started
+        if slow_log.is_slow("cypher", elapsed):
+            counters = summary.counters
+            affected = (
+                counters.nodes_created
+                + counters.nodes_deleted
+                + counters.relationships_created
+                + counters.relationships_deleted
+            )
+            advice = slow_log.advisor.review(query)
+            slow_log.record("cypher", query, elapsed, parameters, affected, advice=advice)
+        return {
+            "nodes_created": summary.counters.nodes_created,
+            "nodes_deleted": summary.counters.nodes_deleted,
+            "relationships_created": summary.counters.relationships_created,
+            "relationships_deleted": summary.counters.relationships_deleted,
+            "properties_set": summary.counters.properties_set,
+        }
 
-        async with self.session() as session:
-            result = await session.run(query, parameters)
-            summary = await result.consume()
-            return {
-                "nodes_created": summary.counters.nodes_created,
-                "nodes_deleted": summary.counters.nodes_deleted,
-                "relationships_created": summary.counters.relationships_created,
-                "relationships_deleted": summary.counters.relationships_deleted,
-                "properties_set": summary.counters.properties_set,
-            }
+    async def _profile(
+        self,
+        query: str,
+        parameters: dict[str, Any],
+        elapsed: float,
+        rows: int,
+        advice: list[str],
+    ) -> None:
+        """Run a slow read query once with PROFILE and record it in the slow log.
+
+        Runs in the background with its own time limit, both in the client
+        and as the server-side transaction timeout.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            elapsed: Duration of the original query.
+            rows: Rows it returned.
+            advice: Findings of the index advisor so far.
+        """
+        timeout = get_settings().slow_log.profile_timeout_seconds
+        db_hits = None
+        try:
+            profiled = lazy_import("neo4j").Query(f"PROFILE {query}", timeout=timeout)
+            async with asyncio.timeout(timeout):
+                async with self.session() as session:
+                    result = await session.run(profiled, parameters)
+                    summary = await result.consume()
+            db_hits = total_db_hits(summary.profile)
+            advice = advice + IndexAdvisor.analyze_plan(summary.profile)
+        except Exception as e:
+            logger.debug(f"PROFILE of slow query failed: {e}")
+        get_slow_log().record("cypher", query, elapsed, parameters, rows, db_hits, advice)
 
     async def execute_batch(
         self,
@@ -151,19 +260,22 @@ class Neo4jAdapter:
             List of result summaries.
         """
         results = []
-
-        async with self.session() as session:
-            async with session.begin_transaction() as tx:
-                for query, params in queries:
-                    result = await tx.run(query, params)
-                    summary = await result.consume()
-                    results.append(
-                        {
-                            "nodes_created": summary.counters.nodes_created,
-                            "relationships_created": summary.counters.relationships_created,
-                        }
-                    )
-                await tx.commit()
+        check_deadline("Neo4j batch")
+        left = remaining()
+
+        with track_adapter("neo4j", "batch"):
+            async with self.session() as session:
+                async with await session.begin_transaction(timeout=left) as tx:
+                    for query, params in queries:
+                        result = await tx.run(query, params)
+                        summary = await result.consume()
+                        results.append(
+                            {
+                                "nodes_created": summary.counters.nodes_created,
+                                "relationships_created": summary.counters.relationships_created,
+                            }
+                        )
+                    await tx.commit()
 
         return results
 
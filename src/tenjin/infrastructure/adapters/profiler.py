@@ -0,0 +1,332 @@
+"""On-demand sampling profiler for a running server.
+
+A profiling session samples the interpreter stack on a CPU-time timer
+(``SIGPROF``) for the next N tool calls or T seconds, whichever comes
+first. The signal handler runs on the event loop thread between
+bytecodes, so it sees the context of the task that is currently running
+and can attribute each sample to the tool call that task belongs to
+(including tasks the tool spawned). Samples are aggregated into collapsed
+stacks (``frame;frame;frame count``), the input format of flamegraph
+tools.
+
+Optionally tracemalloc runs for the duration of the session and the
+report includes the allocation growth between its start and end.
+
+Sampling needs ``signal.setitimer`` (POSIX) and must be started from the
+main thread, which is where the server's event loop runs.
+"""
+
+import asyncio
+import os
+import signal
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+from typing import Any
+
+from ..config.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Root frame of samples taken outside any tool call
+OTHER = "<other>"
+
+_current_tool: ContextVar[str | None] = ContextVar("tenjin_profiled_tool", default=None)
+
+
+@dataclass
+class ProfileReport:
+    """Result of a profiling session.
+
+    Attributes:
+        started_at: Unix time the session started.
+        duration_seconds: Session wall-clock duration.
+        interval_ms: Sampling interval (CPU time).
+        tool_calls: Tool calls completed during the session.
+        stacks: Sample counts by (tool, collapsed stack).
+        memory: Top allocation growth (tracemalloc diff), if captured.
+        stop_reason: Why the session ended.
+    """
+
+    started_at: float
+    duration_seconds: float
+    interval_ms: float
+    tool_calls: int
+    stacks: Counter[tuple[str, str]] = field(default_factory=Counter)
+    memory: list[dict[str, Any]] = field(default_factory=list)
+    stop_reason: str = "stopped"
+
+    @property
+    def samples(self) -> int:
+        """Total number of samples."""
+        return sum(self.stacks.values())
+
+    def collapsed(self, tool: str | None = None) -> str:
+        """Render collapsed stacks, rooted at the tool name.
+
+        Args:
+            tool: Only include samples of this tool.
+
+        Returns:
+            One ``tool;frame;...;frame count`` line per distinct stack.
+        """
+        lines = [
+            f"{name};{stack} {count}" if stack else f"{name} {count}"
+            for (name, stack), count in sorted(self.stacks.items())
+            if tool is None or name == tool
+        ]
+        return "\n".join(lines)
+
+    def by_tool(self, top: int = 10) -> dict[str, dict[str, Any]]:
+        """Summarize samples per tool.
+
+        Args:
+            top: Leaf frames listed per tool.
+
+        Returns:
+            Per tool: sample count, share of all samples and the frames
+            most often on top of the stack.
+        """
+        total = self.samples or 1
+        summary: dict[str, dict[str, Any]] = {}
+        leaves: dict[str, Counter[str]] = {}
+        for (name, stack), count in self.stacks.items():
+            entry = summary.setdefault(name, {"samples": 0})
+            entry["samples"] += count
+            leaves.setdefault(name, Counter())[stack.rsplit(";", 1)[-1]] += count
+        for name, entry in summary.items():
+            entry["share"] = round(entry["samples"] / total, 4)
+            entry["top_frames"] = [
+                {"frame": frame, "samples": count}
+                for frame, count in leaves[name].most_common(top)
+            ]
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["samples"]))
+
+    def to_dict(self, include_collapsed: bool = True) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Args:
+            include_collapsed: Include the collapsed stack text.
+
+        Returns:
+            Dictionary with session info, per-tool summary, memory growth
+            and optionally collapsed stacks.
+        """
+        result: dict[str, Any] = {
+            "started_at": self.started_at,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "interval_ms": self.interval_ms,
+            "tool_calls": self.tool_calls,
+            "samples": self.samples,
+            "stop_reason": self.stop_reason,
+            "tools": self.by_tool(),
+            "memory_growth": self.memory,
+        }
+        if include_collapsed:
+            result["collapsed"] = self.collapsed()
+        return result
+
+
+class SamplingProfiler:
+    """Statistical profiler controlled at runtime."""
+
+    def __init__(self, max_depth: int = 64) -> None:
+        """Initialize sampling profiler.
+
+        Args:
+            max_depth: Frames kept per sample (innermost first).
+        """
+        self._max_depth = max_depth
+        self._lock = threading.Lock()
+        self._labels: dict[CodeType, str] = {}
+        self._session: ProfileReport | None = None
+        self._started = 0.0
+        self._max_calls: int | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._previous_handler: Any = None
+        self._memory_before: tracemalloc.Snapshot | None = None
+        self._started_tracemalloc = False
+        self.last_report: ProfileReport | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether a session is running."""
+        return self._session is not None
+
+    def start(
+        self,
+        max_calls: int | None = None,
+        duration_seconds: float | None = None,
+        interval_ms: float = 5.0,
+        memory: bool = True,
+    ) -> dict[str, Any]:
+        """Start a profiling session.
+
+        Args:
+            max_calls: Stop after this many tool calls.
+            duration_seconds: Stop after this many seconds.
+            interval_ms: Sampling interval in milliseconds of CPU time.
+            memory: Capture a tracemalloc diff over the session.
+
+        Returns:
+            Session status.
+
+        Raises:
+            RuntimeError: If a session is running or sampling is unavailable.
+        """
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("Sampling profiler needs signal.setitimer (POSIX only)")
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("Sampling profiler must be started from the main thread")
+        with self._lock:
+            if self._session is not None:
+                raise RuntimeError("A profiling session is already running")
+            self._session = ProfileReport(
+                started_at=time.time(), duration_seconds=0.0, interval_ms=interval_ms, tool_calls=0
+            )
+        self._started = time.monotonic()
+        self._max_calls = max_calls
+
+        if memory:
+            self._started_tracemalloc = not tracemalloc.is_tracing()
+            if self._started_tracemalloc:
+                tracemalloc.start()
+            self._memory_before = tracemalloc.take_snapshot()
+
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, interval_ms / 1000, interval_ms / 1000)
+
+        if duration_seconds:
+            try:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(duration_seconds, self.stop, "duration")
+            except RuntimeError:
+                pass
+        logger.info(
+            f"Profiling started (calls: {max_calls}, seconds: {duration_seconds}, "
+            f"interval: {interval_ms}ms, memory: {memory})"
+        )
+        return self.status()
+
+    def stop(self, reason: str = "stopped") -> ProfileReport | None:
+        """Stop the running session and build its report.
+
+        Args:
+            reason: Why the session ends.
+
+        Returns:
+            Report, or None if no session was running.
+        """
+        with self._lock:
+            session, self._session = self._session, None
+        if session is None:
+            return None
+
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._memory_before is not None:
+            after = tracemalloc.take_snapshot()
+            stats = after.compare_to(self._memory_before, "lineno")
+            session.memory = [
+                {
+                    "location": str(stat.traceback[0]),
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+                for stat in stats[:20]
+                if stat.size_diff > 0
+            ]
+            self._memory_before = None
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+        session.duration_seconds = time.monotonic() - self._started
+        session.stop_reason = reason
+        self.last_report = session
+        logger.info(
+            f"Profiling stopped ({reason}): {session.samples} samples, "
+            f"{session.tool_calls} tool calls in {session.duration_seconds:.1f}s"
+        )
+        return session
+
+    def status(self) -> dict[str, Any]:
+        """Get the state of the profiler.
+
+        Returns:
+            Whether a session is running and its progress.
+        """
+        session = self._session
+        if session is None:
+            return {"active": False, "has_report": self.last_report is not None}
+        return {
+            "active": True,
+            "elapsed_seconds": round(time.monotonic() - self._started, 3),
+            "tool_calls": session.tool_calls,
+            "max_calls": self._max_calls,
+            "samples": session.samples,
+        }
+
+    @contextmanager
+    def tool_call(self, name: str) -> Iterator[None]:
+        """Attribute samples in the block to a tool call.
+
+        Counts the call towards the session's call limit when it ends.
+
+        Args:
+            name: Tool name.
+        """
+        if self._session is None:
+            yield
+            return
+        token = _current_tool.set(name)
+        try:
+            yield
+        finally:
+            _current_tool.reset(token)
+            session = self._session
+            if session is not None:
+                session.tool_calls += 1
+                if self._max_calls and session.tool_calls >= self._max_calls:
+                    self.stop("max_calls")
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        """Record the interrupted stack (signal handler)."""
+        session = self._session
+        if session is None:
+            return
+        labels = []
+        while frame is not None and len(labels) < self._max_depth:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = (
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+            labels.append(label)
+            frame = frame.f_back
+        session.stacks[(_current_tool.get() or OTHER, ";".join(reversed(labels)))] += 1
+
+
+_profiler = SamplingProfiler()
+
+
+def get_profiler() -> SamplingProfiler:
+    """Get the process-wide sampling profiler."""
+    return _profiler
+
+
+__all__ = [
+    "ProfileReport",
+    "SamplingProfiler",
+    "get_profiler",
+]
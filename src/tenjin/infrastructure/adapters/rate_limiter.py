@@ -0,0 +1,286 @@
+"""Per-provider concurrency and rate limiting for LLM requests.
+
+Each LLM provider gets a semaphore bounding in-flight requests plus
+request-per-minute and token-per-minute token buckets. Callers queue in
+FIFO order until all three admit them, so bursts (e.g. reranking after a
+batch search) are smoothed out instead of triggering provider 429s.
+Limiters are shared per provider across all adapter instances in the
+process.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from ..config.logging import get_logger
+from ..config.settings import get_settings
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    The bucket may go into debt (negative level) when actual usage turns
+    out larger than the amount reserved up front; later acquirers then
+    wait until the debt is paid back.
+    """
+
+    def __init__(self, per_minute: int, capacity: int | None = None) -> None:
+        """Initialize token bucket.
+
+        Args:
+            per_minute: Refill rate per minute.
+            capacity: Maximum burst size (defaults to one minute of refill).
+        """
+        self._rate = per_minute / 60.0
+        self._capacity = float(capacity or per_minute)
+        self._level = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        self._level = min(self._capacity, self._level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def delay_for(self, amount: float) -> float:
+        """Get the wait time until an amount can be taken.
+
+        Args:
+            amount: Tokens needed.
+
+        Returns:
+            Seconds to wait (0 if available now).
+        """
+        self._refill()
+        # A request larger than the whole bucket only waits for a full bucket
+        needed = min(amount, self._capacity)
+        if self._level >= needed:
+            return 0.0
+        return (needed - self._level) / self._rate
+
+    def consume(self, amount: float) -> None:
+        """Take tokens, allowing the level to go negative.
+
+        Args:
+            amount: Tokens to take.
+        """
+        self._refill()
+        self._level -= amount
+
+    @property
+    def level(self) -> float:
+        """Current number of available tokens."""
+        self._refill()
+        return self._level
+
+
+@dataclass
+class LimiterStats:
+    """Queueing statistics of one provider limiter.
+
+    Attributes:
+        requests: Requests admitted.
+        queued: Requests currently waiting for admission.
+        in_flight: Requests currently running.
+        max_queue_depth: Highest observed queue depth.
+        total_wait_seconds: Summed admission wait time.
+        max_wait_seconds: Longest admission wait.
+        tokens: Estimated tokens used.
+    """
+
+    requests: int = 0
+    queued: int = 0
+    in_flight: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    tokens: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with all statistics.
+        """
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_wait_seconds": round(
+                self.total_wait_seconds / self.requests if self.requests else 0.0, 4
+            ),
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+            "tokens": self.tokens,
+        }
+
+
+class ProviderLimiter:
+    """Concurrency and rate limiter for one LLM provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+    ) -> None:
+        """Initialize provider limiter.
+
+        Args:
+            provider: Provider name.
+            max_concurrency: Maximum requests in flight.
+            requests_per_minute: Request rate limit (0 for unlimited).
+            tokens_per_minute: Token rate limit (0 for unlimited).
+        """
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._admission = asyncio.Lock()
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._limits = {
+            "max_concurrency": max_concurrency,
+            "requests_per_minute": requests_per_minute,
+            "tokens_per_minute": tokens_per_minute,
+        }
+        self.stats = LimiterStats()
+
+    async def _wait_for_rate(self, tokens: int) -> None:
+        """Sleep until both rate buckets can admit a request."""
+        while True:
+            delay = max(
+                self._requests.delay_for(1) if self._requests else 0.0,
+                self._tokens.delay_for(tokens) if self._tokens else 0.0,
+            )
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        if self._requests:
+            self._requests.consume(1)
+        if self._tokens:
+            self._tokens.consume(tokens)
+
+    @asynccontextmanager
+    async def acquire(self, tokens: int = 0) -> AsyncIterator["ProviderLimiter"]:
+        """Wait for admission and hold a concurrency slot.
+
+        Args:
+            tokens: Estimated tokens of the request.
+
+        Yields:
+            This limiter, for recording actual usage via ``record_tokens``.
+        """
+        stats = self.stats
+        stats.queued += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queued)
+        started = time.monotonic()
+        try:
+            await self._semaphore.acquire()
+            try:
+                # Serialize rate waits so queued requests are admitted in order
+                async with self._admission:
+                    await self._wait_for_rate(tokens)
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            stats.queued -= 1
+
+        waited = time.monotonic() - started
+        stats.requests += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+        stats.tokens += tokens
+        stats.in_flight += 1
+        if waited > 1.0:
+            logger.debug(f"LLM request to {self.provider} queued for {waited:.2f}s")
+        try:
+            yield self
+        finally:
+            stats.in_flight -= 1
+            self._semaphore.release()
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charge tokens used beyond the estimate given to ``acquire``.
+
+        Args:
+            tokens: Additional tokens (e.g. the completion).
+        """
+        if tokens <= 0:
+            return
+        self.stats.tokens += tokens
+        if self._tokens:
+            self._tokens.consume(tokens)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get limits, queue depth, and wait-time statistics.
+
+        Returns:
+            Dictionary of limiter statistics.
+        """
+        result: dict[str, Any] = {"provider": self.provider, "limits": self._limits}
+        result.update(self.stats.to_dict())
+        if self._requests:
+            result["requests_available"] = round(self._requests.level, 2)
+        if self._tokens:
+            result["tokens_available"] = round(self._tokens.level, 2)
+        return result
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text.
+
+    Args:
+        text: Input text.
+
+    Returns:
+        Estimated tokens (about four characters per token).
+    """
+    return max(1, len(text) // 4)
+
+
+_limiters: dict[str, ProviderLimiter] = {}
+
+
+def get_provider_limiter(provider: str) -> ProviderLimiter:
+    """Get the shared limiter for a provider, creating it from settings.
+
+    Args:
+        provider: Provider name.
+
+    Returns:
+        Provider limiter.
+    """
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        settings = get_settings().llm
+        concurrency, rpm, tpm = settings.provider_limit_map.get(
+            provider,
+            (settings.max_concurrency, settings.requests_per_minute, settings.tokens_per_minute),
+        )
+        limiter = ProviderLimiter(provider, concurrency, rpm, tpm)
+        _limiters[provider] = limiter
+        logger.info(
+            f"LLM limiter for {provider}: concurrency={concurrency}, rpm={rpm}, tpm={tpm}"
+        )
+    return limiter
+
+
+def get_limiter_statistics() -> dict[str, dict[str, Any]]:
+    """Get statistics of all provider limiters.
+
+    Returns:
+        Mapping of provider to limiter statistics.
+    """
+    return {name: limiter.get_statistics() for name, limiter in _limiters.items()}
+
+
+def reset_provider_limiters() -> None:
+    """Drop all limiters so they are recreated from current settings."""
+    _limiters.clear()
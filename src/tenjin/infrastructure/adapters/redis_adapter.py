@@ -9,11 +9,16 @@ import redis.asyncio as redis
 from redis.asyncio.connection import ConnectionPool
 
 from ..config.logging import get_logger
+from .metrics import record_cache_lookup, track_adapter
 
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Durable state (jobs, shared methodologies) is kept under its own prefix,
+# outside the cache keyspace, so that flushing the cache never reaches it
+STATE_KEY_PREFIX = "tenjin-state:"
+
 
 @dataclass
 class CacheEntry(Generic[T]):
@@ -46,6 +51,7 @@ class RedisAdapter:
         self._pool: ConnectionPool | None = None
         self._client: redis.Redis | None = None
         self._connected = False
+        self._scoped = False
 
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -63,8 +69,28 @@ class RedisAdapter:
             logger.warning(f"Failed to connect to Redis: {e}. Cache will be disabled.")
             self._connected = False
 
+    def scoped(self, key_prefix: str = STATE_KEY_PREFIX) -> "RedisAdapter":
+        """Get an adapter for another keyspace sharing this connection.
+
+        Scoped adapters hold durable state: ``flush_all`` does not delete
+        their keys and ``close`` leaves the shared connection open. Create
+        them after ``connect``.
+
+        Args:
+            key_prefix: Prefix of the keyspace.
+
+        Returns:
+            Adapter using this adapter's connection.
+        """
+        view = RedisAdapter(self._url, self._default_ttl, key_prefix)
+        view._pool, view._client, view._connected = self._pool, self._client, self._connected
+        view._scoped = True
+        return view
+
     async def close(self) -> None:
         """Close Redis connection."""
+        if self._scoped:
+            return
         if self._client:
             await self._client.close()
         if self._pool:
@@ -100,7 +126,9 @@ class RedisAdapter:
 
         try:
             full_key = self._make_key(key)
-            value = await self._client.get(full_key)
+            with track_adapter("redis", "get"):
+                value = await self._client.get(full_key)
+            record_cache_lookup("redis", value is not None)
             if value:
                 logger.debug(f"Cache hit: {key}")
             return value
@@ -147,13 +175,44 @@ class RedisAdapter:
         try:
             full_key = self._make_key(key)
             ttl = ttl or self._default_ttl
-            await self._client.set(full_key, value, ex=ttl)
+            with track_adapter("redis", "set"):
+                await self._client.set(full_key, value, ex=ttl)
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
             return True
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
             return False
 
+    async def set_if_absent(
+        self,
+        key: str,
+        value: str,
+        ttl: int | None = None,
+    ) -> bool:
+        """Set value only if the key does not exist yet (atomic).
+
+        Args:
+            key: Cache key
+            value: Value to set
+            ttl: TTL in seconds (uses default if not specified)
+
+        Returns:
+            True if the key was set, False if it existed or Redis failed
+        """
+        if not self._connected or not self._client:
+            return False
+
+        try:
+            full_key = self._make_key(key)
+            with track_adapter("redis", "set"):
+                created = await self._client.set(
+                    full_key, value, ex=ttl or self._default_ttl, nx=True
+                )
+            return bool(created)
+        except Exception as e:
+            logger.warning(f"Cache set error: {e}")
+            return False
+
     async def set_json(
         self,
         key: str,
@@ -191,7 +250,8 @@ class RedisAdapter:
 
         try:
             full_key = self._make_key(key)
-            result = await self._client.delete(full_key)
+            with track_adapter("redis", "delete"):
+                result = await self._client.delete(full_key)
             return result > 0
         except Exception as e:
             logger.warning(f"Cache delete error: {e}")
@@ -240,6 +300,28 @@ class RedisAdapter:
             logger.warning(f"Cache exists error: {e}")
             return False
 
+    async def keys(self, pattern: str) -> list[str]:
+        """List keys matching pattern.
+
+        Args:
+            pattern: Key pattern (e.g., "jobs:*")
+
+        Returns:
+            Matching keys without the key prefix
+        """
+        if not self._connected or not self._client:
+            return []
+
+        try:
+            full_pattern = self._make_key(pattern)
+            return [
+                key[len(self._key_prefix):]
+                async for key in self._client.scan_iter(match=full_pattern)
+            ]
+        except Exception as e:
+            logger.warning(f"Cache keys error: {e}")
+            return []
+
     async def ttl(self, key: str) -> int:
         """Get TTL of key.
 
@@ -260,11 +342,17 @@ class RedisAdapter:
             return -2
 
     async def flush_all(self) -> bool:
-        """Flush all keys with prefix.
+        """Flush all cache keys (the keys with this adapter's prefix).
+
+        Durable state lives in scoped adapters under another prefix
+        (``STATE_KEY_PREFIX``) that the flush never matches.
 
         Returns:
             True if successful
         """
+        if self._scoped:
+            logger.warning(f"Refusing to flush durable keyspace {self._key_prefix}")
+            return False
         return await self.delete_pattern("*") >= 0
 
     async def get_stats(self) -> dict[str, Any]:
@@ -0,0 +1,346 @@
+"""Slow-operation log and Cypher index advisor.
+
+Adapters report the duration of Cypher queries, vector queries and LLM
+calls here. Operations slower than the configured threshold for their
+kind are logged with a truncated hash of their parameters, the row count
+and the duration, and kept in a bounded in-memory list. Parameters
+themselves are never logged.
+
+The index advisor inspects Cypher text (and, when captured, the PROFILE
+plan) for patterns that cannot use a range index and therefore scan every
+node of a label, e.g. ``CONTAINS`` predicates.
+"""
+
+import hashlib
+import json
+import re
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from ..config.logging import get_logger
+from ..config.settings import get_settings
+
+logger = get_logger(__name__)
+
+OperationKind = Literal["cypher", "vector", "llm"]
+
+# Plan operators that read every node (of a label)
+_SCAN_OPERATORS = ("NodeByLabelScan", "AllNodesScan")
+
+_NODE_PATTERN = re.compile(r"\(\s*(\w+)\s*:\s*(\w+)")
+_SUBSTRING_PREDICATE = re.compile(r"\b(\w+)\.(\w+)\s+(CONTAINS|ENDS\s+WITH)\b", re.IGNORECASE)
+_FUNCTION_ON_PROPERTY = re.compile(
+    r"\b(toLower|toUpper|trim|toString)\s*\(\s*(\w+)\.(\w+)\s*\)", re.IGNORECASE
+)
+_REGEX_PREDICATE = re.compile(r"\b(\w+)\.(\w+)\s*=~", re.IGNORECASE)
+_LIST_SCAN = re.compile(r"\bANY\s*\(\s*\w+\s+IN\s+(\w+)\.(\w+)\s+WHERE", re.IGNORECASE)
+
+
+def params_hash(parameters: Any) -> str:
+    """Hash parameters for correlating log lines without logging values.
+
+    Args:
+        parameters: Operation parameters.
+
+    Returns:
+        First 12 hex digits of the SHA-256 of the canonical JSON.
+    """
+    encoded = json.dumps(parameters, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+
+
+def _first_line(text: str, limit: int = 120) -> str:
+    """Collapse whitespace and truncate an operation description."""
+    collapsed = " ".join(text.split())
+    return collapsed if len(collapsed) <= limit else collapsed[: limit - 3] + "..."
+
+
+@dataclass
+class SlowOperation:
+    """Operation that exceeded its slow threshold.
+
+    Attributes:
+        kind: Operation kind (cypher, vector, llm).
+        operation: Operation description (query text or provider/model).
+        duration_ms: Duration in milliseconds.
+        threshold_ms: Threshold that was exceeded.
+        params_hash: Truncated hash of the parameters.
+        rows: Rows returned or affected, if known.
+        db_hits: Database hits from a PROFILE run, if captured.
+        advice: Index advisor findings for the operation.
+        timestamp: Unix time the operation finished.
+    """
+
+    kind: str
+    operation: str
+    duration_ms: float
+    threshold_ms: float
+    params_hash: str
+    rows: int | None = None
+    db_hits: int | None = None
+    advice: list[str] = field(default_factory=list)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with the operation, timing and advisor findings.
+        """
+        return {
+            "kind": self.kind,
+            "operation": self.operation,
+            "duration_ms": round(self.duration_ms, 1),
+            "threshold_ms": self.threshold_ms,
+            "params_hash": self.params_hash,
+            "rows": self.rows,
+            "db_hits": self.db_hits,
+            "advice": self.advice,
+            "timestamp": self.timestamp,
+        }
+
+
+class IndexAdvisor:
+    """Flags Cypher queries that scan a label instead of using an index.
+
+    Findings are computed once per distinct query text and logged the
+    first time the query is seen.
+    """
+
+    def __init__(self) -> None:
+        """Initialize index advisor."""
+        self._findings: dict[str, list[str]] = {}
+
+    def review(self, query: str) -> list[str]:
+        """Get findings for a query, logging them on first sight.
+
+        Args:
+            query: Cypher query text.
+
+        Returns:
+            Findings (empty if the query looks index-friendly).
+        """
+        findings = self._findings.get(query)
+        if findings is None:
+            findings = self._findings[query] = self.analyze_query(query)
+            for finding in findings:
+                logger.warning(f"Index advisor: {finding} in query: {_first_line(query)}")
+        return findings
+
+    @staticmethod
+    def analyze_query(query: str) -> list[str]:
+        """Find predicates that force a label scan.
+
+        Args:
+            query: Cypher query text.
+
+        Returns:
+            Findings.
+        """
+        labels = dict(_NODE_PATTERN.findall(query))
+
+        def node(var: str) -> str:
+            return f"{var}:{labels[var]}" if var in labels else var
+
+        findings = []
+        for var, prop, op in _SUBSTRING_PREDICATE.findall(query):
+            op = " ".join(op.upper().split())
+            label = labels.get(var, "Label")
+            findings.append(
+                f"label scan: ({node(var)}) filtered by {var}.{prop} {op}, which a range "
+                f"index cannot serve; add CREATE TEXT INDEX FOR (n:{label}) ON (n.{prop}) "
+                f"or query a full-text index"
+            )
+        for func, var, prop in _FUNCTION_ON_PROPERTY.findall(query):
+            findings.append(
+                f"label scan: {func}({var}.{prop}) on ({node(var)}) prevents index use; "
+                f"store a normalized property and index that instead"
+            )
+        for var, prop in _REGEX_PREDICATE.findall(query):
+            findings.append(f"label scan: regular expression on {var}.{prop} ({node(var)})")
+        for var, prop in _LIST_SCAN.findall(query):
+            findings.append(
+                f"label scan: ANY() over list property {var}.{prop} ({node(var)}) "
+                f"is evaluated per node"
+            )
+        return findings
+
+    @staticmethod
+    def analyze_plan(profile: dict[str, Any] | None) -> list[str]:
+        """Find scan operators in a PROFILE plan.
+
+        Args:
+            profile: Plan as returned in the result summary.
+
+        Returns:
+            Findings with operator, identifiers and rows.
+        """
+        findings = []
+        for operator in _walk_plan(profile):
+            name = str(operator.get("operatorType", ""))
+            if name.split("@")[0] in _SCAN_OPERATORS:
+                details = operator.get("args", {}).get("Details", "")
+                findings.append(
+                    f"plan: {name.split('@')[0]} {details} "
+                    f"({operator.get('rows', '?')} rows, {operator.get('dbHits', '?')} db hits)"
+                )
+        return findings
+
+
+def _walk_plan(profile: dict[str, Any] | None) -> Iterable[dict[str, Any]]:
+    """Yield every operator of a plan tree."""
+    stack = [profile] if profile else []
+    while stack:
+        operator = stack.pop()
+        yield operator
+        stack.extend(operator.get("children", []))
+
+
+def total_db_hits(profile: dict[str, Any] | None) -> int | None:
+    """Sum the database hits of all operators of a PROFILE plan.
+
+    Args:
+        profile: Plan as returned in the result summary.
+
+    Returns:
+        Total db hits, or None without a plan.
+    """
+    if not profile:
+        return None
+    return sum(int(operator.get("dbHits", 0) or 0) for operator in _walk_plan(profile))
+
+
+class SlowOperationLog:
+    """Logs and keeps operations slower than their kind's threshold."""
+
+    def __init__(
+        self,
+        thresholds_ms: dict[str, float],
+        max_entries: int = 200,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize slow-operation log.
+
+        Args:
+            thresholds_ms: Threshold per operation kind in milliseconds.
+            max_entries: Slow operations kept in memory.
+            enabled: Whether operations are checked at all.
+        """
+        self.enabled = enabled
+        self._thresholds = dict(thresholds_ms)
+        self._entries: deque[SlowOperation] = deque(maxlen=max_entries)
+        self._profiled: set[str] = set()
+        self.advisor = IndexAdvisor()
+
+    def is_slow(self, kind: OperationKind, seconds: float) -> bool:
+        """Check whether a duration exceeds the kind's threshold."""
+        threshold = self._thresholds.get(kind)
+        return self.enabled and threshold is not None and seconds * 1000 >= threshold
+
+    def should_profile(self, query: str) -> bool:
+        """Check whether a slow query still needs a PROFILE run (once per query text)."""
+        if query in self._profiled or query.lstrip().upper().startswith(("PROFILE", "EXPLAIN")):
+            return False
+        self._profiled.add(query)
+        return True
+
+    def record(
+        self,
+        kind: OperationKind,
+        operation: str,
+        seconds: float,
+        parameters: Any = None,
+        rows: int | None = None,
+        db_hits: int | None = None,
+        advice: list[str] | None = None,
+    ) -> SlowOperation | None:
+        """Record an operation if it was slow.
+
+        Args:
+            kind: Operation kind.
+            operation: Query text or provider/model.
+            seconds: Duration.
+            parameters: Parameters (only their hash is kept).
+            rows: Rows returned or affected (tokens generated for LLM calls).
+            db_hits: Database hits from a PROFILE run.
+            advice: Index advisor findings.
+
+        Returns:
+            The slow operation, or None if it was under the threshold.
+        """
+        if not self.is_slow(kind, seconds):
+            return None
+        entry = SlowOperation(
+            kind=kind,
+            operation=_first_line(operation, 500),
+            duration_ms=seconds * 1000,
+            threshold_ms=self._thresholds[kind],
+            params_hash=params_hash(parameters),
+            rows=rows,
+            db_hits=db_hits,
+            advice=list(advice or []),
+        )
+        self._entries.append(entry)
+        extra = f", {db_hits} db hits" if db_hits is not None else ""
+        logger.warning(
+            f"Slow {kind} ({entry.duration_ms:.0f}ms > {entry.threshold_ms:.0f}ms, "
+            f"params {entry.params_hash}, rows {rows if rows is not None else '?'}{extra}): "
+            f"{_first_line(operation)}"
+        )
+        return entry
+
+    def recent(self, limit: int | None = None) -> list[SlowOperation]:
+        """Get recent slow operations, newest first.
+
+        Args:
+            limit: Maximum number of entries.
+
+        Returns:
+            Slow operations.
+        """
+        entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        """Drop recorded slow operations."""
+        self._entries.clear()
+
+
+_slow_log: SlowOperationLog | None = None
+
+
+def get_slow_log() -> SlowOperationLog:
+    """Get the process-wide slow-operation log, creating it from settings."""
+    global _slow_log
+    if _slow_log is None:
+        settings = get_settings().slow_log
+        _slow_log = SlowOperationLog(
+            {
+                "cypher": settings.cypher_ms,
+                "vector": settings.vector_ms,
+                "llm": settings.llm_ms,
+            },
+            max_entries=settings.max_entries,
+            enabled=settings.enabled,
+        )
+    return _slow_log
+
+
+def reset_slow_log() -> None:
+    """Drop the slow-operation log so it is recreated from current settings."""
+    global _slow_log
+    _slow_log = None
+
+
+__all__ = [
+    "SlowOperation",
+    "SlowOperationLog",
+    "IndexAdvisor",
+    "get_slow_log",
+    "reset_slow_log",
+    "params_hash",
+    "total_db_hits",
+]
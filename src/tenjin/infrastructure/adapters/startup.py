@@ -0,0 +1,132 @@
+"""Startup timing report and deferred imports.
+
+Heavy client libraries (chromadb, neo4j, esperanto) are imported on first
+use through ``lazy_import`` rather than when their adapter module is
+imported. Backends are connected concurrently, and rarely used services
+are built on first use. The startup report records where the remaining
+cold-start time goes:
+
+- ``imports``: import time per deferred library
+- ``connects``: connect time per backend
+- ``services``: build time per lazily built service
+"""
+
+import importlib
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Any
+
+from ..config.logging import get_logger
+
+logger = get_logger(__name__)
+
+SECTIONS = ("imports", "connects", "services")
+
+
+class StartupReport:
+    """Durations of the steps of server startup."""
+
+    def __init__(self) -> None:
+        """Initialize empty report."""
+        self._lock = threading.Lock()
+        self._sections: dict[str, dict[str, float]] = {section: {} for section in SECTIONS}
+        self.initialize_seconds: float | None = None
+
+    def record(self, section: str, name: str, seconds: float) -> None:
+        """Record the duration of one step.
+
+        Args:
+            section: "imports", "connects" or "services".
+            name: Module, backend or service name.
+            seconds: Duration.
+        """
+        with self._lock:
+            self._sections[section][name] = seconds
+
+    @contextmanager
+    def timed(self, section: str, name: str) -> Iterator[None]:
+        """Record the duration of a block (also when it fails).
+
+        Args:
+            section: "imports", "connects" or "services".
+            name: Module, backend or service name.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(section, name, time.perf_counter() - started)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Milliseconds per step, grouped by section, slowest first.
+        """
+        with self._lock:
+            report: dict[str, Any] = {
+                section: {
+                    name: round(seconds * 1000, 1)
+                    for name, seconds in sorted(steps.items(), key=lambda item: -item[1])
+                }
+                for section, steps in self._sections.items()
+            }
+        report["initialize_ms"] = (
+            round(self.initialize_seconds * 1000, 1)
+            if self.initialize_seconds is not None
+            else None
+        )
+        return report
+
+    def summary(self) -> str:
+        """Format the report as one log line.
+
+        Returns:
+            Summary such as ``initialize 412ms | imports: chromadb 203ms, ...``.
+        """
+        report = self.to_dict()
+        parts = [f"initialize {report['initialize_ms'] or 0:.0f}ms"]
+        for section in SECTIONS:
+            if report[section]:
+                steps = ", ".join(f"{name} {ms:.0f}ms" for name, ms in report[section].items())
+                parts.append(f"{section}: {steps}")
+        return " | ".join(parts)
+
+
+_report = StartupReport()
+
+
+def get_startup_report() -> StartupReport:
+    """Get the process-wide startup report."""
+    return _report
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module on first use and record its import time.
+
+    Args:
+        name: Module name.
+
+    Returns:
+        Imported module.
+    """
+    module = sys.modules.get(name)
+    spec = getattr(module, "__spec__", None)
+    if module is not None and not getattr(spec, "_initializing", False):
+        return module
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    _report.record("imports", name, time.perf_counter() - started)
+    logger.debug(f"Imported {name} in {(time.perf_counter() - started) * 1000:.0f}ms")
+    return module
+
+
+__all__ = [
+    "StartupReport",
+    "get_startup_report",
+    "lazy_import",
+]
@@ -0,0 +1,140 @@
+"""Helpers for streaming LLM output to clients as it is generated.
+
+Long JSON completions (synthesis, gap analysis, implementation guides)
+are streamed from the provider and every top-level JSON field is reported
+as soon as it is complete, so clients see results long before the whole
+completion has arrived.
+"""
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from ..config.logging import get_logger
+
+if TYPE_CHECKING:
+    from .esperanto_adapter import EsperantoAdapter
+
+logger = get_logger(__name__)
+
+# Receives one progress message (JSON text) per event
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+
+class JsonFieldStream:
+    """Incremental parser reporting completed top-level fields of a JSON object.
+
+    Text is fed in arbitrary chunks. Whenever a ``"key": value`` pair of the
+    outermost object is complete, ``on_field(key, value)`` is awaited. Text
+    before the first ``{`` (e.g. a code fence) is ignored.
+    """
+
+    def __init__(self, on_field: Callable[[str, Any], Awaitable[None]]) -> None:
+        """Initialize JSON field stream.
+
+        Args:
+            on_field: Callback receiving each completed field.
+        """
+        self._on_field = on_field
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._field_start: int | None = None
+        self._done = False
+
+    async def feed(self, chunk: str) -> None:
+        """Consume a chunk of the response.
+
+        Args:
+            chunk: Next piece of response text.
+        """
+        if self._done or not chunk:
+            return
+        self._text += chunk
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1 and self._field_start is None:
+                    if char != "{":
+                        self._done = True
+                        break
+                    self._field_start = i + 1
+            elif char in "}]":
+                if self._depth == 1 and self._field_start is not None:
+                    await self._emit(text[self._field_start : i])
+                    self._done = True
+                    break
+                self._depth = max(0, self._depth - 1)
+            elif char == "," and self._depth == 1 and self._field_start is not None:
+                await self._emit(text[self._field_start : i])
+                self._field_start = i + 1
+        self._pos = len(text)
+
+    async def _emit(self, segment: str) -> None:
+        """Parse a ``"key": value`` segment and report it.
+
+        Args:
+            segment: Text of one field of the outer object.
+        """
+        if not segment.strip():
+            return
+        try:
+            field = json.loads("{" + segment + "}")
+        except json.JSONDecodeError:
+            # Not valid JSON (e.g. a placeholder echoed back); the final
+            # result still carries whatever could be parsed
+            return
+        for key, value in field.items():
+            await self._on_field(key, value)
+
+
+async def stream_json_fields(
+    llm: "EsperantoAdapter",
+    prompt: str,
+    system_prompt: str | None,
+    on_progress: ProgressCallback,
+    operation: str,
+) -> str:
+    """Generate a JSON completion while reporting its fields as progress.
+
+    A "started" message is sent immediately, then one message per
+    completed top-level field: ``{"field": <key>, "value": <value>}``.
+
+    Args:
+        llm: LLM adapter.
+        prompt: User prompt asking for a JSON object.
+        system_prompt: Optional system prompt.
+        on_progress: Progress callback.
+        operation: Operation name included in the "started" message.
+
+    Returns:
+        Full response text.
+    """
+
+    async def on_field(key: str, value: Any) -> None:
+        await on_progress(json.dumps({"field": key, "value": value}, ensure_ascii=False))
+
+    await on_progress(json.dumps({"status": "started", "operation": operation}))
+    fields = JsonFieldStream(on_field)
+    return await llm.generate_stream(
+        prompt,
+        system_prompt,
+        on_chunk=fields.feed,
+        operation=operation,
+    )
@@ -0,0 +1,384 @@
+"""Lightweight tracing with contextvars-based spans.
+
+A trace is started around each tool call. While it is active, spans are
+opened around service and repository methods (``trace_methods``) and
+adapter calls (``track_adapter`` in the metrics module); each new span
+becomes the parent of spans opened inside it, also across ``await`` and
+tasks created within it. When the root span ends the finished trace is
+handed to the exporter, which writes it in the OTLP/JSON format (one
+``ExportTraceServiceRequest`` per line).
+
+Outside an active trace spans are no-ops, so instrumented code pays only
+a context variable lookup.
+"""
+
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import IO, Any, Protocol, TypeVar
+
+from ..config.logging import get_logger
+
+logger = get_logger(__name__)
+
+SERVICE_NAME = "tenjin"
+
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    """Timed operation within a trace.
+
+    Attributes:
+        name: Operation name.
+        trace_id: Trace ID (32 hex digits).
+        span_id: Span ID (16 hex digits).
+        parent_id: Parent span ID (None for the root span).
+        start_ns: Start time in nanoseconds since the epoch.
+        end_ns: End time in nanoseconds since the epoch.
+        attributes: Span attributes.
+        error: Error message if the operation failed.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds."""
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Convert to an OTLP/JSON span.
+
+        Returns:
+            Span in the OTLP/JSON encoding.
+        """
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+@dataclass
+class Trace:
+    """Spans of one traced request.
+
+    Attributes:
+        root: Root span.
+        spans: Finished spans, the root last.
+        finished: Whether the root span has ended (later spans are dropped).
+    """
+
+    root: Span
+    spans: list[Span] = field(default_factory=list)
+    finished: bool = False
+
+    def breakdown(self) -> dict[str, Any]:
+        """Summarize where the time went.
+
+        Returns:
+            Dictionary with the trace ID, total duration and, per span name,
+            the number of spans and their summed duration, slowest first.
+        """
+        totals: dict[str, list[float]] = {}
+        for span in self.spans:
+            if span is self.root:
+                continue
+            entry = totals.setdefault(span.name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += span.duration_ms
+        return {
+            "trace_id": self.root.trace_id,
+            "total_ms": round(self.root.duration_ms, 2),
+            "spans": {
+                name: {"count": int(count), "ms": round(ms, 2)}
+                for name, (count, ms) in sorted(totals.items(), key=lambda i: -i[1][1])
+            },
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    """Encode an attribute as an OTLP key/value pair."""
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def to_otlp_request(trace: Trace) -> dict[str, Any]:
+    """Build an OTLP/JSON ``ExportTraceServiceRequest`` for a trace.
+
+    Args:
+        trace: Finished trace.
+
+    Returns:
+        Export request with one resource and one scope.
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": SERVICE_NAME},
+                        "spans": [span.to_otlp() for span in trace.spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter(Protocol):
+    """Receives finished traces."""
+
+    def export(self, trace: Trace) -> None:
+        """Export a finished trace."""
+        ...
+
+
+class OTLPJsonExporter:
+    """Writes traces as OTLP/JSON lines to a stream or a file."""
+
+    def __init__(self, path: str | None = None, stream: IO[str] | None = None) -> None:
+        """Initialize OTLP/JSON exporter.
+
+        Args:
+            path: File to append to (used when no stream is given).
+            stream: Text stream to write to, e.g. ``sys.stdout``.
+        """
+        self._path = path
+        self._stream = stream
+        self._lock = threading.Lock()
+        if path and stream is None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def export(self, trace: Trace) -> None:
+        """Write one trace as a single JSON line."""
+        line = json.dumps(to_otlp_request(trace), ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._stream is not None:
+                self._stream.write(line + "\n")
+                self._stream.flush()
+            elif self._path:
+                with open(self._path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("tenjin_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("tenjin_span", default=None)
+_exporter: SpanExporter | None = None
+
+
+def configure_tracing(exporter: SpanExporter | None) -> None:
+    """Set the exporter finished traces are sent to.
+
+    Args:
+        exporter: Exporter, or None to only keep traces in memory.
+    """
+    global _exporter
+    _exporter = exporter
+
+
+def create_exporter(kind: str, file_path: str, stdio: bool = False) -> SpanExporter | None:
+    """Create the exporter selected in the settings.
+
+    Args:
+        kind: "stdout", "file" or "none".
+        file_path: Output file for the "file" exporter.
+        stdio: Whether stdout carries the MCP protocol (traces then go
+            to stderr instead).
+
+    Returns:
+        Exporter, or None for "none".
+    """
+    if kind == "stdout":
+        if stdio:
+            logger.warning("stdout carries the MCP protocol in STDIO mode; tracing to stderr")
+            return OTLPJsonExporter(stream=sys.stderr)
+        return OTLPJsonExporter(stream=sys.stdout)
+    if kind == "file":
+        return OTLPJsonExporter(path=file_path)
+    return None
+
+
+def current_trace() -> Trace | None:
+    """Get the trace active in the current context."""
+    return _current_trace.get()
+
+
+def _new_span(name: str, trace_id: str, parent: Span | None, attributes: dict) -> Span:
+    return Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=os.urandom(8).hex(),
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes=attributes,
+    )
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Trace]:
+    """Start a trace with a root span around the block.
+
+    The trace is exported when the block ends.
+
+    Args:
+        name: Root span name.
+        **attributes: Root span attributes.
+
+    Yields:
+        The active trace.
+    """
+    root = _new_span(name, os.urandom(16).hex(), None, attributes)
+    trace = Trace(root=root)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(root)
+    try:
+        yield trace
+    except BaseException as e:
+        root.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        root.end_ns = time.time_ns()
+        trace.spans.append(root)
+        trace.finished = True
+        if _exporter is not None:
+            try:
+                _exporter.export(trace)
+            except Exception as e:
+                logger.warning(f"Trace export failed: {e}")
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Open a child span around the block (no-op outside a trace).
+
+    Args:
+        name: Span name.
+        **attributes: Span attributes.
+
+    Yields:
+        The span, or None when no trace is active.
+    """
+    trace = _current_trace.get()
+    if trace is None or trace.finished:
+        yield None
+        return
+    current = _new_span(name, trace.root.trace_id, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_ns = time.time_ns()
+        trace.spans.append(current)
+
+
+def record_span(name: str, seconds: float, error: bool = False, **attributes: Any) -> None:
+    """Record a span that ends now and lasted ``seconds``.
+
+    For operations timed by the caller rather than wrapped in ``span``.
+
+    Args:
+        name: Span name.
+        seconds: Duration.
+        error: Whether the operation failed.
+        **attributes: Span attributes.
+    """
+    trace = _current_trace.get()
+    if trace is None or trace.finished:
+        return
+    finished = _new_span(name, trace.root.trace_id, _current_span.get(), attributes)
+    finished.end_ns = time.time_ns()
+    finished.start_ns = finished.end_ns - int(seconds * 1e9)
+    if error:
+        finished.error = "failed"
+    trace.spans.append(finished)
+
+
+def trace_methods(layer: str) -> Callable[[type[T]], type[T]]:
+    """Class decorator opening a span around each public async method.
+
+    Spans are named ``ClassName.method`` and carry a ``tenjin.layer``
+    attribute.
+
+    Args:
+        layer: Architectural layer (e.g. "service", "repository").
+
+    Returns:
+        Class decorator.
+    """
+
+    def decorate(cls: type[T]) -> type[T]:
+        for attr, method in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.iscoroutinefunction(method):
+                continue
+            setattr(cls, attr, _traced(method, f"{cls.__name__}.{attr}", layer))
+        return cls
+
+    return decorate
+
+
+def _traced(method: Callable[..., Any], name: str, layer: str) -> Callable[..., Any]:
+    """Wrap a coroutine function in a span."""
+
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _current_trace.get() is None:
+            return await method(*args, **kwargs)
+        with span(name, **{"tenjin.layer": layer}):
+            return await method(*args, **kwargs)
+
+    return wrapper
+
+
+__all__ = [
+    "Span",
+    "Trace",
+    "OTLPJsonExporter",
+    "configure_tracing",
+    "create_exporter",
+    "current_trace",
+    "start_trace",
+    "span",
+    "record_span",
+    "trace_methods",
+    "to_otlp_request",
+]
@@ -3,7 +3,7 @@
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -26,6 +26,10 @@ class ChromaDBSettings(BaseSettings):
     port: int = Field(default=8000, description="ChromaDB server port")
     persist_dir: str = Field(default="./data/chromadb", description="ChromaDB persistence directory (for local mode)")
     collection_name: str = Field(default="tenjin_theories", description="Default collection name")
+    alias_refresh_interval: float = Field(
+        default=30.0,
+        description="Seconds between checks for a collection alias swap (0 disables)",
+    )
 
     @property
     def use_http(self) -> bool:
@@ -51,12 +55,127 @@ class LLMSettings(BaseSettings):
         default="anthropic,ollama",
         description="Comma-separated fallback providers",
     )
+    stub_latency: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Simulated response latency (seconds) of the local LLM stub",
+    )
+    max_concurrency: int = Field(
+        default=8, gt=0, description="Default maximum in-flight requests per provider"
+    )
+    requests_per_minute: int = Field(
+        default=0, ge=0, description="Default requests per minute per provider (0 = unlimited)"
+    )
+    tokens_per_minute: int = Field(
+        default=0, ge=0, description="Default tokens per minute per provider (0 = unlimited)"
+    )
+    circuit_failure_threshold: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Error or slow-call rate in the window that opens a provider circuit",
+    )
+    circuit_window_size: int = Field(
+        default=20, gt=0, description="Recent calls per provider considered by the circuit"
+    )
+    circuit_min_calls: int = Field(
+        default=5, gt=0, description="Calls in the window before a circuit can open"
+    )
+    circuit_open_seconds: float = Field(
+        default=30.0, gt=0.0, description="Seconds an open circuit waits before a probe"
+    )
+    circuit_slow_call_seconds: float = Field(
+        default=30.0, gt=0.0, description="Latency above which a call counts as slow"
+    )
+    request_timeout: float = Field(
+        default=120.0,
+        ge=0.0,
+        description="Timeout (seconds) of one LLM request, shortened by the deadline (0 = none)",
+    )
+    explanation_mode: Literal["batch", "gather", "sequential"] = Field(
+        default="batch",
+        description="How recommendation explanations are generated",
+    )
+    explanation_concurrency: int = Field(
+        default=4, gt=0, description="Concurrent explanation calls in gather mode"
+    )
+    hedge_operations: str = Field(
+        default="rerank",
+        description="Comma-separated operations whose requests are hedged",
+    )
+    hedge_percentile: float = Field(
+        default=0.95,
+        gt=0.0,
+        le=1.0,
+        description="Latency percentile of the provider after which a hedge is sent",
+    )
+    hedge_min_samples: int = Field(
+        default=10, gt=0, description="Latency samples needed before the percentile is used"
+    )
+    hedge_default_delay: float = Field(
+        default=2.0, gt=0.0, description="Hedge delay (seconds) while samples are missing"
+    )
+    hedge_min_delay: float = Field(
+        default=0.2, ge=0.0, description="Lower bound of the hedge delay (seconds)"
+    )
+    provider_limits: str = Field(
+        default="",
+        description=(
+            "Per-provider overrides as provider=concurrency/rpm/tpm, comma-separated "
+            "(e.g. 'openai=4/500/200000,ollama=2')"
+        ),
+    )
+
+    @field_validator("provider_limits")
+    @classmethod
+    def _check_provider_limits(cls, value: str) -> str:
+        """Reject malformed per-provider overrides at startup."""
+        for entry in value.split(","):
+            if not entry.strip():
+                continue
+            provider, sep, spec = entry.partition("=")
+            parts = spec.split("/")
+            if not sep or not provider.strip() or len(parts) > 3:
+                raise ValueError(
+                    f"Invalid provider limit '{entry.strip()}', "
+                    "expected provider=concurrency/rpm/tpm"
+                )
+            for part in parts:
+                if part.strip() and not part.strip().isdigit():
+                    raise ValueError(
+                        f"Invalid provider limit '{entry.strip()}': "
+                        f"'{part.strip()}' is not a non-negative integer"
+                    )
+        return value
 
     @property
     def fallback_provider_list(self) -> list[str]:
         """Get fallback providers as list."""
         return [p.strip() for p in self.fallback_providers.split(",") if p.strip()]
 
+    @property
+    def hedge_operation_list(self) -> list[str]:
+        """Get hedged operations as list."""
+        return [p.strip() for p in self.hedge_operations.split(",") if p.strip()]
+
+    @property
+    def provider_limit_map(self) -> dict[str, tuple[int, int, int]]:
+        """Get per-provider (concurrency, rpm, tpm) limits.
+
+        Values missing from an override fall back to the defaults.
+        """
+        limits: dict[str, tuple[int, int, int]] = {}
+        for entry in self.provider_limits.split(","):
+            if not entry.strip():
+                continue
+            provider, _, spec = entry.partition("=")
+            defaults = [self.max_concurrency, self.requests_per_minute, self.tokens_per_minute]
+            for i, value in enumerate(spec.split("/")[:3]):
+                if value.strip():
+                    defaults[i] = int(value)
+            limits[provider.strip()] = (max(1, defaults[0]), defaults[1], defaults[2])
+        return limits
+
 
 class EmbeddingSettings(BaseSettings):
     """Embedding model settings."""
@@ -72,6 +191,32 @@ class EmbeddingSettings(BaseSettings):
     model: str = Field(default="nomic-embed-text", description="Embedding model name")
     base_url: str = Field(default="http://localhost:11434", description="Embedding service base URL")
     api_key: str | None = Field(default=None, description="API key for embedding service")
+    dimensions: int = Field(
+        default=384, gt=0, description="Embedding dimension of the local provider"
+    )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Persist embeddings on disk keyed by provider, model and text hash",
+    )
+    cache_dir: str = Field(
+        default="./data/embedding_cache",
+        description="Directory of the persistent embedding store",
+    )
+    batch_size: int = Field(default=100, gt=0, description="Initial texts per embedding request")
+    max_batch_size: int = Field(
+        default=512, gt=0, description="Upper bound for adaptive batch size"
+    )
+    batch_concurrency: int = Field(
+        default=4, gt=0, description="Maximum embedding requests in flight"
+    )
+    target_batch_latency: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Batch latency (seconds) the adaptive batch size aims for",
+    )
+    batch_max_retries: int = Field(
+        default=3, ge=0, description="Retries per failed sub-batch before giving up"
+    )
 
 
 class CacheSettings(BaseSettings):
@@ -84,6 +229,290 @@ class CacheSettings(BaseSettings):
     redis_url: str = Field(default="redis://localhost:6379", description="Redis URL")
 
 
+class InferenceSettings(BaseSettings):
+    """Relationship inference settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="INFERENCE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    min_confidence: float = Field(
+        default=0.5, ge=0.0, le=1.0, description="Minimum confidence of stored inferred edges"
+    )
+    precompute_checkpoint: str = Field(
+        default="./data/relationship_precompute.json",
+        description="Checkpoint file of the relationship precomputation",
+    )
+    precompute_neighbors: int = Field(
+        default=5, gt=0, description="Most similar unconnected theories considered per theory"
+    )
+    precompute_min_similarity: float = Field(
+        default=0.3, ge=-1.0, le=1.0, description="Minimum embedding cosine of candidate pairs"
+    )
+    precompute_max_pairs: int = Field(
+        default=2000, gt=0, description="Maximum candidate pairs sent to the LLM per run"
+    )
+    precompute_batch_size: int = Field(
+        default=8, gt=0, description="Theory pairs judged per LLM call"
+    )
+    precompute_concurrency: int = Field(
+        default=2, gt=0, description="LLM batches in flight during precomputation"
+    )
+    prefilter_enabled: bool = Field(
+        default=True, description="Rank relationship candidates locally before the LLM"
+    )
+    prefilter_top_k: int = Field(
+        default=8, gt=0, description="Top-scoring candidates sent to the LLM per request"
+    )
+    prefilter_weight_common_neighbors: float = Field(
+        default=0.2, ge=0.0, description="Link prediction weight of common neighbours"
+    )
+    prefilter_weight_adamic_adar: float = Field(
+        default=0.2, ge=0.0, description="Link prediction weight of Adamic-Adar"
+    )
+    prefilter_weight_jaccard: float = Field(
+        default=0.2, ge=0.0, description="Link prediction weight of principle/keyword Jaccard"
+    )
+    prefilter_weight_embedding: float = Field(
+        default=0.4, ge=0.0, description="Link prediction weight of embedding cosine"
+    )
+    gap_coverage_threshold: float = Field(
+        default=0.5,
+        ge=-1.0,
+        le=1.0,
+        description="Outcome-theory cosine at which an outcome counts as covered",
+    )
+    gap_candidates_per_outcome: int = Field(
+        default=3, gt=0, description="Candidate theories suggested per uncovered outcome"
+    )
+    embedding_matrix_ttl: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds the cached theory embedding matrix is reused (0 = no cache)",
+    )
+
+
+class JobSettings(BaseSettings):
+    """Background job settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="JOB_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    backend: Literal["sqlite", "redis"] = Field(
+        default="sqlite",
+        description="Job state store (redis falls back to sqlite if unavailable)",
+    )
+    sqlite_path: str = Field(
+        default="./data/jobs.sqlite3", description="SQLite job database path"
+    )
+    max_workers: int = Field(default=2, gt=0, description="Jobs executed concurrently")
+    timeout_seconds: float = Field(
+        default=1800.0, gt=0.0, description="Maximum run time of one job"
+    )
+    result_ttl_seconds: int = Field(
+        default=86400, gt=0, description="How long finished jobs and results are kept"
+    )
+
+
+
+class ToolSettings(BaseSettings):
+    """MCP tool dispatch settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="TOOL_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    max_concurrency: int = Field(default=32, gt=0, description="Tool calls in flight")
+    heavy_concurrency: int = Field(
+        default=2, gt=0, description="Calls in flight per export or batch tool"
+    )
+    cache_enabled: bool = Field(
+        default=True, description="Cache results of deterministic read-only tools in process"
+    )
+    cache_ttl_seconds: float = Field(
+        default=300.0, gt=0.0, description="How long cached tool results are served"
+    )
+    cache_max_entries: int = Field(default=1024, gt=0, description="Maximum cached tool results")
+    pretty_json: bool = Field(
+        default=False, description="Indent JSON tool and resource responses (compact otherwise)"
+    )
+    default_timeout_seconds: float = Field(
+        default=120.0, ge=0.0, description="Default deadline of a tool call (0 = none)"
+    )
+    llm_timeout_seconds: float = Field(
+        default=300.0, ge=0.0, description="Default deadline of LLM inference tools (0 = none)"
+    )
+    max_timeout_seconds: float = Field(
+        default=600.0, gt=0.0, description="Upper bound of a client-supplied timeout"
+    )
+    timeouts: str = Field(
+        default="",
+        description=(
+            "Per-tool default deadlines as tool=seconds, comma-separated "
+            "(e.g. 'synthesize_theories=300,search_theories=15')"
+        ),
+    )
+
+    @property
+    def timeout_map(self) -> dict[str, float]:
+        """Get per-tool default deadlines."""
+        timeouts: dict[str, float] = {}
+        for entry in self.timeouts.split(","):
+            if "=" in entry:
+                tool, _, seconds = entry.partition("=")
+                timeouts[tool.strip()] = float(seconds)
+        return timeouts
+
+
+class AdmissionSettings(BaseSettings):
+    """Admission control settings (SSE and HTTP mode)."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="ADMISSION_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True, description="Apply admission control in SSE mode")
+    max_sessions: int = Field(default=64, gt=0, description="Open SSE sessions")
+    session_retry_after_seconds: int = Field(
+        default=5, gt=0, description="Retry-After sent when no session is available"
+    )
+    session_max_in_flight: int = Field(
+        default=4, gt=0, description="Tool calls in flight per session"
+    )
+    session_max_queue: int = Field(
+        default=8, ge=0, description="Tool calls of one session waiting for a slot"
+    )
+    cheap_max_in_flight: int = Field(
+        default=32, gt=0, description="Lookup tool calls in flight across sessions"
+    )
+    expensive_max_in_flight: int = Field(
+        default=4, gt=0, description="LLM, batch and export tool calls in flight across sessions"
+    )
+    max_queue: int = Field(
+        default=32, ge=0, description="Tool calls waiting for a slot per pool"
+    )
+    max_wait_seconds: float = Field(
+        default=5.0, ge=0.0, description="Longest wait for a slot before rejection"
+    )
+
+
+class HttpSettings(BaseSettings):
+    """Stateless Streamable HTTP mode settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    workers: int = Field(default=0, ge=0, description="Worker processes (0 = one per CPU core)")
+    path: str = Field(default="/mcp", description="Path of the MCP endpoint")
+    json_response: bool = Field(
+        default=False,
+        description="Answer with plain JSON instead of an SSE stream (no progress notifications)",
+    )
+    snapshot_path: str = Field(
+        default="./data/startup_snapshot.json",
+        description="Startup snapshot written by the supervisor for its workers",
+    )
+
+
+class MetricsSettings(BaseSettings):
+    """Metrics endpoint settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="METRICS_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True, description="Serve /metrics in SSE mode")
+    loop_lag_interval: float = Field(
+        default=0.5, gt=0.0, description="Seconds between event loop lag samples"
+    )
+
+
+class SlowLogSettings(BaseSettings):
+    """Slow-operation log settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="SLOWLOG_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True, description="Log operations slower than thresholds")
+    cypher_ms: float = Field(default=200.0, gt=0.0, description="Slow Cypher query threshold")
+    vector_ms: float = Field(default=200.0, gt=0.0, description="Slow vector query threshold")
+    llm_ms: float = Field(default=10000.0, gt=0.0, description="Slow LLM call threshold")
+    profile_cypher: bool = Field(
+        default=False,
+        description="Re-run slow read queries once with PROFILE to capture db hits",
+    )
+    profile_timeout_seconds: float = Field(
+        default=10.0, gt=0.0, description="Time limit of the background PROFILE run"
+    )
+    max_entries: int = Field(default=200, gt=0, description="Slow operations kept in memory")
+
+
+class ProfilingSettings(BaseSettings):
+    """On-demand profiling settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="PROFILING_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    admin_enabled: bool = Field(
+        default=False, description="Expose the profiling admin tools and /admin/profile"
+    )
+    admin_token: str | None = Field(
+        default=None, description="Bearer token of /admin/profile (not mounted without one)"
+    )
+    interval_ms: float = Field(default=5.0, gt=0.0, description="Default sampling interval")
+    max_duration_seconds: float = Field(
+        default=600.0, gt=0.0, description="Longest allowed profiling session"
+    )
+
+
+class TracingSettings(BaseSettings):
+    """Request tracing settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="TRACING_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=False, description="Trace tool calls and export the spans")
+    exporter: Literal["file", "stdout", "none"] = Field(
+        default="file", description="Where traces are written as OTLP/JSON lines"
+    )
+    file_path: str = Field(default="./data/traces.jsonl", description="Trace output file")
+    debug: bool = Field(
+        default=False, description="Attach a timing breakdown to tool result metadata"
+    )
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
@@ -111,6 +540,15 @@ class Settings(BaseSettings):
     llm: LLMSettings = Field(default_factory=LLMSettings)
     embedding: EmbeddingSettings = Field(default_factory=EmbeddingSettings)
     cache: CacheSettings = Field(default_factory=CacheSettings)
+    inference: InferenceSettings = Field(default_factory=InferenceSettings)
+    job: JobSettings = Field(default_factory=JobSettings)
+    tool: ToolSettings = Field(default_factory=ToolSettings)
+    admission: AdmissionSettings = Field(default_factory=AdmissionSettings)
+    http: HttpSettings = Field(default_factory=HttpSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
+    slow_log: SlowLogSettings = Field(default_factory=SlowLogSettings)
+    profiling: ProfilingSettings = Field(default_factory=ProfilingSettings)
 
 
 @lru_cache
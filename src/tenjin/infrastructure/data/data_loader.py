@@ -4,8 +4,12 @@ This module provides utilities for loading educational theory data
 from JSON files into Neo4j and ChromaDB databases.
 """
 
+import hashlib
 import json
 import logging
+import random
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +29,92 @@ from tenjin.infrastructure.adapters.esperanto_adapter import EmbeddingAdapter
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ChangeSet:
+    """Result of diffing source data against stored content hashes.
+
+    Attributes:
+        added: IDs present in the source data but not in the database.
+        changed: IDs whose content hash differs from the stored one.
+        removed: IDs stored in the database but no longer in the source data.
+        unchanged: Number of entities whose content hash matched.
+        reembedded: IDs whose embedding was regenerated.
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    reembedded: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any entity was added, changed, or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with change lists and counts.
+        """
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+            "reembedded": self.reembedded,
+        }
+
+
+@dataclass
+class RebuildReport:
+    """Result of a blue/green vector collection rebuild.
+
+    Attributes:
+        alias: Logical collection name that was rebuilt.
+        old_collection: Physical collection serving queries before the rebuild.
+        new_collection: Newly built physical collection.
+        old_count: Documents in the old collection.
+        new_count: Documents in the new collection.
+        expected_count: Theories in the source data.
+        sample_size: Number of theories used for the recall check.
+        recall: Mean overlap of top-k neighbours between old and new collection.
+        swapped: Whether the alias now points at the new collection.
+        reason: Why the swap was refused, if it was.
+    """
+
+    alias: str
+    old_collection: str
+    new_collection: str
+    old_count: int = 0
+    new_count: int = 0
+    expected_count: int = 0
+    sample_size: int = 0
+    recall: float | None = None
+    swapped: bool = False
+    reason: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with rebuild details.
+        """
+        return {
+            "alias": self.alias,
+            "old_collection": self.old_collection,
+            "new_collection": self.new_collection,
+            "old_count": self.old_count,
+            "new_count": self.new_count,
+            "expected_count": self.expected_count,
+            "sample_size": self.sample_size,
+            "recall": self.recall,
+            "swapped": self.swapped,
+            "reason": self.reason,
+        }
+
+
 class DataLoader:
     """Loads educational theory data into databases."""
 
@@ -124,47 +214,9 @@ class DataLoader:
         theorists = []
 
         for item in data["theorists"]:
-            theorist = Theorist(
-                id=TheoristId(item["id"]),
-                name=item["name"],
-                name_ja=item["name_ja"],
-                birth_year=item.get("birth_year"),
-                death_year=item.get("death_year"),
-                nationality=item.get("nationality"),
-                primary_field=item.get("primary_field"),
-                contributions=item.get("contributions", []),
-                key_works=item.get("key_works", []),
-                related_theory_ids=[TheoryId(tid) for tid in item.get("related_theories", [])],
-            )
+            theorist = self._build_theorist(item)
             theorists.append(theorist)
-
-            # Create Neo4j node
-            query = """
-            MERGE (t:Theorist {id: $id})
-            SET t.name = $name,
-                t.name_ja = $name_ja,
-                t.birth_year = $birth_year,
-                t.death_year = $death_year,
-                t.nationality = $nationality,
-                t.primary_field = $primary_field,
-                t.contributions = $contributions,
-                t.key_works = $key_works
-            RETURN t
-            """
-            await self.neo4j.execute_write(
-                query,
-                {
-                    "id": str(theorist.id),
-                    "name": theorist.name,
-                    "name_ja": theorist.name_ja,
-                    "birth_year": theorist.birth_year,
-                    "death_year": theorist.death_year,
-                    "nationality": theorist.nationality,
-                    "primary_field": theorist.primary_field,
-                    "contributions": theorist.contributions,
-                    "key_works": theorist.key_works,
-                },
-            )
+            await self._write_theorist(theorist, item)
 
         logger.info(f"Loaded {len(theorists)} theorists")
         return theorists
@@ -177,90 +229,21 @@ class DataLoader:
         """
         data = self._load_json("theories.json")
         theories = []
-        theorist_names_map = {}  # Store theorist names for Neo4j
 
         for item in data["theories"]:
-            # Map category string to CategoryType enum
-            category_type = self._map_category_type(item["category"])
-
-            theory = Theory(
-                id=TheoryId(item["id"]),
-                name=item["name"],
-                name_ja=item["name_ja"],
-                category=category_type,
-                priority=PriorityLevel(item["priority"]),
-                description=item["description"],
-                description_ja=item["description_ja"],
-                key_principles=item.get("key_principles", []),
-                applications=item.get("applications", []),
-                strengths=item.get("strengths", []),
-                limitations=item.get("limitations", []),
-            )
+            theory = self._build_theory(item)
             theories.append(theory)
-            theorist_names_map[str(theory.id)] = item.get("theorists", [])
-
-            # Create Neo4j node
-            query = """
-            MERGE (t:Theory {id: $id})
-            SET t.name = $name,
-                t.name_ja = $name_ja,
-                t.category = $category,
-                t.priority = $priority,
-                t.theorist_names = $theorist_names,
-                t.description = $description,
-                t.description_ja = $description_ja,
-                t.key_principles = $key_principles,
-                t.applications = $applications,
-                t.strengths = $strengths,
-                t.limitations = $limitations
-            RETURN t
-            """
-            await self.neo4j.execute_write(
-                query,
-                {
-                    "id": str(theory.id),
-                    "name": theory.name,
-                    "name_ja": theory.name_ja,
-                    "category": theory.category.value,
-                    "priority": theory.priority.value,
-                    "theorist_names": theorist_names_map[str(theory.id)],
-                    "description": theory.description,
-                    "description_ja": theory.description_ja,
-                    "key_principles": theory.key_principles,
-                    "applications": theory.applications,
-                    "strengths": theory.strengths,
-                    "limitations": theory.limitations,
-                },
-            )
-
-            # Link to category
-            category_query = """
-            MATCH (t:Theory {id: $theory_id})
-            MATCH (c:Category {id: $category_id})
-            MERGE (t)-[:BELONGS_TO]->(c)
-            """
-            await self.neo4j.execute_write(
-                category_query,
-                {
-                    "theory_id": str(theory.id),
-                    "category_id": theory.category.value,
-                },
-            )
+            await self._write_theory(theory, item)
 
             # Generate embedding and add to ChromaDB
             embedding_text = self._create_embedding_text(theory)
-            embedding = await self.embedding.embed(embedding_text)
-            
+            embedding = await self.embedding.embed(embedding_text, persist=True)
+
             self.chromadb.add(
                 ids=[str(theory.id)],
                 embeddings=[embedding],
                 documents=[embedding_text],
-                metadatas=[{
-                    "name": theory.name,
-                    "name_ja": theory.name_ja,
-                    "category": theory.category.value,
-                    "priority": theory.priority.value,
-                }],
+                metadatas=[self._theory_metadata(theory, embedding_text)],
             )
 
         logger.info(f"Loaded {len(theories)} theories")
@@ -276,38 +259,9 @@ class DataLoader:
         relationships = []
 
         for item in data["relationships"]:
-            # Map relationship type string to enum
-            rel_type = self._map_relationship_type(item["relationship_type"])
-
-            relationship = TheoryRelationship(
-                source_id=str(item["source_id"]),
-                target_id=str(item["target_id"]),
-                relationship_type=rel_type,
-                strength=item.get("strength", 0.5),
-                description=item.get("description", ""),
-            )
+            relationship = self._build_relationship(item)
             relationships.append(relationship)
-
-            # Create Neo4j relationship
-            query = f"""
-            MATCH (source:Theory {{id: $source_id}})
-            MATCH (target:Theory {{id: $target_id}})
-            MERGE (source)-[r:{rel_type.value.upper()}]->(target)
-            SET r.id = $id,
-                r.strength = $strength,
-                r.description = $description
-            RETURN r
-            """
-            await self.neo4j.execute_write(
-                query,
-                {
-                    "source_id": str(relationship.source_id),
-                    "target_id": str(relationship.target_id),
-                    "id": item.get("id", f"{relationship.source_id}-{rel_type.value}-{relationship.target_id}"),
-                    "strength": relationship.strength,
-                    "description": relationship.description,
-                },
-            )
+            await self._write_relationship(relationship, item)
 
         logger.info(f"Loaded {len(relationships)} relationships")
         return relationships
@@ -358,6 +312,616 @@ class DataLoader:
         logger.info(f"Data load complete: {counts}")
         return counts
 
+    async def sync_all(self) -> dict[str, dict[str, Any]]:
+        """Incrementally synchronize databases with the JSON data files.
+
+        Each theory, theorist, and relationship carries a content hash of its
+        source JSON. Only entities whose hash differs from the stored one are
+        upserted, and only theories whose embedding text changed are
+        re-embedded. Entities missing from the source data are deleted.
+
+        Returns:
+            Change summary per entity type.
+        """
+        logger.info("Starting incremental data sync...")
+
+        self.chromadb.connect()
+
+        await self.load_categories()
+        theory_changes = await self.sync_theories()
+        theorist_changes = await self.sync_theorists(
+            new_theory_ids=set(theory_changes.added),
+        )
+        relationship_changes = await self.sync_relationships()
+
+        summary = {
+            "theories": theory_changes.to_dict(),
+            "theorists": theorist_changes.to_dict(),
+            "relationships": relationship_changes.to_dict(),
+        }
+        logger.info(
+            "Data sync complete: "
+            + ", ".join(
+                f"{name}(+{len(c['added'])} ~{len(c['changed'])} -{len(c['removed'])})"
+                for name, c in summary.items()
+            )
+        )
+        return summary
+
+    async def sync_theories(self) -> ChangeSet:
+        """Upsert changed theories and re-embed only changed embedding texts.
+
+        Neo4j writes follow the content-hash diff. Embeddings are checked for
+        every source theory against the ``embedding_hash`` stored in ChromaDB,
+        so theories missing from the collection (e.g. a fresh or wiped vector
+        volume) are embedded even when Neo4j is up to date.
+
+        Returns:
+            Theory change set.
+        """
+        data = self._load_json("theories.json")
+        items = {item["id"]: item for item in data["theories"]}
+        stored = await self._get_stored_hashes(
+            "MATCH (t:Theory) RETURN t.id as id, t.content_hash as hash"
+        )
+        changes = self._diff(items, stored)
+
+        theories = {theory_id: self._build_theory(item) for theory_id, item in items.items()}
+        for theory_id in changes.added + changes.changed:
+            await self._write_theory(theories[theory_id], items[theory_id])
+
+        texts = {
+            theory_id: self._create_embedding_text(theory)
+            for theory_id, theory in theories.items()
+        }
+        stored_embedding_hashes: dict[str, str | None] = {}
+        if texts:
+            existing = self.chromadb.get(ids=list(texts), include=["metadatas"])
+            stored_embedding_hashes = {
+                doc_id: (meta or {}).get("embedding_hash")
+                for doc_id, meta in zip(
+                    existing.get("ids") or [], existing.get("metadatas") or [], strict=True
+                )
+            }
+
+        # Regenerate embeddings that are missing or whose source text changed
+        to_embed = [
+            theory_id
+            for theory_id, text in texts.items()
+            if stored_embedding_hashes.get(theory_id) != self._text_hash(text)
+        ]
+        # Metadata-only change (e.g. priority): keep the stored vector
+        to_update = [
+            theory_id
+            for theory_id in changes.added + changes.changed
+            if stored_embedding_hashes.get(theory_id) == self._text_hash(texts[theory_id])
+        ]
+
+        if to_embed:
+            embeddings = await self.embedding.embed_batch([texts[i] for i in to_embed])
+            self.chromadb.upsert(
+                ids=to_embed,
+                embeddings=embeddings,
+                documents=[texts[i] for i in to_embed],
+                metadatas=[self._theory_metadata(theories[i], texts[i]) for i in to_embed],
+            )
+            changes.reembedded = to_embed
+
+        if to_update:
+            self.chromadb.update(
+                ids=to_update,
+                metadatas=[self._theory_metadata(theories[i], texts[i]) for i in to_update],
+            )
+
+        if changes.removed:
+            await self.neo4j.execute_write(
+                "MATCH (t:Theory) WHERE t.id IN $ids DETACH DELETE t",
+                {"ids": changes.removed},
+            )
+            self.chromadb.delete(ids=changes.removed)
+
+        logger.info(f"Synced theories: {changes.to_dict()}")
+        return changes
+
+    async def rebuild_vectors(
+        self,
+        min_recall: float = 0.5,
+        sample_size: int = 20,
+        top_k: int = 5,
+        swap: bool = True,
+    ) -> RebuildReport:
+        """Rebuild the theory vector collection side by side and swap it in.
+
+        Theories are embedded into a new versioned collection while queries
+        keep using the collection the alias currently points to. The new
+        collection must contain every source theory and, when the old
+        collection has data, its nearest neighbours for a sample of theories
+        must overlap the old ones by at least ``min_recall`` before the alias
+        is switched.
+
+        Args:
+            min_recall: Minimum mean top-k neighbour overlap with the old collection.
+            sample_size: Number of theories to sample for the recall check.
+            top_k: Neighbours compared per sampled theory.
+            swap: Whether to switch the alias after successful verification.
+
+        Returns:
+            Rebuild report.
+        """
+        self.chromadb.connect()
+        alias = self.chromadb.collection_name
+        old = self.chromadb
+        new_name = f"{alias}__{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+        report = RebuildReport(
+            alias=alias,
+            old_collection=old.physical_name,
+            new_collection=new_name,
+            old_count=old.count(),
+        )
+        logger.info(f"Rebuilding '{alias}' into '{new_name}' (serving '{old.physical_name}')")
+
+        data = self._load_json("theories.json")
+        theories = [self._build_theory(item) for item in data["theories"]]
+        texts = [self._create_embedding_text(t) for t in theories]
+        report.expected_count = len(theories)
+
+        new = old.for_collection(new_name)
+        embeddings = await self.embedding.embed_batch(texts) if texts else []
+        if theories:
+            new.upsert(
+                ids=[str(t.id) for t in theories],
+                embeddings=embeddings,
+                documents=texts,
+                metadatas=[
+                    self._theory_metadata(t, text)
+                    for t, text in zip(theories, texts, strict=True)
+                ],
+            )
+        report.new_count = new.count()
+
+        if report.new_count != report.expected_count:
+            report.reason = (
+                f"count mismatch: {report.new_count} documents, "
+                f"expected {report.expected_count}"
+            )
+        elif report.old_count:
+            report.recall, report.sample_size = self._sample_recall(
+                old, new, sample_size, top_k
+            )
+            if report.recall is not None and report.recall < min_recall:
+                report.reason = f"recall {report.recall:.2f} below {min_recall:.2f}"
+
+        if report.reason:
+            logger.warning(f"Keeping '{old.physical_name}': {report.reason}")
+        elif swap:
+            old.swap_alias(alias, new_name)
+            report.swapped = True
+
+        logger.info(f"Rebuild finished: {report.to_dict()}")
+        return report
+
+    @staticmethod
+    def _sample_recall(
+        old: ChromaDBAdapter,
+        new: ChromaDBAdapter,
+        sample_size: int,
+        top_k: int,
+    ) -> tuple[float | None, int]:
+        """Compare nearest neighbours of sampled theories in two collections.
+
+        Each collection is queried with its own stored vector for the theory,
+        so the check also works across embedding models of different dimensions.
+
+        Args:
+            old: Adapter for the currently served collection.
+            new: Adapter for the rebuilt collection.
+            sample_size: Number of theories to sample.
+            top_k: Neighbours compared per theory.
+
+        Returns:
+            Tuple of (mean recall, number of sampled theories).
+        """
+        new_ids = set(new.get(include=[])["ids"])
+        shared = sorted(new_ids & set(old.get(include=[])["ids"]))
+        if not shared:
+            return None, 0
+        sample = random.Random(0).sample(shared, min(sample_size, len(shared)))
+
+        def neighbours(adapter: ChromaDBAdapter) -> dict[str, set[str]]:
+            stored = adapter.get(ids=sample, include=["embeddings"])
+            results = adapter.query(
+                query_embeddings=[list(e) for e in stored["embeddings"]],
+                n_results=top_k + 1,
+                include=[],
+            )
+            return {
+                doc_id: {n for n in ids if n != doc_id}
+                for doc_id, ids in zip(stored["ids"], results["ids"], strict=True)
+            }
+
+        before = neighbours(old)
+        after = neighbours(new)
+        scores = [
+            len(before[i] & after[i]) / len(before[i])
+            for i in sample
+            if before.get(i) and i in after
+        ]
+        if not scores:
+            return None, len(sample)
+        return sum(scores) / len(scores), len(sample)
+
+    async def sync_theorists(self, new_theory_ids: set[str] | None = None) -> ChangeSet:
+        """Upsert changed theorists and refresh their theory links.
+
+        Args:
+            new_theory_ids: Theories added in this sync. Theorists referencing
+                them are re-linked even if their own data is unchanged.
+
+        Returns:
+            Theorist change set.
+        """
+        new_theory_ids = new_theory_ids or set()
+        data = self._load_json("theorists.json")
+        items = {item["id"]: item for item in data["theorists"]}
+        stored = await self._get_stored_hashes(
+            "MATCH (t:Theorist) RETURN t.id as id, t.content_hash as hash"
+        )
+        changes = self._diff(items, stored)
+
+        upserted = changes.added + changes.changed
+        for theorist_id in upserted:
+            item = items[theorist_id]
+            await self._write_theorist(self._build_theorist(item), item)
+
+        relink = set(upserted) | {
+            theorist_id
+            for theorist_id, item in items.items()
+            if new_theory_ids.intersection(item.get("related_theories", []))
+        }
+        for theorist_id in sorted(relink):
+            await self.neo4j.execute_write(
+                "MATCH (:Theorist {id: $theorist_id})-[r:DEVELOPED]->() DELETE r",
+                {"theorist_id": theorist_id},
+            )
+            await self.neo4j.execute_write(
+                """
+                MATCH (theorist:Theorist {id: $theorist_id})
+                MATCH (theory:Theory) WHERE theory.id IN $theory_ids
+                MERGE (theorist)-[:DEVELOPED]->(theory)
+                """,
+                {
+                    "theorist_id": theorist_id,
+                    "theory_ids": items[theorist_id].get("related_theories", []),
+                },
+            )
+
+        if changes.removed:
+            await self.neo4j.execute_write(
+                "MATCH (t:Theorist) WHERE t.id IN $ids DETACH DELETE t",
+                {"ids": changes.removed},
+            )
+
+        logger.info(f"Synced theorists: {changes.to_dict()}")
+        return changes
+
+    async def sync_relationships(self) -> ChangeSet:
+        """Upsert changed theory relationships and delete removed ones.
+
+        Returns:
+            Relationship change set.
+        """
+        data = self._load_json("relationships.json")
+        items = {self._relationship_id(item): item for item in data["relationships"]}
+        stored = await self._get_stored_hashes(
+            """
+            MATCH (:Theory)-[r]->(:Theory)
+            WHERE r.content_hash IS NOT NULL
+            RETURN r.id as id, r.content_hash as hash
+            """
+        )
+        changes = self._diff(items, stored)
+
+        # Changed relationships may have a new type, so drop the old edge first
+        stale = changes.changed + changes.removed
+        if stale:
+            await self.neo4j.execute_write(
+                "MATCH (:Theory)-[r]->(:Theory) WHERE r.id IN $ids DELETE r",
+                {"ids": stale},
+            )
+
+        for rel_id in changes.added + changes.changed:
+            item = items[rel_id]
+            await self._write_relationship(self._build_relationship(item), item)
+
+        logger.info(f"Synced relationships: {changes.to_dict()}")
+        return changes
+
+    async def _get_stored_hashes(self, query: str) -> dict[str, str | None]:
+        """Read stored content hashes from Neo4j.
+
+        Args:
+            query: Cypher query returning ``id`` and ``hash`` columns.
+
+        Returns:
+            Mapping of entity ID to stored hash (None if never hashed).
+        """
+        records = await self.neo4j.execute_read(query)
+        return {r["id"]: r.get("hash") for r in records if r.get("id")}
+
+    def _diff(
+        self,
+        items: dict[str, dict[str, Any]],
+        stored: dict[str, str | None],
+    ) -> ChangeSet:
+        """Diff source items against stored content hashes.
+
+        Args:
+            items: Source JSON items keyed by ID.
+            stored: Stored content hashes keyed by ID.
+
+        Returns:
+            Change set (IDs sorted for stable output).
+        """
+        changes = ChangeSet()
+        for item_id, item in sorted(items.items()):
+            if item_id not in stored:
+                changes.added.append(item_id)
+            elif stored[item_id] != self._content_hash(item):
+                changes.changed.append(item_id)
+            else:
+                changes.unchanged += 1
+        changes.removed = sorted(set(stored) - set(items))
+        return changes
+
+    def _build_theorist(self, item: dict[str, Any]) -> Theorist:
+        """Build a Theorist entity from a JSON item.
+
+        Args:
+            item: Theorist JSON item.
+
+        Returns:
+            Theorist entity.
+        """
+        return Theorist(
+            id=TheoristId(item["id"]),
+            name=item["name"],
+            name_ja=item["name_ja"],
+            birth_year=item.get("birth_year"),
+            death_year=item.get("death_year"),
+            nationality=item.get("nationality"),
+            primary_field=item.get("primary_field"),
+            contributions=item.get("contributions", []),
+            key_works=item.get("key_works", []),
+            related_theory_ids=[TheoryId(tid) for tid in item.get("related_theories", [])],
+        )
+
+    async def _write_theorist(self, theorist: Theorist, item: dict[str, Any]) -> None:
+        """Upsert a theorist node in Neo4j.
+
+        Args:
+            theorist: Theorist entity.
+            item: Source JSON item (for content hash).
+        """
+        query = """
+        MERGE (t:Theorist {id: $id})
+        SET t.name = $name,
+            t.name_ja = $name_ja,
+            t.birth_year = $birth_year,
+            t.death_year = $death_year,
+            t.nationality = $nationality,
+            t.primary_field = $primary_field,
+            t.contributions = $contributions,
+            t.key_works = $key_works,
+            t.content_hash = $content_hash
+        RETURN t
+        """
+        await self.neo4j.execute_write(
+            query,
+            {
+                "id": str(theorist.id),
+                "name": theorist.name,
+                "name_ja": theorist.name_ja,
+                "birth_year": theorist.birth_year,
+                "death_year": theorist.death_year,
+                "nationality": theorist.nationality,
+                "primary_field": theorist.primary_field,
+                "contributions": theorist.contributions,
+                "key_works": theorist.key_works,
+                "content_hash": self._content_hash(item),
+            },
+        )
+
+    def _build_theory(self, item: dict[str, Any]) -> Theory:
+        """Build a Theory entity from a JSON item.
+
+        Args:
+            item: Theory JSON item.
+
+        Returns:
+            Theory entity.
+        """
+        return Theory(
+            id=TheoryId(item["id"]),
+            name=item["name"],
+            name_ja=item["name_ja"],
+            category=self._map_category_type(item["category"]),
+            priority=PriorityLevel(item["priority"]),
+            description=item["description"],
+            description_ja=item["description_ja"],
+            key_principles=item.get("key_principles", []),
+            applications=item.get("applications", []),
+            strengths=item.get("strengths", []),
+            limitations=item.get("limitations", []),
+        )
+
+    async def _write_theory(self, theory: Theory, item: dict[str, Any]) -> None:
+        """Upsert a theory node and its category link in Neo4j.
+
+        Args:
+            theory: Theory entity.
+            item: Source JSON item (for theorist names and content hash).
+        """
+        query = """
+        MERGE (t:Theory {id: $id})
+        SET t.name = $name,
+            t.name_ja = $name_ja,
+            t.category = $category,
+            t.priority = $priority,
+            t.theorist_names = $theorist_names,
+            t.description = $description,
+            t.description_ja = $description_ja,
+            t.key_principles = $key_principles,
+            t.applications = $applications,
+            t.strengths = $strengths,
+            t.limitations = $limitations,
+            t.content_hash = $content_hash
+        RETURN t
+        """
+        await self.neo4j.execute_write(
+            query,
+            {
+                "id": str(theory.id),
+                "name": theory.name,
+                "name_ja": theory.name_ja,
+                "category": theory.category.value,
+                "priority": theory.priority.value,
+                "theorist_names": item.get("theorists", []),
+                "description": theory.description,
+                "description_ja": theory.description_ja,
+                "key_principles": theory.key_principles,
+                "applications": theory.applications,
+                "strengths": theory.strengths,
+                "limitations": theory.limitations,
+                "content_hash": self._content_hash(item),
+            },
+        )
+
+        # Link to category (replacing any previous category link)
+        category_query = """
+        MATCH (t:Theory {id: $theory_id})
+        OPTIONAL MATCH (t)-[old:BELONGS_TO]->(:Category)
+        DELETE old
+        WITH DISTINCT t
+        MATCH (c:Category {id: $category_id})
+        MERGE (t)-[:BELONGS_TO]->(c)
+        """
+        await self.neo4j.execute_write(
+            category_query,
+            {
+                "theory_id": str(theory.id),
+                "category_id": theory.category.value,
+            },
+        )
+
+    def _theory_metadata(self, theory: Theory, embedding_text: str) -> dict[str, Any]:
+        """Build ChromaDB metadata for a theory.
+
+        Args:
+            theory: Theory entity.
+            embedding_text: Text the stored embedding was computed from.
+
+        Returns:
+            Metadata dictionary.
+        """
+        return {
+            "name": theory.name,
+            "name_ja": theory.name_ja,
+            "category": theory.category.value,
+            "priority": theory.priority.value,
+            "embedding_hash": self._text_hash(embedding_text),
+        }
+
+    def _build_relationship(self, item: dict[str, Any]) -> TheoryRelationship:
+        """Build a TheoryRelationship from a JSON item.
+
+        Args:
+            item: Relationship JSON item.
+
+        Returns:
+            TheoryRelationship entity.
+        """
+        return TheoryRelationship(
+            source_id=str(item["source_id"]),
+            target_id=str(item["target_id"]),
+            relationship_type=self._map_relationship_type(item["relationship_type"]),
+            strength=item.get("strength", 0.5),
+            description=item.get("description", ""),
+        )
+
+    async def _write_relationship(
+        self,
+        relationship: TheoryRelationship,
+        item: dict[str, Any],
+    ) -> None:
+        """Upsert a theory relationship in Neo4j.
+
+        Args:
+            relationship: Relationship entity.
+            item: Source JSON item (for ID and content hash).
+        """
+        rel_type = relationship.relationship_type
+        query = f"""
+        MATCH (source:Theory {{id: $source_id}})
+        MATCH (target:Theory {{id: $target_id}})
+        MERGE (source)-[r:{rel_type.value.upper()}]->(target)
+        SET r.id = $id,
+            r.strength = $strength,
+            r.description = $description,
+            r.content_hash = $content_hash
+        RETURN r
+        """
+        await self.neo4j.execute_write(
+            query,
+            {
+                "source_id": str(relationship.source_id),
+                "target_id": str(relationship.target_id),
+                "id": self._relationship_id(item),
+                "strength": relationship.strength,
+                "description": relationship.description,
+                "content_hash": self._content_hash(item),
+            },
+        )
+
+    def _relationship_id(self, item: dict[str, Any]) -> str:
+        """Get the stable ID of a relationship JSON item.
+
+        Args:
+            item: Relationship JSON item.
+
+        Returns:
+            Explicit ID, or one derived from source, type, and target.
+        """
+        return item.get(
+            "id",
+            f"{item['source_id']}-{self._map_relationship_type(item['relationship_type']).value}"
+            f"-{item['target_id']}",
+        )
+
+    @staticmethod
+    def _content_hash(item: dict[str, Any]) -> str:
+        """Compute a stable content hash of a JSON item.
+
+        Args:
+            item: JSON item.
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON encoding.
+        """
+        canonical = json.dumps(item, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        """Compute SHA-256 hex digest of a text.
+
+        Args:
+            text: Text to hash.
+
+        Returns:
+            Hex digest.
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
     def _map_category_type(self, category_str: str) -> CategoryType:
         """Map category string to CategoryType enum.
 
@@ -3,9 +3,13 @@
 from .neo4j_theory_repository import Neo4jTheoryRepository
 from .neo4j_graph_repository import Neo4jGraphRepository
 from .chromadb_vector_repository import ChromaDBVectorRepository
+from .memory_methodology_repository import InMemoryMethodologyRepository
+from .redis_methodology_repository import RedisMethodologyRepository
 
 __all__ = [
     "Neo4jTheoryRepository",
     "Neo4jGraphRepository",
     "ChromaDBVectorRepository",
+    "InMemoryMethodologyRepository",
+    "RedisMethodologyRepository",
 ]
@@ -1,22 +1,32 @@
 """ChromaDB implementation of VectorRepository."""
 
+import asyncio
+import time
 from typing import Any, Sequence
 
+import numpy as np
+
 from ...domain.repositories.vector_repository import VectorRepository
 from ...domain.value_objects.search_query import SearchQuery
 from ...domain.value_objects.search_result import SearchResult, SearchResults
 from ..adapters.chromadb_adapter import ChromaDBAdapter
 from ..adapters.esperanto_adapter import EmbeddingAdapter, EsperantoAdapter
+from ..adapters.tracing import trace_methods
 from ..config.logging import get_logger
+from ..config.settings import get_settings
 
 logger = get_logger(__name__)
 
 
+@trace_methods("repository")
 class ChromaDBVectorRepository(VectorRepository):
     """ChromaDB implementation of VectorRepository.
 
     Provides vector search operations using ChromaDB for storage
-    and esperanto for embeddings.
+    and esperanto for embeddings. The matrix of all embeddings is cached;
+    writes through this repository drop it, and changes made by a data
+    sync in another process are picked up when the collection or its size
+    changes, or after ``INFERENCE_EMBEDDING_MATRIX_TTL`` seconds.
     """
 
     def __init__(
@@ -35,6 +45,10 @@ class ChromaDBVectorRepository(VectorRepository):
         self._chromadb = chromadb_adapter
         self._embedding = embedding_adapter
         self._llm = llm_adapter
+        self._matrix: tuple[list[str], np.ndarray] | None = None
+        self._matrix_version: tuple[str, int] | None = None
+        self._matrix_loaded_at = 0.0
+        self._matrix_lock = asyncio.Lock()
 
     async def semantic_search(
         self,
@@ -153,7 +167,7 @@ class ChromaDBVectorRepository(VectorRepository):
         """Add or update embedding for an entity."""
         try:
             # Generate embedding
-            embedding = await self._embedding.embed(text)
+            embedding = await self._embedding.embed(text, persist=True)
 
             # Prepare metadata
             full_metadata = metadata or {}
@@ -167,6 +181,7 @@ class ChromaDBVectorRepository(VectorRepository):
                 metadatas=[full_metadata],
             )
 
+            self.invalidate_embedding_matrix()
             logger.debug(f"Added embedding for {entity_type}: {entity_id}")
             return True
         except Exception as e:
@@ -177,6 +192,7 @@ class ChromaDBVectorRepository(VectorRepository):
         """Delete embedding for an entity."""
         try:
             self._chromadb.delete(ids=[entity_id])
+            self.invalidate_embedding_matrix()
             logger.debug(f"Deleted embedding: {entity_id}")
             return True
         except Exception as e:
@@ -194,6 +210,76 @@ class ChromaDBVectorRepository(VectorRepository):
             logger.error(f"Failed to get embedding: {e}")
             return None
 
+    async def get_embeddings(self, entity_ids: Sequence[str]) -> dict[str, list[float]]:
+        """Get raw embedding vectors for multiple entities."""
+        vectors: dict[str, list[float]] = {}
+        ids = list(entity_ids)
+        for i in range(0, len(ids), 500):
+            try:
+                results = self._chromadb.get(ids=ids[i : i + 500], include=["embeddings"])
+            except Exception as e:
+                logger.error(f"Failed to get embeddings: {e}")
+                continue
+            embeddings = results.get("embeddings")
+            if embeddings is None:
+                continue
+            for entity_id, embedding in zip(results["ids"], embeddings):
+                if embedding is not None and len(embedding):
+                    vectors[entity_id] = [float(x) for x in embedding]
+        return vectors
+
+    def invalidate_embedding_matrix(self) -> None:
+        """Drop the cached embedding matrix (after the collection changed)."""
+        self._matrix = None
+        self._matrix_version = None
+
+    def _collection_version(self) -> tuple[str, int]:
+        """Identify the collection contents cheaply: physical collection and size."""
+        count = self._chromadb.count()
+        return self._chromadb.physical_name, count
+
+    def _load_matrix(self) -> tuple[list[str], np.ndarray]:
+        """Read every embedding from ChromaDB (blocking)."""
+        results = self._chromadb.get(include=["embeddings"])
+        embeddings = results.get("embeddings")
+        if embeddings is None:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        rows = [
+            (entity_id, embedding)
+            for entity_id, embedding in zip(results["ids"], embeddings)
+            if embedding is not None and len(embedding)
+        ]
+        if not rows:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        ids = [entity_id for entity_id, _ in rows]
+        return ids, np.asarray([embedding for _, embedding in rows], dtype=np.float32)
+
+    async def get_embedding_matrix(self) -> tuple[list[str], np.ndarray]:
+        """Get the embedding vectors of every entity in the collection."""
+        ttl = get_settings().inference.embedding_matrix_ttl
+        async with self._matrix_lock:
+            try:
+                version = await asyncio.to_thread(self._collection_version)
+                if (
+                    self._matrix is not None
+                    and version == self._matrix_version
+                    and time.monotonic() - self._matrix_loaded_at < ttl
+                ):
+                    return self._matrix
+                matrix = await asyncio.to_thread(self._load_matrix)
+            except Exception as e:
+                logger.error(f"Failed to get embeddings: {e}")
+                return [], np.zeros((0, 0), dtype=np.float32)
+            self._matrix, self._matrix_version = matrix, version
+            self._matrix_loaded_at = time.monotonic()
+            return matrix
+
+    async def embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts with the collection's embedding model."""
+        if not texts:
+            return []
+        return await self._embedding.embed_batch(list(texts))
+
     async def batch_add_embeddings(
         self,
         items: Sequence[dict[str, Any]],
@@ -227,6 +313,7 @@ class ChromaDBVectorRepository(VectorRepository):
                 metadatas=metadatas,
             )
 
+            self.invalidate_embedding_matrix()
             logger.info(f"Batch added {len(items)} embeddings")
             return len(items)
         except Exception as e:
@@ -353,6 +440,7 @@ class ChromaDBVectorRepository(VectorRepository):
         """Clear all embeddings from the collection."""
         try:
             self._chromadb.reset()
+            self.invalidate_embedding_matrix()
             logger.warning("Vector collection cleared")
             return True
         except Exception as e:
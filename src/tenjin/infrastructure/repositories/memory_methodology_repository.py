@@ -0,0 +1,30 @@
+"""In-memory implementation of MethodologyRepository."""
+
+from typing import Sequence
+
+from ...domain.entities.methodology import Methodology
+from ...domain.repositories.methodology_repository import MethodologyRepository
+
+
+class InMemoryMethodologyRepository(MethodologyRepository):
+    """Methodology repository in process memory (lost on restart)."""
+
+    def __init__(self) -> None:
+        """Initialize in-memory repository."""
+        self._methodologies: dict[str, Methodology] = {}
+
+    async def get(self, methodology_id: str) -> Methodology | None:
+        """Get a methodology by ID."""
+        return self._methodologies.get(methodology_id)
+
+    async def list_all(self) -> Sequence[Methodology]:
+        """List all methodologies, oldest first."""
+        return list(self._methodologies.values())
+
+    async def save(self, methodology: Methodology) -> None:
+        """Insert or update a methodology."""
+        self._methodologies[str(methodology.id)] = methodology
+
+    async def delete(self, methodology_id: str) -> bool:
+        """Delete a methodology."""
+        return self._methodologies.pop(methodology_id, None) is not None
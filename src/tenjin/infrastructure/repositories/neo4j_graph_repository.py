@@ -6,11 +6,22 @@ from ...domain.entities.relationship import TheoryRelationship
 from ...domain.repositories.graph_repository import GraphRepository
 from ...domain.value_objects.relationship_type import RelationshipType
 from ..adapters.neo4j_adapter import Neo4jAdapter
+from ..adapters.tracing import trace_methods
 from ..config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Relationship type of LLM-inferred edges; they also carry ``inferred: true``
+# and are excluded from every query except the inferred-relationship ones
+INFERRED_RELATIONSHIP = "INFERRED_RELATION"
 
+_INVERSE_DIRECTION = {
+    "source_to_target": "target_to_source",
+    "target_to_source": "source_to_target",
+}
+
+
+@trace_methods("repository")
 class Neo4jGraphRepository(GraphRepository):
     """Neo4j implementation of GraphRepository.
 
@@ -40,7 +51,7 @@ class Neo4jGraphRepository(GraphRepository):
 
         query = f"""
         MATCH (t1:Theory {{id: $id}})-[r{rel_filter}*1..{depth}]-(t2:Theory)
-        WHERE t1 <> t2
+        WHERE t1 <> t2 AND none(rel IN r WHERE coalesce(rel.inferred, false))
         WITH DISTINCT t2, r
         RETURN t2 as theory,
                [rel in r | type(rel)] as relationship_types,
@@ -69,6 +80,7 @@ class Neo4jGraphRepository(GraphRepository):
         """Get relationship between two theories."""
         query = """
         MATCH (t1:Theory {id: $source_id})-[r]->(t2:Theory {id: $target_id})
+        WHERE NOT coalesce(r.inferred, false)
         RETURN type(r) as type, r.description as description,
                r.strength as strength, r.created_at as created_at
         """
@@ -96,18 +108,21 @@ class Neo4jGraphRepository(GraphRepository):
         if direction == "outgoing":
             query = """
             MATCH (t1:Theory {id: $id})-[r]->(t2:Theory)
+            WHERE NOT coalesce(r.inferred, false)
             RETURN t1.id as source, t2.id as target, type(r) as type,
                    r.description as description, r.strength as strength
             """
         elif direction == "incoming":
             query = """
             MATCH (t1:Theory)-[r]->(t2:Theory {id: $id})
+            WHERE NOT coalesce(r.inferred, false)
             RETURN t1.id as source, t2.id as target, type(r) as type,
                    r.description as description, r.strength as strength
             """
         else:  # both
             query = """
             MATCH (t1:Theory {id: $id})-[r]-(t2:Theory)
+            WHERE NOT coalesce(r.inferred, false)
             RETURN t1.id as source, t2.id as target, type(r) as type,
                    r.description as description, r.strength as strength
             """
@@ -208,6 +223,7 @@ class Neo4jGraphRepository(GraphRepository):
         MATCH path = shortestPath(
             (t1:Theory {{id: $source_id}})-[*1..{max_depth}]-(t2:Theory {{id: $target_id}})
         )
+        WHERE none(rel IN relationships(path) WHERE coalesce(rel.inferred, false))
         RETURN [node in nodes(path) | {{
             id: node.id,
             name: node.name,
@@ -238,6 +254,7 @@ class Neo4jGraphRepository(GraphRepository):
         """Get network graph around a theory."""
         query = f"""
         MATCH path = (t1:Theory {{id: $id}})-[*0..{depth}]-(t2:Theory)
+        WHERE none(rel IN relationships(path) WHERE coalesce(rel.inferred, false))
         WITH collect(distinct t1) + collect(distinct t2) as allNodes,
              collect(distinct relationships(path)) as allRels
         UNWIND allNodes as node
@@ -274,6 +291,7 @@ class Neo4jGraphRepository(GraphRepository):
         query = """
         MATCH (t:Theory {category: $category})
         OPTIONAL MATCH (t)-[r]-(t2:Theory {category: $category})
+        WHERE NOT coalesce(r.inferred, false)
         WITH collect(distinct {
             id: t.id,
             name: t.name,
@@ -340,6 +358,7 @@ class Neo4jGraphRepository(GraphRepository):
         query = """
         MATCH (t:Theory)-[r]-(common:Theory)
         WHERE t.id IN $ids AND NOT common.id IN $ids
+          AND NOT coalesce(r.inferred, false)
         WITH common, count(distinct t) as connection_count
         WHERE connection_count >= 2
         RETURN common as theory, connection_count
@@ -355,6 +374,133 @@ class Neo4jGraphRepository(GraphRepository):
             for r in records
         ]
 
+    async def get_relationships_among(
+        self,
+        theory_ids: Sequence[str],
+        relationship_types: Sequence[RelationshipType] | None = None,
+    ) -> Sequence[dict[str, Any]]:
+        """Get curated relationships whose both ends are in a set of theories."""
+        if not theory_ids:
+            return []
+        query = """
+        MATCH (t1:Theory)-[r]->(t2:Theory)
+        WHERE t1.id IN $ids AND t2.id IN $ids
+          AND NOT coalesce(r.inferred, false)
+          AND ($types IS NULL OR type(r) IN $types)
+        RETURN t1.id as source_id, t2.id as target_id,
+               toLower(type(r)) as relationship_type,
+               coalesce(r.strength, 1.0) as strength
+        """
+        types = (
+            [t.value.upper() for t in relationship_types]
+            if relationship_types is not None
+            else None
+        )
+        records = await self._adapter.execute_read(
+            query, {"ids": list(theory_ids), "types": types}
+        )
+        return [dict(r) for r in records]
+
+    async def get_relationship_pairs(self) -> Sequence[tuple[str, str]]:
+        """Get the theory pairs connected by curated relationships."""
+        query = """
+        MATCH (t1:Theory)-[r]->(t2:Theory)
+        WHERE NOT coalesce(r.inferred, false)
+        RETURN DISTINCT t1.id as source, t2.id as target
+        """
+        records = await self._adapter.execute_read(query)
+        return [(r["source"], r["target"]) for r in records]
+
+    async def save_inferred_relationships(
+        self,
+        relationships: Sequence[dict[str, Any]],
+    ) -> int:
+        """Store LLM-inferred relationships, replacing earlier ones per pair."""
+        if not relationships:
+            return 0
+
+        query = f"""
+        UNWIND $rels as rel
+        MATCH (t1:Theory {{id: rel.source_id}})
+        MATCH (t2:Theory {{id: rel.target_id}})
+        OPTIONAL MATCH (t2)-[old:{INFERRED_RELATIONSHIP}]->(t1)
+        DELETE old
+        MERGE (t1)-[r:{INFERRED_RELATIONSHIP}]->(t2)
+        SET r.inferred = true,
+            r.relationship_type = rel.relationship_type,
+            r.confidence = rel.confidence,
+            r.direction = rel.direction,
+            r.evidence = rel.evidence,
+            r.practical_implications = rel.practical_implications,
+            r.similarity = rel.similarity,
+            r.inferred_at = datetime()
+        """
+        rels = [
+            {
+                "source_id": rel["source_id"],
+                "target_id": rel["target_id"],
+                "relationship_type": rel.get("relationship_type", "unknown"),
+                "confidence": float(rel.get("confidence", 0.5)),
+                "direction": rel.get("direction", "bidirectional"),
+                "evidence": rel.get("evidence", ""),
+                "practical_implications": rel.get("practical_implications", ""),
+                "similarity": rel.get("similarity"),
+            }
+            for rel in relationships
+        ]
+        await self._adapter.execute_write(query, {"rels": rels})
+        logger.debug(f"Stored {len(rels)} inferred relationships")
+        return len(rels)
+
+    async def get_inferred_relationships(
+        self,
+        theory_id: str,
+        min_confidence: float = 0.0,
+        limit: int = 20,
+    ) -> Sequence[dict[str, Any]]:
+        """Get stored inferred relationships of a theory."""
+        query = f"""
+        MATCH (t1:Theory {{id: $id}})-[r:{INFERRED_RELATIONSHIP}]-(t2:Theory)
+        WHERE r.confidence >= $min_confidence
+        RETURN t2 as theory, r.relationship_type as relationship_type,
+               r.confidence as confidence, r.direction as direction,
+               r.evidence as evidence,
+               r.practical_implications as practical_implications,
+               startNode(r) = t1 as outgoing
+        ORDER BY confidence DESC
+        LIMIT $limit
+        """
+        records = await self._adapter.execute_read(
+            query, {"id": theory_id, "min_confidence": min_confidence, "limit": limit}
+        )
+
+        results = []
+        for r in records:
+            direction = r["direction"] or "bidirectional"
+            if not r["outgoing"]:
+                direction = _INVERSE_DIRECTION.get(direction, direction)
+            results.append(
+                {
+                    "theory": dict(r["theory"]),
+                    "relationship_type": r["relationship_type"],
+                    "confidence": r["confidence"],
+                    # Relative to the requested theory
+                    "direction": direction,
+                    "evidence": r["evidence"] or "",
+                    "practical_implications": r["practical_implications"] or "",
+                }
+            )
+        return results
+
+    async def delete_inferred_relationships(self) -> int:
+        """Delete all stored inferred relationships."""
+        query = f"""
+        MATCH ()-[r:{INFERRED_RELATIONSHIP}]->()
+        DELETE r
+        """
+        result = await self._adapter.execute_write(query)
+        return result.get("relationships_deleted", 0)
+
     async def execute_cypher(
         self,
         query: str,
@@ -13,11 +13,13 @@ from ...domain.value_objects.concept_id import ConceptId
 from ...domain.value_objects.category_type import CategoryType
 from ...domain.value_objects.priority_level import PriorityLevel
 from ..adapters.neo4j_adapter import Neo4jAdapter
+from ..adapters.tracing import trace_methods
 from ..config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@trace_methods("repository")
 class Neo4jTheoryRepository(TheoryRepository):
     """Neo4j implementation of TheoryRepository.
 
@@ -0,0 +1,51 @@
+"""Redis implementation of MethodologyRepository."""
+
+from typing import Sequence
+
+from ...domain.entities.methodology import Methodology
+from ...domain.repositories.methodology_repository import MethodologyRepository
+from ..adapters.redis_adapter import RedisAdapter
+
+
+class RedisMethodologyRepository(MethodologyRepository):
+    """Methodology repository in Redis, shared between server processes.
+
+    Each methodology is a JSON value under ``methodologies:<id>`` in the
+    durable keyspace (``RedisAdapter.scoped``), which cache invalidation
+    never touches. Keys expire after the configured TTL, which is
+    refreshed on each update.
+    """
+
+    def __init__(self, redis: RedisAdapter, ttl_seconds: int = 30 * 86400) -> None:
+        """Initialize Redis methodology repository.
+
+        Args:
+            redis: Connected Redis adapter of the durable keyspace.
+            ttl_seconds: Lifetime of a methodology after its last update.
+        """
+        self._redis = redis
+        self._ttl = ttl_seconds
+
+    async def get(self, methodology_id: str) -> Methodology | None:
+        """Get a methodology by ID."""
+        data = await self._redis.get_json(f"methodologies:{methodology_id}")
+        return Methodology.from_dict(data) if data else None
+
+    async def list_all(self) -> Sequence[Methodology]:
+        """List all methodologies, oldest first."""
+        methodologies = []
+        for key in await self._redis.keys("methodologies:*"):
+            methodology = await self.get(key.removeprefix("methodologies:"))
+            if methodology is not None:
+                methodologies.append(methodology)
+        return sorted(methodologies, key=lambda m: m.created_at)
+
+    async def save(self, methodology: Methodology) -> None:
+        """Insert or update a methodology."""
+        await self._redis.set_json(
+            f"methodologies:{methodology.id}", methodology.to_dict(), ttl=self._ttl
+        )
+
+    async def delete(self, methodology_id: str) -> bool:
+        """Delete a methodology."""
+        return await self._redis.delete(f"methodologies:{methodology_id}")
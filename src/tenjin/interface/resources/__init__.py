@@ -1,9 +1,13 @@
 """MCP Resources - Data access handlers for MCP protocol."""
 
+from typing import Any
+
 from mcp.server import Server
 from mcp.types import Resource
 
+from ..serialization import dumps
 from ..server import TenjinServer
+from ...infrastructure.adapters.deadline import gather_or_cancel
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -117,31 +121,29 @@ def register_resources(server: Server, tenjin: TenjinServer) -> None:
     @server.read_resource()
     async def read_resource(uri: str) -> str:
         """Read a specific resource."""
-        import json
-
         # Parse URI
         if uri == "tenjin://theories":
             result = await tenjin.theory_service.list_theories(limit=1000)
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri.startswith("tenjin://theories/by-category/"):
             category = uri.split("/")[-1]
             result = await tenjin.theory_service.get_theories_by_category(
                 category, limit=100
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri.startswith("tenjin://theory/"):
             theory_id = uri.split("/")[-1]
             result = await tenjin.theory_service.get_theory_details(theory_id)
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri == "tenjin://theorists":
-            return json.dumps({"message": "Theorist listing available"})
+            return dumps({"message": "Theorist listing available"})
 
         elif uri.startswith("tenjin://theorist/"):
             theorist_id = uri.split("/")[-1]
-            return json.dumps({"theorist_id": theorist_id})
+            return dumps({"theorist_id": theorist_id})
 
         elif uri == "tenjin://categories":
             from ...domain.value_objects.category_type import CategoryType
@@ -154,11 +156,11 @@ def register_resources(server: Server, tenjin: TenjinServer) -> None:
                 }
                 for cat in CategoryType
             ]
-            return json.dumps(categories, ensure_ascii=False, indent=2)
+            return dumps(categories)
 
         elif uri == "tenjin://categories/statistics":
             result = await tenjin.theory_service.get_category_statistics()
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri == "tenjin://relationships/types":
             from ...domain.value_objects.relationship_type import RelationshipType
@@ -171,40 +173,50 @@ def register_resources(server: Server, tenjin: TenjinServer) -> None:
                 }
                 for rt in RelationshipType
             ]
-            return json.dumps(types, ensure_ascii=False, indent=2)
+            return dumps(types)
 
         elif uri.startswith("tenjin://relationships/"):
             theory_id = uri.split("/")[-1]
             result = await tenjin.graph_service.get_theory_relationships(theory_id)
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri == "tenjin://methodologies":
             result = await tenjin.methodology_service.list_methodologies(limit=100)
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri.startswith("tenjin://methodology/"):
             methodology_id = uri.split("/")[-1]
             result = await tenjin.methodology_service.get_methodology(methodology_id)
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri == "tenjin://graph/statistics":
             result = await tenjin.graph_service.get_graph_statistics()
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         elif uri == "tenjin://graph/network":
             theories = await tenjin.theory_service.list_theories(limit=50)
-            theory_ids = [t.get("id", "") for t in theories.get("theories", [])]
-            result = await tenjin.graph_service.get_theory_network(
-                theory_ids=theory_ids[:20], depth=1
+            networks = await gather_or_cancel(
+                *(
+                    tenjin.graph_service.get_theory_network(str(t.id), depth=1)
+                    for t in list(theories)[:20]
+                )
             )
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            nodes: dict[Any, dict[str, Any]] = {}
+            edges: dict[tuple[Any, ...], dict[str, Any]] = {}
+            for network in networks:
+                for node in network.get("nodes", []):
+                    nodes.setdefault(node.get("id"), node)
+                for edge in network.get("edges", []):
+                    key = (edge.get("source"), edge.get("target"), edge.get("type"))
+                    edges.setdefault(key, edge)
+            return dumps({"nodes": list(nodes.values()), "edges": list(edges.values())})
 
         elif uri == "tenjin://search/index-stats":
             result = await tenjin.search_service.get_index_statistics()
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return dumps(result)
 
         else:
-            return json.dumps({"error": f"Unknown resource: {uri}"})
+            return dumps({"error": f"Unknown resource: {uri}"})
 
 
 __all__ = ["register_resources"]
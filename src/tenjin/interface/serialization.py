@@ -0,0 +1,103 @@
+"""JSON serialization of tool and resource responses.
+
+Every tool result and resource body goes through ``dumps``. Output is
+compact by default; indented output is produced when requested (the
+``TOOL_PRETTY_JSON`` setting or ``pretty=True``). When orjson is installed
+it does the encoding, otherwise the standard library does; both produce
+the same JSON.
+
+Domain objects are encoded as they are met during encoding, so services
+can return entities and value objects as they are:
+
+- objects with ``to_dict()`` (Theory, SearchResult, ...) use its layout
+- identifiers defining ``__str__`` (TheoryId, ...) become strings
+- other dataclasses become a mapping of their fields
+- enums become their value, dates and datetimes ISO 8601 strings
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from mcp.types import TextContent
+
+from ..infrastructure.config.settings import get_settings
+
+try:  # optional fast path (pip install tenjin[speedups])
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Dataclasses and datetimes go through _default so both backends agree
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _default(obj: Any) -> Any:
+    """Convert an object the JSON encoders do not handle natively.
+
+    Args:
+        obj: Object met during encoding.
+
+    Returns:
+        JSON-compatible replacement, encoded in turn.
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        if type(obj).__str__ is not object.__str__:
+            return str(obj)
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def dumps(obj: Any, pretty: bool | None = None) -> str:
+    """Serialize a response body to JSON.
+
+    Args:
+        obj: Response body (dicts, lists, entities, value objects, ...).
+        pretty: Indent the output. Defaults to the ``TOOL_PRETTY_JSON`` setting.
+
+    Returns:
+        JSON text.
+    """
+    if pretty is None:
+        pretty = get_settings().tool.pretty_json
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=_default, option=options).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the standard library handles them
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def json_content(obj: Any, pretty: bool | None = None) -> list[TextContent]:
+    """Serialize a tool result to a single JSON text content.
+
+    Args:
+        obj: Tool result.
+        pretty: Indent the output. Defaults to the ``TOOL_PRETTY_JSON`` setting.
+
+    Returns:
+        Tool result content.
+    """
+    return [TextContent(type="text", text=dumps(obj, pretty))]
+
+
+__all__ = ["dumps", "json_content"]
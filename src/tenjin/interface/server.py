@@ -2,43 +2,133 @@
 
 import argparse
 import asyncio
+import hmac
+import json
+import os
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Any
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import uvicorn
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.server.sse import SseServerTransport
+from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.applications import Starlette
-from starlette.routing import Route
 from starlette.requests import Request
-from starlette.responses import Response
-import uvicorn
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
 
-from ..infrastructure.config.settings import get_settings
-from ..infrastructure.config.logging import get_logger, setup_logging
-from ..infrastructure.adapters.neo4j_adapter import Neo4jAdapter
-from ..infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
-from ..infrastructure.adapters.esperanto_adapter import EsperantoAdapter
-from ..infrastructure.adapters.esperanto_adapter import EmbeddingAdapter
-from ..infrastructure.adapters.redis_adapter import RedisAdapter
-from ..infrastructure.repositories.neo4j_theory_repository import Neo4jTheoryRepository
-from ..infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
-from ..infrastructure.repositories.chromadb_vector_repository import ChromaDBVectorRepository
 from ..application.services import (
-    TheoryService,
-    SearchService,
-    GraphService,
     AnalysisService,
-    RecommendationService,
+    CacheService,
     CitationService,
-    MethodologyService,
+    GraphService,
     InferenceService,
-    CacheService,
+    MethodologyService,
+    RecommendationService,
+    SearchService,
+    TheoryService,
 )
 from ..application.services.export_service import ExportService
+from ..application.services.job_service import JobService
+from ..application.services.relationship_precompute_service import (
+    RelationshipPrecomputeService,
+)
+from ..infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+from ..infrastructure.adapters.deadline import gather_or_cancel
+from ..infrastructure.adapters.esperanto_adapter import EmbeddingAdapter, EsperantoAdapter
+from ..infrastructure.adapters.job_store import JobStore, RedisJobStore, SQLiteJobStore
+from ..infrastructure.adapters.metrics import CONTENT_TYPE, EventLoopLagMonitor, get_metrics
+from ..infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from ..infrastructure.adapters.profiler import get_profiler
+from ..infrastructure.adapters.redis_adapter import STATE_KEY_PREFIX, RedisAdapter
+from ..infrastructure.adapters.startup import get_startup_report
+from ..infrastructure.adapters.streaming import ProgressCallback
+from ..infrastructure.adapters.tracing import configure_tracing, create_exporter
+from ..infrastructure.config.logging import get_logger, setup_logging
+from ..infrastructure.config.settings import get_settings
+from ..infrastructure.repositories.chromadb_vector_repository import ChromaDBVectorRepository
+from ..infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+from ..infrastructure.repositories.neo4j_theory_repository import Neo4jTheoryRepository
+from ..infrastructure.repositories.redis_methodology_repository import (
+    RedisMethodologyRepository,
+)
+
+if TYPE_CHECKING:
+    from .tools.registry import ToolRegistry
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+@dataclass
+class StartupSnapshot:
+    """One-time startup work done by the supervisor for its workers.
+
+    In HTTP mode with several worker processes, the supervisor checks the
+    backends and recovers interrupted jobs once before spawning workers,
+    and writes the outcome to a file. Workers that find a snapshot of
+    their own supervisor skip that work.
+
+    Attributes:
+        supervisor_pid: Process ID of the supervisor that wrote it.
+        created_at: Creation time (epoch seconds).
+        neo4j_verified: Whether Neo4j connectivity was verified.
+        jobs_recovered: Interrupted jobs reset to pending.
+    """
+
+    supervisor_pid: int
+    created_at: float
+    neo4j_verified: bool = False
+    jobs_recovered: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary of snapshot fields.
+        """
+        return {
+            "supervisor_pid": self.supervisor_pid,
+            "created_at": self.created_at,
+            "neo4j_verified": self.neo4j_verified,
+            "jobs_recovered": self.jobs_recovered,
+        }
+
+    def write(self, path: str | Path) -> None:
+        """Write the snapshot to a file.
+
+        Args:
+            path: Snapshot file path.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "StartupSnapshot | None":
+        """Load the snapshot written by this process's supervisor.
+
+        Args:
+            path: Snapshot file path.
+
+        Returns:
+            Snapshot, or None if missing, unreadable or from another supervisor.
+        """
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            snapshot = cls(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        return snapshot if snapshot.supervisor_pid == os.getppid() else None
+
 
 class TenjinServer:
     """TENJIN MCP Server for educational theory GraphRAG."""
@@ -72,28 +162,63 @@ class TenjinServer:
         self._inference_service: InferenceService | None = None
         self._cache_service: CacheService | None = None
         self._export_service: ExportService | None = None
+        self._job_service: JobService | None = None
+
+        self._shared = False
+
+        # Set by register_tools
+        self.tool_registry: "ToolRegistry | None" = None
+
+    async def initialize(
+        self,
+        shared: bool = False,
+        snapshot: StartupSnapshot | None = None,
+    ) -> None:
+        """Initialize all adapters, repositories, and services.
 
-    async def initialize(self) -> None:
-        """Initialize all adapters, repositories, and services."""
+        Args:
+            shared: Keep state that must be visible to every server
+                process (methodologies) in Redis.
+            snapshot: Startup work already done by the supervisor.
+        """
         if self._initialized:
             return
 
         logger.info("Initializing TENJIN server...")
+        started = time.perf_counter()
+        report = get_startup_report()
 
-        # Initialize adapters
+        # Initialize adapters (backends are connected concurrently)
         self._neo4j = Neo4jAdapter(
             uri=self._settings.neo4j.uri,
             user=self._settings.neo4j.user,
             password=self._settings.neo4j.password,
         )
-        await self._neo4j.connect()
-
         self._chromadb = ChromaDBAdapter(
             persist_dir=self._settings.chromadb.persist_dir,
             collection_name=self._settings.chromadb.collection_name,
         )
-        self._chromadb.connect()
 
+        async def connect_neo4j() -> None:
+            with report.timed("connects", "neo4j"):
+                await self._neo4j.connect(
+                    verify=snapshot is None or not snapshot.neo4j_verified
+                )
+
+        async def connect_chromadb() -> None:
+            # The client is synchronous; open it off the event loop
+            with report.timed("connects", "chromadb"):
+                await asyncio.to_thread(self._chromadb.connect)
+
+        async def connect_redis() -> None:
+            with report.timed("connects", "redis"):
+                await self._connect_redis()
+
+        await gather_or_cancel(connect_neo4j(), connect_chromadb(), connect_redis())
+        if shared and not self._redis:
+            logger.warning("Redis not available, state is not shared between processes")
+
+        # LLM and embedding clients are created on first use
         self._llm = EsperantoAdapter(
             provider=self._settings.llm.provider,
             model=self._settings.llm.model,
@@ -104,19 +229,6 @@ class TenjinServer:
             model=self._settings.embedding.model,
         )
 
-        # Initialize Redis adapter (optional - for caching)
-        if self._settings.cache.enabled:
-            try:
-                self._redis = RedisAdapter(
-                    url=self._settings.cache.redis_url,
-                    default_ttl=self._settings.cache.ttl_seconds,
-                )
-                await self._redis.connect()
-                logger.info("Redis cache connected")
-            except Exception as e:
-                logger.warning(f"Redis cache not available: {e}. Continuing without cache.")
-                self._redis = None
-
         # Initialize repositories
         self._theory_repo = Neo4jTheoryRepository(self._neo4j)
         self._graph_repo = Neo4jGraphRepository(self._neo4j)
@@ -124,51 +236,194 @@ class TenjinServer:
             self._chromadb, self._embedding
         )
 
-        # Initialize services
+        # Initialize the services used by most sessions; the others are
+        # built on first use (see the service properties)
+        self._shared = shared
         self._theory_service = TheoryService(self._theory_repo)
         self._search_service = SearchService(
             self._vector_repo,
             self._theory_repo,
         )
         self._graph_service = GraphService(self._graph_repo)
-        self._analysis_service = AnalysisService(
-            self._theory_repo,
-            self._graph_repo,
-            self._llm,
-        )
-        self._recommendation_service = RecommendationService(
-            self._theory_repo,
-            self._vector_repo,
-            self._graph_repo,
-            self._llm,
-        )
-        self._citation_service = CitationService(self._theory_repo)
-        self._methodology_service = MethodologyService(
-            self._theory_repo,
-            self._vector_repo,
-            self._llm,
-        )
-        self._inference_service = InferenceService(
-            self._theory_repo,
-            self._vector_repo,
-            self._graph_repo,
-            self._llm,
-        )
-        
-        self._export_service = ExportService(self._theory_repo)
+        self._analysis_service = None
+        self._recommendation_service = None
+        self._citation_service = None
+        self._methodology_service = None
+        self._inference_service = None
+        self._export_service = None
 
         # Initialize cache service
         if self._redis:
             self._cache_service = CacheService(self._redis)
             logger.info("Cache service initialized")
 
+        # Initialize background jobs
+        job_service = JobService(
+            self._create_job_store(),
+            max_workers=self._settings.job.max_workers,
+            timeout_seconds=self._settings.job.timeout_seconds,
+            result_ttl_seconds=self._settings.job.result_ttl_seconds,
+        )
+        self._register_job_operations(job_service)
+        try:
+            await job_service.start(recover=snapshot is None)
+            self._job_service = job_service
+        except (OSError, sqlite3.Error) as e:
+            # e.g. read-only data volume: keep serving, just without background jobs
+            logger.warning(f"Job store unavailable, background jobs disabled: {e}")
+
         self._initialized = True
-        logger.info("TENJIN server initialized successfully")
+        report.initialize_seconds = time.perf_counter() - started
+        logger.info(f"TENJIN server initialized successfully ({report.summary()})")
+
+    async def _connect_redis(self) -> None:
+        """Connect the Redis adapter if caching is enabled."""
+        if not self._settings.cache.enabled:
+            return
+        try:
+            self._redis = RedisAdapter(
+                url=self._settings.cache.redis_url,
+                default_ttl=self._settings.cache.ttl_seconds,
+            )
+            await self._redis.connect()
+            logger.info("Redis cache connected")
+        except Exception as e:
+            logger.warning(f"Redis cache not available: {e}. Continuing without cache.")
+            self._redis = None
+
+    async def prepare_workers(self) -> StartupSnapshot:
+        """Do the startup work shared by all worker processes once.
+
+        Verifies Neo4j connectivity and recovers jobs interrupted by the
+        previous run, so that workers neither repeat the check nor reset
+        jobs a sibling worker has already started.
+
+        Returns:
+            Snapshot to hand to the workers.
+        """
+        snapshot = StartupSnapshot(supervisor_pid=os.getpid(), created_at=time.time())
+
+        neo4j = Neo4jAdapter(
+            uri=self._settings.neo4j.uri,
+            user=self._settings.neo4j.user,
+            password=self._settings.neo4j.password,
+        )
+        try:
+            await neo4j.connect()
+            snapshot.neo4j_verified = True
+        except Exception as e:
+            logger.warning(f"Neo4j not reachable from the supervisor: {e}")
+        finally:
+            await neo4j.close()
+
+        await self._connect_redis()
+        store = self._create_job_store()
+        try:
+            jobs = JobService(store, result_ttl_seconds=self._settings.job.result_ttl_seconds)
+            snapshot.jobs_recovered = await jobs.recover()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Job store unavailable, background jobs disabled: {e}")
+        finally:
+            if isinstance(store, SQLiteJobStore):
+                store.close()
+            if self._redis:
+                await self._redis.close()
+                self._redis = None
+
+        return snapshot
+
+    def _create_job_store(self) -> JobStore:
+        """Create the configured job store.
+
+        Returns:
+            Redis job store if configured and Redis is connected,
+            otherwise the SQLite job store.
+        """
+        settings = self._settings.job
+        if settings.backend == "redis":
+            if self._redis and self._redis.is_connected:
+                return RedisJobStore(
+                    self._redis.scoped(STATE_KEY_PREFIX), ttl_seconds=settings.result_ttl_seconds
+                )
+            logger.warning("Redis not available for jobs, using SQLite job store")
+        return SQLiteJobStore(settings.sqlite_path)
+
+    def _register_job_operations(self, jobs: JobService) -> None:
+        """Register long-running operations that can be run as jobs.
+
+        Services are resolved when a job runs, so registering the
+        operations does not build them.
+
+        Args:
+            jobs: Job service.
+        """
+
+        async def infer_relationships(
+            args: dict[str, Any], on_progress: ProgressCallback
+        ) -> Any:
+            return await self.inference_service.infer_theory_relationships(
+                theory_id=args.get("theory_id", ""),
+                inference_depth=args.get("inference_depth", 2),
+            )
+
+        async def gap_analysis(
+            args: dict[str, Any], on_progress: ProgressCallback
+        ) -> Any:
+            return await self.inference_service.analyze_learning_design_gaps(
+                current_design=args.get("current_design", {}),
+                target_outcomes=args.get("target_outcomes", []),
+                applied_theories=args.get("applied_theories"),
+                on_progress=on_progress,
+                use_llm=args.get("use_llm", True),
+            )
+
+        async def synthesis(
+            args: dict[str, Any], on_progress: ProgressCallback
+        ) -> Any:
+            return await self.inference_service.synthesize_theories(
+                theory_ids=args.get("theory_ids", []),
+                synthesis_goal=args.get("synthesis_goal", ""),
+                context=args.get("context"),
+                on_progress=on_progress,
+            )
+
+        async def application_reasoning(
+            args: dict[str, Any], on_progress: ProgressCallback
+        ) -> Any:
+            return await self.inference_service.reason_about_application(
+                scenario=args.get("scenario", ""),
+                constraints=args.get("constraints"),
+            )
+
+        async def precompute_relationships(
+            args: dict[str, Any], on_progress: ProgressCallback
+        ) -> Any:
+            precompute = RelationshipPrecomputeService(
+                self._theory_repo,
+                self._vector_repo,
+                self._graph_repo,
+                self._llm,
+            )
+            report = await precompute.precompute(
+                restart=args.get("restart", False),
+                max_pairs=args.get("max_pairs"),
+                on_progress=on_progress,
+            )
+            return report.to_dict()
+
+        jobs.register("infer_theory_relationships", infer_relationships)
+        jobs.register("analyze_learning_design_gaps", gap_analysis)
+        jobs.register("synthesize_theories", synthesis)
+        jobs.register("reason_about_application", application_reasoning)
+        jobs.register("precompute_relationships", precompute_relationships)
 
     async def shutdown(self) -> None:
         """Shutdown all connections."""
         logger.info("Shutting down TENJIN server...")
 
+        if self._job_service:
+            await self._job_service.stop()
+
         if self._redis:
             await self._redis.close()
 
@@ -183,6 +438,26 @@ class TenjinServer:
         """Get MCP server instance."""
         return self._server
 
+    def _build(self, name: str, factory: Callable[[], T]) -> T:
+        """Build a lazily created service and record its build time.
+
+        Args:
+            name: Service name (for the startup report).
+            factory: Creates the service.
+
+        Returns:
+            Created service.
+
+        Raises:
+            RuntimeError: If the server is not initialized.
+        """
+        if self._theory_repo is None:
+            raise RuntimeError("Server not initialized")
+        with get_startup_report().timed("services", name):
+            service = factory()
+        logger.debug(f"Built {name} service on first use")
+        return service
+
     @property
     def theory_service(self) -> TheoryService:
         """Get theory service."""
@@ -206,51 +481,104 @@ class TenjinServer:
 
     @property
     def analysis_service(self) -> AnalysisService:
-        """Get analysis service."""
+        """Get analysis service (built on first use)."""
         if not self._analysis_service:
-            raise RuntimeError("Server not initialized")
+            self._analysis_service = self._build(
+                "analysis",
+                lambda: AnalysisService(
+                    self._theory_repo,
+                    self._graph_repo,
+                    self._llm,
+                ),
+            )
         return self._analysis_service
 
     @property
     def recommendation_service(self) -> RecommendationService:
-        """Get recommendation service."""
+        """Get recommendation service (built on first use)."""
         if not self._recommendation_service:
-            raise RuntimeError("Server not initialized")
+            self._recommendation_service = self._build(
+                "recommendation",
+                lambda: RecommendationService(
+                    self._theory_repo,
+                    self._vector_repo,
+                    self._graph_repo,
+                    self._llm,
+                ),
+            )
         return self._recommendation_service
 
     @property
     def citation_service(self) -> CitationService:
-        """Get citation service."""
+        """Get citation service (built on first use)."""
         if not self._citation_service:
-            raise RuntimeError("Server not initialized")
+            self._citation_service = self._build(
+                "citation",
+                lambda: CitationService(self._theory_repo),
+            )
         return self._citation_service
 
     @property
     def methodology_service(self) -> MethodologyService:
-        """Get methodology service."""
+        """Get methodology service (built on first use)."""
         if not self._methodology_service:
-            raise RuntimeError("Server not initialized")
+            self._methodology_service = self._build(
+                "methodology",
+                lambda: MethodologyService(
+                    self._theory_repo,
+                    self._vector_repo,
+                    self._llm,
+                    RedisMethodologyRepository(self._redis.scoped(STATE_KEY_PREFIX))
+                    if self._shared and self._redis
+                    else None,
+                ),
+            )
         return self._methodology_service
 
     @property
     def inference_service(self) -> InferenceService:
-        """Get inference service."""
+        """Get inference service (built on first use)."""
         if not self._inference_service:
-            raise RuntimeError("Server not initialized")
+            self._inference_service = self._build(
+                "inference",
+                lambda: InferenceService(
+                    self._theory_repo,
+                    self._vector_repo,
+                    self._graph_repo,
+                    self._llm,
+                ),
+            )
         return self._inference_service
 
     @property
     def export_service(self) -> ExportService:
-        """Get export service."""
+        """Get export service (built on first use)."""
         if not self._export_service:
-            raise RuntimeError("Server not initialized")
+            self._export_service = self._build(
+                "export",
+                lambda: ExportService(self._theory_repo),
+            )
         return self._export_service
 
+    @property
+    def job_service(self) -> JobService:
+        """Get background job service."""
+        if not self._job_service:
+            if self._initialized:
+                raise RuntimeError("Background jobs are disabled (job store unavailable)")
+            raise RuntimeError("Server not initialized")
+        return self._job_service
+
     @property
     def cache_service(self) -> CacheService | None:
         """Get cache service (may be None if Redis is not available)."""
         return self._cache_service
 
+    @property
+    def llm_adapter(self) -> EsperantoAdapter | None:
+        """Get LLM adapter."""
+        return self._llm
+
     @property
     def redis_adapter(self) -> RedisAdapter | None:
         """Get Redis adapter (may be None if not available)."""
@@ -274,26 +602,47 @@ def get_tenjin_server() -> TenjinServer:
 
 
 @asynccontextmanager
-async def server_lifespan() -> AsyncIterator[TenjinServer]:
-    """Server lifespan context manager."""
+async def server_lifespan(
+    shared: bool = False,
+    snapshot: StartupSnapshot | None = None,
+) -> AsyncIterator[TenjinServer]:
+    """Server lifespan context manager.
+
+    Args:
+        shared: Share state between server processes through Redis.
+        snapshot: Startup work already done by the supervisor.
+    """
     server = get_tenjin_server()
     try:
-        await server.initialize()
+        await server.initialize(shared=shared, snapshot=snapshot)
         yield server
     finally:
         await server.shutdown()
 
 
+def setup_tracing(stdio: bool) -> None:
+    """Configure the trace exporter from settings.
+
+    Args:
+        stdio: Whether stdout carries the MCP protocol.
+    """
+    settings = get_settings().tracing
+    if settings.enabled:
+        configure_tracing(create_exporter(settings.exporter, settings.file_path, stdio=stdio))
+        logger.info(f"Tracing enabled (exporter: {settings.exporter})")
+
+
 async def main() -> None:
     """Main entry point (STDIO mode)."""
     setup_logging()
+    setup_tracing(stdio=True)
     logger.info("Starting TENJIN MCP Server (STDIO mode)...")
 
     async with server_lifespan() as tenjin:
         # Register tools, resources, and prompts
-        from .tools import register_tools
-        from .resources import register_resources
         from .prompts import register_prompts
+        from .resources import register_resources
+        from .tools import register_tools
 
         register_tools(tenjin.server, tenjin)
         register_resources(tenjin.server, tenjin)
@@ -311,6 +660,7 @@ async def main() -> None:
 async def main_sse(host: str = "0.0.0.0", port: int = 8080) -> None:
     """Main entry point (SSE mode for remote access)."""
     setup_logging()
+    setup_tracing(stdio=False)
     logger.info(f"Starting TENJIN MCP Server (SSE mode on {host}:{port})...")
 
     # Create SSE transport
@@ -318,28 +668,60 @@ async def main_sse(host: str = "0.0.0.0", port: int = 8080) -> None:
 
     async with server_lifespan() as tenjin:
         # Register tools, resources, and prompts
-        from .tools import register_tools
-        from .resources import register_resources
         from .prompts import register_prompts
+        from .resources import register_resources
+        from .tools import register_tools
 
-        register_tools(tenjin.server, tenjin)
+        registry = register_tools(tenjin.server, tenjin, admission=True)
         register_resources(tenjin.server, tenjin)
         register_prompts(tenjin.server, tenjin)
 
+        from .tools.admin_tools import start_profiling_session
+        from .tools.middleware import AdmissionMiddleware
+
+        metrics_settings = get_settings().metrics
+        profiling_settings = get_settings().profiling
+        admission_settings = get_settings().admission
+        sse_connections = get_metrics().gauge(
+            "tenjin_sse_connections", "Open SSE client connections"
+        )
+        sse_rejected = get_metrics().counter(
+            "tenjin_sse_rejected_total", "SSE connections rejected at the session limit"
+        )
+        admission = next(
+            (m for m in registry.middleware if isinstance(m, AdmissionMiddleware)), None
+        )
+        open_sessions = 0
+
         # SSE connection handler
         async def handle_sse(request: Request) -> Response:
             """Handle SSE connection."""
-            logger.info(f"SSE connection from {request.client}")
-            async with sse_transport.connect_sse(
-                request.scope,
-                request.receive,
-                request._send,  # type: ignore
-            ) as (read_stream, write_stream):
-                await tenjin.server.run(
-                    read_stream,
-                    write_stream,
-                    tenjin.server.create_initialization_options(),
+            nonlocal open_sessions
+            if admission_settings.enabled and open_sessions >= admission_settings.max_sessions:
+                logger.warning(f"Rejecting SSE connection from {request.client}: session limit")
+                sse_rejected.inc()
+                return Response(
+                    "Too many sessions",
+                    status_code=503,
+                    headers={"Retry-After": str(admission_settings.session_retry_after_seconds)},
                 )
+            logger.info(f"SSE connection from {request.client}")
+            open_sessions += 1
+            sse_connections.inc()
+            try:
+                async with sse_transport.connect_sse(
+                    request.scope,
+                    request.receive,
+                    request._send,  # type: ignore
+                ) as (read_stream, write_stream):
+                    await tenjin.server.run(
+                        read_stream,
+                        write_stream,
+                        tenjin.server.create_initialization_options(),
+                    )
+            finally:
+                open_sessions -= 1
+                sse_connections.dec()
             return Response()
 
         # POST message handler
@@ -355,24 +737,238 @@ async def main_sse(host: str = "0.0.0.0", port: int = 8080) -> None:
         # Health check endpoint
         async def health_check(request: Request) -> Response:
             """Health check endpoint."""
+            providers = tenjin.llm_adapter.get_provider_health() if tenjin.llm_adapter else {}
+            llm_available = not providers or any(
+                p["state"] != "open" for p in providers.values()
+            )
             return Response(
-                content='{"status": "healthy", "service": "tenjin-mcp"}',
+                content=json.dumps(
+                    {
+                        "status": "healthy" if llm_available else "degraded",
+                        "service": "tenjin-mcp",
+                        "llm_providers": providers,
+                        "sessions": open_sessions,
+                        "admission": admission.get_statistics() if admission else None,
+                        "startup": get_startup_report().to_dict(),
+                    }
+                ),
                 media_type="application/json",
             )
 
+        # Prometheus metrics endpoint
+        async def metrics_endpoint(request: Request) -> Response:
+            """Expose metrics in the Prometheus text format."""
+            return Response(content=get_metrics().render(), media_type=CONTENT_TYPE)
+
+        # Profiling admin endpoint
+        async def profile_endpoint(request: Request) -> Response:
+            """Start (POST), stop (DELETE) or inspect (GET) a profiling session."""
+            expected = f"Bearer {profiling_settings.admin_token}".encode()
+            supplied = request.headers.get("authorization", "").encode()
+            if not hmac.compare_digest(supplied, expected):
+                return Response(status_code=401)
+
+            profiler = get_profiler()
+            if request.method == "POST":
+                params = request.query_params
+                arguments = {
+                    "max_calls": params.get("max_calls"),
+                    "duration_seconds": params.get("duration_seconds"),
+                    "interval_ms": params.get("interval_ms"),
+                    "memory": params.get("memory", "true").lower() != "false",
+                }
+                try:
+                    return JSONResponse(start_profiling_session(arguments))
+                except ValueError as e:
+                    return JSONResponse({"error": str(e)}, status_code=400)
+                except RuntimeError as e:
+                    return JSONResponse({"error": str(e)}, status_code=409)
+            if request.method == "DELETE":
+                profiler.stop()
+
+            report = profiler.last_report
+            if request.query_params.get("format") == "collapsed":
+                text = report.collapsed(request.query_params.get("tool")) if report else ""
+                return PlainTextResponse(text)
+            return JSONResponse(
+                {
+                    "status": profiler.status(),
+                    "report": report.to_dict(include_collapsed=False) if report else None,
+                }
+            )
+
+        routes = [
+            Route("/sse", endpoint=handle_sse),
+            Route("/messages/", endpoint=handle_messages, methods=["POST"]),
+            Route("/health", endpoint=health_check),
+        ]
+        lag_monitor = None
+        if metrics_settings.enabled:
+            routes.append(Route("/metrics", endpoint=metrics_endpoint))
+            lag_monitor = EventLoopLagMonitor(metrics_settings.loop_lag_interval)
+            lag_monitor.start()
+        if profiling_settings.admin_enabled and profiling_settings.admin_token:
+            routes.append(
+                Route(
+                    "/admin/profile", endpoint=profile_endpoint, methods=["GET", "POST", "DELETE"]
+                )
+            )
+        elif profiling_settings.admin_enabled:
+            logger.warning("PROFILING_ADMIN_TOKEN is not set; /admin/profile is not mounted")
+
         # Create Starlette app
-        app = Starlette(
-            routes=[
-                Route("/sse", endpoint=handle_sse),
-                Route("/messages/", endpoint=handle_messages, methods=["POST"]),
-                Route("/health", endpoint=health_check),
-            ],
-        )
+        app = Starlette(routes=routes)
 
         # Run with uvicorn
         config = uvicorn.Config(app, host=host, port=port, log_level="info")
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            if lag_monitor is not None:
+                await lag_monitor.stop()
+
+
+class _StreamableHTTPEndpoint:
+    """ASGI endpoint handing MCP requests to the session manager."""
+
+    def __init__(self) -> None:
+        """Initialize endpoint (the manager is set on startup)."""
+        self.manager: StreamableHTTPSessionManager | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one MCP request."""
+        if self.manager is None:
+            await Response("Server is starting", status_code=503)(scope, receive, send)
+            return
+        await self.manager.handle_request(scope, receive, send)
+
+
+def create_http_app() -> Starlette:
+    """Create the app of one stateless Streamable HTTP worker.
+
+    Every request is handled on its own, without a session pinned to this
+    process, so a load balancer or the uvicorn supervisor may send any
+    request to any worker. State that outlives a request lives in Redis
+    (cached tool results, methodologies, jobs) or in the job store.
+
+    Returns:
+        Starlette application (uvicorn app factory).
+    """
+    settings = get_settings()
+    setup_logging()
+    setup_tracing(stdio=False)
+    snapshot = StartupSnapshot.load(settings.http.snapshot_path)
+    endpoint = _StreamableHTTPEndpoint()
+    state: dict[str, Any] = {}
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        """Initialize this worker and run the session manager."""
+        if snapshot is not None:
+            logger.info(f"Worker {os.getpid()} using startup snapshot of {snapshot.supervisor_pid}")
+        async with server_lifespan(shared=True, snapshot=snapshot) as tenjin:
+            from .prompts import register_prompts
+            from .resources import register_resources
+            from .tools import register_tools
+            from .tools.middleware import AdmissionMiddleware
+
+            registry = register_tools(tenjin.server, tenjin, admission=True, shared_cache=True)
+            register_resources(tenjin.server, tenjin)
+            register_prompts(tenjin.server, tenjin)
+            state["tenjin"] = tenjin
+            state["admission"] = next(
+                (m for m in registry.middleware if isinstance(m, AdmissionMiddleware)), None
+            )
+
+            endpoint.manager = StreamableHTTPSessionManager(
+                app=tenjin.server,
+                stateless=True,
+                json_response=settings.http.json_response,
+            )
+            lag_monitor = None
+            if settings.metrics.enabled:
+                lag_monitor = EventLoopLagMonitor(settings.metrics.loop_lag_interval)
+                lag_monitor.start()
+            try:
+                async with endpoint.manager.run():
+                    logger.info(f"Worker {os.getpid()} serving {settings.http.path}")
+                    yield
+            finally:
+                endpoint.manager = None
+                if lag_monitor is not None:
+                    await lag_monitor.stop()
+
+    async def health_check(request: Request) -> Response:
+        """Health check endpoint (of the worker answering it)."""
+        tenjin: TenjinServer | None = state.get("tenjin")
+        if tenjin is None:
+            return JSONResponse({"status": "starting"}, status_code=503)
+        providers = tenjin.llm_adapter.get_provider_health() if tenjin.llm_adapter else {}
+        llm_available = not providers or any(p["state"] != "open" for p in providers.values())
+        admission = state.get("admission")
+        return JSONResponse(
+            {
+                "status": "healthy" if llm_available else "degraded",
+                "service": "tenjin-mcp",
+                "worker": os.getpid(),
+                "llm_providers": providers,
+                "admission": admission.get_statistics() if admission else None,
+                "startup": get_startup_report().to_dict(),
+            }
+        )
+
+    async def metrics_endpoint(request: Request) -> Response:
+        """Expose this worker's metrics in the Prometheus text format."""
+        return Response(content=get_metrics().render(), media_type=CONTENT_TYPE)
+
+    routes = [
+        Route(settings.http.path, endpoint=endpoint, methods=["GET", "POST", "DELETE"]),
+        Route("/health", endpoint=health_check),
+    ]
+    if settings.metrics.enabled:
+        routes.append(Route("/metrics", endpoint=metrics_endpoint))
+    return Starlette(routes=routes, lifespan=lifespan)
+
+
+def main_http(host: str = "0.0.0.0", port: int = 8080, workers: int | None = None) -> None:
+    """Main entry point (stateless Streamable HTTP mode on worker processes).
+
+    With more than one worker, this process becomes the uvicorn supervisor:
+    it does the shared startup work once, writes the startup snapshot and
+    spawns the workers, each of which builds its app with
+    ``create_http_app``.
+
+    Args:
+        host: Bind host.
+        port: Bind port.
+        workers: Worker processes (default: ``HTTP_WORKERS``, 0 = CPU cores).
+    """
+    setup_logging()
+    settings = get_settings()
+    if workers is None:
+        workers = settings.http.workers
+    workers = workers or os.cpu_count() or 1
+    logger.info(
+        f"Starting TENJIN MCP Server (HTTP mode on {host}:{port}, {workers} workers)..."
+    )
+
+    snapshot_path = Path(settings.http.snapshot_path)
+    if workers > 1:
+        snapshot = asyncio.run(TenjinServer().prepare_workers())
+        snapshot.write(snapshot_path)
+        logger.info(f"Startup snapshot written: {snapshot.to_dict()}")
+    else:
+        snapshot_path.unlink(missing_ok=True)
+
+    uvicorn.run(
+        "tenjin.interface.server:create_http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+    )
 
 
 def run() -> None:
@@ -382,24 +978,32 @@ def run() -> None:
     )
     parser.add_argument(
         "--mode",
-        choices=["stdio", "sse"],
+        choices=["stdio", "sse", "http"],
         default="stdio",
-        help="Transport mode: stdio (default) or sse",
+        help="Transport mode: stdio (default), sse, or http (stateless, multi-process)",
     )
     parser.add_argument(
         "--host",
         default="0.0.0.0",
-        help="Host for SSE mode (default: 0.0.0.0)",
+        help="Host for SSE and HTTP mode (default: 0.0.0.0)",
     )
     parser.add_argument(
         "--port",
         type=int,
         default=8080,
-        help="Port for SSE mode (default: 8080)",
+        help="Port for SSE and HTTP mode (default: 8080)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for HTTP mode (default: HTTP_WORKERS, 0 = CPU cores)",
     )
     args = parser.parse_args()
 
-    if args.mode == "sse":
+    if args.mode == "http":
+        main_http(host=args.host, port=args.port, workers=args.workers)
+    elif args.mode == "sse":
         asyncio.run(main_sse(host=args.host, port=args.port))
     else:
         asyncio.run(main())
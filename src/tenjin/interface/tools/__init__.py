@@ -1,9 +1,11 @@
 """MCP Tools - Action handlers for MCP protocol."""
 
 from mcp.server import Server
-from mcp.types import Tool
 
 from ..server import TenjinServer
+from ...infrastructure.config.settings import get_settings
+from .registry import ToolRegistry
+from .middleware import default_middleware
 from .theory_tools import register_theory_tools, get_theory_tool_definitions
 from .search_tools import register_search_tools, get_search_tool_definitions
 from .graph_tools import register_graph_tools, get_graph_tool_definitions
@@ -23,43 +25,78 @@ from .inference_tools import (
 )
 from .cache_tools import register_cache_tools, get_cache_tool_definitions
 from .export_tools import register_export_tools, get_export_tool_definitions
+from .provider_tools import register_provider_tools, get_provider_tool_definitions
+from .job_tools import register_job_tools, get_job_tool_definitions
+from .admin_tools import register_admin_tools, get_admin_tool_definitions
 
 
-def register_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_tools(
+    server: Server,
+    tenjin: TenjinServer,
+    admission: bool = False,
+    shared_cache: bool = False,
+) -> ToolRegistry:
     """Register all MCP tools with the server.
 
+    Every tool module registers its handlers in one registry, which is
+    installed as the server's single ``call_tool`` and ``list_tools``
+    handler.
+
     Args:
         server: MCP server instance.
         tenjin: TENJIN server instance.
+        admission: Apply per-session and per-pool admission control
+            (for transports serving several clients).
+        shared_cache: Share cached tool results between server processes
+            through Redis (when Redis is available).
+
+    Returns:
+        Installed tool registry.
     """
+    settings = get_settings()
+    registry = ToolRegistry(
+        server,
+        default_middleware(
+            settings.tool,
+            settings.tracing,
+            settings.admission if admission else None,
+            tenjin.redis_adapter if shared_cache else None,
+        ),
+    )
+
     # Register tool handlers
-    register_theory_tools(server, tenjin)
-    register_search_tools(server, tenjin)
-    register_graph_tools(server, tenjin)
-    register_analysis_tools(server, tenjin)
-    register_recommendation_tools(server, tenjin)
-    register_citation_tools(server, tenjin)
-    register_methodology_tools(server, tenjin)
-    register_inference_tools(server, tenjin)
-    register_cache_tools(server, tenjin)
-    register_export_tools(server, tenjin)
+    register_theory_tools(registry, tenjin)
+    register_search_tools(registry, tenjin)
+    register_graph_tools(registry, tenjin)
+    register_analysis_tools(registry, tenjin)
+    register_recommendation_tools(registry, tenjin)
+    register_citation_tools(registry, tenjin)
+    register_methodology_tools(registry, tenjin)
+    register_inference_tools(registry, tenjin)
+    register_cache_tools(registry, tenjin)
+    register_export_tools(registry, tenjin)
+    register_provider_tools(registry, tenjin)
+    register_job_tools(registry, tenjin)
+    register_admin_tools(registry, tenjin)
+
+    # Register tool definitions (input schemas are validated on dispatch)
+    registry.define(get_theory_tool_definitions())
+    registry.define(get_search_tool_definitions())
+    registry.define(get_graph_tool_definitions())
+    registry.define(get_analysis_tool_definitions())
+    registry.define(get_recommendation_tool_definitions())
+    registry.define(get_citation_tool_definitions())
+    registry.define(get_methodology_tool_definitions())
+    registry.define(get_inference_tool_definitions())
+    registry.define(get_cache_tool_definitions(tenjin))
+    registry.define(get_export_tool_definitions())
+    registry.define(get_provider_tool_definitions())
+    registry.define(get_job_tool_definitions())
+    registry.define(get_admin_tool_definitions())
 
-    # Register tool listing
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        """List all available tools."""
-        tools = []
-        tools.extend(get_theory_tool_definitions())
-        tools.extend(get_search_tool_definitions())
-        tools.extend(get_graph_tool_definitions())
-        tools.extend(get_analysis_tool_definitions())
-        tools.extend(get_recommendation_tool_definitions())
-        tools.extend(get_citation_tool_definitions())
-        tools.extend(get_methodology_tool_definitions())
-        tools.extend(get_inference_tool_definitions())
-        tools.extend(get_cache_tool_definitions(tenjin))
-        tools.extend(get_export_tool_definitions())
-        return tools
+    registry.install()
+    tenjin.tool_registry = registry
+    return registry
 
 
-__all__ = ["register_tools"]
+__all__ = ["register_tools", "ToolRegistry"]
@@ -0,0 +1,170 @@
+"""MCP Tools registration - Profiling admin tools.
+
+These tools control the on-demand sampling profiler of the running
+server. They are only registered when ``PROFILING_ADMIN_ENABLED`` is set.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from mcp.types import TextContent, Tool
+
+from ...infrastructure.adapters.profiler import get_profiler
+from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
+from ..serialization import json_content
+from .registry import ToolRegistry
+
+if TYPE_CHECKING:
+    from ..server import TenjinServer
+
+logger = get_logger(__name__)
+
+# Session length when neither a call nor a time limit is given
+DEFAULT_DURATION_SECONDS = 60.0
+
+
+def start_profiling_session(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Start a profiling session from tool or HTTP arguments.
+
+    Args:
+        arguments: max_calls, duration_seconds, interval_ms and memory.
+
+    Returns:
+        Session status.
+
+    Raises:
+        ValueError: If a numeric argument is malformed.
+        RuntimeError: If a session is running or sampling is unavailable.
+    """
+    settings = get_settings().profiling
+    max_calls = arguments.get("max_calls")
+    duration = arguments.get("duration_seconds")
+    if not max_calls and not duration:
+        duration = DEFAULT_DURATION_SECONDS
+    # Always bound the session so a forgotten one does not run forever
+    duration = min(float(duration or settings.max_duration_seconds), settings.max_duration_seconds)
+    return get_profiler().start(
+        max_calls=int(max_calls) if max_calls else None,
+        duration_seconds=duration,
+        interval_ms=float(arguments.get("interval_ms") or settings.interval_ms),
+        memory=bool(arguments.get("memory", True)),
+    )
+
+
+def register_admin_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
+    """Register profiling admin tools (if enabled).
+
+    Args:
+        registry: Tool registry.
+        tenjin: TENJIN server instance.
+    """
+    if not get_settings().profiling.admin_enabled:
+        return
+
+    profiler = get_profiler()
+
+    @registry.tool("start_profiling")
+    async def start_profiling(arguments: dict[str, Any]) -> list[TextContent]:
+        """Start sampling the next tool calls."""
+        try:
+            return json_content(start_profiling_session(arguments))
+        except RuntimeError as e:
+            return json_content({"error": str(e), **profiler.status()})
+
+    @registry.tool("stop_profiling")
+    async def stop_profiling(arguments: dict[str, Any]) -> list[TextContent]:
+        """Stop the profiling session and return its summary."""
+        report = profiler.stop()
+        if report is None:
+            return json_content({"error": "No profiling session is running", **profiler.status()})
+        return json_content(report.to_dict(include_collapsed=False))
+
+    @registry.tool("get_profiling_report")
+    async def get_profiling_report(arguments: dict[str, Any]) -> list[TextContent]:
+        """Get the profiler status and the last session's report."""
+        report = profiler.last_report
+        if report is None:
+            return json_content({"status": profiler.status(), "report": None})
+        tool = arguments.get("tool")
+        if arguments.get("format") == "collapsed":
+            return [TextContent(type="text", text=report.collapsed(tool))]
+        result = report.to_dict(include_collapsed=False)
+        if tool:
+            result["tools"] = {k: v for k, v in result["tools"].items() if k == tool}
+        return json_content({"status": profiler.status(), "report": result})
+
+
+def get_admin_tool_definitions() -> list[Tool]:
+    """Get profiling admin tool definitions.
+
+    Returns:
+        List of admin tool definitions (empty if admin tools are disabled).
+    """
+    if not get_settings().profiling.admin_enabled:
+        return []
+
+    return [
+        Tool(
+            name="start_profiling",
+            description=(
+                "Admin: start a sampling profiler session for the next N tool calls "
+                "or T seconds (whichever comes first), optionally with a "
+                "tracemalloc memory diff. Fetch results with get_profiling_report."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "max_calls": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Stop after this many tool calls",
+                    },
+                    "duration_seconds": {
+                        "type": "number",
+                        "exclusiveMinimum": 0,
+                        "description": "Stop after this many seconds (default 60)",
+                    },
+                    "interval_ms": {
+                        "type": "number",
+                        "exclusiveMinimum": 0,
+                        "description": "Sampling interval in milliseconds of CPU time",
+                    },
+                    "memory": {
+                        "type": "boolean",
+                        "description": "Capture a tracemalloc diff (default true)",
+                    },
+                },
+                "required": [],
+            },
+        ),
+        Tool(
+            name="stop_profiling",
+            description="Admin: stop the running profiler session and summarize it.",
+            inputSchema={"type": "object", "properties": {}, "required": []},
+        ),
+        Tool(
+            name="get_profiling_report",
+            description=(
+                "Admin: get the profiler status and the last session's report: samples "
+                "per tool with their hottest frames and memory growth, or collapsed "
+                "stacks for flamegraph tools."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tool": {
+                        "type": "string",
+                        "description": "Only include samples of this tool",
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["summary", "collapsed"],
+                        "description": "summary (default) or collapsed stacks",
+                    },
+                },
+                "required": [],
+            },
+        ),
+    ]
@@ -1,24 +1,25 @@
 """MCP Tools registration - Analysis tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_analysis_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_analysis_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register analysis-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("compare_theories", expensive=True)
     async def compare_theories(arguments: dict[str, Any]) -> list[TextContent]:
         """Compare multiple educational theories."""
         theory_ids = arguments.get("theory_ids", [])
@@ -28,9 +29,9 @@ def register_analysis_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_ids=theory_ids,
             aspects=aspects,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("analyze_theory", expensive=True)
     async def analyze_theory(arguments: dict[str, Any]) -> list[TextContent]:
         """Perform in-depth analysis of a theory."""
         theory_id = arguments.get("theory_id", "")
@@ -40,21 +41,9 @@ def register_analysis_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_id=theory_id,
             analysis_type=analysis_type,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
-    async def synthesize_theories(arguments: dict[str, Any]) -> list[TextContent]:
-        """Synthesize multiple theories for a context."""
-        theory_ids = arguments.get("theory_ids", [])
-        context = arguments.get("context", "")
-
-        result = await tenjin.analysis_service.synthesize_theories(
-            theory_ids=theory_ids,
-            context=context,
-        )
-        return [TextContent(type="text", text=str(result))]
-
-    @server.call_tool()
+    @registry.tool("get_theory_applications", expensive=True)
     async def get_theory_applications(arguments: dict[str, Any]) -> list[TextContent]:
         """Get practical applications for a theory."""
         theory_id = arguments.get("theory_id", "")
@@ -64,7 +53,7 @@ def register_analysis_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_id=theory_id,
             context=context,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
 
 def get_analysis_tool_definitions() -> list[Tool]:
@@ -110,25 +99,6 @@ def get_analysis_tool_definitions() -> list[Tool]:
                 "required": ["theory_id"],
             },
         ),
-        Tool(
-            name="synthesize_theories",
-            description="Synthesize multiple theories into an integrated approach for a specific educational context.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "theory_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Theory IDs to synthesize",
-                    },
-                    "context": {
-                        "type": "string",
-                        "description": "Educational context for the synthesis",
-                    },
-                },
-                "required": ["theory_ids"],
-            },
-        ),
         Tool(
             name="get_theory_applications",
             description="Get detailed practical applications for a theory in a specific context, including classroom activities, assessment methods, and examples.",
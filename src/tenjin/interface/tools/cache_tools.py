@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any
 
-from mcp.server import Server
 from mcp.types import TextContent, Tool
 
 from ...infrastructure.config.logging import get_logger
+from ..serialization import json_content
+from .middleware import CacheMiddleware
+from .registry import ToolRegistry
 
 if TYPE_CHECKING:
     from ..server import TenjinServer
@@ -16,15 +17,15 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-def register_cache_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_cache_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register cache management tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("get_cache_stats")
     async def get_cache_stats(arguments: dict[str, Any]) -> list[TextContent]:
         """Get Redis cache statistics."""
         redis = tenjin.redis_adapter
@@ -42,12 +43,7 @@ def register_cache_tools(server: Server, tenjin: TenjinServer) -> None:
                 "status": "connected" if redis._client else "disconnected",
                 "statistics": stats,
             }
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False),
-                )
-            ]
+            return json_content(result)
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
             return [
@@ -57,11 +53,18 @@ def register_cache_tools(server: Server, tenjin: TenjinServer) -> None:
                 )
             ]
 
-    @server.call_tool()
+    @registry.tool("invalidate_cache")
     async def invalidate_cache(arguments: dict[str, Any]) -> list[TextContent]:
         """Invalidate cached data by pattern."""
         pattern = arguments.get("pattern", "*")
 
+        # In-process tool results are keyed by tool, so only a full flush clears them
+        tool_results = 0
+        if pattern == "*":
+            for middleware in registry.middleware:
+                if isinstance(middleware, CacheMiddleware):
+                    tool_results += middleware.clear()
+
         cache_service = tenjin.cache_service
         redis = tenjin.redis_adapter
         if not cache_service or not redis:
@@ -82,13 +85,9 @@ def register_cache_tools(server: Server, tenjin: TenjinServer) -> None:
                 "success": True,
                 "pattern": pattern,
                 "deleted_keys": deleted,
+                "tool_results_cleared": tool_results,
             }
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False),
-                )
-            ]
+            return json_content(result)
         except Exception as e:
             logger.error(f"Failed to invalidate cache: {e}")
             return [
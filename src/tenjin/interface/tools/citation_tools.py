@@ -1,24 +1,25 @@
 """MCP Tools registration - Citation tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_citation_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_citation_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register citation-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("generate_citation", cacheable=True)
     async def generate_citation(arguments: dict[str, Any]) -> list[TextContent]:
         """Generate citation for a theory."""
         theory_id = arguments.get("theory_id", "")
@@ -30,9 +31,9 @@ def register_citation_tools(server: Server, tenjin: TenjinServer) -> None:
             style=style,
             include_url=include_url,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("generate_bibliography", cacheable=True)
     async def generate_bibliography(arguments: dict[str, Any]) -> list[TextContent]:
         """Generate bibliography for multiple theories."""
         theory_ids = arguments.get("theory_ids", [])
@@ -44,9 +45,9 @@ def register_citation_tools(server: Server, tenjin: TenjinServer) -> None:
             style=style,
             sort_by=sort_by,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("export_citations", cacheable=True)
     async def export_citations(arguments: dict[str, Any]) -> list[TextContent]:
         """Export citations in various formats."""
         theory_ids = arguments.get("theory_ids", [])
@@ -56,15 +57,15 @@ def register_citation_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_ids=theory_ids,
             format=format,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_citation_preview", cacheable=True)
     async def get_citation_preview(arguments: dict[str, Any]) -> list[TextContent]:
         """Preview citation in all styles."""
         theory_id = arguments.get("theory_id", "")
 
         result = await tenjin.citation_service.get_citation_preview(theory_id)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
 
 def get_citation_tool_definitions() -> list[Tool]:
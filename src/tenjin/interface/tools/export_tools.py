@@ -1,26 +1,28 @@
 """MCP Tools registration - Export tools."""
 
-import json
 from typing import Any
 
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
 
 logger = get_logger(__name__)
 
 
-def register_export_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_export_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register export-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
+    heavy = get_settings().tool.heavy_concurrency
 
-    @server.call_tool()
+    @registry.tool("export_theories_json", max_concurrency=heavy, expensive=True)
     async def export_theories_json(arguments: dict[str, Any]) -> list[TextContent]:
         """Export theories as JSON."""
         theory_ids = arguments.get("theory_ids")
@@ -32,12 +34,9 @@ def register_export_tools(server: Server, tenjin: TenjinServer) -> None:
             categories=categories,
             include_metadata=include_metadata,
         )
-        return [TextContent(
-            type="text",
-            text=json.dumps(result, ensure_ascii=False, indent=2),
-        )]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("export_theories_markdown", max_concurrency=heavy, expensive=True)
     async def export_theories_markdown(arguments: dict[str, Any]) -> list[TextContent]:
         """Export theories as Markdown document."""
         theory_ids = arguments.get("theory_ids")
@@ -53,7 +52,7 @@ def register_export_tools(server: Server, tenjin: TenjinServer) -> None:
         )
         return [TextContent(type="text", text=result)]
 
-    @server.call_tool()
+    @registry.tool("export_theories_csv", max_concurrency=heavy, expensive=True)
     async def export_theories_csv(arguments: dict[str, Any]) -> list[TextContent]:
         """Export theories as CSV."""
         theory_ids = arguments.get("theory_ids")
@@ -1,24 +1,25 @@
 """MCP Tools registration - Graph tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_graph_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_graph_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register graph-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("get_related_theories", cacheable=True)
     async def get_related_theories(arguments: dict[str, Any]) -> list[TextContent]:
         """Get theories related to a given theory."""
         theory_id = arguments.get("theory_id", "")
@@ -32,17 +33,17 @@ def register_graph_tools(server: Server, tenjin: TenjinServer) -> None:
             depth=depth,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_theory_relationships", cacheable=True)
     async def get_theory_relationships(arguments: dict[str, Any]) -> list[TextContent]:
         """Get all relationships for a theory."""
         theory_id = arguments.get("theory_id", "")
 
         result = await tenjin.graph_service.get_theory_relationships(theory_id)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("find_theory_path", cacheable=True)
     async def find_theory_path(arguments: dict[str, Any]) -> list[TextContent]:
         """Find path between two theories."""
         source_id = arguments.get("source_id", "")
@@ -54,9 +55,9 @@ def register_graph_tools(server: Server, tenjin: TenjinServer) -> None:
             target_id=target_id,
             max_depth=max_depth,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_theory_network", cacheable=True)
     async def get_theory_network(arguments: dict[str, Any]) -> list[TextContent]:
         """Get network visualization data for theories."""
         theory_ids = arguments.get("theory_ids", [])
@@ -66,9 +67,9 @@ def register_graph_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_ids=theory_ids,
             depth=depth,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_influence_chain", cacheable=True)
     async def get_influence_chain(arguments: dict[str, Any]) -> list[TextContent]:
         """Get chain of influence from a theory."""
         theory_id = arguments.get("theory_id", "")
@@ -78,21 +79,21 @@ def register_graph_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_id=theory_id,
             max_depth=max_depth,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("find_common_connections", cacheable=True)
     async def find_common_connections(arguments: dict[str, Any]) -> list[TextContent]:
         """Find common connections between theories."""
         theory_ids = arguments.get("theory_ids", [])
 
         result = await tenjin.graph_service.find_common_connections(theory_ids)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_graph_statistics", cacheable=True)
     async def get_graph_statistics(arguments: dict[str, Any]) -> list[TextContent]:
         """Get statistics about the knowledge graph."""
         result = await tenjin.graph_service.get_graph_statistics()
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
 
 def get_graph_tool_definitions() -> list[Tool]:
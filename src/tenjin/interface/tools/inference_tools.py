@@ -8,13 +8,15 @@ Provides tools for:
 """
 
 from typing import Any
-import json
 
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
+from .progress import progress_callback
 from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
 
 logger = get_logger(__name__)
 
@@ -112,7 +114,9 @@ Example use cases:
 - "Analyze gaps between my lesson plan and learning outcomes"
 - "How can I improve my workshop design using educational theory?"
 
-Returns gap analysis with prioritized improvement suggestions.""",
+Returns per-outcome coverage scores (embedding similarity to the applied
+theories, with candidate theories for each uncovered outcome) and a gap
+analysis with prioritized improvement suggestions.""",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -151,6 +155,14 @@ Returns gap analysis with prioritized improvement suggestions.""",
                         "type": "array",
                         "items": {"type": "string"},
                         "description": "Theory IDs currently being applied (optional)"
+                    },
+                    "use_llm": {
+                        "type": "boolean",
+                        "description": (
+                            "Run the AI analysis; false returns only the fast numeric "
+                            "outcome coverage"
+                        ),
+                        "default": True
                     }
                 },
                 "required": ["current_design", "target_outcomes"]
@@ -291,77 +303,67 @@ Returns an integrated framework with:
     ]
 
 
-def register_inference_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_inference_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register inference tool handlers.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
+    # Multi-step LLM chains get a longer deadline than lookups
+    slow = get_settings().tool.llm_timeout_seconds or None
 
-    @server.call_tool()
-    async def call_inference_tool(name: str, arguments: dict) -> list[TextContent]:
-        """Handle inference tool calls."""
-        
-        # Get inference service
-        inference_service = tenjin.get_inference_service()
-        
-        if name == "recommend_theories_for_learner":
-            result = await inference_service.recommend_theories_for_learner(
-                learner_profile=arguments.get("learner_profile", {}),
-                learning_goals=arguments.get("learning_goals", []),
-                constraints=arguments.get("constraints"),
-                limit=arguments.get("limit", 5),
-            )
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
-            )]
-
-        elif name == "analyze_learning_design_gaps":
-            result = await inference_service.analyze_learning_design_gaps(
-                current_design=arguments.get("current_design", {}),
-                target_outcomes=arguments.get("target_outcomes", []),
-                applied_theories=arguments.get("applied_theories"),
-            )
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
-            )]
+    @registry.tool("recommend_theories_for_learner", expensive=True, timeout=slow)
+    async def recommend_theories_for_learner(arguments: dict[str, Any]) -> list[TextContent]:
+        """Recommend theories for a learner profile."""
+        result = await tenjin.get_inference_service().recommend_theories_for_learner(
+            learner_profile=arguments.get("learner_profile", {}),
+            learning_goals=arguments.get("learning_goals", []),
+            constraints=arguments.get("constraints"),
+            limit=arguments.get("limit", 5),
+        )
+        return json_content(result)
 
-        elif name == "infer_theory_relationships":
-            result = await inference_service.infer_theory_relationships(
-                theory_id=arguments.get("theory_id", ""),
-                inference_depth=arguments.get("inference_depth", 2),
-            )
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
-            )]
+    @registry.tool("analyze_learning_design_gaps", expensive=True, timeout=slow)
+    async def analyze_learning_design_gaps(arguments: dict[str, Any]) -> list[TextContent]:
+        """Analyze gaps in a learning design."""
+        result = await tenjin.get_inference_service().analyze_learning_design_gaps(
+            current_design=arguments.get("current_design", {}),
+            target_outcomes=arguments.get("target_outcomes", []),
+            applied_theories=arguments.get("applied_theories"),
+            on_progress=progress_callback(registry.server),
+            use_llm=arguments.get("use_llm", True),
+        )
+        return json_content(result)
 
-        elif name == "reason_about_application":
-            result = await inference_service.reason_about_application(
-                scenario=arguments.get("scenario", ""),
-                constraints=arguments.get("constraints"),
-            )
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
-            )]
+    @registry.tool("infer_theory_relationships", expensive=True, timeout=slow)
+    async def infer_theory_relationships(arguments: dict[str, Any]) -> list[TextContent]:
+        """Infer relationships of a theory."""
+        result = await tenjin.get_inference_service().infer_theory_relationships(
+            theory_id=arguments.get("theory_id", ""),
+            inference_depth=arguments.get("inference_depth", 2),
+        )
+        return json_content(result)
 
-        elif name == "synthesize_theories":
-            result = await inference_service.synthesize_theories(
-                theory_ids=arguments.get("theory_ids", []),
-                synthesis_goal=arguments.get("synthesis_goal", ""),
-                context=arguments.get("context"),
-            )
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
-            )]
+    @registry.tool("reason_about_application", expensive=True, timeout=slow)
+    async def reason_about_application(arguments: dict[str, Any]) -> list[TextContent]:
+        """Reason about applying theories to a scenario."""
+        result = await tenjin.get_inference_service().reason_about_application(
+            scenario=arguments.get("scenario", ""),
+            constraints=arguments.get("constraints"),
+        )
+        return json_content(result)
 
-        # If tool name doesn't match, return None to let other handlers try
-        return None
+    @registry.tool("synthesize_theories", expensive=True, timeout=slow)
+    async def synthesize_theories(arguments: dict[str, Any]) -> list[TextContent]:
+        """Synthesize multiple theories."""
+        result = await tenjin.get_inference_service().synthesize_theories(
+            theory_ids=arguments.get("theory_ids", []),
+            synthesis_goal=arguments.get("synthesis_goal", ""),
+            context=arguments.get("context"),
+            on_progress=progress_callback(registry.server),
+        )
+        return json_content(result)
 
 
 __all__ = ["register_inference_tools", "get_inference_tool_definitions"]
@@ -0,0 +1,152 @@
+"""MCP Tools registration - Background job tools.
+
+Long-running inference (relationship inference, gap analysis, synthesis)
+can exceed client tool timeouts. These tools run such operations as
+background jobs: ``submit_job`` returns a job ID immediately, and the
+client polls ``get_job_status`` and fetches ``get_job_result``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from mcp.types import TextContent, Tool
+
+from ...infrastructure.adapters.job_store import JobStatus
+from ...infrastructure.config.logging import get_logger
+from ..serialization import json_content
+from .registry import ToolRegistry
+
+if TYPE_CHECKING:
+    from ..server import TenjinServer
+
+logger = get_logger(__name__)
+
+JOB_OPERATIONS = [
+    "infer_theory_relationships",
+    "analyze_learning_design_gaps",
+    "synthesize_theories",
+    "reason_about_application",
+    "precompute_relationships",
+]
+
+
+def register_job_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
+    """Register background job tools.
+
+    Args:
+        registry: Tool registry.
+        tenjin: TENJIN server instance.
+    """
+
+    @registry.tool("submit_job")
+    async def submit_job(arguments: dict[str, Any]) -> list[TextContent]:
+        """Submit a background job."""
+        try:
+            job, deduplicated = await tenjin.job_service.submit(
+                arguments.get("operation", ""),
+                arguments.get("arguments") or {},
+            )
+        except ValueError as e:
+            return json_content({"error": str(e)})
+        result = job.to_dict(include_result=False)
+        result["deduplicated"] = deduplicated
+        return json_content(result)
+
+    @registry.tool("get_job_status")
+    async def get_job_status(arguments: dict[str, Any]) -> list[TextContent]:
+        """Get the status of a background job."""
+        job_id = arguments.get("job_id", "")
+        job = await tenjin.job_service.get(job_id)
+        if job is None:
+            return json_content({"error": f"Job not found or expired: {job_id}"})
+        return json_content(job.to_dict(include_result=False))
+
+    @registry.tool("get_job_result")
+    async def get_job_result(arguments: dict[str, Any]) -> list[TextContent]:
+        """Get the result of a completed background job."""
+        job_id = arguments.get("job_id", "")
+        job = await tenjin.job_service.get(job_id)
+        if job is None:
+            return json_content({"error": f"Job not found or expired: {job_id}"})
+        if job.status != JobStatus.COMPLETED:
+            return json_content(
+                {
+                    "job_id": job.job_id,
+                    "status": job.status.value,
+                    "error": job.error or "Job has not completed yet",
+                }
+            )
+        return json_content(
+            {"job_id": job.job_id, "status": job.status.value, "result": job.result}
+        )
+
+    @registry.tool("cancel_job")
+    async def cancel_job(arguments: dict[str, Any]) -> list[TextContent]:
+        """Cancel a pending or running background job."""
+        job_id = arguments.get("job_id", "")
+        job = await tenjin.job_service.cancel(job_id)
+        if job is None:
+            return json_content({"error": f"Job not found or expired: {job_id}"})
+        return json_content(job.to_dict(include_result=False))
+
+
+def get_job_tool_definitions() -> list[Tool]:
+    """Get background job tool definitions."""
+    job_id_schema = {
+        "type": "object",
+        "properties": {
+            "job_id": {"type": "string", "description": "Job ID returned by submit_job"},
+        },
+        "required": ["job_id"],
+    }
+    return [
+        Tool(
+            name="submit_job",
+            description=(
+                "Run a long-running inference operation as a background job "
+                "(precompute_relationships infers relationships across the whole "
+                "catalog; arguments: restart, max_pairs). "
+                "Returns a job ID immediately; poll get_job_status and fetch the "
+                "output with get_job_result. Submitting the same operation with the "
+                "same arguments returns the existing job. Jobs and results survive "
+                "server restarts."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "enum": JOB_OPERATIONS,
+                        "description": "Inference tool to run in the background",
+                    },
+                    "arguments": {
+                        "type": "object",
+                        "description": "Arguments of the inference tool",
+                    },
+                },
+                "required": ["operation", "arguments"],
+            },
+        ),
+        Tool(
+            name="get_job_status",
+            description=(
+                "Get the status of a background job (pending, running, completed, "
+                "failed, cancelled) with timestamps and the latest progress message."
+            ),
+            inputSchema=job_id_schema,
+        ),
+        Tool(
+            name="get_job_result",
+            description="Get the result of a completed background job.",
+            inputSchema=job_id_schema,
+        ),
+        Tool(
+            name="cancel_job",
+            description=(
+                "Cancel a pending or running background job. A job running in another "
+                "server process shows cancel_requested until that process has cancelled it."
+            ),
+            inputSchema=job_id_schema,
+        ),
+    ]
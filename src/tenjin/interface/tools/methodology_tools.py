@@ -1,32 +1,34 @@
 """MCP Tools registration - Methodology tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
+from .progress import progress_callback
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_methodology_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_methodology_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register methodology-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("get_methodology", cacheable=True)
     async def get_methodology(arguments: dict[str, Any]) -> list[TextContent]:
         """Get a methodology by ID."""
         methodology_id = arguments.get("methodology_id", "")
 
         result = await tenjin.methodology_service.get_methodology(methodology_id)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("list_methodologies", cacheable=True)
     async def list_methodologies(arguments: dict[str, Any]) -> list[TextContent]:
         """List methodologies with optional filters."""
         theory_id = arguments.get("theory_id")
@@ -40,9 +42,9 @@ def register_methodology_tools(server: Server, tenjin: TenjinServer) -> None:
             limit=limit,
             offset=offset,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("search_methodologies", cacheable=True)
     async def search_methodologies(arguments: dict[str, Any]) -> list[TextContent]:
         """Search for methodologies."""
         query = arguments.get("query", "")
@@ -52,9 +54,9 @@ def register_methodology_tools(server: Server, tenjin: TenjinServer) -> None:
             query=query,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_methodologies_for_theory", cacheable=True)
     async def get_methodologies_for_theory(
         arguments: dict[str, Any],
     ) -> list[TextContent]:
@@ -64,9 +66,9 @@ def register_methodology_tools(server: Server, tenjin: TenjinServer) -> None:
         result = await tenjin.methodology_service.get_methodologies_for_theory(
             theory_id
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("recommend_methodology", expensive=True)
     async def recommend_methodology(arguments: dict[str, Any]) -> list[TextContent]:
         """Recommend methodology for a context."""
         context = arguments.get("context", "")
@@ -76,9 +78,9 @@ def register_methodology_tools(server: Server, tenjin: TenjinServer) -> None:
             context=context,
             constraints=constraints,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_implementation_guide", expensive=True)
     async def get_implementation_guide(arguments: dict[str, Any]) -> list[TextContent]:
         """Get implementation guide for a methodology."""
         methodology_id = arguments.get("methodology_id", "")
@@ -87,8 +89,9 @@ def register_methodology_tools(server: Server, tenjin: TenjinServer) -> None:
         result = await tenjin.methodology_service.get_implementation_guide(
             methodology_id=methodology_id,
             context=context,
+            on_progress=progress_callback(registry.server),
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
 
 def get_methodology_tool_definitions() -> list[Tool]:
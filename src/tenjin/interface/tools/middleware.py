@@ -0,0 +1,552 @@
+"""Tool middleware - Cross-cutting behaviour wrapped around every tool call.
+
+Default chain (outermost first)::
+
+    ErrorMiddleware -> ProfilingMiddleware -> TracingMiddleware -> TimingMiddleware
+        -> DeadlineMiddleware -> CacheMiddleware -> AdmissionMiddleware
+        -> ConcurrencyMiddleware -> handler
+
+Errors are shaped last so tracing and timing see failures, and cache hits
+are answered before a concurrency slot is taken. Waiting for a slot counts
+against the call's deadline. Tracing is only in the chain when enabled,
+admission control only in SSE and HTTP mode.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from mcp.server.lowlevel.server import request_ctx
+from mcp.types import CallToolResult, TextContent
+
+from ...infrastructure.adapters.admission import AdmissionPool, Overloaded
+from ...infrastructure.adapters.deadline import DeadlineExceededError, deadline
+from ...infrastructure.adapters.metrics import get_metrics, record_cache_lookup
+from ...infrastructure.adapters.profiler import SamplingProfiler, get_profiler
+from ...infrastructure.adapters.redis_adapter import RedisAdapter
+from ...infrastructure.adapters.tracing import start_trace
+from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import AdmissionSettings, ToolSettings, TracingSettings
+from .registry import (
+    TIMEOUT_ARGUMENT,
+    CallNext,
+    Middleware,
+    ToolCall,
+    ToolResult,
+    error_result,
+    is_error,
+)
+
+logger = get_logger(__name__)
+
+# Recent latencies kept per tool for percentiles
+_LATENCY_WINDOW = 512
+
+
+class ErrorMiddleware:
+    """Turns handler exceptions into JSON error results."""
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Run the call and shape any exception as an error result."""
+        try:
+            return await call_next(call)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Tool {call.name} failed: {type(e).__name__}: {e}", exc_info=True)
+            return error_result(call.name, str(e) or type(e).__name__, type(e).__name__)
+
+
+class ProfilingMiddleware:
+    """Attributes profiler samples to the tool call being run.
+
+    A pass-through unless a profiling session is active.
+    """
+
+    def __init__(self, profiler: SamplingProfiler | None = None) -> None:
+        """Initialize profiling middleware.
+
+        Args:
+            profiler: Profiler (defaults to the process-wide one).
+        """
+        self._profiler = profiler or get_profiler()
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Run the call, labelled with its tool name while profiling."""
+        if not self._profiler.active:
+            return await call_next(call)
+        with self._profiler.tool_call(call.name):
+            return await call_next(call)
+
+
+class TracingMiddleware:
+    """Starts a trace for every tool call.
+
+    In debug mode the trace's timing breakdown is attached to the tool
+    result metadata under ``tenjin/timing``.
+    """
+
+    def __init__(self, debug: bool = False) -> None:
+        """Initialize tracing middleware.
+
+        Args:
+            debug: Attach the timing breakdown to results.
+        """
+        self._debug = debug
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Run the call inside a trace."""
+        with start_trace(f"tool.{call.name}", **{"tenjin.tool": call.name}) as trace:
+            result = await call_next(call)
+            if is_error(result):
+                trace.root.error = "error result"
+        if not self._debug:
+            return result
+
+        meta = {"tenjin/timing": trace.breakdown()}
+        if isinstance(result, CallToolResult):
+            return result.model_copy(update={"meta": {**(result.meta or {}), **meta}})
+        return CallToolResult(content=list(result), _meta=meta)
+
+
+@dataclass
+class ToolStats:
+    """Latency statistics of one tool.
+
+    Attributes:
+        calls: Completed calls.
+        errors: Calls that raised or returned an error result.
+        cache_hits: Calls answered from the result cache.
+        total_seconds: Sum of call durations.
+        max_seconds: Longest call duration.
+        recent: Durations of the most recent calls.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def record(self, seconds: float, error: bool, cache_hit: bool) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.errors += error
+        self.cache_hits += cache_hit
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """Get a latency percentile over the recent calls.
+
+        Args:
+            q: Percentile (0-100).
+
+        Returns:
+            Duration in seconds (0.0 without calls).
+        """
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Returns:
+            Dictionary with counts and latencies in milliseconds.
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "avg_ms": round(self.total_seconds / self.calls * 1000, 2) if self.calls else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+class TimingMiddleware:
+    """Records per-tool call counts, errors and latencies.
+
+    Latencies are also exported as the ``tenjin_tool_duration_seconds``
+    histogram, next to a gauge of tool calls in flight.
+    """
+
+    def __init__(self) -> None:
+        """Initialize timing middleware."""
+        self.stats: dict[str, ToolStats] = {}
+        metrics = get_metrics()
+        self._duration = metrics.histogram(
+            "tenjin_tool_duration_seconds", "Latency of MCP tool calls", ("tool", "status")
+        )
+        self._in_flight = metrics.gauge(
+            "tenjin_tool_calls_in_flight", "MCP tool calls being processed"
+        )
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Time the call."""
+        started = time.perf_counter()
+        error = True
+        self._in_flight.inc()
+        try:
+            result = await call_next(call)
+            error = is_error(result)
+            return result
+        finally:
+            self._in_flight.dec()
+            elapsed = time.perf_counter() - started
+            cache_hit = bool(call.context.get("cache_hit"))
+            stats = self.stats.setdefault(call.name, ToolStats())
+            stats.record(elapsed, error, cache_hit)
+            status = "error" if error else "cache_hit" if cache_hit else "ok"
+            self._duration.observe(elapsed, tool=call.name, status=status)
+            logger.debug(f"Tool {call.name} took {elapsed * 1000:.1f}ms")
+
+    def get_statistics(self) -> dict[str, dict[str, Any]]:
+        """Get statistics of every called tool.
+
+        Returns:
+            Statistics by tool name.
+        """
+        return {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+
+
+class DeadlineMiddleware:
+    """Runs every tool call under a deadline.
+
+    The deadline is the client's ``timeout`` argument (capped at the
+    maximum), else the tool's configured or registered default, else the
+    server default. Adapters read it to bound their own timeouts; when it
+    passes, the call is cancelled and answered with a ``DeadlineExceeded``
+    error result.
+    """
+
+    def __init__(
+        self,
+        default_seconds: float | None = 120.0,
+        max_seconds: float = 600.0,
+        per_tool: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize deadline middleware.
+
+        Args:
+            default_seconds: Deadline of tools without their own (None = none).
+            max_seconds: Upper bound of a client-supplied timeout.
+            per_tool: Deadlines by tool name, overriding registered defaults.
+        """
+        self._default = default_seconds
+        self._max = max_seconds
+        self._per_tool = dict(per_tool or {})
+        self._exceeded = get_metrics().counter(
+            "tenjin_tool_deadline_exceeded_total", "Tool calls that ran out of time", ("tool",)
+        )
+
+    def timeout_for(self, call: ToolCall) -> float | None:
+        """Get the deadline of a call, consuming the ``timeout`` argument.
+
+        Args:
+            call: Tool call.
+
+        Returns:
+            Deadline in seconds, or None for no deadline.
+        """
+        if TIMEOUT_ARGUMENT in call.arguments:
+            arguments = dict(call.arguments)
+            requested = arguments.pop(TIMEOUT_ARGUMENT)
+            call.arguments = arguments
+            if requested:
+                return min(float(requested), self._max)
+        timeout = self._per_tool.get(call.name, call.spec.timeout or self._default)
+        return timeout or None
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Run the call until it finishes or its deadline passes."""
+        timeout = self.timeout_for(call)
+        try:
+            async with deadline(timeout):
+                return await call_next(call)
+        except DeadlineExceededError as e:
+            logger.warning(f"Tool {call.name} exceeded its deadline of {timeout:g}s: {e}")
+            self._exceeded.inc(tool=call.name)
+            return error_result(call.name, str(e), "DeadlineExceeded")
+
+
+class CacheMiddleware:
+    """In-process TTL/LRU cache for tools registered as cacheable.
+
+    The key is the tool name plus the canonical JSON of the arguments.
+    Error results are never cached. With a shared Redis layer, results
+    missing in process memory are looked up in Redis and stored there, so
+    server processes reuse each other's results; an entry keeps the expiry
+    it got when it was first computed.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1024,
+        shared: RedisAdapter | None = None,
+    ) -> None:
+        """Initialize cache middleware.
+
+        Args:
+            ttl_seconds: How long a result is served from the cache.
+            max_entries: Maximum cached results (least recently used evicted).
+            shared: Redis adapter of the cache shared between processes.
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._shared = shared
+        self._entries: OrderedDict[str, tuple[float, ToolResult]] = OrderedDict()
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Serve cacheable calls from the cache."""
+        if not call.spec.cacheable:
+            return await call_next(call)
+
+        key = call.name + ":" + json.dumps(call.arguments, sort_keys=True, default=str)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            call.context["cache_hit"] = True
+            record_cache_lookup("tool", True)
+            return entry[1]
+
+        record_cache_lookup("tool", False)
+        shared_key = "tool:" + hashlib.sha256(key.encode()).hexdigest()[:32]
+        if self._shared is not None:
+            data = await self._shared.get_json(shared_key)
+            record_cache_lookup("tool_shared", data is not None)
+            if data is not None:
+                result = [TextContent.model_validate(item) for item in data["content"]]
+                self._remember(key, now + data["expires_at"] - time.time(), result)
+                call.context["cache_hit"] = True
+                return result
+
+        result = await call_next(call)
+        if not is_error(result):
+            self._remember(key, now + self._ttl, result)
+            if self._shared is not None and isinstance(result, list):
+                await self._shared.set_json(
+                    shared_key,
+                    {
+                        "expires_at": time.time() + self._ttl,
+                        "content": [
+                            item.model_dump(mode="json", by_alias=True, exclude_none=True)
+                            for item in result
+                        ],
+                    },
+                    ttl=math.ceil(self._ttl),
+                )
+        return result
+
+    def _remember(self, key: str, expires: float, result: ToolResult) -> None:
+        """Store a result in process memory, evicting the least recently used."""
+        self._entries[key] = (expires, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """Drop all results cached in process memory.
+
+        Shared results are kept under the Redis key prefix and are removed
+        when the whole Redis cache is flushed.
+
+        Returns:
+            Number of entries removed.
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+
+class AdmissionMiddleware:
+    """Admits tool calls per client session and per cost pool.
+
+    A call first takes a slot of its session, so a client flooding the
+    server queues behind its own calls, then a slot of the cheap or the
+    expensive pool (``ToolSpec.expensive``), so lookups are not stuck
+    behind LLM chains. Waiting is bounded in queue length and time; a
+    saturated pool answers with an ``Overloaded`` error result carrying a
+    ``retry_after`` hint in seconds.
+    """
+
+    def __init__(
+        self,
+        cheap: AdmissionPool,
+        expensive: AdmissionPool,
+        session_max_in_flight: int | None = None,
+        session_max_queue: int = 0,
+    ) -> None:
+        """Initialize admission middleware.
+
+        Args:
+            cheap: Pool of lookup tool calls.
+            expensive: Pool of expensive tool calls.
+            session_max_in_flight: Tool calls in flight per session (None = no limit).
+            session_max_queue: Tool calls of one session waiting for a slot.
+        """
+        self.cheap = cheap
+        self.expensive = expensive
+        self._session_limit = session_max_in_flight
+        self._session_queue = session_max_queue
+        self._sessions: WeakKeyDictionary[Any, AdmissionPool] = WeakKeyDictionary()
+
+    @classmethod
+    def from_settings(cls, settings: AdmissionSettings) -> "AdmissionMiddleware":
+        """Create admission middleware from settings.
+
+        Args:
+            settings: Admission settings.
+
+        Returns:
+            Admission middleware.
+        """
+
+        def pool(name: str, max_in_flight: int) -> AdmissionPool:
+            return AdmissionPool(
+                name, max_in_flight, settings.max_queue, settings.max_wait_seconds
+            )
+
+        return cls(
+            pool("cheap", settings.cheap_max_in_flight),
+            pool("expensive", settings.expensive_max_in_flight),
+            settings.session_max_in_flight,
+            settings.session_max_queue,
+        )
+
+    def _session_pool(self) -> AdmissionPool | None:
+        """Get the pool of the session the current request belongs to."""
+        if self._session_limit is None:
+            return None
+        try:
+            session = request_ctx.get().session
+        except LookupError:
+            return None
+        pool = self._sessions.get(session)
+        if pool is None:
+            pool = self._sessions[session] = AdmissionPool(
+                "session",
+                self._session_limit,
+                self._session_queue,
+                self.cheap.max_wait_seconds,
+            )
+        return pool
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Run the call once its session and its cost pool admit it."""
+        pools = [self._session_pool(), self.expensive if call.spec.expensive else self.cheap]
+        async with AsyncExitStack() as stack:
+            try:
+                for pool in pools:
+                    if pool is not None:
+                        await stack.enter_async_context(pool.acquire())
+            except Overloaded as e:
+                return error_result(call.name, str(e), "Overloaded", retry_after=e.retry_after)
+            return await call_next(call)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Statistics of the cheap and expensive pools and the open sessions.
+        """
+        return {
+            "cheap": self.cheap.get_statistics(),
+            "expensive": self.expensive.get_statistics(),
+            "sessions": len(self._sessions),
+        }
+
+
+class ConcurrencyMiddleware:
+    """Limits tool calls in flight, overall and per tool."""
+
+    def __init__(self, max_concurrency: int = 32) -> None:
+        """Initialize concurrency middleware.
+
+        Args:
+            max_concurrency: Tool calls in flight across all tools.
+        """
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._per_tool: dict[str, asyncio.Semaphore] = {}
+
+    async def __call__(self, call: ToolCall, call_next: CallNext) -> ToolResult:
+        """Run the call once both the global and the tool's slot are free."""
+        limit = call.spec.max_concurrency
+        async with self._global:
+            if limit is None:
+                return await call_next(call)
+            semaphore = self._per_tool.get(call.name)
+            if semaphore is None:
+                semaphore = self._per_tool[call.name] = asyncio.Semaphore(limit)
+            async with semaphore:
+                return await call_next(call)
+
+
+def default_middleware(
+    settings: ToolSettings,
+    tracing: TracingSettings | None = None,
+    admission: AdmissionSettings | None = None,
+    shared_cache: RedisAdapter | None = None,
+) -> list[Middleware]:
+    """Build the default middleware chain.
+
+    Args:
+        settings: Tool dispatch settings.
+        tracing: Tracing settings (tracing is off without them).
+        admission: Admission settings (admission control is off without them).
+        shared_cache: Redis adapter sharing cached results between processes.
+
+    Returns:
+        Middleware, outermost first.
+    """
+    chain: list[Middleware] = [ErrorMiddleware(), ProfilingMiddleware()]
+    if tracing is not None and (tracing.enabled or tracing.debug):
+        chain.append(TracingMiddleware(debug=tracing.debug))
+    chain.append(TimingMiddleware())
+    chain.append(
+        DeadlineMiddleware(
+            settings.default_timeout_seconds or None,
+            settings.max_timeout_seconds,
+            settings.timeout_map,
+        )
+    )
+    if settings.cache_enabled:
+        chain.append(
+            CacheMiddleware(settings.cache_ttl_seconds, settings.cache_max_entries, shared_cache)
+        )
+    if admission is not None and admission.enabled:
+        chain.append(AdmissionMiddleware.from_settings(admission))
+    chain.append(ConcurrencyMiddleware(settings.max_concurrency))
+    return chain
+
+
+__all__ = [
+    "ErrorMiddleware",
+    "ProfilingMiddleware",
+    "TracingMiddleware",
+    "TimingMiddleware",
+    "DeadlineMiddleware",
+    "ToolStats",
+    "CacheMiddleware",
+    "AdmissionMiddleware",
+    "ConcurrencyMiddleware",
+    "default_middleware",
+]
@@ -0,0 +1,50 @@
+"""MCP progress notifications for long-running tools."""
+
+from mcp.server import Server
+
+from ...infrastructure.adapters.streaming import ProgressCallback
+from ...infrastructure.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def progress_callback(server: Server) -> ProgressCallback | None:
+    """Create a progress callback for the tool call being handled.
+
+    Clients opt in to streaming by sending a ``progressToken`` in the
+    request metadata; each message is then delivered as a
+    ``notifications/progress`` with an increasing progress counter.
+
+    Args:
+        server: MCP server instance.
+
+    Returns:
+        Async callback sending one progress notification per message, or
+        None if there is no request in progress or the client did not ask
+        for progress.
+    """
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
+
+    count = 0
+
+    async def send(message: str) -> None:
+        nonlocal count
+        count += 1
+        await ctx.session.send_progress_notification(
+            token,
+            progress=count,
+            message=message,
+            related_request_id=str(ctx.request_id),
+        )
+
+    return send
+
+
+__all__ = ["progress_callback"]
@@ -0,0 +1,59 @@
+"""MCP Tools registration - LLM provider monitoring tools."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from mcp.types import TextContent, Tool
+
+from ...infrastructure.adapters.circuit_breaker import get_circuit_states
+from ...infrastructure.adapters.rate_limiter import get_limiter_statistics
+from ...infrastructure.config.logging import get_logger
+from ..serialization import json_content
+from .registry import ToolRegistry
+
+if TYPE_CHECKING:
+    from ..server import TenjinServer
+
+logger = get_logger(__name__)
+
+
+def register_provider_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
+    """Register LLM provider monitoring tools.
+
+    Args:
+        registry: Tool registry.
+        tenjin: TENJIN server instance.
+    """
+
+    @registry.tool("get_llm_provider_stats")
+    async def get_llm_provider_stats(arguments: dict[str, Any]) -> list[TextContent]:
+        """Get per-provider LLM limiter and circuit breaker statistics."""
+        result = {
+            "providers": get_limiter_statistics(),
+            "circuits": get_circuit_states(),
+            "hedging": (
+                tenjin.llm_adapter.get_hedge_statistics() if tenjin.llm_adapter else {}
+            ),
+        }
+        return json_content(result)
+
+
+def get_provider_tool_definitions() -> list[Tool]:
+    """Get LLM provider monitoring tool definitions."""
+    return [
+        Tool(
+            name="get_llm_provider_stats",
+            description=(
+                "Get per-provider LLM concurrency and rate limit statistics "
+                "(configured limits, queue depth, in-flight requests, wait times, "
+                "remaining request/token budget), circuit breaker states, and "
+                "hedged request counts."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        ),
+    ]
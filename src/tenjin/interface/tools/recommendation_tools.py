@@ -1,24 +1,25 @@
 """MCP Tools registration - Recommendation tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_recommendation_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_recommendation_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register recommendation-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("recommend_theories", expensive=True)
     async def recommend_theories(arguments: dict[str, Any]) -> list[TextContent]:
         """Recommend theories for a context."""
         context = arguments.get("context", "")
@@ -30,9 +31,9 @@ def register_recommendation_tools(server: Server, tenjin: TenjinServer) -> None:
             limit=limit,
             filters=filters,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("recommend_similar_theories")
     async def recommend_similar_theories(
         arguments: dict[str, Any],
     ) -> list[TextContent]:
@@ -44,9 +45,9 @@ def register_recommendation_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_id=theory_id,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("recommend_for_learner", expensive=True)
     async def recommend_for_learner(arguments: dict[str, Any]) -> list[TextContent]:
         """Recommend theories based on learner profile."""
         learner_profile = arguments.get("learner_profile", {})
@@ -56,9 +57,9 @@ def register_recommendation_tools(server: Server, tenjin: TenjinServer) -> None:
             learner_profile=learner_profile,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("recommend_complementary", expensive=True)
     async def recommend_complementary(arguments: dict[str, Any]) -> list[TextContent]:
         """Recommend complementary theories."""
         theory_ids = arguments.get("theory_ids", [])
@@ -68,19 +69,21 @@ def register_recommendation_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_ids=theory_ids,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_learning_path", cacheable=True, expensive=True)
     async def get_learning_path(arguments: dict[str, Any]) -> list[TextContent]:
         """Generate a learning path for a goal."""
         goal = arguments.get("goal", "")
         current_knowledge = arguments.get("current_knowledge", [])
+        narrate = arguments.get("narrate", False)
 
         result = await tenjin.recommendation_service.get_learning_path(
             goal=goal,
             current_knowledge=current_knowledge,
+            narrate=narrate,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
 
 def get_recommendation_tool_definitions() -> list[Tool]:
@@ -191,7 +194,11 @@ def get_recommendation_tool_definitions() -> list[Tool]:
         ),
         Tool(
             name="get_learning_path",
-            description="Generate an ordered learning path of theories to achieve a specific educational goal.",
+            description=(
+                "Generate an ordered learning path of theories to achieve a specific "
+                "educational goal. The order follows prerequisite relationships (builds "
+                "upon, derived from, extends, influences) and relevance to the goal."
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -204,6 +211,11 @@ def get_recommendation_tool_definitions() -> list[Tool]:
                         "items": {"type": "string"},
                         "description": "Theory IDs you already know",
                     },
+                    "narrate": {
+                        "type": "boolean",
+                        "description": "Add an AI-written description of the computed path",
+                        "default": False,
+                    },
                 },
                 "required": ["goal"],
             },
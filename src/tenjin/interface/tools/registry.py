@@ -0,0 +1,352 @@
+"""Tool registry - Central dispatch of MCP tool calls.
+
+The MCP low-level server keeps a single ``call_tool`` handler. Every tool
+module registers its handlers here by name instead; the registry installs
+one handler on the server that looks the tool up, validates the arguments
+against the tool's declared ``inputSchema`` and runs the handler through
+the middleware chain.
+
+Every tool also accepts an optional ``timeout`` argument (seconds), the
+client's deadline for the call; it is added to each declared input schema
+and consumed by the deadline middleware.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Sequence
+
+import jsonschema
+from mcp.server import Server
+from mcp.types import CallToolResult, TextContent, Tool
+
+from ...infrastructure.config.logging import get_logger
+from ..serialization import dumps
+
+logger = get_logger(__name__)
+
+ToolResult = list[TextContent] | CallToolResult
+ToolHandler = Callable[[dict[str, Any]], Awaitable[ToolResult]]
+
+# Argument accepted by every tool: the client's deadline in seconds
+TIMEOUT_ARGUMENT = "timeout"
+_TIMEOUT_SCHEMA = {
+    "type": "number",
+    "exclusiveMinimum": 0,
+    "description": "Deadline for this call in seconds (defaults to the tool's own)",
+}
+
+
+@dataclass
+class ToolSpec:
+    """Registered tool.
+
+    Attributes:
+        name: Tool name.
+        handler: Coroutine function handling the tool's arguments.
+        cacheable: Whether results may be served from the result cache.
+        max_concurrency: Calls of this tool allowed in flight (None = no limit).
+        expensive: Whether calls draw from the expensive admission pool.
+        timeout: Default deadline of a call in seconds (None = server default).
+        definition: Declared MCP tool definition.
+        validator: Compiled validator of the definition's input schema.
+    """
+
+    name: str
+    handler: ToolHandler
+    cacheable: bool = False
+    max_concurrency: int | None = None
+    expensive: bool = False
+    timeout: float | None = None
+    definition: Tool | None = None
+    validator: Any = None
+
+
+@dataclass
+class ToolCall:
+    """One tool invocation passed through the middleware chain.
+
+    Attributes:
+        spec: Tool being called.
+        arguments: Validated call arguments.
+        context: Values shared between middleware for this call.
+    """
+
+    spec: ToolSpec
+    arguments: dict[str, Any]
+    context: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """Tool name."""
+        return self.spec.name
+
+
+CallNext = Callable[[ToolCall], Awaitable[ToolResult]]
+Middleware = Callable[[ToolCall, CallNext], Awaitable[ToolResult]]
+
+
+def error_result(
+    tool: str, message: str, error_type: str = "ToolError", **details: Any
+) -> CallToolResult:
+    """Build an MCP error result with a JSON error body.
+
+    Args:
+        tool: Tool name.
+        message: Error message.
+        error_type: Error category.
+        **details: Additional body fields (e.g. ``retry_after``).
+
+    Returns:
+        Tool result flagged as an error.
+    """
+    body = {"error": error_type, "message": message, "tool": tool, **details}
+    return CallToolResult(
+        content=[TextContent(type="text", text=dumps(body))],
+        isError=True,
+    )
+
+
+def is_error(result: ToolResult) -> bool:
+    """Check whether a tool result is an error result."""
+    return isinstance(result, CallToolResult) and result.isError
+
+
+class ToolRegistry:
+    """Maps tool names to handlers and dispatches calls through middleware.
+
+    Handlers are looked up in a dictionary, so dispatch cost does not
+    depend on the number of tools. The middleware chain is composed once
+    when middleware is added; the first middleware is the outermost.
+    """
+
+    def __init__(self, server: Server, middleware: Sequence[Middleware] = ()) -> None:
+        """Initialize tool registry.
+
+        Args:
+            server: MCP server instance.
+            middleware: Middleware wrapping every tool call, outermost first.
+        """
+        self.server = server
+        self._tools: dict[str, ToolSpec] = {}
+        self._definitions: list[Tool] = []
+        self._middleware: list[Middleware] = []
+        self._chain: CallNext = self._invoke
+        for item in middleware:
+            self.use(item)
+
+    def tool(
+        self,
+        name: str,
+        cacheable: bool = False,
+        max_concurrency: int | None = None,
+        expensive: bool = False,
+        timeout: float | None = None,
+    ) -> Callable[[ToolHandler], ToolHandler]:
+        """Decorator registering a tool handler.
+
+        Args:
+            name: Tool name.
+            cacheable: Results depend only on the arguments and may be cached.
+            max_concurrency: Calls of this tool allowed in flight.
+            expensive: Calls are costly (LLM chains, batch or export work).
+            timeout: Default deadline of a call in seconds.
+
+        Returns:
+            Decorator returning the handler unchanged.
+        """
+
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            self.register(
+                name,
+                handler,
+                cacheable=cacheable,
+                max_concurrency=max_concurrency,
+                expensive=expensive,
+                timeout=timeout,
+            )
+            return handler
+
+        return decorator
+
+    def register(
+        self,
+        name: str,
+        handler: ToolHandler,
+        cacheable: bool = False,
+        max_concurrency: int | None = None,
+        expensive: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Register a tool handler.
+
+        Args:
+            name: Tool name.
+            handler: Coroutine function handling the tool's arguments.
+            cacheable: Results depend only on the arguments and may be cached.
+            max_concurrency: Calls of this tool allowed in flight.
+            expensive: Calls are costly (LLM chains, batch or export work).
+            timeout: Default deadline of a call in seconds.
+
+        Raises:
+            ValueError: If a handler is already registered for the name.
+        """
+        if name in self._tools:
+            raise ValueError(f"Tool already registered: {name}")
+        spec = ToolSpec(
+            name,
+            handler,
+            cacheable=cacheable,
+            max_concurrency=max_concurrency,
+            expensive=expensive,
+            timeout=timeout,
+        )
+        self._tools[name] = spec
+        for definition in self._definitions:
+            if definition.name == name:
+                self._attach(spec, definition)
+
+    def define(self, tools: Iterable[Tool]) -> None:
+        """Declare tool definitions and compile their input schemas.
+
+        The ``timeout`` argument is added to each input schema.
+
+        Args:
+            tools: MCP tool definitions.
+        """
+        for definition in tools:
+            schema = definition.inputSchema or {"type": "object"}
+            properties = schema.get("properties", {})
+            if TIMEOUT_ARGUMENT not in properties:
+                schema = {**schema, "properties": {**properties, TIMEOUT_ARGUMENT: _TIMEOUT_SCHEMA}}
+                definition = definition.model_copy(update={"inputSchema": schema})
+            self._definitions.append(definition)
+            spec = self._tools.get(definition.name)
+            if spec is not None:
+                self._attach(spec, definition)
+
+    def use(self, middleware: Middleware) -> None:
+        """Add a middleware inside the already added ones.
+
+        Args:
+            middleware: Middleware wrapping every tool call.
+        """
+        self._middleware.append(middleware)
+        chain: CallNext = self._invoke
+        for item in reversed(self._middleware):
+            chain = self._wrap(item, chain)
+        self._chain = chain
+
+    @property
+    def middleware(self) -> list[Middleware]:
+        """Installed middleware, outermost first."""
+        return list(self._middleware)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of tools with a registered handler."""
+        return list(self._tools)
+
+    def get(self, name: str) -> ToolSpec | None:
+        """Get a registered tool.
+
+        Args:
+            name: Tool name.
+
+        Returns:
+            Tool spec or None if unknown.
+        """
+        return self._tools.get(name)
+
+    def definitions(self) -> list[Tool]:
+        """Get the definitions of tools that have a handler.
+
+        Returns:
+            Tool definitions in declaration order.
+        """
+        return [d for d in self._definitions if d.name in self._tools]
+
+    async def dispatch(self, name: str, arguments: dict[str, Any] | None) -> ToolResult:
+        """Validate and run a tool call.
+
+        Args:
+            name: Tool name.
+            arguments: Call arguments.
+
+        Returns:
+            Tool result, or an error result for unknown tools and invalid arguments.
+        """
+        spec = self._tools.get(name)
+        if spec is None:
+            return error_result(name, f"Unknown tool: {name}", "UnknownTool")
+
+        arguments = arguments or {}
+        if spec.validator is not None:
+            error = jsonschema.exceptions.best_match(spec.validator.iter_errors(arguments))
+            if error is not None:
+                path = ".".join(str(p) for p in error.absolute_path)
+                message = f"{path}: {error.message}" if path else error.message
+                return error_result(name, message, "InvalidArguments")
+
+        return await self._chain(ToolCall(spec, arguments))
+
+    def install(self) -> None:
+        """Install the registry as the server's tool handlers.
+
+        Schema validation happens in ``dispatch`` with validators compiled
+        once, so the server's own per-call validation is disabled.
+        """
+        missing = [d.name for d in self._definitions if d.name not in self._tools]
+        if missing:
+            logger.warning(f"Tools declared without a handler: {', '.join(missing)}")
+        undeclared = [n for n in self._tools if all(d.name != n for d in self._definitions)]
+        if undeclared:
+            # e.g. cache tools are only listed while Redis is available
+            logger.debug(f"Tools registered without a definition: {', '.join(undeclared)}")
+
+        self.server.call_tool(validate_input=False)(self.dispatch)
+
+        @self.server.list_tools()
+        async def list_tools() -> list[Tool]:
+            """List all available tools."""
+            return self.definitions()
+
+        logger.info(
+            f"Tool registry installed: {len(self._tools)} tools, "
+            f"{len(self._middleware)} middleware"
+        )
+
+    @staticmethod
+    def _attach(spec: ToolSpec, definition: Tool) -> None:
+        """Attach a definition and its compiled input-schema validator."""
+        schema = definition.inputSchema or {"type": "object"}
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        spec.definition = definition
+        spec.validator = validator_class(schema)
+
+    @staticmethod
+    def _wrap(middleware: Middleware, call_next: CallNext) -> CallNext:
+        """Bind a middleware to the rest of the chain."""
+
+        async def call(tool_call: ToolCall) -> ToolResult:
+            return await middleware(tool_call, call_next)
+
+        return call
+
+    @staticmethod
+    async def _invoke(tool_call: ToolCall) -> ToolResult:
+        """Call the tool handler (innermost link of the chain)."""
+        return await tool_call.spec.handler(tool_call.arguments)
+
+
+__all__ = [
+    "ToolRegistry",
+    "ToolSpec",
+    "ToolCall",
+    "ToolHandler",
+    "ToolResult",
+    "TIMEOUT_ARGUMENT",
+    "Middleware",
+    "CallNext",
+    "error_result",
+    "is_error",
+]
@@ -1,24 +1,27 @@
 """MCP Tools registration - Search tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
+from ...infrastructure.config.settings import get_settings
 
 logger = get_logger(__name__)
 
 
-def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_search_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register search-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
+    heavy = get_settings().tool.heavy_concurrency
 
-    @server.call_tool()
+    @registry.tool("search_theories", cacheable=True)
     async def search_theories(arguments: dict[str, Any]) -> list[TextContent]:
         """Search theories using hybrid search (graph + vector)."""
         query = arguments.get("query", "")
@@ -44,9 +47,9 @@ def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
             decade=decade,
             evidence_level=evidence_level,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("semantic_search", cacheable=True)
     async def semantic_search(arguments: dict[str, Any]) -> list[TextContent]:
         """Perform semantic search across theories."""
         query = arguments.get("query", "")
@@ -56,9 +59,9 @@ def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
             query=query,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("find_similar_theories", cacheable=True)
     async def find_similar_theories(arguments: dict[str, Any]) -> list[TextContent]:
         """Find theories similar to a given theory."""
         theory_id = arguments.get("theory_id", "")
@@ -68,9 +71,9 @@ def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
             theory_id=theory_id,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("search_with_reranking")
     async def search_with_reranking(arguments: dict[str, Any]) -> list[TextContent]:
         """Search with LLM reranking for improved relevance."""
         query = arguments.get("query", "")
@@ -80,9 +83,9 @@ def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
             query=query,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("search_concepts", cacheable=True)
     async def search_concepts(arguments: dict[str, Any]) -> list[TextContent]:
         """Search for concepts across theories."""
         query = arguments.get("query", "")
@@ -92,13 +95,11 @@ def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
             query=query,
             limit=limit,
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("batch_search", max_concurrency=heavy, expensive=True)
     async def batch_search(arguments: dict[str, Any]) -> list[TextContent]:
         """Perform multiple searches in batch."""
-        import json
-
         queries = arguments.get("queries", [])
         default_search_type = arguments.get("default_search_type", "hybrid")
         default_limit = arguments.get("default_limit", 5)
@@ -108,10 +109,7 @@ def register_search_tools(server: Server, tenjin: TenjinServer) -> None:
             default_search_type=default_search_type,
             default_limit=default_limit,
         )
-        return [TextContent(
-            type="text",
-            text=json.dumps(result, ensure_ascii=False, indent=2)
-        )]
+        return json_content(result)
 
 
 def get_search_tool_definitions() -> list[Tool]:
@@ -1,24 +1,25 @@
 """MCP Tools registration - Theory tools."""
 
 from typing import Any
-from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+from ..serialization import json_content
 from ..server import TenjinServer
+from .registry import ToolRegistry
 from ...infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_theory_tools(server: Server, tenjin: TenjinServer) -> None:
+def register_theory_tools(registry: ToolRegistry, tenjin: TenjinServer) -> None:
     """Register theory-related MCP tools.
 
     Args:
-        server: MCP server instance.
+        registry: Tool registry.
         tenjin: TENJIN server instance.
     """
 
-    @server.call_tool()
+    @registry.tool("get_theory", cacheable=True)
     async def get_theory(arguments: dict[str, Any]) -> list[TextContent]:
         """Get a theory by ID."""
         theory_id = arguments.get("theory_id", "")
@@ -29,24 +30,24 @@ def register_theory_tools(server: Server, tenjin: TenjinServer) -> None:
         else:
             result = await tenjin.theory_service.get_theory(theory_id)
 
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_theory_by_name", cacheable=True)
     async def get_theory_by_name(arguments: dict[str, Any]) -> list[TextContent]:
         """Get a theory by name."""
         name = arguments.get("name", "")
         result = await tenjin.theory_service.get_theory_by_name(name)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("list_theories", cacheable=True)
     async def list_theories(arguments: dict[str, Any]) -> list[TextContent]:
         """List all theories with optional filters."""
         limit = arguments.get("limit", 20)
         offset = arguments.get("offset", 0)
         result = await tenjin.theory_service.list_theories(limit=limit, offset=offset)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_theories_by_category", cacheable=True)
     async def get_theories_by_category(arguments: dict[str, Any]) -> list[TextContent]:
         """Get theories by category."""
         category = arguments.get("category", "")
@@ -54,23 +55,20 @@ def register_theory_tools(server: Server, tenjin: TenjinServer) -> None:
         result = await tenjin.theory_service.get_theories_by_category(
             category, limit=limit
         )
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_theories_by_theorist", cacheable=True)
     async def get_theories_by_theorist(arguments: dict[str, Any]) -> list[TextContent]:
         """Get theories by theorist."""
         theorist_id = arguments.get("theorist_id", "")
         result = await tenjin.theory_service.get_theories_by_theorist(theorist_id)
-        return [TextContent(type="text", text=str(result))]
+        return json_content(result)
 
-    @server.call_tool()
+    @registry.tool("get_category_statistics", cacheable=True)
     async def get_category_statistics(arguments: dict[str, Any]) -> list[TextContent]:
         """Get statistics by category."""
         result = await tenjin.theory_service.get_category_statistics()
-        return [TextContent(type="text", text=str(result))]
-
-    # Register tool definitions
-    server.list_tools_handler = lambda: get_theory_tool_definitions()
+        return json_content(result)
 
 
 def get_theory_tool_definitions() -> list[Tool]:
@@ -3,11 +3,14 @@
 import json
 import pytest
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from tenjin.infrastructure.data.data_loader import DataLoader
 
+if TYPE_CHECKING:
+    from tenjin.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
 
 class TestDataLoader:
     """Integration tests for DataLoader."""
@@ -216,3 +219,303 @@ class TestDataLoader:
         assert "Constructivism" in text
         assert "構成主義" in text
         assert "learning_theory" in text
+
+
+class TestIncrementalSync:
+    """Tests for content-hashed incremental sync."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path, sample_theories_json: dict[str, Any]) -> Path:
+        """Create data directory with theories, theorists and relationships."""
+        data_dir = tmp_path / "theories"
+        data_dir.mkdir()
+        files = {
+            "theories.json": sample_theories_json,
+            "categories.json": {"categories": []},
+            "theorists.json": {
+                "theorists": [
+                    {
+                        "id": "theorist-001",
+                        "name": "Jean Piaget",
+                        "name_ja": "ジャン・ピアジェ",
+                        "related_theories": ["theory-001"],
+                    }
+                ]
+            },
+            "relationships.json": {
+                "relationships": [
+                    {
+                        "id": "rel-001",
+                        "source_id": "theory-001",
+                        "target_id": "theory-002",
+                        "relationship_type": "influences",
+                        "strength": 0.8,
+                    }
+                ]
+            },
+        }
+        for name, content in files.items():
+            with open(data_dir / name, "w", encoding="utf-8") as f:
+                json.dump(content, f, ensure_ascii=False)
+        return data_dir
+
+    def _make_loader(
+        self,
+        data_dir: Path,
+        stored: dict[str, dict[str, str | None]],
+        embedding_hashes: dict[str, str] | None = None,
+    ) -> DataLoader:
+        """Create a DataLoader whose databases report the given stored hashes."""
+        neo4j = AsyncMock()
+        neo4j.execute_write = AsyncMock(return_value={})
+
+        async def execute_read(query: str, parameters: Any = None) -> list[dict[str, Any]]:
+            for label in ("Theorist", "Theory"):
+                if f"MATCH (t:{label})" in query:
+                    return [{"id": k, "hash": v} for k, v in stored[label].items()]
+            return [{"id": k, "hash": v} for k, v in stored["rel"].items()]
+
+        neo4j.execute_read = AsyncMock(side_effect=execute_read)
+
+        chromadb = MagicMock()
+        embedding_hashes = embedding_hashes or {}
+
+        def chroma_get(ids: list[str], include: list[str]) -> dict[str, Any]:
+            found = [i for i in ids if i in embedding_hashes]
+            return {
+                "ids": found,
+                "metadatas": [{"embedding_hash": embedding_hashes[i]} for i in found],
+            }
+
+        chromadb.get = MagicMock(side_effect=chroma_get)
+
+        embedding = AsyncMock()
+        embedding.embed_batch = AsyncMock(
+            side_effect=lambda texts: [[0.1] * 4 for _ in texts]
+        )
+        return DataLoader(neo4j, chromadb, embedding, data_dir=data_dir)
+
+    def _current_hashes(self, data_dir: Path) -> dict[str, dict[str, str | None]]:
+        """Compute the hashes a previous sync would have stored."""
+        def load(name: str) -> dict[str, Any]:
+            with open(data_dir / name, encoding="utf-8") as f:
+                return json.load(f)
+
+        return {
+            "Theory": {
+                t["id"]: DataLoader._content_hash(t)
+                for t in load("theories.json")["theories"]
+            },
+            "Theorist": {
+                t["id"]: DataLoader._content_hash(t)
+                for t in load("theorists.json")["theorists"]
+            },
+            "rel": {
+                r["id"]: DataLoader._content_hash(r)
+                for r in load("relationships.json")["relationships"]
+            },
+        }
+
+    def _current_embedding_hashes(self, data_dir: Path) -> dict[str, str]:
+        """Compute the embedding hashes a previous sync would have stored."""
+        loader = self._make_loader(data_dir, {"Theory": {}, "Theorist": {}, "rel": {}})
+        with open(data_dir / "theories.json", encoding="utf-8") as f:
+            items = json.load(f)["theories"]
+        return {
+            item["id"]: DataLoader._text_hash(
+                loader._create_embedding_text(loader._build_theory(item))
+            )
+            for item in items
+        }
+
+    @pytest.mark.asyncio
+    async def test_first_sync_adds_everything(self, data_dir: Path) -> None:
+        """Test that an empty database gets every entity added and embedded."""
+        loader = self._make_loader(data_dir, {"Theory": {}, "Theorist": {}, "rel": {}})
+
+        summary = await loader.sync_all()
+
+        assert summary["theories"]["added"] == ["theory-001", "theory-002"]
+        assert summary["theories"]["reembedded"] == ["theory-001", "theory-002"]
+        assert summary["theorists"]["added"] == ["theorist-001"]
+        assert summary["relationships"]["added"] == ["rel-001"]
+        loader.embedding.embed_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_data_needs_no_writes_or_embeddings(self, data_dir: Path) -> None:
+        """Test that a sync with identical data is a no-op."""
+        loader = self._make_loader(
+            data_dir, self._current_hashes(data_dir), self._current_embedding_hashes(data_dir)
+        )
+
+        summary = await loader.sync_all()
+
+        for changes in summary.values():
+            assert changes["added"] == changes["changed"] == changes["removed"] == []
+        loader.embedding.embed_batch.assert_not_awaited()
+        loader.chromadb.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_and_removed_theories(
+        self,
+        data_dir: Path,
+        sample_theories_json: dict[str, Any],
+    ) -> None:
+        """Test that only the changed theory is re-embedded and stale ones deleted."""
+        stored = self._current_hashes(data_dir)
+        stored["Theory"]["theory-999"] = "stale"
+        embedding_hashes = self._current_embedding_hashes(data_dir)
+
+        sample_theories_json["theories"][0]["description"] = "Updated description."
+        with open(data_dir / "theories.json", "w", encoding="utf-8") as f:
+            json.dump(sample_theories_json, f, ensure_ascii=False)
+
+        loader = self._make_loader(data_dir, stored, embedding_hashes)
+        changes = await loader.sync_theories()
+
+        assert changes.changed == ["theory-001"]
+        assert changes.removed == ["theory-999"]
+        assert changes.unchanged == 1
+        assert changes.reembedded == ["theory-001"]
+        loader.chromadb.delete.assert_called_once_with(ids=["theory-999"])
+
+    @pytest.mark.asyncio
+    async def test_metadata_only_change_keeps_embedding(
+        self,
+        data_dir: Path,
+        sample_theories_json: dict[str, Any],
+    ) -> None:
+        """Test that a change outside the embedding text skips re-embedding."""
+        stored = self._current_hashes(data_dir)
+        loader = self._make_loader(data_dir, stored)
+        theory = loader._build_theory(sample_theories_json["theories"][0])
+        text_hash = DataLoader._text_hash(loader._create_embedding_text(theory))
+
+        sample_theories_json["theories"][0]["limitations"] = ["Requires skilled facilitation"]
+        with open(data_dir / "theories.json", "w", encoding="utf-8") as f:
+            json.dump(sample_theories_json, f, ensure_ascii=False)
+
+        embedding_hashes = self._current_embedding_hashes(data_dir)
+        assert embedding_hashes["theory-001"] == text_hash
+        loader = self._make_loader(data_dir, stored, embedding_hashes)
+        changes = await loader.sync_theories()
+
+        assert changes.changed == ["theory-001"]
+        assert changes.reembedded == []
+        loader.embedding.embed_batch.assert_not_awaited()
+        loader.chromadb.update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refills_wiped_vector_collection(self, data_dir: Path) -> None:
+        """Test that theories missing from ChromaDB are embedded though Neo4j is current."""
+        embedding_hashes = self._current_embedding_hashes(data_dir)
+        del embedding_hashes["theory-002"]
+        loader = self._make_loader(data_dir, self._current_hashes(data_dir), embedding_hashes)
+
+        changes = await loader.sync_theories()
+
+        assert not changes.has_changes
+        assert changes.reembedded == ["theory-002"]
+        loader.chromadb.upsert.assert_called_once()
+        loader.neo4j.execute_write.assert_not_awaited()
+
+
+class TestVectorRebuild:
+    """Tests for blue/green vector collection rebuilds."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path, sample_theories_json: dict[str, Any]) -> Path:
+        """Create data directory with theories."""
+        data_dir = tmp_path / "theories"
+        data_dir.mkdir()
+        with open(data_dir / "theories.json", "w", encoding="utf-8") as f:
+            json.dump(sample_theories_json, f, ensure_ascii=False)
+        return data_dir
+
+    @pytest.fixture
+    def chromadb(self, tmp_path: Path) -> "ChromaDBAdapter":
+        """Create a local ChromaDB adapter with a served collection."""
+        from tenjin.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(
+            persist_dir=str(tmp_path / "chroma"),
+            collection_name="theories",
+        )
+        adapter.upsert(
+            ids=["theory-001", "theory-002"],
+            embeddings=[[1.0, 0.0], [0.0, 1.0]],
+            documents=["old 1", "old 2"],
+        )
+        return adapter
+
+    def _make_loader(self, data_dir: Path, chromadb: Any) -> DataLoader:
+        """Create a DataLoader with a 3-dimensional fake embedding model."""
+        embedding = AsyncMock()
+        embedding.embed_batch = AsyncMock(
+            side_effect=lambda texts: [[float(i), 1.0, 0.5] for i in range(len(texts))]
+        )
+        return DataLoader(AsyncMock(), chromadb, embedding, data_dir=data_dir)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_swaps_alias(self, data_dir: Path, chromadb: Any) -> None:
+        """Test that a verified rebuild switches the alias to the new collection."""
+        reader = chromadb.for_collection("theories")
+        loader = self._make_loader(data_dir, chromadb)
+
+        report = await loader.rebuild_vectors()
+
+        assert report.swapped
+        assert report.old_collection == "theories"
+        assert report.new_count == report.expected_count == 2
+        assert chromadb.resolve_alias("theories") == report.new_collection
+        assert chromadb.physical_name == report.new_collection
+        # The new collection holds vectors of the new model's dimension
+        stored = chromadb.get(ids=["theory-001"], include=["embeddings"])
+        assert len(stored["embeddings"][0]) == 3
+        # The previous collection is untouched until dropped
+        assert reader.count() == 2
+        with pytest.raises(ValueError):
+            chromadb.drop_collection(report.new_collection)
+        chromadb.drop_collection("theories")
+
+    @pytest.mark.asyncio
+    async def test_no_swap_keeps_serving_old_collection(
+        self, data_dir: Path, chromadb: Any
+    ) -> None:
+        """Test that a build without swap leaves live queries on the old collection."""
+        loader = self._make_loader(data_dir, chromadb)
+
+        report = await loader.rebuild_vectors(swap=False)
+
+        assert not report.swapped
+        assert report.reason is None
+        assert chromadb.resolve_alias("theories") is None
+        assert chromadb.physical_name == "theories"
+        assert report.new_collection in chromadb.list_collections()
+
+    @pytest.mark.asyncio
+    async def test_low_recall_refuses_swap(self, data_dir: Path, chromadb: Any) -> None:
+        """Test that failing verification keeps the alias unchanged."""
+        loader = self._make_loader(data_dir, chromadb)
+
+        report = await loader.rebuild_vectors(min_recall=1.1)
+
+        assert not report.swapped
+        assert "recall" in report.reason
+        assert chromadb.physical_name == "theories"
+
+    def test_other_process_follows_swap(self, chromadb: Any, tmp_path: Path) -> None:
+        """Test that a second adapter picks up the swap on its next refresh."""
+        from tenjin.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        other = ChromaDBAdapter(persist_dir=str(tmp_path / "chroma"), collection_name="theories")
+        other._client = chromadb._client
+        other._open_collection()
+        chromadb.for_collection("theories_v2").upsert(ids=["x"], embeddings=[[1.0, 1.0]])
+
+        chromadb.swap_alias("theories", "theories_v2")
+        assert other.count() == 2  # still within the refresh interval
+
+        other._alias_checked_at = 0.0
+        assert other.count() == 1
+        assert other.physical_name == "theories_v2"
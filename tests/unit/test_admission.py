@@ -0,0 +1,124 @@
+"""Tests for admission control."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from mcp.server import Server
+from mcp.server.lowlevel.server import request_ctx
+from mcp.types import TextContent
+
+from tenjin.infrastructure.adapters.admission import AdmissionPool, Overloaded
+from tenjin.interface.tools.middleware import AdmissionMiddleware
+from tenjin.interface.tools.registry import ToolRegistry
+
+
+class _Session:
+    """Stand-in for an MCP client session."""
+
+
+class TestAdmissionPool:
+    """Tests for AdmissionPool."""
+
+    @pytest.mark.asyncio
+    async def test_queue_and_reject(self) -> None:
+        """Test FIFO hand-over, a full queue and a wait timeout."""
+        pool = AdmissionPool("test", max_in_flight=1, max_queue=1, max_wait_seconds=1.0)
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def work(name: str) -> None:
+            async with pool.acquire():
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(work("first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(work("second"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(Overloaded) as full:
+            async with pool.acquire():
+                pass
+        assert full.value.reason == "queue_full"
+        assert full.value.retry_after >= 1
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert order == ["first", "second"]
+        assert pool.in_flight == 0
+
+        pool.max_wait_seconds = 0.01
+        async with pool.acquire():
+            with pytest.raises(Overloaded, match="wait_timeout"):
+                async with pool.acquire():
+                    pass
+        assert pool.get_statistics()["rejected"] == 2
+        assert pool.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self) -> None:
+        """Test that a cancelled waiter leaves the queue without leaking a slot."""
+        pool = AdmissionPool("test", max_in_flight=1, max_queue=4, max_wait_seconds=5.0)
+
+        async with pool.acquire():
+            waiter = asyncio.create_task(pool.acquire().__aenter__())
+            await asyncio.sleep(0)
+            assert pool.waiting == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert pool.waiting == 0
+        assert pool.in_flight == 0
+
+
+class TestAdmissionMiddleware:
+    """Tests for AdmissionMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_pools_and_sessions(self) -> None:
+        """Test that expensive calls do not block lookups and sessions are limited."""
+        admission = AdmissionMiddleware(
+            AdmissionPool("cheap", 8),
+            AdmissionPool("expensive", 1),
+            session_max_in_flight=2,
+        )
+        registry = ToolRegistry(Server("test"), [admission])
+        release = asyncio.Event()
+
+        @registry.tool("synthesize", expensive=True)
+        async def synthesize(arguments: dict[str, Any]) -> list[TextContent]:
+            await release.wait()
+            return [TextContent(type="text", text="synthesis")]
+
+        @registry.tool("lookup")
+        async def lookup(arguments: dict[str, Any]) -> list[TextContent]:
+            await release.wait()
+            return [TextContent(type="text", text="theory")]
+
+        async def call(session: _Session, name: str) -> Any:
+            request_ctx.set(SimpleNamespace(session=session))  # type: ignore[arg-type]
+            return await registry.dispatch(name, {})
+
+        greedy, other = _Session(), _Session()
+        running = asyncio.create_task(call(greedy, "synthesize"))
+        await asyncio.sleep(0)
+
+        rejected = await call(other, "synthesize")
+        body = json.loads(rejected.content[0].text)
+        assert body["error"] == "Overloaded"
+        assert body["retry_after"] >= 1
+
+        lookups = [asyncio.create_task(call(greedy, "lookup"))]
+        await asyncio.sleep(0)
+        session_full = await call(greedy, "lookup")
+        assert "session" in json.loads(session_full.content[0].text)["message"]
+        lookups.append(asyncio.create_task(call(other, "lookup")))
+
+        release.set()
+        results = await asyncio.gather(running, *lookups)
+        assert [r[0].text for r in results] == ["synthesis", "theory", "theory"]
+        assert admission.get_statistics()["sessions"] == 2
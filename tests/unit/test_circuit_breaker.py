@@ -0,0 +1,228 @@
+"""Tests for provider circuit breakers and health-aware LLM routing."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tenjin.infrastructure.adapters.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    get_circuit_breaker,
+    get_latency_window,
+    reset_circuit_breakers,
+)
+from tenjin.infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from tenjin.infrastructure.adapters.rate_limiter import reset_provider_limiters
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers() -> Iterator[None]:
+    """Start every test with closed circuits and fresh limiters."""
+    reset_circuit_breakers()
+    reset_provider_limiters()
+    yield
+    reset_circuit_breakers()
+    reset_provider_limiters()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_on_error_rate(self) -> None:
+        """Test that the circuit opens once the window error rate crosses the threshold."""
+        breaker = CircuitBreaker("p", failure_threshold=0.5, min_calls=4)
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+        breaker.record_failure(0.1, TimeoutError("timeout"))
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure(0.1, TimeoutError("timeout"))
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.get_status()["last_error"] == "TimeoutError: timeout"
+
+    def test_opens_on_slow_calls(self) -> None:
+        """Test that consistently slow successes also open the circuit."""
+        breaker = CircuitBreaker("p", min_calls=2, slow_call_seconds=1.0)
+        breaker.record_success(5.0)
+        breaker.record_success(5.0)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_allows_single_probe(self) -> None:
+        """Test the half-open probe closing or reopening the circuit."""
+        breaker = CircuitBreaker("p", min_calls=1, open_seconds=0.0)
+        breaker.record_failure(0.1)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_failure(0.1)
+        assert breaker._state == CircuitState.OPEN
+
+        assert breaker.allow_request()
+        breaker.record_success(0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestEsperantoAdapterRouting:
+    """Tests for circuit-aware provider routing."""
+
+    def _adapter(self) -> tuple[EsperantoAdapter, MagicMock, MagicMock]:
+        """Create an adapter with a failing primary and a working fallback."""
+        adapter = EsperantoAdapter(
+            provider="openai", model="m", fallback_providers=["ollama"]
+        )
+        primary = MagicMock()
+        primary.achat_complete = AsyncMock(side_effect=TimeoutError("timeout"))
+        fallback = MagicMock()
+        fallback.achat_complete = AsyncMock(return_value=MagicMock(content="ok"))
+        adapter._clients = {"openai": primary, "ollama": fallback}
+        return adapter, primary, fallback
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_is_skipped(self) -> None:
+        """Test that once the primary's circuit opens it is no longer called."""
+        adapter, primary, fallback = self._adapter()
+        with patch.object(get_circuit_breaker("openai"), "_min_calls", 2):
+            for _ in range(5):
+                assert await adapter.generate("q") == "ok"
+
+        assert primary.achat_complete.await_count == 2
+        assert fallback.achat_complete.await_count == 5
+        health = adapter.get_provider_health()
+        assert health["openai"]["state"] == "open"
+        assert health["ollama"]["state"] == "closed"
+        assert adapter.health_check()
+
+    @pytest.mark.asyncio
+    async def test_clients_are_cached(self) -> None:
+        """Test that fallback clients are created once, not per call."""
+        adapter = EsperantoAdapter(provider="local", model="stub", fallback_providers=[])
+
+        with patch.object(adapter, "_create_llm", wraps=adapter._create_llm) as create:
+            await adapter.generate("a")
+            await adapter.generate("b")
+
+        create.assert_called_once_with("local")
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open_fails_fast(self) -> None:
+        """Test that requests fail immediately when every circuit is open."""
+        adapter, primary, fallback = self._adapter()
+        get_circuit_breaker("openai")._open("test")
+        get_circuit_breaker("ollama")._open("test")
+
+        with pytest.raises(RuntimeError, match="circuits open"):
+            await adapter.generate("q")
+
+        primary.achat_complete.assert_not_awaited()
+        fallback.achat_complete.assert_not_awaited()
+        assert not adapter.health_check()
+
+
+class TestHedgedRequests:
+    """Tests for hedged LLM requests."""
+
+    def _adapter(self, primary_delay: float) -> tuple[EsperantoAdapter, MagicMock, MagicMock]:
+        """Create an adapter whose primary answers after a delay."""
+        import asyncio
+
+        adapter = EsperantoAdapter(provider="openai", model="m", fallback_providers=["ollama"])
+        adapter._hedge_operations = {"rerank"}
+        cancelled = []
+
+        async def slow(messages: list, **kwargs: object) -> MagicMock:
+            try:
+                await asyncio.sleep(primary_delay)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return MagicMock(content="primary")
+
+        primary = MagicMock()
+        primary.achat_complete = AsyncMock(side_effect=slow)
+        primary.cancelled = cancelled
+        backup = MagicMock()
+        backup.achat_complete = AsyncMock(return_value=MagicMock(content="backup"))
+        adapter._clients = {"openai": primary, "ollama": backup}
+        return adapter, primary, backup
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        """Test that the backup wins and the slow primary is cancelled."""
+        import asyncio
+
+        adapter, primary, backup = self._adapter(primary_delay=5.0)
+
+        with patch.object(adapter, "_hedge_delay", return_value=0.01):
+            result = await adapter.generate("q", operation="rerank")
+        await asyncio.sleep(0)
+
+        assert result == "backup"
+        assert primary.cancelled == [True]
+        assert adapter.get_hedge_statistics() == {"hedged": 1, "hedge_wins": 1}
+        assert get_circuit_breaker("openai").state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_unlisted_operation_is_not_hedged(self) -> None:
+        """Test that operations outside the hedge list wait for the primary."""
+        adapter, primary, backup = self._adapter(primary_delay=0.05)
+
+        with patch.object(adapter, "_hedge_delay", return_value=0.01):
+            result = await adapter.generate("q", operation="synthesis")
+
+        assert result == "primary"
+        backup.achat_complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_needs_no_hedge(self) -> None:
+        """Test that a primary answering within the delay is used alone."""
+        adapter, primary, backup = self._adapter(primary_delay=0.0)
+
+        result = await adapter.generate("q", hedge=True)
+
+        assert result == "primary"
+        backup.achat_complete.assert_not_awaited()
+
+    def test_hedge_delay_uses_latency_percentile(self) -> None:
+        """Test that the delay follows the operation's observed latencies."""
+        adapter = EsperantoAdapter(provider="openai", model="m", fallback_providers=[])
+        window = get_latency_window("openai", "rerank")
+        for latency in [0.5] * 18 + [3.0, 4.0]:
+            window.record(latency)
+
+        assert adapter._hedge_delay("openai", "rerank") == 3.0
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_per_operation(self) -> None:
+        """Test that long completions do not raise the delay of short operations."""
+        import asyncio
+
+        adapter = EsperantoAdapter(provider="openai", model="m", fallback_providers=[])
+        latencies = {"synthesis": 0.2, "rerank": 0.01}
+
+        async def complete(messages: list, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(latencies[messages[-1]["content"]])
+            return MagicMock(content="ok")
+
+        client = MagicMock()
+        client.achat_complete = AsyncMock(side_effect=complete)
+        adapter._clients = {"openai": client}
+        for _ in range(5):
+            await asyncio.gather(
+                adapter.generate("synthesis", operation="synthesis"),
+                adapter.generate("rerank", operation="rerank"),
+            )
+
+        with patch(
+            "tenjin.infrastructure.adapters.esperanto_adapter.get_settings"
+        ) as settings:
+            settings.return_value.llm.hedge_percentile = 0.95
+            settings.return_value.llm.hedge_min_samples = 5
+            settings.return_value.llm.hedge_min_delay = 0.0
+            assert adapter._hedge_delay("openai", "rerank") < 0.1
+            assert adapter._hedge_delay("openai", "synthesis") >= 0.2
@@ -0,0 +1,89 @@
+"""Tests for vectorized learning-outcome coverage."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from tenjin.application.services.coverage import compute_coverage
+from tenjin.infrastructure.repositories.chromadb_vector_repository import (
+    ChromaDBVectorRepository,
+)
+
+
+class TestComputeCoverage:
+    """Tests for compute_coverage."""
+
+    def test_scores_gaps_and_candidates(self) -> None:
+        """Test coverage scores, uncovered outcomes and ranked candidates."""
+        theory_ids = ["applied", "near", "mid", "far"]
+        theory_vectors = np.array(
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.8, 0.6], [0.0, 0.0, 1.0]]
+        )
+        outcome_vectors = np.array([[0.9, 0.1, 0.0], [0.0, 1.0, 0.1]])
+
+        report = compute_coverage(
+            ["recall facts", "collaborate"],
+            outcome_vectors,
+            theory_ids,
+            theory_vectors,
+            ["applied"],
+            threshold=0.5,
+            candidates_per_gap=2,
+        )
+
+        covered, gap = report.outcomes
+        assert covered.covered and covered.covered_by == "applied"
+        assert covered.candidates == []
+        assert not gap.covered
+        assert gap.score == 0.0
+        assert [theory_id for theory_id, _ in gap.candidates] == ["near", "mid"]
+        assert report.coverage_score == 0.5
+        assert report.candidate_ids() == ["near", "mid"]
+
+        summary = report.to_dict({"near": "Social learning"})
+        assert summary["uncovered_outcomes"] == ["collaborate"]
+        assert summary["outcomes"][1]["candidates"][0]["name"] == "Social learning"
+
+    def test_without_applied_theories(self) -> None:
+        """Test that every outcome is a gap when nothing is applied."""
+        report = compute_coverage(
+            ["a", "b"],
+            np.eye(2),
+            ["t1", "t2", "t3"],
+            np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]),
+            [],
+            candidates_per_gap=5,
+        )
+
+        assert [o.covered for o in report.outcomes] == [False, False]
+        assert [c[0] for c in report.outcomes[0].candidates] == ["t1", "t3", "t2"]
+        assert all(o.covered_by is None for o in report.outcomes)
+
+
+class TestEmbeddingMatrix:
+    """Tests for the cached embedding matrix of ChromaDBVectorRepository."""
+
+    @pytest.mark.asyncio
+    async def test_cached_until_collection_changes(self) -> None:
+        """Test that the matrix is read once and reloaded after writes or size changes."""
+        chromadb = MagicMock()
+        chromadb.physical_name = "theories"
+        chromadb.count.return_value = 2
+        chromadb.get.return_value = {"ids": ["a", "b"], "embeddings": [[1.0, 0.0], [0.0, 1.0]]}
+        repo = ChromaDBVectorRepository(chromadb, MagicMock())
+
+        ids, matrix = await repo.get_embedding_matrix()
+        assert ids == ["a", "b"]
+        assert matrix.dtype == np.float32 and matrix.shape == (2, 2)
+        assert (await repo.get_embedding_matrix())[1] is matrix
+        assert chromadb.get.call_count == 1
+
+        # A sync in another process changed the collection size
+        chromadb.count.return_value = 3
+        await repo.get_embedding_matrix()
+        assert chromadb.get.call_count == 2
+
+        await repo.delete_embedding("a")
+        await repo.get_embedding_matrix()
+        assert chromadb.get.call_count == 3
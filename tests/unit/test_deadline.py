@@ -0,0 +1,154 @@
+"""Tests for request deadlines and cancellation."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.server import Server
+from mcp.types import TextContent, Tool
+from neo4j import Query
+
+from tenjin.infrastructure.adapters.deadline import (
+    DeadlineExceededError,
+    bounded,
+    deadline,
+    gather_or_cancel,
+    remaining,
+)
+from tenjin.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tenjin.interface.tools.middleware import DeadlineMiddleware, ErrorMiddleware
+from tenjin.interface.tools.registry import ToolCall, ToolRegistry
+
+
+class TestDeadline:
+    """Tests for deadline scopes."""
+
+    @pytest.mark.asyncio
+    async def test_cancels_block(self) -> None:
+        """Test that a block running past its deadline is cancelled."""
+        with pytest.raises(DeadlineExceededError):
+            async with deadline(0.02):
+                await asyncio.sleep(1)
+        assert remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_nested_and_inherited(self) -> None:
+        """Test that nesting cannot extend a deadline and tasks inherit it."""
+        async with deadline(0.5), deadline(10):
+            left = remaining()
+            seen = await asyncio.create_task(asyncio.sleep(0, result=remaining()))
+
+        assert left is not None and left <= 0.5
+        assert seen is not None and seen <= left
+
+    @pytest.mark.asyncio
+    async def test_bounded(self) -> None:
+        """Test which limit is reported when an operation times out."""
+        with pytest.raises(TimeoutError) as own:
+            async with bounded(0.01):
+                await asyncio.sleep(1)
+        assert not isinstance(own.value, DeadlineExceededError)
+
+        with pytest.raises(DeadlineExceededError):
+            async with deadline(5), deadline(0.01), bounded(10, "LLM request"):
+                await asyncio.sleep(1)
+
+    @pytest.mark.asyncio
+    async def test_gather_or_cancel(self) -> None:
+        """Test that siblings of a failed awaitable are cancelled and awaited."""
+        cancelled = []
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def failing() -> None:
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await gather_or_cancel(slow(), slow(), failing())
+
+        assert cancelled == [True, True]
+        assert await gather_or_cancel(asyncio.sleep(0, 1), asyncio.sleep(0, 2)) == [1, 2]
+
+
+class TestDeadlineMiddleware:
+    """Tests for DeadlineMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_client_timeout(self) -> None:
+        """Test the timeout argument, its schema and the error result."""
+        registry = ToolRegistry(
+            Server("test"), [ErrorMiddleware(), DeadlineMiddleware(default_seconds=None)]
+        )
+        received: list[dict[str, Any]] = []
+
+        @registry.tool("slow")
+        async def slow(arguments: dict[str, Any]) -> list[TextContent]:
+            received.append(arguments)
+            await asyncio.sleep(1)
+            return [TextContent(type="text", text="done")]
+
+        registry.define(
+            [Tool(name="slow", inputSchema={"type": "object", "properties": {"q": {}}})]
+        )
+
+        result = await registry.dispatch("slow", {"q": "x", "timeout": 0.02})
+
+        assert result.isError
+        assert "DeadlineExceeded" in result.content[0].text
+        assert received == [{"q": "x"}]
+        assert "timeout" in registry.definitions()[0].inputSchema["properties"]
+        invalid = await registry.dispatch("slow", {"timeout": -1})
+        assert "InvalidArguments" in invalid.content[0].text
+
+    def test_timeout_precedence(self) -> None:
+        """Test configured, registered and default deadlines."""
+        middleware = DeadlineMiddleware(120.0, 600.0, {"export": 30.0})
+        registry = ToolRegistry(Server("test"))
+        handler = AsyncMock()
+        registry.register("export", handler, timeout=5.0)
+        registry.register("synthesize", handler, timeout=300.0)
+        registry.register("search", handler)
+
+        def timeout(name: str, arguments: dict[str, Any]) -> float | None:
+            return middleware.timeout_for(ToolCall(registry.get(name), arguments))
+
+        assert timeout("export", {}) == 30.0
+        assert timeout("synthesize", {}) == 300.0
+        assert timeout("search", {}) == 120.0
+        assert timeout("search", {"timeout": 5000}) == 600.0
+
+
+class TestNeo4jDeadline:
+    """Tests for Neo4j transaction timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_query_timeout_from_deadline(self) -> None:
+        """Test that reads carry the time left as transaction timeout."""
+        result = MagicMock()
+        result.data = AsyncMock(return_value=[])
+        session = MagicMock()
+        session.run = AsyncMock(return_value=result)
+
+        @asynccontextmanager
+        async def fake_session() -> AsyncIterator[MagicMock]:
+            yield session
+
+        adapter = Neo4jAdapter("bolt://localhost", "neo4j", "password")
+        adapter.session = fake_session  # type: ignore[method-assign]
+
+        await adapter.execute_read("RETURN 1")
+        assert session.run.call_args.args[0] == "RETURN 1"
+
+        async with deadline(5):
+            await adapter.execute_read("RETURN 1")
+        query = session.run.call_args.args[0]
+        assert isinstance(query, Query)
+        assert 0 < query.timeout <= 5
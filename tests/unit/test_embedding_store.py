@@ -0,0 +1,205 @@
+"""Tests for the persistent embedding store and its use by EmbeddingAdapter."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tenjin.infrastructure.adapters.embedding_store import EmbeddingStore
+from tenjin.infrastructure.adapters.esperanto_adapter import EmbeddingAdapter
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+
+    def test_roundtrip_and_persistence(self, tmp_path: Path) -> None:
+        """Test that stored vectors survive reopening the store."""
+        store = EmbeddingStore(tmp_path)
+        store.put_many("ollama", "bge-m3", ["a", "b"], [[0.5, 1.0], [2.0, -1.5]])
+        store.close()
+
+        reopened = EmbeddingStore(tmp_path)
+        assert reopened.get_many("ollama", "bge-m3", ["b", "a", "c"]) == [
+            [2.0, -1.5],
+            [0.5, 1.0],
+            None,
+        ]
+
+    def test_keyed_by_provider_and_model(self, tmp_path: Path) -> None:
+        """Test that the same text under another model is a miss."""
+        store = EmbeddingStore(tmp_path)
+        store.put("ollama", "bge-m3", "text", [1.0, 2.0])
+
+        assert store.get("ollama", "bge-m3", "text") == [1.0, 2.0]
+        assert store.get("ollama", "nomic-embed-text", "text") is None
+        assert store.get("openai", "bge-m3", "text") is None
+
+    def test_duplicate_put_is_not_appended(self, tmp_path: Path) -> None:
+        """Test that re-storing a known text does not grow the vector file."""
+        store = EmbeddingStore(tmp_path)
+        assert store.put_many("p", "m", ["x"], [[1.0, 2.0, 3.0]]) == 1
+        assert store.put_many("p", "m", ["x"], [[1.0, 2.0, 3.0]]) == 0
+        assert (tmp_path / "vectors.f32").stat().st_size == 12
+
+    def test_statistics(self, tmp_path: Path) -> None:
+        """Test hit/miss accounting."""
+        store = EmbeddingStore(tmp_path)
+        store.put("p", "m", "x", [1.0])
+        store.get_many("p", "m", ["x", "y"])
+
+        stats = store.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == {"p/m": 1}
+
+
+class TestEmbeddingAdapterStore:
+    """Tests for EmbeddingAdapter consulting the store."""
+
+    @pytest.fixture
+    def adapter(self, tmp_path: Path) -> EmbeddingAdapter:
+        """Create adapter with a temporary store and a fake provider."""
+        adapter = EmbeddingAdapter(
+            provider="ollama",
+            model="bge-m3",
+            store=EmbeddingStore(tmp_path),
+        )
+        model = MagicMock()
+        model.aembed = AsyncMock(
+            side_effect=lambda texts: [[float(len(t)), 1.0] for t in texts]
+        )
+        adapter._embedding_model = model
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_only_calls_provider_for_misses(
+        self, adapter: EmbeddingAdapter
+    ) -> None:
+        """Test that stored texts are not re-embedded."""
+        await adapter.embed("aa", persist=True)
+        result = await adapter.embed_batch(["aa", "bbb", "bbb"])
+
+        assert result == [[2.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+        calls = adapter.embedding_model.aembed.await_args_list
+        assert [c.args[0] for c in calls] == [["aa"], ["bbb"]]
+
+    @pytest.mark.asyncio
+    async def test_search_queries_not_persisted(self, adapter: EmbeddingAdapter) -> None:
+        """Test that query embeddings are looked up but never stored."""
+        await adapter.embed_batch(["document"])
+
+        await adapter.embed("document")
+        await adapter.embed("a user query")
+        await adapter.embed("a user query")
+
+        calls = adapter.embedding_model.aembed.await_args_list
+        assert [c.args[0] for c in calls] == [["document"], ["a user query"], ["a user query"]]
+        assert adapter.get_store_statistics()["entries"] == {"ollama/bge-m3": 1}
+
+    def test_sync_queries_not_persisted(self, adapter: EmbeddingAdapter) -> None:
+        """Test that embed_sync only stores embeddings when asked to."""
+        adapter.embedding_model.embed = MagicMock(return_value=[[0.25, 0.5]])
+
+        adapter.embed_sync("a user query")
+        assert adapter.get_store_statistics()["entries"] == {}
+
+        adapter.embed_sync("a document", persist=True)
+        assert adapter.get_store_statistics()["entries"] == {"ollama/bge-m3": 1}
+
+    @pytest.mark.asyncio
+    async def test_rebuild_needs_no_embedding_calls(
+        self, adapter: EmbeddingAdapter
+    ) -> None:
+        """Test that a second full pass over the same texts is served from disk."""
+        texts = [f"theory {i}" for i in range(5)]
+        first = await adapter.embed_batch(texts)
+        adapter.embedding_model.aembed.reset_mock()
+
+        second = await adapter.embed_batch(texts)
+
+        assert second == first
+        adapter.embedding_model.aembed.assert_not_awaited()
+
+
+class TestAdaptiveBatching:
+    """Tests for concurrent, adaptive embed_batch."""
+
+    @pytest.fixture
+    def adapter(self) -> EmbeddingAdapter:
+        """Create adapter without a persistent store."""
+        adapter = EmbeddingAdapter(provider="ollama", model="bge-m3", store=None)
+        adapter._store = None
+        adapter._retry_backoff = 0
+        adapter._embedding_model = MagicMock()
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, adapter: EmbeddingAdapter) -> None:
+        """Test that no more than batch_concurrency requests run at once."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def aembed(texts: list[str]) -> list[list[float]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[1.0] for _ in texts]
+
+        adapter._embedding_model.aembed = aembed
+        adapter._batch_size = 2
+        adapter._batch_concurrency = 3
+
+        result = await adapter.embed_batch([f"t{i}" for i in range(20)])
+
+        assert len(result) == 20
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_batch_is_split_and_retried(
+        self, adapter: EmbeddingAdapter
+    ) -> None:
+        """Test that a provider error retries halves instead of failing the load."""
+        calls: list[list[str]] = []
+
+        async def aembed(texts: list[str]) -> list[list[float]]:
+            calls.append(list(texts))
+            if len(calls) == 1:
+                raise ConnectionError("provider hiccup")
+            return [[float(t[1:])] for t in texts]
+
+        adapter._embedding_model.aembed = aembed
+        adapter._batch_size = 4
+        adapter._batch_concurrency = 1
+
+        result = await adapter.embed_batch(["t0", "t1", "t2", "t3"])
+
+        assert result == [[0.0], [1.0], [2.0], [3.0]]
+        assert calls[1:] == [["t0", "t1"], ["t2", "t3"]]
+        stats = adapter.get_batch_statistics()
+        assert stats["retries"] == 1
+        assert stats["requests"] == 3
+        assert stats["texts_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_persistent_failure_raises(self, adapter: EmbeddingAdapter) -> None:
+        """Test that a sub-batch failing on every retry raises."""
+        adapter._embedding_model.aembed = AsyncMock(side_effect=ConnectionError("down"))
+        adapter._batch_max_retries = 1
+
+        with pytest.raises(RuntimeError, match="after 2 attempts"):
+            await adapter.embed_batch(["a"])
+
+    def test_batch_size_adapts_to_latency(self, adapter: EmbeddingAdapter) -> None:
+        """Test growth on fast responses and shrinking on slow ones."""
+        adapter._batch_size = 100
+        adapter._target_batch_latency = 2.0
+
+        adapter._adapt_batch_size(100, 0.1)
+        assert adapter._batch_size == 200
+
+        adapter._adapt_batch_size(200, 5.0)
+        assert adapter._batch_size == 100
@@ -0,0 +1,203 @@
+"""Tests for the stateless Streamable HTTP mode and its shared state."""
+
+import fnmatch
+import json
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.server import Server
+from mcp.types import TextContent
+from starlette.testclient import TestClient
+
+from tenjin.application.services.cache_service import CacheService
+from tenjin.domain.entities.methodology import Methodology
+from tenjin.domain.value_objects.methodology_id import MethodologyId
+from tenjin.infrastructure.adapters.job_store import JobRecord, RedisJobStore
+from tenjin.infrastructure.adapters.redis_adapter import RedisAdapter
+from tenjin.infrastructure.repositories.redis_methodology_repository import (
+    RedisMethodologyRepository,
+)
+from tenjin.interface import server as server_module
+from tenjin.interface.server import StartupSnapshot
+from tenjin.interface.tools.cache_tools import register_cache_tools
+from tenjin.interface.tools.middleware import CacheMiddleware
+from tenjin.interface.tools.registry import ToolRegistry
+
+
+class _FakeRedis:
+    """In-memory stand-in for the JSON operations of RedisAdapter."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get_json(self, key: str) -> Any | None:
+        value = self.values.get(key)
+        return json.loads(value) if value else None
+
+    async def set_json(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        self.values[key] = json.dumps(value)
+        return True
+
+    async def keys(self, pattern: str) -> list[str]:
+        return [key for key in self.values if fnmatch.fnmatch(key, pattern)]
+
+    async def delete(self, key: str) -> bool:
+        return self.values.pop(key, None) is not None
+
+
+class _FakeRedisClient:
+    """In-memory stand-in for the redis-py client used by RedisAdapter."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match: str) -> AsyncIterator[str]:
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+
+class TestStartupSnapshot:
+    """Tests for StartupSnapshot."""
+
+    def test_only_loaded_from_own_supervisor(self, tmp_path: Path) -> None:
+        """Test that workers ignore a snapshot left by another supervisor."""
+        path = tmp_path / "snapshot.json"
+        StartupSnapshot(os.getppid(), 1.0, neo4j_verified=True, jobs_recovered=2).write(path)
+
+        snapshot = StartupSnapshot.load(path)
+        assert snapshot is not None
+        assert snapshot.jobs_recovered == 2
+
+        StartupSnapshot(os.getppid() + 1, 1.0).write(path)
+        assert StartupSnapshot.load(path) is None
+        assert StartupSnapshot.load(tmp_path / "missing.json") is None
+
+
+class TestSharedState:
+    """Tests for state shared between worker processes through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_tool_results_shared_between_processes(self) -> None:
+        """Test that a result computed in one process is served in another."""
+        redis = _FakeRedis()
+        calls = 0
+
+        def worker() -> ToolRegistry:
+            registry = ToolRegistry(Server("test"), [CacheMiddleware(shared=redis)])
+
+            @registry.tool("lookup", cacheable=True)
+            async def lookup(arguments: dict[str, Any]) -> list[TextContent]:
+                nonlocal calls
+                calls += 1
+                return [TextContent(type="text", text=arguments["q"])]
+
+            return registry
+
+        first = await worker().dispatch("lookup", {"q": "vygotsky"})
+        second = await worker().dispatch("lookup", {"q": "vygotsky"})
+
+        assert calls == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_methodologies_shared_between_processes(self) -> None:
+        """Test that methodologies round-trip through the Redis repository."""
+        redis = _FakeRedis()
+        methodology = Methodology(
+            id=MethodologyId.generate(), name="Jigsaw", steps=["split", "share"]
+        )
+        await RedisMethodologyRepository(redis).save(methodology)
+
+        other = RedisMethodologyRepository(redis)
+        loaded = await other.get(str(methodology.id))
+        assert loaded is not None
+        assert loaded.to_dict() == methodology.to_dict()
+        assert [m.name for m in await other.list_all()] == ["Jigsaw"]
+        assert await other.delete(str(methodology.id))
+        assert await other.list_all() == []
+
+
+    @pytest.mark.asyncio
+    async def test_methodologies_survive_cache_invalidation(self) -> None:
+        """Test that flushing the cache keeps the durable keyspace."""
+        client = _FakeRedisClient()
+        cache = RedisAdapter()
+        cache._client, cache._connected = client, True
+        state = cache.scoped()
+        methodologies = RedisMethodologyRepository(state)
+        methodology = Methodology(id=MethodologyId.generate(), name="Jigsaw")
+        await methodologies.save(methodology)
+        await cache.set_json("tool:abc", {"cached": True})
+
+        tenjin = MagicMock()
+        tenjin.redis_adapter = cache
+        tenjin.cache_service = CacheService(cache)
+        registry = ToolRegistry(Server("test"))
+        register_cache_tools(registry, tenjin)
+        await registry.dispatch("invalidate_cache", {})
+
+        assert await cache.get_json("tool:abc") is None
+        assert await methodologies.get(str(methodology.id)) is not None
+        assert not await state.flush_all()
+
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_cache_flush(self) -> None:
+        """Test that Redis job records are out of reach of the cache flush."""
+        cache = RedisAdapter()
+        cache._client, cache._connected = _FakeRedisClient(), True
+        store = RedisJobStore(cache.scoped())
+        job = JobRecord.create("analyze", {"outcomes": ["x"]})
+        await store.save(job)
+
+        await CacheService(cache).invalidate_all()
+        assert await cache.delete_pattern("*") == 0
+
+        assert await store.get(job.job_id) is not None
+        assert await store.find_reusable(job.dedup_key) is not None
+
+
+class TestHttpApp:
+    """Tests for the stateless Streamable HTTP app."""
+
+    def test_requests_without_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that requests are answered without an initialized session."""
+        tenjin = MagicMock()
+        tenjin.server = Server("tenjin")
+        tenjin.redis_adapter = None
+        tenjin.llm_adapter = None
+
+        @asynccontextmanager
+        async def lifespan(**kwargs: Any) -> AsyncIterator[Any]:
+            yield tenjin
+
+        monkeypatch.setattr(server_module, "server_lifespan", lifespan)
+        headers = {"accept": "application/json, text/event-stream"}
+
+        with TestClient(server_module.create_http_app()) as client:
+            assert client.get("/health").json()["worker"] == os.getpid()
+            response = client.post(
+                "/mcp",
+                headers=headers,
+                json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+            )
+
+        assert response.status_code == 200
+        assert '"name":"get_theory"' in response.text
@@ -1,8 +1,10 @@
 """Tests for InferenceService - Advanced LLM-powered reasoning operations."""
 
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from tenjin.application.services import relationship_precompute_service as precompute_module
 from tenjin.application.services.inference_service import InferenceService
 from tenjin.domain.entities.theory import Theory
 from tenjin.domain.value_objects.theory_id import TheoryId
@@ -171,6 +173,33 @@ class TestAnalyzeLearningDesignGaps:
         assert result["applied_theories"] == []
 
 
+    @pytest.mark.asyncio
+    async def test_gap_analysis_coverage_without_llm(
+        self, inference_service, mock_theory_repository, mock_vector_repository,
+        mock_llm_adapter, sample_theory
+    ):
+        """Test the numeric coverage mode that skips the LLM."""
+        mock_theory_repository.get_by_id.return_value = sample_theory
+        mock_vector_repository.embed_texts.return_value = [[1.0, 0.0], [0.0, 1.0]]
+        mock_vector_repository.get_embedding_matrix.return_value = (
+            ["THEORY-001", "THEORY-002"],
+            np.array([[1.0, 0.1], [0.1, 1.0]]),
+        )
+
+        result = await inference_service.analyze_learning_design_gaps(
+            current_design={"activities": "lectures"},
+            target_outcomes=["Recall", "Collaboration"],
+            applied_theories=["THEORY-001"],
+            use_llm=False,
+        )
+
+        coverage = result["coverage"]
+        assert coverage["uncovered_outcomes"] == ["Collaboration"]
+        assert coverage["outcomes"][1]["candidates"][0]["theory_id"] == "THEORY-002"
+        assert "analysis" not in result
+        mock_llm_adapter.generate.assert_not_called()
+        mock_vector_repository.semantic_search.assert_not_called()
+
 class TestInferTheoryRelationships:
     """Tests for infer_theory_relationships method."""
 
@@ -198,6 +227,121 @@ class TestInferTheoryRelationships:
         assert "inferred_relationships" in result
         assert "relationship_graph" in result
 
+    @pytest.mark.asyncio
+    async def test_infer_relationships_uses_precomputed(
+        self, inference_service, mock_theory_repository, mock_graph_repository,
+        mock_llm_adapter, sample_theory
+    ):
+        """Test that precomputed relationships are returned without calling the LLM."""
+        mock_theory_repository.get_by_id.return_value = sample_theory
+        mock_graph_repository.get_related_theories.return_value = []
+        mock_graph_repository.get_inferred_relationships.return_value = [
+            {
+                "theory": {"id": "THEORY-002", "name": "Scaffolding"},
+                "relationship_type": "extension",
+                "confidence": 0.8,
+                "direction": "source_to_target",
+                "evidence": "Both emphasise guided construction",
+                "practical_implications": "Combine in design",
+            }
+        ]
+
+        result = await inference_service.infer_theory_relationships(
+            theory_id="THEORY-001",
+            inference_depth=2,
+        )
+
+        assert result["inference_source"] == "precomputed"
+        inferred = result["inferred_relationships"]
+        assert inferred[0]["related_theory"]["id"] == "THEORY-002"
+        assert inferred[0]["direction"] == "base_to_candidate"
+        mock_llm_adapter.generate.assert_not_called()
+        mock_theory_repository.get_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_infer_relationships_prefilters_candidates(
+        self, inference_service, mock_theory_repository, mock_graph_repository,
+        mock_vector_repository, mock_llm_adapter, sample_theory
+    ):
+        """Test that only the top link-prediction candidates reach the LLM."""
+        candidates = [
+            Theory(
+                id=TheoryId.from_string(f"THEORY-{i:03d}"),
+                name=f"Candidate {i}",
+                name_ja=f"候補{i}",
+                category=CategoryType.CONSTRUCTIVIST,
+                description="Candidate theory",
+                description_ja="候補理論",
+                priority=PriorityLevel.MEDIUM,
+            )
+            for i in range(2, 22)
+        ]
+        mock_theory_repository.get_by_id.return_value = sample_theory
+        mock_theory_repository.get_all.return_value = [sample_theory, *candidates]
+        mock_graph_repository.get_related_theories.return_value = []
+        mock_graph_repository.get_inferred_relationships.return_value = []
+        mock_graph_repository.get_relationship_pairs.return_value = []
+        mock_vector_repository.get_embeddings.return_value = {
+            "THEORY-001": [1.0, 0.0],
+            "THEORY-021": [1.0, 0.1],
+        }
+        mock_llm_adapter.generate.return_value = (
+            '{"inferred_relationships": [{"candidate_index": 1, '
+            '"relationship_type": "extension", "strength": 0.8}]}'
+        )
+
+        result = await inference_service.infer_theory_relationships(
+            theory_id="THEORY-001",
+            inference_depth=2,
+        )
+
+        prompt = mock_llm_adapter.generate.call_args.args[0]
+        assert "Candidate 21" in prompt
+        assert prompt.count("Category:") == 1 + 8
+        inferred = result["inferred_relationships"][0]
+        assert inferred["related_theory"]["id"] == "THEORY-021"
+        assert inferred["link_score"]["embedding_similarity"] > 0.9
+
+    @pytest.mark.asyncio
+    async def test_infer_relationships_pages_through_catalog(
+        self, inference_service, mock_theory_repository, mock_graph_repository,
+        mock_vector_repository, mock_llm_adapter, sample_theory, monkeypatch
+    ):
+        """Test that candidates beyond the first page of theories are considered."""
+        catalog = [sample_theory] + [
+            Theory(
+                id=TheoryId.from_string(f"THEORY-{i:03d}"),
+                name=f"Candidate {i}",
+                name_ja=f"候補{i}",
+                category=CategoryType.CONSTRUCTIVIST,
+                description="Candidate theory",
+                description_ja="候補理論",
+                priority=PriorityLevel.MEDIUM,
+            )
+            for i in range(2, 13)
+        ]
+        monkeypatch.setattr(precompute_module, "_PAGE_SIZE", 5)
+
+        async def get_all(limit: int = 100, offset: int = 0) -> list[Theory]:
+            return catalog[offset : offset + limit]
+
+        mock_theory_repository.get_by_id.return_value = sample_theory
+        mock_theory_repository.get_all.side_effect = get_all
+        mock_graph_repository.get_related_theories.return_value = []
+        mock_graph_repository.get_inferred_relationships.return_value = []
+        mock_graph_repository.get_relationship_pairs.return_value = []
+        mock_vector_repository.get_embeddings.return_value = {
+            "THEORY-001": [1.0, 0.0],
+            "THEORY-012": [1.0, 0.1],
+        }
+        mock_llm_adapter.generate.return_value = '{"inferred_relationships": []}'
+
+        await inference_service.infer_theory_relationships(theory_id="THEORY-001")
+
+        assert mock_theory_repository.get_all.await_count == 3
+        prompt = mock_llm_adapter.generate.call_args.args[0]
+        assert "Candidate 12" in prompt
+
     @pytest.mark.asyncio
     async def test_infer_relationships_invalid_theory_id(
         self, inference_service, mock_theory_repository
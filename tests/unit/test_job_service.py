@@ -0,0 +1,259 @@
+"""Tests for the background job service and job stores."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tenjin.application.services.job_service import JobService
+from tenjin.infrastructure.adapters.job_store import (
+    JobRecord,
+    JobStatus,
+    JobStore,
+    SQLiteJobStore,
+)
+
+
+async def _wait_for(service: JobService, job_id: str, status: JobStatus) -> JobRecord:
+    """Poll a job until it reaches a status."""
+    for _ in range(200):
+        job = await service.get(job_id)
+        if job is not None and job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not reach {status.value}")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SQLiteJobStore:
+    """Create a job store in a temporary directory."""
+    return SQLiteJobStore(tmp_path / "jobs.sqlite3")
+
+
+class TestJobService:
+    """Tests for JobService."""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_reports_progress(self, store: SQLiteJobStore) -> None:
+        """Test that a submitted job completes with its result and progress."""
+        service = JobService(store)
+
+        async def synthesize(args: dict[str, Any], on_progress: Any) -> dict[str, Any]:
+            await on_progress('{"field": "synergies"}')
+            return {"goal": args["goal"]}
+
+        service.register("synthesize", synthesize)
+        await service.start()
+        try:
+            job, deduplicated = await service.submit("synthesize", {"goal": "course"})
+            assert not deduplicated
+
+            done = await _wait_for(service, job.job_id, JobStatus.COMPLETED)
+            assert done.result == {"goal": "course"}
+            assert done.progress == 1
+            assert done.attempts == 1
+        finally:
+            await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_identical_jobs(self, store: SQLiteJobStore) -> None:
+        """Test that identical submissions share a job while failed ones are retried."""
+        service = JobService(store)
+        calls = 0
+
+        async def infer(args: dict[str, Any], on_progress: Any) -> int:
+            nonlocal calls
+            calls += 1
+            if args.get("fail"):
+                raise RuntimeError("LLM unavailable")
+            return calls
+
+        service.register("infer", infer)
+        await service.start()
+        try:
+            first, _ = await service.submit("infer", {"theory_id": "t1", "depth": 2})
+            second, deduplicated = await service.submit("infer", {"depth": 2, "theory_id": "t1"})
+            assert deduplicated
+            assert second.job_id == first.job_id
+            await _wait_for(service, first.job_id, JobStatus.COMPLETED)
+
+            failed, _ = await service.submit("infer", {"fail": True})
+            failed = await _wait_for(service, failed.job_id, JobStatus.FAILED)
+            assert failed.error == "RuntimeError: LLM unavailable"
+
+            retried, deduplicated = await service.submit("infer", {"fail": True})
+            assert not deduplicated
+            assert retried.job_id != failed.job_id
+        finally:
+            await service.stop()
+
+        assert calls >= 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, store: SQLiteJobStore) -> None:
+        """Test cancelling a job while its handler runs."""
+        service = JobService(store)
+        started = asyncio.Event()
+
+        async def slow(args: dict[str, Any], on_progress: Any) -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        service.register("slow", slow)
+        await service.start()
+        try:
+            job, _ = await service.submit("slow", {})
+            await asyncio.wait_for(started.wait(), 1)
+
+            cancelled = await service.cancel(job.job_id)
+
+            assert cancelled is not None
+            assert cancelled.status == JobStatus.CANCELLED
+            assert service.get_statistics()["running"] == 0
+        finally:
+            await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_resumes_jobs_after_restart(self, tmp_path: Path) -> None:
+        """Test that a job interrupted by shutdown runs again and its result persists."""
+        path = tmp_path / "jobs.sqlite3"
+        started = asyncio.Event()
+
+        async def hang(args: dict[str, Any], on_progress: Any) -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        first = JobService(SQLiteJobStore(path))
+        first.register("analyze", hang)
+        await first.start()
+        job, _ = await first.submit("analyze", {"outcomes": ["x"]})
+        await asyncio.wait_for(started.wait(), 1)
+        await first.stop()
+        assert (await first.get(job.job_id)).status == JobStatus.RUNNING
+
+        async def finish(args: dict[str, Any], on_progress: Any) -> list[str]:
+            return args["outcomes"]
+
+        second = JobService(SQLiteJobStore(path))
+        second.register("analyze", finish)
+        await second.start()
+        try:
+            done = await _wait_for(second, job.job_id, JobStatus.COMPLETED)
+            assert done.result == ["x"]
+            assert done.attempts == 2
+        finally:
+            await second.stop()
+
+        third = JobService(SQLiteJobStore(path))
+        third.register("analyze", finish)
+        reused, deduplicated = await third.submit("analyze", {"outcomes": ["x"]})
+        assert deduplicated
+        assert reused.result == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_shared_store_runs_job_once(self, tmp_path: Path) -> None:
+        """Test that processes resuming from one store run each job once."""
+        path = tmp_path / "jobs.sqlite3"
+        calls = 0
+
+        async def count(args: dict[str, Any], on_progress: Any) -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        pending = JobRecord.create("analyze", {"outcomes": ["x"]})
+        await SQLiteJobStore(path).save(pending)
+
+        services = [JobService(SQLiteJobStore(path)) for _ in range(3)]
+        await services[0].recover()
+        for service in services:
+            service.register("analyze", count)
+            await service.start(recover=False)
+        try:
+            done = await _wait_for(services[1], pending.job_id, JobStatus.COMPLETED)
+            await asyncio.sleep(0.1)
+            assert calls == 1
+            assert done.attempts == 1
+        finally:
+            for service in services:
+                await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_job_running_in_other_process(self, tmp_path: Path) -> None:
+        """Test that a job is cancelled by its owner, not by the requesting process."""
+        path = tmp_path / "jobs.sqlite3"
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def long(args: dict[str, Any], on_progress: Any) -> str:
+            started.set()
+            if args.get("report"):
+                await release.wait()
+                await on_progress("step")
+            await asyncio.sleep(10)
+            return "done"
+
+        owner = JobService(SQLiteJobStore(path), cancel_poll_seconds=0.05)
+        owner.register("long", long)
+        await owner.start()
+        other = JobService(SQLiteJobStore(path))
+        other.register("long", long)
+        try:
+            for arguments in ({"report": True}, {"report": False}):
+                started.clear()
+                job, _ = await owner.submit("long", arguments)
+                await asyncio.wait_for(started.wait(), 1)
+
+                requested = await other.cancel(job.job_id)
+                assert requested.status == JobStatus.RUNNING
+                assert requested.cancel_requested
+
+                release.set()
+                cancelled = await _wait_for(other, job.job_id, JobStatus.CANCELLED)
+                assert cancelled.result is None
+                await asyncio.sleep(0.1)
+                await SQLiteJobStore(path).save(requested)  # stale running record
+                assert (await other.get(job.job_id)).status == JobStatus.CANCELLED
+                assert owner.get_statistics()["running"] == 0
+        finally:
+            await owner.stop()
+
+    @pytest.mark.asyncio
+    async def test_unknown_operation(self, store: SQLiteJobStore) -> None:
+        """Test that unknown operations are rejected."""
+        service = JobService(store)
+
+        with pytest.raises(ValueError, match="Unknown operation"):
+            await service.submit("missing", {})
+
+
+class TestSQLiteJobStore:
+    """Tests for SQLiteJobStore."""
+
+    def test_store_interface_is_abstract(self) -> None:
+        """Test that a store must implement the whole interface."""
+        with pytest.raises(TypeError):
+            JobStore()  # type: ignore[abstract]
+
+    @pytest.mark.asyncio
+    async def test_queries_run_off_the_event_loop(
+        self, store: SQLiteJobStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that database calls are handed to a worker thread."""
+        calls = []
+        to_thread = asyncio.to_thread
+
+        async def record(func: Any, *args: Any) -> Any:
+            calls.append(func.__name__)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", record)
+        job = JobRecord.create("sync", {})
+
+        await store.save(job)
+        assert await store.claim(job, "worker-1")
+        assert (await store.get(job.job_id)).job_id == job.job_id
+
+        assert calls == ["_write", "_write", "_fetch", "_fetch"]
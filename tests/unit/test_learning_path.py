@@ -0,0 +1,135 @@
+"""Tests for deterministic learning path planning."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tenjin.application.services.learning_path import LearningPathPlanner
+from tenjin.application.services.recommendation_service import RecommendationService
+from tenjin.domain.entities.theory import Theory
+from tenjin.domain.value_objects.category_type import CategoryType
+from tenjin.domain.value_objects.priority_level import PriorityLevel
+from tenjin.domain.value_objects.search_result import SearchResult, SearchResults
+from tenjin.domain.value_objects.theory_id import TheoryId
+
+
+def make_theory(index: int, priority: PriorityLevel = PriorityLevel.MEDIUM) -> Theory:
+    """Create a sample theory."""
+    return Theory(
+        id=TheoryId.from_string(f"THEORY-00{index}"),
+        name=f"Theory {index}",
+        name_ja=f"理論{index}",
+        category=CategoryType.CONSTRUCTIVIST,
+        description=f"Description {index}",
+        description_ja=f"説明{index}",
+        priority=priority,
+    )
+
+
+def rel(source: int, target: int, rel_type: str, strength: float = 0.8) -> dict:
+    """Create a relationship record."""
+    return {
+        "source_id": f"THEORY-00{source}",
+        "target_id": f"THEORY-00{target}",
+        "relationship_type": rel_type,
+        "strength": strength,
+    }
+
+
+@pytest.fixture
+def theories() -> list[Theory]:
+    """Create four candidate theories."""
+    return [make_theory(i) for i in range(1, 5)]
+
+
+class TestLearningPathPlanner:
+    """Tests for LearningPathPlanner."""
+
+    def test_orders_prerequisites_first(self, theories: list[Theory]) -> None:
+        """Test that edge directions put prerequisites before dependents."""
+        relevance = {"THEORY-001": 0.9, "THEORY-002": 0.8, "THEORY-003": 0.7, "THEORY-004": 0.6}
+        relationships = [
+            rel(1, 2, "builds_upon"),  # 2 before 1
+            rel(3, 2, "influences"),  # 3 before 2
+            rel(4, 1, "similar_to"),  # no ordering
+        ]
+
+        path = LearningPathPlanner().plan(theories, relevance, relationships)
+
+        names = [step.theory.name for step in path.steps]
+        assert names.index("Theory 3") < names.index("Theory 2") < names.index("Theory 1")
+        first = path.steps[names.index("Theory 1")]
+        assert [t.name for t in first.prerequisites] == ["Theory 2"]
+        assert first.reason == "Builds on Theory 2"
+        assert path.broken_edges == []
+
+    def test_breaks_cycles_at_weakest_edge(self, theories: list[Theory]) -> None:
+        """Test that the weakest edge of a cycle is dropped deterministically."""
+        relationships = [
+            rel(1, 2, "influences", 0.9),
+            rel(2, 3, "influences", 0.8),
+            rel(3, 1, "influences", 0.3),
+        ]
+
+        first = LearningPathPlanner().plan(theories[:3], {}, relationships)
+        second = LearningPathPlanner().plan(theories[:3], {}, list(reversed(relationships)))
+
+        assert first.broken_edges == [("THEORY-003", "THEORY-001")]
+        assert [s.theory.name for s in first.steps] == ["Theory 1", "Theory 2", "Theory 3"]
+        assert first.to_dict() == second.to_dict()
+
+    def test_unconstrained_order_follows_relevance(self, theories: list[Theory]) -> None:
+        """Test that relevance decides among theories without prerequisites."""
+        relevance = {"THEORY-001": 0.2, "THEORY-002": 0.9, "THEORY-003": 0.5, "THEORY-004": 0.5}
+
+        path = LearningPathPlanner().plan(theories, relevance, [])
+
+        assert [s.order for s in path.steps] == [1, 2, 3, 4]
+        assert [s.theory.name for s in path.steps] == [
+            "Theory 2",
+            "Theory 3",
+            "Theory 4",
+            "Theory 1",
+        ]
+
+
+class TestGetLearningPath:
+    """Tests for RecommendationService.get_learning_path."""
+
+    @pytest.mark.asyncio
+    async def test_path_computed_without_llm(self, theories: list[Theory]) -> None:
+        """Test that the path is planned locally and known prerequisites are reported."""
+        by_id = {str(t.id): t for t in theories}
+        vector_repo = AsyncMock()
+        vector_repo.semantic_search.return_value = SearchResults(
+            results=tuple(
+                SearchResult(id=str(t.id), entity_type="theory", name=t.name, score=0.9)
+                for t in theories
+            ),
+            total_count=4,
+            query="goal",
+            search_type="semantic",
+        )
+        theory_repo = AsyncMock()
+        theory_repo.get_by_id.side_effect = lambda theory_id: by_id.get(str(theory_id))
+        graph_repo = AsyncMock()
+        graph_repo.get_relationships_among.return_value = [
+            rel(1, 3, "extends"),
+            rel(3, 4, "derived_from"),
+        ]
+        llm = AsyncMock()
+        service = RecommendationService(theory_repo, vector_repo, graph_repo, llm)
+
+        result = await service.get_learning_path("goal", current_knowledge=["THEORY-004"])
+
+        llm.generate.assert_not_called()
+        names = [step["name"] for step in result["learning_path"]]
+        assert names.index("Theory 3") < names.index("Theory 1")
+        assert "Theory 4" not in names
+        theory_3 = result["learning_path"][names.index("Theory 3")]
+        assert theory_3["known_prerequisites"] == ["THEORY-004"]
+
+        llm.generate.return_value = "Start with Theory 3."
+        narrated = await service.get_learning_path("goal", narrate=True)
+        assert narrated["narrative"] == "Start with Theory 3."
+        assert narrated["learning_path"] != []
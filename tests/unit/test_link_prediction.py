@@ -0,0 +1,92 @@
+"""Tests for local link prediction between theories."""
+
+import pytest
+
+from tenjin.application.services.link_prediction import LinkPredictor, feature_set
+from tenjin.domain.entities.theory import Theory
+from tenjin.domain.value_objects.category_type import CategoryType
+from tenjin.domain.value_objects.priority_level import PriorityLevel
+from tenjin.domain.value_objects.theory_id import TheoryId
+
+
+def _theory(number: int, principles: list[str], keywords: list[str] | None = None) -> Theory:
+    """Create a minimal theory."""
+    return Theory(
+        id=TheoryId.from_string(f"THEORY-{number:03d}"),
+        name=f"Theory {number}",
+        name_ja=f"理論{number}",
+        category=CategoryType.CONSTRUCTIVIST,
+        description="Learning theory",
+        description_ja="学習理論",
+        priority=PriorityLevel.HIGH,
+        key_principles=principles,
+        keywords=keywords or [],
+    )
+
+
+@pytest.fixture
+def theories() -> list[Theory]:
+    """Create a small catalog."""
+    return [
+        _theory(1, ["Active learning", "Prior knowledge"], ["constructivism"]),
+        _theory(2, ["Social interaction"]),
+        _theory(3, ["Social interaction", "Zone of proximal development"]),
+        _theory(4, ["Active learning", "Prior knowledge"], ["constructivism"]),
+        _theory(5, ["Reinforcement"]),
+    ]
+
+
+class TestLinkPredictor:
+    """Tests for LinkPredictor."""
+
+    def test_feature_set(self) -> None:
+        """Test that principles are tokenized and short words dropped."""
+        theory = _theory(1, ["Zone of proximal development"], ["Scaffolding "])
+
+        assert feature_set(theory) == {"zone", "proximal", "development", "scaffolding"}
+
+    def test_graph_features(self, theories: list[Theory]) -> None:
+        """Test common neighbours and Adamic-Adar over the adjacency matrix."""
+        pairs = [
+            ("THEORY-001", "THEORY-002"),
+            ("THEORY-003", "THEORY-002"),
+            ("THEORY-001", "THEORY-005"),
+            ("THEORY-003", "THEORY-005"),
+            ("THEORY-004", "THEORY-005"),
+        ]
+        predictor = LinkPredictor(theories, pairs)
+
+        scores = {s.theory_id: s for s in predictor.score("THEORY-001")}
+
+        assert scores["THEORY-003"].common_neighbors == 2
+        assert scores["THEORY-004"].common_neighbors == 1
+        # THEORY-002 (degree 2) counts more than THEORY-005 (degree 3)
+        assert scores["THEORY-003"].adamic_adar == pytest.approx(1 / 0.6931 + 1 / 1.0986, 1e-3)
+        assert scores["THEORY-004"].adamic_adar == pytest.approx(1 / 1.0986, 1e-3)
+
+    def test_top_k_ranks_by_combined_score(self, theories: list[Theory]) -> None:
+        """Test that feature overlap and embeddings decide the ranking."""
+        embeddings = {
+            "THEORY-001": [1.0, 0.0],
+            "THEORY-002": [0.0, 1.0],
+            "THEORY-003": [0.6, 0.8],
+            "THEORY-004": [0.9, 0.1],
+            "THEORY-005": [-1.0, 0.0],
+        }
+        predictor = LinkPredictor(theories, [], embeddings)
+
+        top = predictor.top_k(
+            "THEORY-001", ["THEORY-002", "THEORY-003", "THEORY-004", "THEORY-005"], k=2
+        )
+
+        assert [s.theory_id for s in top] == ["THEORY-004", "THEORY-003"]
+        assert top[0].jaccard == pytest.approx(1.0)
+        assert top[0].embedding_similarity > top[1].embedding_similarity
+
+    def test_unknown_candidates_are_skipped(self, theories: list[Theory]) -> None:
+        """Test that candidates outside the catalog are ignored."""
+        predictor = LinkPredictor(theories, [])
+
+        scores = predictor.score("THEORY-001", ["THEORY-999", "THEORY-001", "THEORY-002"])
+
+        assert [s.theory_id for s in scores] == ["THEORY-002"]
@@ -0,0 +1,97 @@
+"""Tests for the local deterministic LLM and embedding providers."""
+
+import json
+
+import numpy as np
+import pytest
+
+from tenjin.infrastructure.adapters.esperanto_adapter import EmbeddingAdapter, EsperantoAdapter
+from tenjin.infrastructure.adapters.local_providers import (
+    LocalEmbeddingModel,
+    LocalLanguageModel,
+)
+
+
+class TestLocalEmbeddingModel:
+    """Tests for LocalEmbeddingModel."""
+
+    def test_deterministic_and_normalized(self) -> None:
+        """Test that embeddings are stable across instances and unit length."""
+        texts = ["Constructivism and active learning", "構成主義"]
+        first = LocalEmbeddingModel(dimensions=64).embed(texts)
+        second = LocalEmbeddingModel(dimensions=64).embed(texts)
+
+        assert first == second
+        assert len(first[0]) == 64
+        for vector in first:
+            assert np.linalg.norm(vector) == pytest.approx(1.0, abs=1e-5)
+
+    def test_shared_vocabulary_is_more_similar(self) -> None:
+        """Test that related texts are closer than unrelated ones."""
+        model = LocalEmbeddingModel()
+        query, related, unrelated = np.array(
+            model.embed(
+                [
+                    "social learning through observation",
+                    "observational learning in social contexts",
+                    "operant conditioning reinforcement schedules",
+                ]
+            )
+        )
+
+        assert query @ related > query @ unrelated
+
+    def test_empty_text(self) -> None:
+        """Test that empty text yields a zero vector instead of NaN."""
+        assert LocalEmbeddingModel(dimensions=8).embed([""]) == [[0.0] * 8]
+
+
+class TestLocalLanguageModel:
+    """Tests for LocalLanguageModel."""
+
+    @pytest.mark.asyncio
+    async def test_json_prompt_returns_embedded_example(self) -> None:
+        """Test that JSON prompts get parseable JSON back."""
+        llm = LocalLanguageModel()
+        prompt = 'Respond in JSON format:\n{"relationships": [], "confidence": 0.5}'
+
+        response = await llm.achat_complete([{"role": "user", "content": prompt}])
+
+        assert json.loads(response.content) == {"relationships": [], "confidence": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_ranking_prompt(self) -> None:
+        """Test that rerank prompts get one number per listed document."""
+        llm = LocalLanguageModel()
+        prompt = "Return numbers, comma-separated.\n1. a\n2. b\n3. c"
+
+        response = await llm.achat_complete([{"role": "user", "content": prompt}])
+
+        assert response.content == "1, 2, 3"
+
+    @pytest.mark.asyncio
+    async def test_esperanto_adapter_local_provider(self) -> None:
+        """Test that EsperantoAdapter serves the stub without network access."""
+        adapter = EsperantoAdapter(provider="local", model="stub", fallback_providers=[])
+
+        first = await adapter.generate("Explain scaffolding")
+        second = await adapter.generate("Explain scaffolding")
+
+        assert first == second
+        assert "Explain scaffolding" in first
+
+
+class TestEmbeddingAdapterLocalProvider:
+    """Tests for EmbeddingAdapter with the local provider."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_matches_embed(self) -> None:
+        """Test that batch and single embeddings agree and skip the store."""
+        adapter = EmbeddingAdapter(provider="local", model="hash-ngram")
+
+        batch = await adapter.embed_batch(["zone of proximal development", "schema"])
+        single = await adapter.embed("schema")
+
+        assert adapter._store is None
+        assert isinstance(adapter.embedding_model, LocalEmbeddingModel)
+        assert batch[1] == single
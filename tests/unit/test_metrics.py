@@ -0,0 +1,142 @@
+"""Tests for in-process Prometheus metrics."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from tenjin.infrastructure.adapters.metrics import (
+    EventLoopLagMonitor,
+    MetricsRegistry,
+    get_metrics,
+    record_cache_lookup,
+    record_llm_tokens,
+    reset_metrics,
+    track_adapter,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics() -> Iterator[None]:
+    """Start every test with an empty registry."""
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def _sample(text: str, series: str) -> float:
+    """Get the value of a series from exposition text."""
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{series} not found")
+
+
+class TestMetricsRegistry:
+    """Tests for metric types and the exposition format."""
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test bucket, sum and count lines of a histogram."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", ("op",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value, op="read")
+
+        text = registry.render()
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{op="read",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{op="read",le="1.0"} 3' in text
+        assert 'latency_seconds_bucket{op="read",le="+Inf"} 4' in text
+        assert 'latency_seconds_sum{op="read"} 4.05' in text
+        assert 'latency_seconds_count{op="read"} 4' in text
+
+    def test_counter_and_gauge(self) -> None:
+        """Test counter and gauge samples and label escaping."""
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls", ("name",))
+        counter.inc(name='say "hi"')
+        counter.inc(2, name='say "hi"')
+        gauge = registry.gauge("in_flight", "In flight")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        text = registry.render()
+
+        assert 'calls_total{name="say \\"hi\\""} 3.0' in text
+        assert "in_flight 1.0" in text
+        with pytest.raises(ValueError):
+            counter.inc(-1, name="x")
+
+    def test_label_and_type_mismatch(self) -> None:
+        """Test that wrong labels and conflicting types are rejected."""
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls", ("name",))
+
+        with pytest.raises(ValueError):
+            counter.inc(tool="x")
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Calls")
+        assert registry.counter("calls_total", "Calls", ("name",)) is counter
+
+
+class TestRecordingHelpers:
+    """Tests for the adapter recording helpers."""
+
+    def test_track_adapter_records_errors(self) -> None:
+        """Test that failing calls are recorded with an error status."""
+        with track_adapter("neo4j", "read"):
+            pass
+        with pytest.raises(RuntimeError):
+            with track_adapter("neo4j", "read"):
+                raise RuntimeError("unavailable")
+
+        histogram = get_metrics().histogram(
+            "tenjin_adapter_duration_seconds", "", ("adapter", "operation", "status")
+        )
+        assert histogram.count(adapter="neo4j", operation="read", status="ok") == 1
+        assert histogram.count(adapter="neo4j", operation="read", status="error") == 1
+
+    def test_cache_hit_ratio(self) -> None:
+        """Test that hit ratios are derived when rendering."""
+        record_cache_lookup("tool", True, 3)
+        record_cache_lookup("tool", False)
+        record_cache_lookup("redis", False, 0)
+
+        text = get_metrics().render()
+
+        assert 'tenjin_cache_requests_total{cache="tool",result="hit"} 3.0' in text
+        assert 'tenjin_cache_hit_ratio{cache="tool"} 0.75' in text
+        assert 'cache="redis"' not in text
+
+    def test_llm_tokens(self) -> None:
+        """Test prompt and completion token counters."""
+        record_llm_tokens("openai", 120, 30)
+        record_llm_tokens("openai", 80, 10)
+
+        text = get_metrics().render()
+
+        assert 'tenjin_llm_tokens_total{provider="openai",kind="prompt"} 200.0' in text
+        assert 'tenjin_llm_tokens_total{provider="openai",kind="completion"} 40.0' in text
+
+
+class TestEventLoopLagMonitor:
+    """Tests for EventLoopLagMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_samples_lag(self) -> None:
+        """Test that a blocked loop shows up as lag."""
+        monitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.05)  # block the loop
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        text = get_metrics().render()
+        fast = int(_sample(text, 'tenjin_event_loop_lag_seconds_bucket{le="0.025"}'))
+        total = int(_sample(text, "tenjin_event_loop_lag_seconds_count"))
+        assert total >= 2
+        assert fast < total
@@ -0,0 +1,78 @@
+"""Tests for the on-demand sampling profiler."""
+
+import time
+from typing import Any
+
+import pytest
+from mcp.server import Server
+from mcp.types import TextContent
+
+from tenjin.infrastructure.adapters.profiler import OTHER, SamplingProfiler
+from tenjin.interface.tools.middleware import ProfilingMiddleware
+from tenjin.interface.tools.registry import ToolRegistry
+
+
+def _busy(seconds: float) -> list[bytes]:
+    """Burn CPU time and allocate while doing it."""
+    chunks = []
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        chunks.append(bytes(256))
+    return chunks
+
+
+class TestSamplingProfiler:
+    """Tests for SamplingProfiler."""
+
+    @pytest.mark.asyncio
+    async def test_samples_attributed_to_tool(self) -> None:
+        """Test that samples are rooted at the tool that was running."""
+        profiler = SamplingProfiler()
+        registry = ToolRegistry(Server("test"), [ProfilingMiddleware(profiler)])
+        kept: list[Any] = []
+
+        @registry.tool("crunch")
+        async def crunch(arguments: dict[str, Any]) -> list[TextContent]:
+            kept.append(_busy(0.2))
+            return [TextContent(type="text", text="ok")]
+
+        profiler.start(max_calls=2, interval_ms=1.0)
+        await registry.dispatch("crunch", {})
+        assert profiler.active
+        await registry.dispatch("crunch", {})
+
+        report = profiler.last_report
+        assert not profiler.active
+        assert report is not None
+        assert report.stop_reason == "max_calls"
+        assert report.tool_calls == 2
+        summary = report.to_dict()
+        assert summary["tools"]["crunch"]["samples"] > 0
+        assert "_busy" in report.collapsed("crunch")
+        assert all(line.startswith("crunch;") for line in report.collapsed("crunch").split("\n"))
+        assert any("test_profiler.py" in entry["location"] for entry in report.memory)
+
+    def test_samples_outside_tool_calls(self) -> None:
+        """Test manual stop, the fallback root and the memory switch."""
+        profiler = SamplingProfiler()
+        profiler.start(interval_ms=1.0, memory=False)
+        _busy(0.05)
+        report = profiler.stop()
+
+        assert report is not None
+        assert report.stop_reason == "stopped"
+        assert {tool for tool, _ in report.stacks} == {OTHER}
+        assert report.memory == []
+        assert profiler.stop() is None
+
+    def test_single_session(self) -> None:
+        """Test that a second session cannot start while one is running."""
+        profiler = SamplingProfiler()
+        profiler.start(interval_ms=10.0, memory=False)
+        try:
+            with pytest.raises(RuntimeError, match="already running"):
+                profiler.start()
+            assert profiler.status()["active"] is True
+        finally:
+            profiler.stop()
+        assert profiler.status() == {"active": False, "has_report": True}
@@ -0,0 +1,124 @@
+"""Tests for per-provider LLM concurrency and rate limiting."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from tenjin.infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from tenjin.infrastructure.adapters.rate_limiter import (
+    ProviderLimiter,
+    TokenBucket,
+    get_limiter_statistics,
+    reset_provider_limiters,
+)
+from tenjin.infrastructure.config.settings import LLMSettings
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters() -> Iterator[None]:
+    """Recreate shared limiters for every test (they bind to its event loop)."""
+    reset_provider_limiters()
+    yield
+    reset_provider_limiters()
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_delay_after_burst(self) -> None:
+        """Test that an exhausted bucket reports the refill wait."""
+        bucket = TokenBucket(per_minute=60)
+        bucket.consume(60)
+
+        assert bucket.delay_for(1) == pytest.approx(1.0, abs=0.05)
+
+    def test_debt_delays_later_requests(self) -> None:
+        """Test that usage beyond the reservation is paid back later."""
+        bucket = TokenBucket(per_minute=600)
+        bucket.consume(700)
+
+        assert bucket.delay_for(1) == pytest.approx(10.1, abs=0.05)
+
+
+class TestProviderLimiter:
+    """Tests for ProviderLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_and_queue_metrics(self) -> None:
+        """Test that in-flight requests are bounded and queueing is recorded."""
+        limiter = ProviderLimiter("test", max_concurrency=2)
+        peak = 0
+
+        async def call() -> None:
+            nonlocal peak
+            async with limiter.acquire(tokens=10):
+                peak = max(peak, limiter.stats.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        stats = limiter.get_statistics()
+        assert peak == 2
+        assert stats["requests"] == 6
+        assert stats["queued"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["max_queue_depth"] == 4
+        assert stats["max_wait_seconds"] > 0
+        assert stats["tokens"] == 60
+
+    @pytest.mark.asyncio
+    async def test_request_rate_limit_waits(self) -> None:
+        """Test that requests beyond the per-minute budget are delayed."""
+        limiter = ProviderLimiter("test", max_concurrency=4, requests_per_minute=600)
+        limiter._requests.consume(600)  # budget used up: next slot in 0.1s
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with limiter.acquire():
+            pass
+
+        assert loop.time() - started >= 0.09
+
+    def test_provider_limit_overrides(self) -> None:
+        """Test parsing of per-provider limit overrides."""
+        settings = LLMSettings(
+            max_concurrency=8,
+            requests_per_minute=100,
+            provider_limits="openai=4/500/200000, ollama=2",
+        )
+
+        assert settings.provider_limit_map == {
+            "openai": (4, 500, 200000),
+            "ollama": (2, 100, 0),
+        }
+
+    @pytest.mark.parametrize(
+        "limits", ["openai=four", "openai=1/2/3/4", "openai", "=2", "openai=-1"]
+    )
+    def test_invalid_provider_limits_rejected(self, limits: str) -> None:
+        """Test that malformed overrides fail when settings load, not per request."""
+        with pytest.raises(ValidationError, match="Invalid provider limit"):
+            LLMSettings(provider_limits=limits)
+
+
+class TestEsperantoAdapterLimits:
+    """Tests for limiter use in EsperantoAdapter.generate."""
+
+    @pytest.mark.asyncio
+    async def test_generate_goes_through_limiter(self) -> None:
+        """Test that generate records requests on the provider limiter."""
+        adapter = EsperantoAdapter(provider="local", model="stub", fallback_providers=[])
+
+        with patch(
+            "tenjin.infrastructure.adapters.rate_limiter.get_settings"
+        ) as get_settings:
+            get_settings.return_value.llm = LLMSettings(provider_limits="local=1")
+            await asyncio.gather(*(adapter.generate(f"q{i}") for i in range(3)))
+
+        stats = get_limiter_statistics()["local"]
+        assert stats["limits"]["max_concurrency"] == 1
+        assert stats["requests"] == 3
+        assert stats["tokens"] > 0
@@ -0,0 +1,133 @@
+"""Tests for RecommendationService explanation generation."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tenjin.application.services.recommendation_service import RecommendationService
+from tenjin.domain.entities.theory import Theory
+from tenjin.domain.value_objects.category_type import CategoryType
+from tenjin.domain.value_objects.priority_level import PriorityLevel
+from tenjin.domain.value_objects.theory_id import TheoryId
+
+
+def make_theory(index: int) -> Theory:
+    """Create a sample theory."""
+    return Theory(
+        id=TheoryId.from_string(f"THEORY-00{index}"),
+        name=f"Theory {index}",
+        name_ja=f"理論{index}",
+        category=CategoryType.CONSTRUCTIVIST,
+        description=f"Description {index}",
+        description_ja=f"説明{index}",
+        priority=PriorityLevel.HIGH,
+        key_principles=[f"Principle {index}"],
+        applications=["Project-based learning"],
+    )
+
+
+@pytest.fixture
+def theories() -> list[Theory]:
+    """Create three candidate theories."""
+    return [make_theory(i) for i in range(1, 4)]
+
+
+def make_service(llm: AsyncMock, mode: str, concurrency: int = 2) -> RecommendationService:
+    """Create a service with mocked repositories."""
+    return RecommendationService(
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        llm,
+        explanation_mode=mode,  # type: ignore[arg-type]
+        explanation_concurrency=concurrency,
+    )
+
+
+class TestBatchedExplanations:
+    """Tests for batch and gather explanation modes."""
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_call(self, theories: list[Theory]) -> None:
+        """Test that all explanations come from one structured call."""
+        llm = AsyncMock()
+        llm.generate.return_value = "```json\n" + json.dumps(
+            [{"theory_id": str(t.id), "explanation": f"Fits {t.name}"} for t in reversed(theories)]
+        ) + "\n```"
+        service = make_service(llm, "batch")
+
+        result = await service._generate_recommendations(
+            "middle school science", [(t, 0.9) for t in theories]
+        )
+
+        assert llm.generate.await_count == 1
+        assert [r["explanation"] for r in result] == [
+            "Fits Theory 1",
+            "Fits Theory 2",
+            "Fits Theory 3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_per_item(self, theories: list[Theory]) -> None:
+        """Test that unknown IDs are ignored and missing theories explained individually."""
+        llm = AsyncMock()
+        batch = json.dumps(
+            [
+                {"theory_id": str(theories[0].id), "explanation": "Batch 1"},
+                {"theory_id": "THEORY-999", "explanation": "Not a candidate"},
+                {"theory_id": str(theories[2].id), "explanation": ""},
+            ]
+        )
+        llm.generate.side_effect = [batch, "Single 2", "Single 3"]
+        service = make_service(llm, "batch")
+
+        explanations = await service._generate_explanations("context", theories)
+
+        assert explanations == ["Batch 1", "Single 2", "Single 3"]
+        assert llm.generate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_explains_individually(self, theories: list[Theory]) -> None:
+        """Test that a failed batch call falls back to per-item calls, then templates."""
+        llm = AsyncMock()
+        llm.generate.side_effect = [
+            RuntimeError("Batch call failed"),
+            "Single 1",
+            RuntimeError("All LLM providers failed"),
+            "Single 3",
+        ]
+        service = make_service(llm, "batch", concurrency=1)
+
+        explanations = await service._generate_explanations("context", theories)
+
+        assert llm.generate.await_count == 4
+        assert explanations == [
+            "Single 1",
+            "Theory 2 aligns with your context through its focus on Principle 2.",
+            "Single 3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_gather_bounds_concurrency(self, theories: list[Theory]) -> None:
+        """Test that gather mode runs calls concurrently up to the limit."""
+        in_flight = 0
+        peak = 0
+
+        async def generate(prompt: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return prompt.split('"')[1]
+
+        llm = MagicMock()
+        llm.generate = generate
+        service = make_service(llm, "gather", concurrency=2)
+
+        explanations = await service._generate_explanations("context", theories * 2)
+
+        assert peak == 2
+        assert explanations == [t.name for t in theories * 2]
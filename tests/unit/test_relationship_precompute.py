@@ -0,0 +1,168 @@
+"""Tests for the offline relationship precomputation service."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from tenjin.application.services.graph_service import GraphService
+from tenjin.application.services.relationship_precompute_service import (
+    RelationshipPrecomputeService,
+)
+from tenjin.domain.entities.theory import Theory
+from tenjin.domain.value_objects.category_type import CategoryType
+from tenjin.domain.value_objects.priority_level import PriorityLevel
+from tenjin.domain.value_objects.theory_id import TheoryId
+from tenjin.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+
+def _theory(number: int) -> Theory:
+    """Create a minimal theory."""
+    return Theory(
+        id=TheoryId.from_string(f"THEORY-{number:03d}"),
+        name=f"Theory {number}",
+        name_ja=f"理論{number}",
+        category=CategoryType.CONSTRUCTIVIST,
+        description="Learning as an active process",
+        description_ja="学習は能動的プロセスである",
+        priority=PriorityLevel.HIGH,
+        key_principles=["Active learning"],
+    )
+
+
+class TestSelectCandidatePairs:
+    """Tests for embedding-based candidate pair selection."""
+
+    def test_excludes_connected_and_ranks_by_similarity(self) -> None:
+        """Test that curated pairs and self pairs are skipped and ranking is by cosine."""
+        ids = ["a", "b", "c", "d"]
+        vectors = np.array(
+            [[1.0, 0.0], [0.99, 0.1], [0.9, 0.4], [0.0, 1.0]], dtype=np.float32
+        )
+
+        pairs = RelationshipPrecomputeService.select_candidate_pairs(
+            ids, vectors, connected={("b", "a")}, neighbors=2, min_similarity=0.5
+        )
+
+        keys = [pair.key for pair in pairs]
+        assert "a|b" not in keys
+        assert all(pair.source_id != pair.target_id for pair in pairs)
+        assert keys[0] == "b|c"
+        assert [p.similarity for p in pairs] == sorted(
+            (p.similarity for p in pairs), reverse=True
+        )
+        assert all(p.similarity >= 0.5 for p in pairs)
+
+    def test_respects_max_pairs(self) -> None:
+        """Test that the number of returned pairs is capped."""
+        rng = np.random.default_rng(0)
+        ids = [f"t{i}" for i in range(20)]
+
+        pairs = RelationshipPrecomputeService.select_candidate_pairs(
+            ids, rng.random((20, 8)), connected=set(), neighbors=3,
+            min_similarity=-1.0, max_pairs=5,
+        )
+
+        assert len(pairs) == 5
+
+
+class TestPrecompute:
+    """Tests for the checkpointed precomputation run."""
+
+    @pytest.mark.asyncio
+    async def test_stores_relationships_and_resumes(self, tmp_path: Path) -> None:
+        """Test that judged pairs are checkpointed and skipped on the next run."""
+        theories = [_theory(i) for i in range(1, 4)]
+        theory_repo = AsyncMock()
+        theory_repo.get_all.return_value = theories
+        vector_repo = AsyncMock()
+        vector_repo.get_embeddings.return_value = {
+            "THEORY-001": [1.0, 0.0],
+            "THEORY-002": [0.9, 0.2],
+            "THEORY-003": [0.8, 0.5],
+        }
+        graph_repo = AsyncMock()
+        graph_repo.get_relationship_pairs.return_value = []
+        graph_repo.save_inferred_relationships.side_effect = lambda rels: len(rels)
+        llm = AsyncMock()
+        llm.generate.return_value = json.dumps(
+            {
+                "relationships": [
+                    {
+                        "pair_index": 1,
+                        "relationship_type": "extension",
+                        "confidence": 0.9,
+                        "direction": "b_to_a",
+                    },
+                    {"pair_index": 2, "relationship_type": "contrast", "confidence": 0.1},
+                ]
+            }
+        )
+        checkpoint = tmp_path / "checkpoint.json"
+        service = RelationshipPrecomputeService(
+            theory_repo, vector_repo, graph_repo, llm, checkpoint_path=checkpoint
+        )
+
+        report = await service.precompute()
+
+        assert report.candidate_pairs == 3
+        assert report.judged_pairs == 3
+        assert report.relationships_stored == 1
+        stored = graph_repo.save_inferred_relationships.call_args.args[0]
+        assert len(stored) == 1
+        assert stored[0]["direction"] == "target_to_source"
+        assert len(json.loads(checkpoint.read_text())["judged"]) == 3
+
+        llm.generate.reset_mock()
+        resumed = await service.precompute()
+
+        assert resumed.resumed_pairs == 3
+        assert resumed.judged_pairs == 0
+        llm.generate.assert_not_called()
+
+
+class TestCuratedGraphQueries:
+    """Tests that graph traversals leave inferred edges out."""
+
+    @pytest.mark.asyncio
+    async def test_traversals_exclude_inferred_edges(
+        self, mock_neo4j_adapter: AsyncMock
+    ) -> None:
+        """Test that every traversal query filters inferred relationships."""
+        repo = Neo4jGraphRepository(mock_neo4j_adapter)
+
+        await repo.get_related_theories("a")
+        await repo.get_relationship("a", "b")
+        await repo.get_relationships("a")
+        await repo.find_path("a", "b")
+        await repo.get_theory_network("a")
+        await repo.get_category_subgraph("constructivist")
+        await repo.get_common_relationships(["a", "b"])
+        await repo.get_relationships_among(["a", "b"])
+
+        queries = [call.args[0] for call in mock_neo4j_adapter.execute_read.call_args_list]
+        assert len(queries) == 8
+        for query in queries:
+            assert "coalesce(r.inferred, false)" in query or (
+                "coalesce(rel.inferred, false)" in query
+            ), query
+
+    @pytest.mark.asyncio
+    async def test_statistics_report_inferred_edges_apart(self) -> None:
+        """Test that inferred edges are not counted as curated relationships."""
+        repo = AsyncMock()
+        repo.execute_cypher.side_effect = [
+            [{"label": "Theory", "count": 3}],
+            [
+                {"type": "BUILDS_ON", "inferred": False, "count": 2},
+                {"type": "INFERRED_RELATION", "inferred": True, "count": 5},
+            ],
+        ]
+
+        stats = await GraphService(repo).get_graph_statistics()
+
+        assert stats["relationships"] == {"BUILDS_ON": 2}
+        assert stats["total_relationships"] == 2
+        assert stats["inferred_relationships"] == 5
@@ -0,0 +1,73 @@
+"""Tests for JSON serialization of tool and resource responses."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from tenjin.domain.entities.theory import Theory
+from tenjin.domain.value_objects.category_type import CategoryType
+from tenjin.domain.value_objects.priority_level import PriorityLevel
+from tenjin.domain.value_objects.search_result import SearchResult, SearchResults
+from tenjin.domain.value_objects.theory_id import TheoryId
+from tenjin.interface import serialization
+from tenjin.interface.serialization import dumps, json_content
+
+
+@pytest.fixture
+def body() -> dict:
+    """Create a response body mixing plain values and domain objects."""
+    theory = Theory(
+        id=TheoryId.from_string("t-1"),
+        name="Constructivism",
+        name_ja="構成主義",
+        description="Learners construct knowledge.",
+        description_ja="学習者は知識を構成する。",
+        category=CategoryType.CONSTRUCTIVIST,
+        priority=PriorityLevel.CRITICAL,
+    )
+    result = SearchResult(id="t-1", entity_type="theory", name="構成主義", score=0.9)
+    return {
+        "theory": theory,
+        "results": SearchResults(
+            results=(result,), total_count=1, query="構成", search_type="hybrid"
+        ),
+        "id": TheoryId.from_string("t-2"),
+        "at": datetime(2024, 4, 1, 9, 30, 0, 250),
+        "tags": ("a", "b"),
+    }
+
+
+class TestDumps:
+    """Tests for dumps."""
+
+    def test_domain_objects_use_their_layout(self, body: dict) -> None:
+        """Test that entities and value objects serialize like their to_dict."""
+        text = dumps(body)
+        decoded = json.loads(text)
+
+        assert decoded["theory"] == json.loads(json.dumps(body["theory"].to_dict()))
+        assert decoded["results"]["results"][0]["name"] == "構成主義"
+        assert decoded["id"] == "t-2"
+        assert decoded["at"] == "2024-04-01T09:30:00.000250"
+        assert decoded["tags"] == ["a", "b"]
+        assert "構成主義" in text
+
+    def test_compact_unless_pretty(self, body: dict) -> None:
+        """Test that output is compact by default and indented on request."""
+        assert "\n" not in dumps(body)
+        assert ", " not in dumps({"a": [1, 2]})
+        assert dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+
+        [content] = json_content({"a": 1})
+        assert content.text == '{"a":1}'
+
+    def test_backends_agree(self, body: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the standard library fallback produces the same JSON."""
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        fast = [dumps(body), dumps(body, pretty=True), dumps({"big": 2**70})]
+
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert [dumps(body), dumps(body, pretty=True), dumps({"big": 2**70})] == fast
@@ -0,0 +1,159 @@
+"""Tests for the slow-operation log and index advisor."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tenjin.infrastructure.adapters import slow_log
+from tenjin.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tenjin.infrastructure.adapters.slow_log import (
+    IndexAdvisor,
+    SlowOperationLog,
+    params_hash,
+    total_db_hits,
+)
+
+KEYWORD_QUERY = """
+MATCH (t:Theory)
+WHERE t.name CONTAINS $keyword
+   OR ANY(k IN t.keywords WHERE k CONTAINS $keyword)
+RETURN t
+"""
+
+PROFILE = {
+    "operatorType": "ProduceResults@neo4j",
+    "dbHits": 0,
+    "rows": 3,
+    "children": [
+        {
+            "operatorType": "Filter@neo4j",
+            "dbHits": 900,
+            "rows": 3,
+            "children": [
+                {
+                    "operatorType": "NodeByLabelScan@neo4j",
+                    "dbHits": 301,
+                    "rows": 300,
+                    "args": {"Details": "t:Theory"},
+                    "children": [],
+                }
+            ],
+        }
+    ],
+}
+
+
+class TestIndexAdvisor:
+    """Tests for IndexAdvisor."""
+
+    def test_flags_contains_predicates(self) -> None:
+        """Test that CONTAINS and ANY() over list properties are flagged."""
+        findings = IndexAdvisor.analyze_query(KEYWORD_QUERY)
+
+        assert len(findings) == 2
+        assert "(t:Theory) filtered by t.name CONTAINS" in findings[0]
+        assert "TEXT INDEX FOR (n:Theory) ON (n.name)" in findings[0]
+        assert "t.keywords" in findings[1]
+
+    def test_index_friendly_query(self) -> None:
+        """Test that equality lookups are not flagged."""
+        assert IndexAdvisor.analyze_query("MATCH (t:Theory {id: $id}) RETURN t") == []
+
+    def test_plan_scans_and_db_hits(self) -> None:
+        """Test scan operators and db hits of a PROFILE plan."""
+        findings = IndexAdvisor.analyze_plan(PROFILE)
+
+        assert findings == ["plan: NodeByLabelScan t:Theory (300 rows, 301 db hits)"]
+        assert total_db_hits(PROFILE) == 1201
+        assert total_db_hits(None) is None
+
+    def test_review_logs_once(self) -> None:
+        """Test that findings are computed and logged once per query."""
+        advisor = IndexAdvisor()
+        with patch.object(slow_log, "logger") as logger:
+            advisor.review(KEYWORD_QUERY)
+            advisor.review(KEYWORD_QUERY)
+
+        assert logger.warning.call_count == 2
+
+
+class TestSlowOperationLog:
+    """Tests for SlowOperationLog."""
+
+    def test_records_only_slow_operations(self) -> None:
+        """Test thresholds per kind and the recorded fields."""
+        log = SlowOperationLog({"cypher": 100.0, "llm": 1000.0})
+
+        assert log.record("cypher", "MATCH (n) RETURN n", 0.05) is None
+        assert log.record("vector", "query theories", 10.0) is None
+        entry = log.record("cypher", "MATCH (n)\n  RETURN n", 0.25, {"id": "secret"}, rows=4)
+
+        assert entry is not None
+        assert entry.operation == "MATCH (n) RETURN n"
+        assert entry.params_hash == params_hash({"id": "secret"})
+        assert "secret" not in str(entry.to_dict())
+        assert [e.rows for e in log.recent()] == [4]
+
+    def test_disabled(self) -> None:
+        """Test that a disabled log records nothing."""
+        log = SlowOperationLog({"cypher": 0.0}, enabled=False)
+
+        assert log.record("cypher", "RETURN 1", 5.0) is None
+
+    def test_profile_once_per_query(self) -> None:
+        """Test that each query text is profiled at most once."""
+        log = SlowOperationLog({"cypher": 0.0})
+
+        assert log.should_profile(KEYWORD_QUERY)
+        assert not log.should_profile(KEYWORD_QUERY)
+        assert not log.should_profile("PROFILE MATCH (n) RETURN n")
+
+
+class TestNeo4jSlowQueries:
+    """Tests for slow query capture in Neo4jAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_slow_read_is_profiled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a slow read is logged with rows, db hits and advice."""
+        log = SlowOperationLog({"cypher": 0.0})
+        monkeypatch.setattr(slow_log, "_slow_log", log)
+        settings = MagicMock()
+        settings.slow_log.profile_cypher = True
+        settings.slow_log.profile_timeout_seconds = 5.0
+        monkeypatch.setattr(
+            "tenjin.infrastructure.adapters.neo4j_adapter.get_settings", lambda: settings
+        )
+
+        data_result = MagicMock()
+        data_result.data = AsyncMock(return_value=[{"t": 1}, {"t": 2}])
+        profile_result = MagicMock()
+        profile_result.consume = AsyncMock(return_value=SimpleNamespace(profile=PROFILE))
+        session = MagicMock()
+        session.run = AsyncMock(
+            side_effect=lambda query, params: profile_result
+            if getattr(query, "text", query).startswith("PROFILE")
+            else data_result
+        )
+
+        @asynccontextmanager
+        async def fake_session() -> AsyncIterator[MagicMock]:
+            yield session
+
+        adapter = Neo4jAdapter("bolt://localhost", "neo4j", "password")
+        adapter.session = fake_session  # type: ignore[method-assign]
+
+        records = await adapter.execute_read(KEYWORD_QUERY, {"keyword": "flow"})
+
+        assert len(records) == 2
+        assert log.recent() == []  # profiled in the background
+        await asyncio.gather(*adapter._profiles)
+        [entry] = log.recent()
+        assert entry.kind == "cypher"
+        assert entry.rows == 2
+        assert entry.db_hits == 1201
+        assert any("NodeByLabelScan" in a for a in entry.advice)
+        assert any("t.name CONTAINS" in a for a in entry.advice)
@@ -0,0 +1,127 @@
+"""Tests for concurrent, lazy startup and the startup report."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tenjin.infrastructure.adapters.job_store import SQLiteJobStore
+from tenjin.infrastructure.adapters.startup import (
+    StartupReport,
+    get_startup_report,
+    lazy_import,
+)
+from tenjin.interface import server as server_module
+from tenjin.interface.server import TenjinServer
+
+
+class _SlowNeo4j:
+    """Neo4j adapter stand-in whose connect takes a while."""
+
+    def __init__(self, **kwargs: object) -> None:
+        pass
+
+    async def connect(self, verify: bool = True) -> None:
+        await asyncio.sleep(0.2)
+
+    async def close(self) -> None:
+        pass
+
+
+class _SlowChromaDB:
+    """ChromaDB adapter stand-in with a blocking connect."""
+
+    def __init__(self, **kwargs: object) -> None:
+        pass
+
+    def connect(self) -> None:
+        time.sleep(0.2)
+
+
+class TestStartupReport:
+    """Tests for StartupReport and lazy_import."""
+
+    def test_lazy_import_records_first_import(self) -> None:
+        """Test that only the first import of a module is recorded."""
+        sys.modules.pop("colorsys", None)
+        report = get_startup_report()
+
+        module = lazy_import("colorsys")
+        recorded = report.to_dict()["imports"]["colorsys"]
+        assert lazy_import("colorsys") is module
+        assert report.to_dict()["imports"]["colorsys"] == recorded
+
+    def test_summary_slowest_first(self) -> None:
+        """Test the report layout."""
+        report = StartupReport()
+        report.record("connects", "redis", 0.002)
+        report.record("connects", "neo4j", 0.150)
+        report.initialize_seconds = 0.2
+
+        assert list(report.to_dict()["connects"]) == ["neo4j", "redis"]
+        assert report.summary() == "initialize 200ms | connects: neo4j 150ms, redis 2ms"
+
+
+class TestLazyStartup:
+    """Tests for TenjinServer startup."""
+
+    @pytest.mark.asyncio
+    async def test_backends_connected_concurrently(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that backends connect at once and rare services are built on use."""
+        monkeypatch.setattr(server_module, "Neo4jAdapter", _SlowNeo4j)
+        monkeypatch.setattr(server_module, "ChromaDBAdapter", _SlowChromaDB)
+        tenjin = TenjinServer()
+        monkeypatch.setattr(tenjin._settings.cache, "enabled", False)
+        monkeypatch.setattr(
+            tenjin, "_create_job_store", lambda: SQLiteJobStore(tmp_path / "jobs.sqlite3")
+        )
+
+        started = time.perf_counter()
+        await tenjin.initialize()
+        try:
+            assert time.perf_counter() - started < 0.35
+            report = get_startup_report().to_dict()
+            assert {"neo4j", "chromadb"} <= set(report["connects"])
+
+            assert tenjin._export_service is None
+            export = tenjin.export_service
+            assert tenjin.export_service is export
+            assert "export" in get_startup_report().to_dict()["services"]
+        finally:
+            await tenjin.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unwritable_job_store_disables_jobs(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the server starts without jobs when the store cannot be opened."""
+        monkeypatch.setattr(server_module, "Neo4jAdapter", _SlowNeo4j)
+        monkeypatch.setattr(server_module, "ChromaDBAdapter", _SlowChromaDB)
+        (tmp_path / "data").write_text("not a directory")
+        tenjin = TenjinServer()
+        monkeypatch.setattr(tenjin._settings.cache, "enabled", False)
+        monkeypatch.setattr(
+            tenjin, "_create_job_store", lambda: SQLiteJobStore(tmp_path / "data" / "jobs.db")
+        )
+
+        await tenjin.initialize()
+        try:
+            assert tenjin.theory_service is not None
+            with pytest.raises(RuntimeError, match="jobs are disabled"):
+                _ = tenjin.job_service
+        finally:
+            await tenjin.shutdown()
+
+    def test_lazy_service_requires_initialize(self) -> None:
+        """Test that lazily built services still require initialization."""
+        tenjin = TenjinServer()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            _ = tenjin.citation_service
+
+        tenjin._theory_repo = MagicMock()
+        assert tenjin.citation_service is tenjin.citation_service
@@ -0,0 +1,186 @@
+"""Tests for streaming LLM output and progress reporting."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from tenjin.infrastructure.adapters.circuit_breaker import reset_circuit_breakers
+from tenjin.infrastructure.adapters.esperanto_adapter import EsperantoAdapter
+from tenjin.infrastructure.adapters.rate_limiter import reset_provider_limiters
+from tenjin.infrastructure.adapters.streaming import JsonFieldStream, stream_json_fields
+
+
+@pytest.fixture(autouse=True)
+def fresh_providers() -> Iterator[None]:
+    """Start every test with closed circuits and fresh limiters."""
+    reset_circuit_breakers()
+    reset_provider_limiters()
+    yield
+    reset_circuit_breakers()
+    reset_provider_limiters()
+
+
+def _chunk(text: str) -> SimpleNamespace:
+    """Build a chat completion chunk carrying a text delta."""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+async def _stream(
+    pieces: list[str], fail_after: int | None = None
+) -> AsyncIterator[SimpleNamespace]:
+    """Yield chunks, optionally raising after a number of them."""
+    for i, piece in enumerate(pieces):
+        if fail_after is not None and i == fail_after:
+            raise ConnectionError("stream reset")
+        yield _chunk(piece)
+
+
+class TestJsonFieldStream:
+    """Tests for JsonFieldStream."""
+
+    @pytest.mark.asyncio
+    async def test_reports_fields_across_chunks(self) -> None:
+        """Test that fields split across chunks are reported once complete."""
+        fields: list[tuple[str, Any]] = []
+
+        async def on_field(key: str, value: Any) -> None:
+            fields.append((key, value))
+
+        stream = JsonFieldStream(on_field)
+        text = '```json\n{"summary": "a {b}, \\"c\\"", "items": [1, {"x": 2}], "score": 70}\n```'
+        for i in range(0, len(text), 3):
+            await stream.feed(text[i : i + 3])
+
+        assert fields == [
+            ("summary", 'a {b}, "c"'),
+            ("items", [1, {"x": 2}]),
+            ("score", 70),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_skips_invalid_fields(self) -> None:
+        """Test that unparsable fields are skipped without failing."""
+        fields: list[str] = []
+
+        async def on_field(key: str, value: Any) -> None:
+            fields.append(key)
+
+        stream = JsonFieldStream(on_field)
+        await stream.feed('{"score": <0-100>, "summary": "ok"}')
+
+        assert fields == ["summary"]
+
+
+class TestGenerateStream:
+    """Tests for EsperantoAdapter.generate_stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_local_provider(self) -> None:
+        """Test streaming from the local provider delivers the full text in chunks."""
+        adapter = EsperantoAdapter(provider="local", model="stub")
+        chunks: list[str] = []
+
+        async def on_chunk(text: str) -> None:
+            chunks.append(text)
+
+        prompt = 'Return JSON like {"summary": "a fairly long summary text", "score": 1}'
+        result = await adapter.generate_stream(prompt, on_chunk=on_chunk)
+
+        assert json.loads(result) == {"summary": "a fairly long summary text", "score": 1}
+        assert len(chunks) > 1
+        assert "".join(chunks) == result
+
+    @pytest.mark.asyncio
+    async def test_falls_back_before_output_only(self) -> None:
+        """Test fallback on early failure and no retry after partial output."""
+        adapter = EsperantoAdapter(provider="openai", model="m", fallback_providers=["ollama"])
+        primary, fallback = MagicMock(), MagicMock()
+        adapter._clients = {"openai": primary, "ollama": fallback}
+
+        async def failing_early(messages: Any, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+            return _stream(["x"], fail_after=0)
+
+        async def working(messages: Any, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+            return _stream(["he", "llo"])
+
+        primary.achat_complete = failing_early
+        fallback.achat_complete = working
+        assert await adapter.generate_stream("hi") == "hello"
+
+        async def failing_late(messages: Any, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+            return _stream(["he", "llo"], fail_after=1)
+
+        primary.achat_complete = failing_late
+        with pytest.raises(RuntimeError, match="partial output"):
+            await adapter.generate_stream("hi")
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_times_out(self) -> None:
+        """Test that a stream that stops sending chunks falls back like a failure."""
+        adapter = EsperantoAdapter(provider="openai", model="m", fallback_providers=["ollama"])
+        adapter._request_timeout = 0.05
+        primary, fallback = MagicMock(), MagicMock()
+        adapter._clients = {"openai": primary, "ollama": fallback}
+
+        async def stalled() -> AsyncIterator[SimpleNamespace]:
+            await asyncio.sleep(10)
+            yield _chunk("late")
+
+        async def stalling(messages: Any, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+            return stalled()
+
+        async def working(messages: Any, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+            return _stream(["ok"])
+
+        primary.achat_complete = stalling
+        fallback.achat_complete = working
+
+        assert await asyncio.wait_for(adapter.generate_stream("hi"), timeout=2) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_consumer_errors_do_not_fail_generation(self) -> None:
+        """Test that a failing progress consumer is dropped, not the generation."""
+        adapter = EsperantoAdapter(provider="local", model="stub")
+        calls = 0
+
+        async def on_chunk(text: str) -> None:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("client disconnected")
+
+        result = await adapter.generate_stream(
+            'JSON {"summary": "long enough to chunk"}', on_chunk=on_chunk
+        )
+
+        assert json.loads(result) == {"summary": "long enough to chunk"}
+        assert calls == 1
+
+
+class TestStreamJsonFields:
+    """Tests for stream_json_fields."""
+
+    @pytest.mark.asyncio
+    async def test_progress_messages(self) -> None:
+        """Test the started message followed by one message per field."""
+        adapter = EsperantoAdapter(provider="local", model="stub")
+        messages: list[dict[str, Any]] = []
+
+        async def on_progress(message: str) -> None:
+            messages.append(json.loads(message))
+
+        prompt = 'Respond in JSON: {"preparation": ["read"], "success_indicators": ["engagement"]}'
+        result = await stream_json_fields(
+            adapter, prompt, None, on_progress, "implementation_guide"
+        )
+
+        assert json.loads(result)["preparation"] == ["read"]
+        assert messages == [
+            {"status": "started", "operation": "implementation_guide"},
+            {"field": "preparation", "value": ["read"]},
+            {"field": "success_indicators", "value": ["engagement"]},
+        ]
@@ -0,0 +1,240 @@
+"""Tests for the tool registry and tool middleware."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.server import Server
+from mcp.types import CallToolResult, TextContent, Tool
+
+from tenjin.infrastructure.config.settings import ToolSettings
+from tenjin.interface.tools import register_tools
+from tenjin.interface.tools.middleware import (
+    CacheMiddleware,
+    ConcurrencyMiddleware,
+    DeadlineMiddleware,
+    ErrorMiddleware,
+    ProfilingMiddleware,
+    TimingMiddleware,
+    default_middleware,
+)
+from tenjin.interface.tools.registry import ToolCall, ToolRegistry
+
+
+def _text(payload: Any) -> list[TextContent]:
+    """Build a text tool result."""
+    return [TextContent(type="text", text=json.dumps(payload))]
+
+
+def _error_body(result: Any) -> dict[str, Any]:
+    """Parse the JSON body of an error result."""
+    assert isinstance(result, CallToolResult)
+    assert result.isError
+    return json.loads(result.content[0].text)
+
+
+def _echo_definition() -> Tool:
+    """Definition of the test echo tool."""
+    return Tool(
+        name="echo",
+        description="Echo the value",
+        inputSchema={
+            "type": "object",
+            "properties": {"value": {"type": "integer"}},
+            "required": ["value"],
+        },
+    )
+
+
+@pytest.fixture
+def registry() -> ToolRegistry:
+    """Registry with an echo tool and no middleware."""
+    registry = ToolRegistry(Server("test"))
+
+    @registry.tool("echo")
+    async def echo(arguments: dict[str, Any]) -> list[TextContent]:
+        return _text(arguments)
+
+    registry.define([_echo_definition()])
+    return registry
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_by_name(self, registry: ToolRegistry) -> None:
+        """Test that calls reach the registered handler."""
+        result = await registry.dispatch("echo", {"value": 3})
+
+        assert json.loads(result[0].text) == {"value": 3}
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, registry: ToolRegistry) -> None:
+        """Test that unknown tools return an error result."""
+        body = _error_body(await registry.dispatch("missing", {}))
+
+        assert body["error"] == "UnknownTool"
+        assert body["tool"] == "missing"
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, registry: ToolRegistry) -> None:
+        """Test that arguments are validated against the input schema."""
+        body = _error_body(await registry.dispatch("echo", {"value": "three"}))
+
+        assert body["error"] == "InvalidArguments"
+        assert "value" in body["message"]
+
+    def test_duplicate_registration(self, registry: ToolRegistry) -> None:
+        """Test that a tool name can only be registered once."""
+
+        async def other(arguments: dict[str, Any]) -> list[TextContent]:
+            return _text({})
+
+        with pytest.raises(ValueError):
+            registry.register("echo", other)
+
+    def test_definitions_only_for_handled_tools(self, registry: ToolRegistry) -> None:
+        """Test that tools without a handler are not listed."""
+        registry.define([Tool(name="orphan", inputSchema={"type": "object"})])
+
+        assert [t.name for t in registry.definitions()] == ["echo"]
+
+    @pytest.mark.asyncio
+    async def test_middleware_order(self, registry: ToolRegistry) -> None:
+        """Test that the first middleware is the outermost."""
+        calls: list[str] = []
+
+        def tracing(label: str):
+            async def middleware(call: ToolCall, call_next):
+                calls.append(f"{label}:before")
+                result = await call_next(call)
+                calls.append(f"{label}:after")
+                return result
+
+            return middleware
+
+        registry.use(tracing("outer"))
+        registry.use(tracing("inner"))
+        await registry.dispatch("echo", {"value": 1})
+
+        assert calls == ["outer:before", "inner:before", "inner:after", "outer:after"]
+
+
+class TestMiddleware:
+    """Tests for the default middleware."""
+
+    @pytest.mark.asyncio
+    async def test_errors_become_results(self) -> None:
+        """Test that handler exceptions are shaped and counted as errors."""
+        timing = TimingMiddleware()
+        registry = ToolRegistry(Server("test"), [ErrorMiddleware(), timing])
+
+        @registry.tool("boom")
+        async def boom(arguments: dict[str, Any]) -> list[TextContent]:
+            raise KeyError("theory_id")
+
+        body = _error_body(await registry.dispatch("boom", {}))
+
+        assert body["error"] == "KeyError"
+        assert timing.get_statistics()["boom"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit(self) -> None:
+        """Test that cacheable results are served from the cache."""
+        timing = TimingMiddleware()
+        cache = CacheMiddleware(ttl_seconds=60)
+        registry = ToolRegistry(Server("test"), [timing, cache])
+        handler_calls = 0
+
+        @registry.tool("lookup", cacheable=True)
+        async def lookup(arguments: dict[str, Any]) -> list[TextContent]:
+            nonlocal handler_calls
+            handler_calls += 1
+            return _text(arguments)
+
+        await registry.dispatch("lookup", {"a": 1, "b": 2})
+        await registry.dispatch("lookup", {"b": 2, "a": 1})
+        await registry.dispatch("lookup", {"a": 2})
+
+        assert handler_calls == 2
+        stats = timing.get_statistics()["lookup"]
+        assert stats["calls"] == 3
+        assert stats["cache_hits"] == 1
+
+        assert cache.clear() == 2
+        await registry.dispatch("lookup", {"a": 1, "b": 2})
+        assert handler_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_tools_bypass_cache(self) -> None:
+        """Test that tools not marked cacheable always run."""
+        cache = CacheMiddleware()
+        registry = ToolRegistry(Server("test"), [cache])
+        handler_calls = 0
+
+        @registry.tool("write")
+        async def write(arguments: dict[str, Any]) -> list[TextContent]:
+            nonlocal handler_calls
+            handler_calls += 1
+            return _text({})
+
+        await registry.dispatch("write", {})
+        await registry.dispatch("write", {})
+
+        assert handler_calls == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_per_tool_concurrency(self) -> None:
+        """Test that a tool's concurrency limit is respected."""
+        registry = ToolRegistry(Server("test"), [ConcurrencyMiddleware(max_concurrency=10)])
+        in_flight = 0
+        peak = 0
+
+        @registry.tool("export", max_concurrency=2)
+        async def export(arguments: dict[str, Any]) -> list[TextContent]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _text({})
+
+        await asyncio.gather(*(registry.dispatch("export", {}) for _ in range(6)))
+
+        assert peak == 2
+
+    def test_default_chain(self) -> None:
+        """Test the default chain and disabling the cache."""
+        chain = default_middleware(ToolSettings())
+        assert [type(m) for m in chain] == [
+            ErrorMiddleware,
+            ProfilingMiddleware,
+            TimingMiddleware,
+            DeadlineMiddleware,
+            CacheMiddleware,
+            ConcurrencyMiddleware,
+        ]
+
+        chain = default_middleware(ToolSettings(cache_enabled=False))
+        assert CacheMiddleware not in [type(m) for m in chain]
+
+
+class TestRegisterTools:
+    """Tests for registering all tool modules."""
+
+    def test_every_definition_has_a_handler(self) -> None:
+        """Test that all declared tools are dispatchable."""
+        tenjin = MagicMock()
+        tenjin.cache_service.is_available = True
+
+        registry = register_tools(Server("test"), tenjin)
+
+        declared = {t.name for t in registry._definitions}
+        assert declared
+        assert declared <= set(registry.names)
+        assert all(registry.get(name).validator is not None for name in declared)
+        assert tenjin.tool_registry is registry
@@ -0,0 +1,151 @@
+"""Tests for contextvars-based tracing."""
+
+import asyncio
+import io
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from mcp.server import Server
+from mcp.types import CallToolResult, TextContent
+
+from tenjin.infrastructure.adapters.metrics import track_adapter
+from tenjin.infrastructure.adapters.tracing import (
+    OTLPJsonExporter,
+    Trace,
+    configure_tracing,
+    record_span,
+    span,
+    start_trace,
+    trace_methods,
+)
+from tenjin.interface.tools.middleware import TracingMiddleware
+from tenjin.interface.tools.registry import ToolRegistry
+
+
+class _Collector:
+    """Exporter keeping traces in memory."""
+
+    def __init__(self) -> None:
+        self.traces: list[Trace] = []
+
+    def export(self, trace: Trace) -> None:
+        self.traces.append(trace)
+
+
+@pytest.fixture
+def collector() -> Iterator[_Collector]:
+    """Send finished traces to an in-memory collector."""
+    collector = _Collector()
+    configure_tracing(collector)
+    yield collector
+    configure_tracing(None)
+
+
+@trace_methods("service")
+class _Service:
+    """Service with traced methods."""
+
+    async def fetch(self, delay: float) -> str:
+        with track_adapter("neo4j", "read"):
+            await asyncio.sleep(delay)
+        return "done"
+
+    async def fan_out(self) -> list[str]:
+        return await asyncio.gather(self.fetch(0.001), self.fetch(0.001))
+
+    async def _private(self) -> None:
+        pass
+
+
+class TestSpans:
+    """Tests for span nesting and export."""
+
+    @pytest.mark.asyncio
+    async def test_spans_nest_across_awaits_and_tasks(self, collector: _Collector) -> None:
+        """Test that spans get the enclosing span as parent."""
+        with start_trace("tool.test"):
+            await _Service().fan_out()
+
+        trace = collector.traces[0]
+        by_name: dict[str, list] = {}
+        for item in trace.spans:
+            by_name.setdefault(item.name, []).append(item)
+
+        root = by_name["tool.test"][0]
+        fan_out = by_name["_Service.fan_out"][0]
+        assert fan_out.parent_id == root.span_id
+        assert len(by_name["_Service.fetch"]) == 2
+        assert all(s.parent_id == fan_out.span_id for s in by_name["_Service.fetch"])
+        fetch_ids = {s.span_id for s in by_name["_Service.fetch"]}
+        assert {s.parent_id for s in by_name["neo4j.read"]} == fetch_ids
+        assert "_Service._private" not in by_name
+
+    @pytest.mark.asyncio
+    async def test_no_spans_outside_trace(self, collector: _Collector) -> None:
+        """Test that instrumented code is a no-op without a trace."""
+        with span("orphan") as current:
+            assert current is None
+        record_span("llm.openai", 0.5)
+        assert await _Service().fetch(0) == "done"
+
+        assert collector.traces == []
+
+    def test_errors_and_breakdown(self, collector: _Collector) -> None:
+        """Test error status and the per-name breakdown."""
+        with pytest.raises(RuntimeError):
+            with start_trace("tool.failing"):
+                record_span("llm.openai", 0.25)
+                record_span("llm.openai", 0.25, error=True)
+                with span("neo4j.read"):
+                    raise RuntimeError("unavailable")
+
+        trace = collector.traces[0]
+        assert trace.root.error == "RuntimeError: unavailable"
+        breakdown = trace.breakdown()
+        assert list(breakdown["spans"]) == ["llm.openai", "neo4j.read"]
+        assert breakdown["spans"]["llm.openai"] == {"count": 2, "ms": 500.0}
+
+    def test_otlp_json_export(self) -> None:
+        """Test the OTLP/JSON encoding of an exported trace."""
+        stream = io.StringIO()
+        configure_tracing(OTLPJsonExporter(stream=stream))
+        try:
+            with start_trace("tool.search", **{"tenjin.tool": "search"}):
+                with span("chromadb.query", n_results=5):
+                    pass
+        finally:
+            configure_tracing(None)
+
+        request = json.loads(stream.getvalue())
+        scope = request["resourceSpans"][0]["scopeSpans"][0]
+        child, root = scope["spans"]
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert "parentSpanId" not in root
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["attributes"] == [{"key": "n_results", "value": {"intValue": "5"}}]
+        assert int(root["endTimeUnixNano"]) >= int(child["endTimeUnixNano"])
+        assert root["status"] == {"code": 1}
+
+
+class TestTracingMiddleware:
+    """Tests for TracingMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_debug_attaches_breakdown(self, collector: _Collector) -> None:
+        """Test that debug mode adds the timing breakdown to result metadata."""
+        registry = ToolRegistry(Server("test"), [TracingMiddleware(debug=True)])
+
+        @registry.tool("lookup")
+        async def lookup(arguments: dict[str, Any]) -> list[TextContent]:
+            await _Service().fetch(0)
+            return [TextContent(type="text", text="ok")]
+
+        result = await registry.dispatch("lookup", {})
+
+        assert isinstance(result, CallToolResult)
+        assert result.content[0].text == "ok"
+        timing = result.meta["tenjin/timing"]
+        assert timing["trace_id"] == collector.traces[0].root.trace_id
+        assert set(timing["spans"]) == {"_Service.fetch", "neo4j.read"}